@@ -0,0 +1,20 @@
+# install numpy - `pip install numpy`
+
+from agno.agent import Agent
+from agno.knowledge.pdf_url import PDFUrlKnowledgeBase
+from agno.vectordb.local import NumpyVectorDb
+
+# Initialize an in-process vector db, persisted in tmp/numpydb
+vector_db = NumpyVectorDb(collection="recipes", path="tmp/numpydb")
+
+# Create knowledge base
+knowledge_base = PDFUrlKnowledgeBase(
+    urls=["https://agno-public.s3.amazonaws.com/recipes/ThaiRecipes.pdf"],
+    vector_db=vector_db,
+)
+
+knowledge_base.load(recreate=False)  # Comment out after first run
+
+# Create and use the agent
+agent = Agent(knowledge=knowledge_base, show_tool_calls=True)
+agent.print_response("Show me how to make Tom Kha Gai", markdown=True)
@@ -0,0 +1,36 @@
+"""Compare the per-request cost of deep_copy vs run_copy for an Agent served by an app.
+
+Run `pip install agno openai` to install dependencies.
+"""
+
+from agno.agent import Agent
+from agno.eval.performance import PerformanceEval
+from agno.models.openai import OpenAIChat
+from agno.tools.duckduckgo import DuckDuckGoTools
+
+agent_template = Agent(
+    model=OpenAIChat(id="gpt-4o"),
+    tools=[DuckDuckGoTools()],
+    instructions=["Be concise, reply with one sentence."],
+    session_state={"shopping_list": []},
+)
+
+
+def deep_copy_agent():
+    return agent_template.deep_copy(update={"session_id": "session-1"})
+
+
+def run_copy_agent():
+    return agent_template.run_copy(update={"session_id": "session-1"})
+
+
+deep_copy_perf = PerformanceEval(
+    name="Agent deep_copy per request", func=deep_copy_agent, num_iterations=1000
+)
+run_copy_perf = PerformanceEval(
+    name="Agent run_copy per request", func=run_copy_agent, num_iterations=1000
+)
+
+if __name__ == "__main__":
+    deep_copy_perf.run(print_summary=True)
+    run_copy_perf.run(print_summary=True)
@@ -0,0 +1,150 @@
+"""Compare the throughput (MB/s) of the fixed size and recursive chunking strategies on a large document.
+
+The `legacy_*` functions are the previous implementations, which walk back over the chunk character by character,
+copy every chunk before searching it and clean the text with one regex pass per kind of whitespace.
+
+Run `pip install agno` to install dependencies.
+"""
+
+import random
+import re
+from typing import Iterator, List
+
+from agno.document import Document
+from agno.document.chunking.fixed import FixedSizeChunking
+from agno.document.chunking.recursive import RecursiveChunking
+from agno.eval.performance import PerformanceEval
+
+CHUNK_SIZE = 5000
+DOCUMENT_SIZE = 8 * 1024 * 1024
+READ_BLOCK_SIZE = 1024 * 1024
+
+words = [
+    "agno",
+    "knowledge",
+    "vector",
+    "chunk",
+    "document",
+    "embedding",
+    "search",
+    "agent",
+    "memory",
+    "model",
+]
+separators = [" "] * 12 + ["  ", "\n", "\n\n", ". ", ".\n", "\t"]
+random.seed(0)
+parts: List[str] = []
+size = 0
+while size < DOCUMENT_SIZE:
+    part = random.choice(words) + random.choice(separators)
+    parts.append(part)
+    size += len(part)
+document = Document(name="benchmark", content="".join(parts))
+document_mb = len(document.content.encode("utf-8")) / 1024 / 1024
+
+
+def legacy_clean_text(text: str) -> str:
+    text = re.sub(r"\n+", "\n", text)
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r"\t+", "\t", text)
+    text = re.sub(r"\r+", "\r", text)
+    text = re.sub(r"\f+", "\f", text)
+    return re.sub(r"\v+", "\v", text)
+
+
+def legacy_fixed_size_chunking() -> List[Document]:
+    content = legacy_clean_text(document.content)
+    chunks: List[Document] = []
+    chunk_number = 1
+    start = 0
+    while start < len(content):
+        end = min(start + CHUNK_SIZE, len(content))
+        if end < len(content):
+            while end > start and content[end] not in [" ", "\n", "\r", "\t"]:
+                end -= 1
+        if end == start:
+            end = start + CHUNK_SIZE
+        chunk = content[start:end]
+        meta_data = document.meta_data.copy()
+        meta_data["chunk"] = chunk_number
+        meta_data["chunk_size"] = len(chunk)
+        chunks.append(
+            Document(
+                id=f"{document.name}_{chunk_number}",
+                name=document.name,
+                meta_data=meta_data,
+                content=chunk,
+            )
+        )
+        chunk_number += 1
+        start = end
+    return chunks
+
+
+def legacy_recursive_chunking() -> List[Document]:
+    content = legacy_clean_text(document.content)
+    chunks: List[Document] = []
+    chunk_number = 1
+    start = 0
+    while start < len(content):
+        end = min(start + CHUNK_SIZE, len(content))
+        if end < len(content):
+            for sep in ["\n", "."]:
+                last_sep = content[start:end].rfind(sep)
+                if last_sep != -1:
+                    end = start + last_sep + 1
+                    break
+        chunk = content[start:end]
+        meta_data = document.meta_data.copy()
+        meta_data["chunk"] = chunk_number
+        meta_data["chunk_size"] = len(chunk)
+        chunks.append(
+            Document(id=None, name=document.name, meta_data=meta_data, content=chunk)
+        )
+        chunk_number += 1
+        start = end
+    return chunks
+
+
+def read_blocks() -> Iterator[str]:
+    for i in range(0, len(document.content), READ_BLOCK_SIZE):
+        yield document.content[i : i + READ_BLOCK_SIZE]
+
+
+fixed_size_chunking = FixedSizeChunking(chunk_size=CHUNK_SIZE)
+recursive_chunking = RecursiveChunking(chunk_size=CHUNK_SIZE)
+
+options = {"num_iterations": 5, "warmup_runs": 1, "measure_memory": False}
+benchmarks = [
+    PerformanceEval(
+        name="Legacy fixed size chunking", func=legacy_fixed_size_chunking, **options
+    ),
+    PerformanceEval(
+        name="Fixed size chunking",
+        func=lambda: fixed_size_chunking.chunk(document),
+        **options,
+    ),
+    PerformanceEval(
+        name="Fixed size chunking, streamed",
+        func=lambda: list(fixed_size_chunking.chunk_stream(document, read_blocks())),
+        **options,
+    ),
+    PerformanceEval(
+        name="Legacy recursive chunking", func=legacy_recursive_chunking, **options
+    ),
+    PerformanceEval(
+        name="Recursive chunking",
+        func=lambda: recursive_chunking.chunk(document),
+        **options,
+    ),
+    PerformanceEval(
+        name="Recursive chunking, streamed",
+        func=lambda: list(recursive_chunking.chunk_stream(document, read_blocks())),
+        **options,
+    ),
+]
+
+if __name__ == "__main__":
+    for benchmark in benchmarks:
+        result = benchmark.run()
+        print(f"{benchmark.name}: {document_mb / result.avg_run_time:.1f} MB/s")
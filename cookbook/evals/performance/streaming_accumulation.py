@@ -0,0 +1,80 @@
+"""Check that the per-chunk cost of streaming stays flat as the response grows to 50k tokens.
+
+The model stream is simulated, so no API calls are made. Each response is streamed one token per chunk as content,
+thinking and audio through an Agent, which accumulates the chunks for the final run response.
+
+Run `pip install openai agno` to install dependencies.
+"""
+
+import time
+from typing import List
+
+from agno.agent import Agent
+from agno.eval.performance import PerformanceEval
+from agno.media import AudioResponse
+from agno.models.openai import OpenAIChat
+from agno.models.response import ModelResponse
+
+NUM_TOKENS = 50_000
+
+model = OpenAIChat(id="gpt-4o")
+agent = Agent(model=model, telemetry=False, monitoring=False)
+num_tokens = NUM_TOKENS
+
+
+def stream_tokens(messages, assistant_message, stream_data, **kwargs):
+    for i in range(num_tokens):
+        yield from model._populate_stream_data_and_assistant_message(
+            stream_data,
+            assistant_message,
+            ModelResponse(
+                content=f"token{i} ",
+                thinking="thought ",
+                audio=AudioResponse(id="audio", content="AAAA"),
+            ),
+        )
+
+
+# Replace the provider stream with the simulated one
+model.process_response_stream = stream_tokens
+
+
+def run_stream() -> List[float]:
+    """Stream a response and return the time taken by each chunk"""
+    chunk_times = []
+    start = time.perf_counter()
+    for _ in agent.run("Write a long story", stream=True):
+        now = time.perf_counter()
+        chunk_times.append(now - start)
+        start = now
+    return chunk_times
+
+
+def per_chunk_overhead(chunk_times: List[float], first: bool) -> float:
+    """Average time in microseconds of the first or last tenth of the chunks"""
+    tenth = len(chunk_times) // 10
+    window = chunk_times[1 : tenth + 1] if first else chunk_times[-tenth - 1 : -1]
+    return sum(window) / len(window) * 1e6
+
+
+if __name__ == "__main__":
+    for tokens in [NUM_TOKENS // 4, NUM_TOKENS // 2, NUM_TOKENS]:
+        num_tokens = tokens
+        evaluation = PerformanceEval(
+            name=f"Streaming {tokens} tokens",
+            func=run_stream,
+            num_iterations=3,
+            warmup_runs=1,
+            measure_memory=False,
+        )
+        result = evaluation.run()
+        print(f"{tokens} tokens: {result.avg_run_time / tokens * 1e6:.1f} us/chunk")
+
+    chunk_times = run_stream()
+    print(
+        f"First 10% of chunks: {per_chunk_overhead(chunk_times, first=True):.1f} us/chunk"
+    )
+    print(
+        f"Last 10% of chunks: {per_chunk_overhead(chunk_times, first=False):.1f} us/chunk"
+    )
+    assert len(agent.run_response.content.split()) == NUM_TOKENS
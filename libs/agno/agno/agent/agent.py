@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import ChainMap, defaultdict, deque
+from contextlib import asynccontextmanager, contextmanager
 from dataclasses import asdict, dataclass
 from os import getenv
 from textwrap import dedent
@@ -51,6 +52,7 @@ from agno.storage.base import Storage
 from agno.storage.session.agent import AgentSession
 from agno.tools.function import Function
 from agno.tools.toolkit import Toolkit
+from agno.utils.debug_trace import DebugTrace
 from agno.utils.events import (
     create_memory_update_completed_event,
     create_memory_update_started_event,
@@ -150,6 +152,8 @@ class Agent:
     num_history_responses: Optional[int] = None
     # Number of historical runs to include in the messages
     num_history_runs: int = 3
+    # Maximum number of tokens of history to include in the messages. The most recent runs that fit are included.
+    max_history_tokens: Optional[int] = None
 
     # --- Agent Knowledge ---
     knowledge: Optional[AgentKnowledge] = None
@@ -337,6 +341,8 @@ class Agent:
     debug_mode: bool = False
     # Debug level: 1 = basic, 2 = detailed
     debug_level: Literal[1, 2] = 1
+    # Sink for structured debug records of the model calls, independent of debug_mode and the log level
+    debug_trace: Optional[DebugTrace] = None
 
     # monitoring=True logs Agent information to agno.com for monitoring
     monitoring: bool = False
@@ -371,6 +377,7 @@ class Agent:
         add_history_to_messages: bool = False,
         num_history_responses: Optional[int] = None,
         num_history_runs: int = 3,
+        max_history_tokens: Optional[int] = None,
         knowledge: Optional[AgentKnowledge] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
         enable_agentic_knowledge_filters: Optional[bool] = None,
@@ -436,6 +443,7 @@ class Agent:
         team_response_separator: str = "\n",
         debug_mode: bool = False,
         debug_level: Literal[1, 2] = 1,
+        debug_trace: Optional[DebugTrace] = None,
         monitoring: bool = False,
         telemetry: bool = True,
     ):
@@ -468,6 +476,7 @@ class Agent:
         self.add_history_to_messages = add_history_to_messages
         self.num_history_responses = num_history_responses
         self.num_history_runs = num_history_runs
+        self.max_history_tokens = max_history_tokens
 
         self.knowledge = knowledge
         self.knowledge_filters = knowledge_filters
@@ -555,6 +564,7 @@ class Agent:
             log_warning(f"Invalid debug level: {debug_level}. Setting to 1.")
             debug_level = 1
         self.debug_level = debug_level
+        self.debug_trace = debug_trace
         self.monitoring = monitoring
         self.telemetry = telemetry
 
@@ -663,6 +673,12 @@ class Agent:
         self.set_storage_mode()
         self.set_debug()
         self.set_agent_id()
+        if self.debug_trace is not None and self.model is not None and self.model.debug_trace is not self.debug_trace:
+            from copy import copy
+
+            # Trace a copy of the model, so a model shared with other agents or teams is left untouched
+            self.model = copy(self.model)
+            self.model.debug_trace = self.debug_trace
 
         log_debug(f"Agent ID: {self.agent_id}", center=True)
 
@@ -1280,7 +1296,9 @@ class Agent:
         self._convert_response_to_structured_format(run_response)
 
         # 6. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id, refresh_session=refresh_session_before_write)
+        await self.awrite_to_storage(
+            user_id=user_id, session_id=session_id, refresh_session=refresh_session_before_write
+        )
 
         # 7. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=run_messages.user_message, session_id=session_id)
@@ -1402,7 +1420,9 @@ class Agent:
             yield self._handle_event(create_run_response_completed_event(from_run_response=run_response), run_response)
 
         # 7. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id, refresh_session=refresh_session_before_write)
+        await self.awrite_to_storage(
+            user_id=user_id, session_id=session_id, refresh_session=refresh_session_before_write
+        )
 
         # Log Agent Run
         await self._alog_agent_run(user_id=user_id, session_id=session_id)
@@ -1440,7 +1460,7 @@ class Agent:
         self.initialize_agent()
 
         # Read existing session from storage
-        self.read_from_storage(session_id=session_id)
+        await self.aread_from_storage(session_id=session_id)
 
         effective_filters = knowledge_filters
         # When filters are passed manually
@@ -2120,7 +2140,7 @@ class Agent:
         self.stream_intermediate_steps = self.stream_intermediate_steps or (stream_intermediate_steps and self.stream)
 
         # Read existing session from storage
-        self.read_from_storage(session_id=session_id)
+        await self.aread_from_storage(session_id=session_id)
 
         # Run can be continued from previous run response or from passed run_response context
         if run_response is not None:
@@ -2329,7 +2349,7 @@ class Agent:
         self._convert_response_to_structured_format(run_response)
 
         # 6. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id)
+        await self.awrite_to_storage(user_id=user_id, session_id=session_id)
 
         # 7. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=run_messages.user_message, session_id=session_id)
@@ -2419,7 +2439,7 @@ class Agent:
             yield self._handle_event(create_run_response_completed_event(run_response), run_response)
 
         # 7. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id)
+        await self.awrite_to_storage(user_id=user_id, session_id=session_id)
 
         # Log Agent Run
         await self._alog_agent_run(user_id=user_id, session_id=session_id)
@@ -3083,6 +3103,8 @@ class Agent:
                 stream_intermediate_steps=stream_intermediate_steps,
             )
 
+        self._update_run_response_from_stream(run_response, model_response)
+
         # Determine reasoning completed
         if stream_intermediate_steps and reasoning_state["reasoning_started"]:
             all_reasoning_steps: List[ReasoningStep] = []
@@ -3153,6 +3175,8 @@ class Agent:
             ):
                 yield event
 
+        self._update_run_response_from_stream(run_response, model_response)
+
         if stream_intermediate_steps and reasoning_state["reasoning_started"]:
             all_reasoning_steps: List[ReasoningStep] = []
             if run_response and run_response.extra_data and hasattr(run_response.extra_data, "reasoning_steps"):
@@ -3181,6 +3205,19 @@ class Agent:
         if model_response.audio is not None:
             run_response.response_audio = model_response.audio
 
+    def _update_run_response_from_stream(self, run_response: RunResponse, model_response: ModelResponse) -> None:
+        """Join the chunks streamed into `model_response` and set them on the run response"""
+        streamed = model_response.join_chunks()
+        if "content" in streamed:
+            run_response.content = model_response.content
+        if "thinking" in streamed:
+            run_response.thinking = model_response.thinking
+        if "reasoning_content" in streamed:
+            run_response.reasoning_content = model_response.reasoning_content
+        if "redacted_thinking" in streamed:
+            # We only have thinking on response
+            run_response.thinking = model_response.redacted_thinking
+
     def _handle_model_response_chunk(
         self,
         run_response: RunResponse,
@@ -3211,27 +3248,18 @@ class Agent:
                         run_response.content = model_response.content
                         run_response.content_type = content_type
                     else:
-                        model_response.content = (model_response.content or "") + model_response_event.content
-                        run_response.content = model_response.content
+                        # Streamed chunks are joined once the stream ends, see _update_run_response_from_stream
+                        model_response.append_chunk("content", model_response_event.content)
                         run_response.content_type = "str"
 
                 if model_response_event.thinking is not None:
-                    model_response.thinking = (model_response.thinking or "") + model_response_event.thinking
-                    run_response.thinking = model_response.thinking
+                    model_response.append_chunk("thinking", model_response_event.thinking)
 
                 if model_response_event.reasoning_content is not None:
-                    model_response.reasoning_content = (
-                        model_response.reasoning_content or ""
-                    ) + model_response_event.reasoning_content
-                    run_response.reasoning_content = model_response.reasoning_content
+                    model_response.append_chunk("reasoning_content", model_response_event.reasoning_content)
 
                 if model_response_event.redacted_thinking is not None:
-                    model_response.redacted_thinking = (
-                        model_response.redacted_thinking or ""
-                    ) + model_response_event.redacted_thinking
-
-                    # We only have thinking on response
-                    run_response.thinking = model_response.redacted_thinking
+                    model_response.append_chunk("redacted_thinking", model_response_event.redacted_thinking)
 
                 if model_response_event.citations is not None:
                     # We get citations in one chunk
@@ -3274,9 +3302,9 @@ class Agent:
                     if model_response_event.audio.id is not None:
                         model_response.audio.id = model_response_event.audio.id  # type: ignore
                     if model_response_event.audio.content is not None:
-                        model_response.audio.content += model_response_event.audio.content  # type: ignore
+                        model_response.append_chunk("audio_content", model_response_event.audio.content)
                     if model_response_event.audio.transcript is not None:
-                        model_response.audio.transcript += model_response_event.audio.transcript  # type: ignore
+                        model_response.append_chunk("audio_transcript", model_response_event.audio.transcript)
                     if model_response_event.audio.expires_at is not None:
                         model_response.audio.expires_at = model_response_event.audio.expires_at  # type: ignore
                     if model_response_event.audio.mime_type is not None:
@@ -3485,6 +3513,10 @@ class Agent:
         self.run_response = cast(RunResponse, self.run_response)
         self.memory = cast(Memory, self.memory)
 
+        if self.memory.defer_updates:
+            self._schedule_memories_and_summaries(run_messages, session_id, user_id)
+            return
+
         with ThreadPoolExecutor(max_workers=3) as executor:
             futures = []
 
@@ -3505,19 +3537,7 @@ class Agent:
                 and run_messages.extra_messages is not None
                 and len(run_messages.extra_messages) > 0
             ):
-                parsed_messages = []
-                for _im in run_messages.extra_messages:
-                    if isinstance(_im, Message):
-                        parsed_messages.append(_im)
-                    elif isinstance(_im, dict):
-                        try:
-                            parsed_messages.append(Message(**_im))
-                        except Exception as e:
-                            log_warning(f"Failed to validate message during memory update: {e}")
-                    else:
-                        log_warning(f"Unsupported message type: {type(_im)}")
-                        continue
-
+                parsed_messages = self._parse_extra_messages(run_messages)
                 if len(parsed_messages) > 0:
                     futures.append(
                         executor.submit(self.memory.create_user_memories, messages=parsed_messages, user_id=user_id)
@@ -3558,6 +3578,11 @@ class Agent:
     ) -> AsyncIterator[RunResponseEvent]:
         self.run_response = cast(RunResponse, self.run_response)
         self.memory = cast(Memory, self.memory)
+
+        if self.memory.defer_updates:
+            self._schedule_memories_and_summaries(run_messages, session_id, user_id)
+            return
+
         tasks = []
 
         # Create user memories from single message
@@ -3576,19 +3601,7 @@ class Agent:
             and run_messages.extra_messages is not None
             and len(run_messages.extra_messages) > 0
         ):
-            parsed_messages = []
-            for _im in run_messages.extra_messages:
-                if isinstance(_im, Message):
-                    parsed_messages.append(_im)
-                elif isinstance(_im, dict):
-                    try:
-                        parsed_messages.append(Message(**_im))
-                    except Exception as e:
-                        log_warning(f"Failed to validate message during memory update: {e}")
-                else:
-                    log_warning(f"Unsupported message type: {type(_im)}")
-                    continue
-
+            parsed_messages = self._parse_extra_messages(run_messages)
             if len(parsed_messages) > 0:
                 tasks.append(self.memory.acreate_user_memories(messages=parsed_messages, user_id=user_id))
             else:
@@ -3616,6 +3629,80 @@ class Agent:
                     create_memory_update_completed_event(from_run_response=self.run_response), self.run_response
                 )
 
+    def _parse_extra_messages(self, run_messages: RunMessages) -> List[Message]:
+        """Convert the extra messages of the run to Message objects, skipping the invalid ones"""
+        parsed_messages: List[Message] = []
+        for _im in run_messages.extra_messages or []:
+            if isinstance(_im, Message):
+                parsed_messages.append(_im)
+            elif isinstance(_im, dict):
+                try:
+                    parsed_messages.append(Message(**_im))
+                except Exception as e:
+                    log_warning(f"Failed to validate message during memory update: {e}")
+            else:
+                log_warning(f"Unsupported message type: {type(_im)}")
+        return parsed_messages
+
+    def _schedule_memories_and_summaries(
+        self,
+        run_messages: RunMessages,
+        session_id: str,
+        user_id: Optional[str] = None,
+    ) -> None:
+        """Schedule the memory and summary updates of the run on the background worker of the Memory"""
+        self.memory = cast(Memory, self.memory)
+
+        if self.enable_user_memories:
+            messages: List[Message] = []
+            if run_messages.user_message is not None:
+                messages.append(Message(role="user", content=run_messages.user_message.get_content_string()))
+            if run_messages.extra_messages is not None and len(run_messages.extra_messages) > 0:
+                messages.extend(self._parse_extra_messages(run_messages))
+            if messages:
+                log_debug("Scheduling user memories.")
+                self.memory.schedule_user_memories(messages=messages, user_id=user_id)
+
+        if self.enable_session_summaries:
+            log_debug("Scheduling session summary.")
+            self.memory.schedule_session_summary(
+                session_id=session_id,
+                user_id=user_id,
+                on_complete=lambda summary: self._persist_session_summary(session_id, user_id, summary),
+            )
+
+    def _persist_session_summary(
+        self, session_id: str, user_id: Optional[str], summary: Optional[SessionSummary]
+    ) -> None:
+        """Write a summary made in the background to the stored session"""
+        if summary is None or self.storage is None:
+            return
+        with self._lock_session_writes():
+            stored_session = self.storage.read(session_id=session_id)
+            if not isinstance(stored_session, AgentSession):
+                return
+            memory_dict = stored_session.memory or {}
+            memory_dict.setdefault("summaries", {}).setdefault(user_id or "default", {})[session_id] = summary.to_dict()
+            stored_session.memory = memory_dict
+            self.storage.upsert(session=stored_session)
+
+    @contextmanager
+    def _lock_session_writes(self) -> Iterator[None]:
+        """Serialize writes of the session with the summaries persisted by the background worker of the Memory"""
+        if isinstance(self.memory, Memory) and self.memory.defer_updates:
+            with self.memory.get_update_worker().lock_session_writes():
+                yield
+        else:
+            yield
+
+    @asynccontextmanager
+    async def _alock_session_writes(self) -> AsyncIterator[None]:
+        if isinstance(self.memory, Memory) and self.memory.defer_updates:
+            async with self.memory.get_update_worker().alock_session_writes():
+                yield
+        else:
+            yield
+
     def _raise_if_async_tools(self) -> None:
         """Raise an exception if any tools contain async functions"""
         if self.tools is None:
@@ -3957,6 +4044,8 @@ class Agent:
         from time import time
 
         """Get an AgentSession object, which can be saved to the database"""
+        # If the storage keeps an append-only run log, only the current run needs to be written
+        only_current_run = self.storage is not None and self.storage.stores_runs_separately
         if self.memory is not None:
             if isinstance(self.memory, AgentMemory):
                 self.memory = cast(AgentMemory, self.memory)
@@ -3965,14 +4054,18 @@ class Agent:
                 memory_dict["runs"] = [
                     agent_run.to_dict()
                     for agent_run in self.memory.runs
-                    if agent_run.response is not None and agent_run.response.session_id == session_id
+                    if agent_run.response is not None
+                    and agent_run.response.session_id == session_id
+                    and (not only_current_run or agent_run.response.run_id == self.run_id)
                 ]
             else:
                 self.memory = cast(Memory, self.memory)
                 # We fake the structure on storage, to maintain the interface with the legacy implementation
                 run_responses = self.memory.runs.get(session_id, [])  # type: ignore
-                memory_dict = self.memory.to_dict()
-                memory_dict["runs"] = [rr.to_dict() for rr in run_responses]
+                memory_dict = self.memory.to_dict(include_runs=False)
+                memory_dict["runs"] = [
+                    rr.to_dict() for rr in run_responses if not only_current_run or rr.run_id == self.run_id
+                ]
         else:
             memory_dict = None
 
@@ -4234,6 +4327,26 @@ class Agent:
                 self.load_agent_session(session=self.agent_session)
         return self.agent_session
 
+    async def aread_from_storage(
+        self,
+        session_id: str,
+    ) -> Optional[AgentSession]:
+        """Load the AgentSession from storage without blocking the event loop
+
+        Args:
+            session_id: The session_id to load from storage.
+
+        Returns:
+            Optional[AgentSession]: The loaded AgentSession or None if not found.
+        """
+        if self.storage is not None:
+            # Get a single session from storage
+            self.agent_session = cast(AgentSession, await self.storage.aread(session_id=session_id))
+            if self.agent_session is not None:
+                # Load the agent session
+                self.load_agent_session(session=self.agent_session)
+        return self.agent_session
+
     def refresh_from_storage(self, session_id: str) -> None:
         """Refresh the AgentSession from storage
 
@@ -4244,6 +4357,24 @@ class Agent:
             return
 
         agent_session_from_db = self.storage.read(session_id=session_id)  # type: ignore
+        if isinstance(agent_session_from_db, AgentSession):
+            self._add_runs_from_stored_session(session_id=session_id, agent_session_from_db=agent_session_from_db)
+
+    async def arefresh_from_storage(self, session_id: str) -> None:
+        """Refresh the AgentSession from storage without blocking the event loop
+
+        Args:
+            session_id: The session_id to refresh from storage.
+        """
+        if not self.storage:
+            return
+
+        agent_session_from_db = await self.storage.aread(session_id=session_id)  # type: ignore
+        if isinstance(agent_session_from_db, AgentSession):
+            self._add_runs_from_stored_session(session_id=session_id, agent_session_from_db=agent_session_from_db)
+
+    def _add_runs_from_stored_session(self, session_id: str, agent_session_from_db: Optional[AgentSession]) -> None:
+        """Add the runs of a stored session that are missing from memory, e.g. runs written by another process"""
         if (
             agent_session_from_db is not None
             and agent_session_from_db.memory is not None  # type: ignore
@@ -4284,10 +4415,35 @@ class Agent:
             if refresh_session:
                 self.refresh_from_storage(session_id=session_id)
 
-            self.agent_session = cast(
-                AgentSession,
-                self.storage.upsert(session=self.get_agent_session(session_id=session_id, user_id=user_id)),
-            )
+            with self._lock_session_writes():
+                self.agent_session = cast(
+                    AgentSession,
+                    self.storage.upsert(session=self.get_agent_session(session_id=session_id, user_id=user_id)),
+                )
+
+        if not self.cache_session:
+            if self.memory is not None and self.memory.runs is not None and session_id in self.memory.runs:
+                self.memory.runs.pop(session_id)  # type: ignore
+
+        return self.agent_session
+
+    async def awrite_to_storage(
+        self, session_id: str, user_id: Optional[str] = None, refresh_session: Optional[bool] = False
+    ) -> Optional[AgentSession]:
+        """Save the AgentSession to storage without blocking the event loop
+
+        Returns:
+            Optional[AgentSession]: The saved AgentSession or None if not saved.
+        """
+        if self.storage is not None:
+            if refresh_session:
+                await self.arefresh_from_storage(session_id=session_id)
+
+            async with self._alock_session_writes():
+                self.agent_session = cast(
+                    AgentSession,
+                    await self.storage.aupsert(session=self.get_agent_session(session_id=session_id, user_id=user_id)),
+                )
 
         if not self.cache_session:
             if self.memory is not None and self.memory.runs is not None and session_id in self.memory.runs:
@@ -4953,8 +5109,6 @@ class Agent:
 
         # 3. Add history to run_messages
         if self.add_history_to_messages:
-            from copy import deepcopy
-
             history: List[Message] = []
             if isinstance(self.memory, AgentMemory):
                 history = self.memory.get_messages_from_last_n_runs(
@@ -4965,17 +5119,15 @@ class Agent:
                     session_id=session_id,
                     last_n=self.num_history_runs,
                     skip_role=self.system_message_role,
+                    max_tokens=self.max_history_tokens,
                     # Only filter by agent_id if this is part of a team
                     agent_id=self.agent_id if self.team_session_id is not None else None,
                 )
 
             if len(history) > 0:
-                # Create a deep copy of the history messages to avoid modifying the original messages
-                history_copy = [deepcopy(msg) for msg in history]
-
-                # Tag each message as coming from history
-                for _msg in history_copy:
-                    _msg.from_history = True
+                # Tag each message as coming from history on a shallow copy, the original messages are not modified
+                # and their content, media and tool results are shared rather than copied
+                history_copy = [msg.model_copy(update={"from_history": True}) for msg in history]
 
                 log_debug(f"Adding {len(history_copy)} messages from history")
 
@@ -5239,6 +5391,86 @@ class Agent:
             # If copy fails, return as is
             return field_value
 
+    def run_copy(self, *, update: Optional[Dict[str, Any]] = None) -> Agent:
+        """Create and return a lightweight per-run copy of this Agent, optionally updating fields.
+
+        Unlike deep_copy, the Agent definition (model client, tools, instructions, knowledge, storage) is
+        shared with this Agent. Only the state that a run mutates (session state, memory, tool bindings) is copied.
+
+        Args:
+            update (Optional[Dict[str, Any]]): Optional dictionary of fields for the new Agent.
+
+        Returns:
+            Agent: A new Agent instance.
+        """
+        from dataclasses import fields
+
+        fields_for_new_agent: Dict[str, Any] = {}
+
+        for f in fields(self):
+            field_value = getattr(self, f.name)
+            if field_value is not None:
+                fields_for_new_agent[f.name] = self._run_copy_field(f.name, field_value)
+
+        # Update fields if provided
+        if update:
+            fields_for_new_agent.update(update)
+        # Create a new Agent
+        new_agent = self.__class__(**fields_for_new_agent)
+        log_debug(f"Created new {self.__class__.__name__} from template")
+        return new_agent
+
+    def _run_copy_field(self, field_name: str, field_value: Any) -> Any:
+        """Helper method to copy a field for a per-run copy of the Agent."""
+        from copy import copy
+
+        # Per-run state is copied so concurrent runs do not see each other's updates
+        if field_name in (
+            "session_state",
+            "team_session_state",
+            "workflow_session_state",
+            "team_data",
+            "memory",
+            "context",
+            "extra_data",
+        ):
+            return self._deep_copy_field(field_name, field_value)
+
+        # Member agents get their own per-run copies
+        elif field_name == "reasoning_agent":
+            return field_value.run_copy()
+        elif field_name == "team":
+            return [member.run_copy() for member in field_value]
+
+        # Models are shallow copied, so the underlying client is shared
+        elif field_name in ("model", "reasoning_model", "parser_model", "output_model"):
+            try:
+                return copy(field_value)
+            except Exception as e:
+                log_warning(f"Failed to copy field: {field_name} - {e}")
+                return field_value
+
+        # Functions are bound to the Agent when a run starts, so each copy gets its own Function objects
+        elif field_name == "tools":
+            return [self._run_copy_tool(tool) for tool in field_value]
+
+        # Everything else is part of the Agent definition and is shared
+        return field_value
+
+    @staticmethod
+    def _run_copy_tool(tool: Union[Toolkit, Callable, Function, Dict]) -> Union[Toolkit, Callable, Function, Dict]:
+        from copy import copy
+
+        if isinstance(tool, Function):
+            return tool.model_copy()
+        elif isinstance(tool, Toolkit):
+            new_toolkit = copy(tool)
+            new_toolkit.functions = tool.functions.__class__(
+                (name, func.model_copy()) for name, func in tool.functions.items()
+            )
+            return new_toolkit
+        return tool
+
     def get_transfer_function(self, member_agent: Agent, index: int, session_id: Optional[str] = None) -> Function:
         def _transfer_task_to_agent(
             task_description: str, expected_output: str, additional_information: Optional[str] = None
@@ -6491,6 +6723,8 @@ class Agent:
                 model_response_event=model_response_event,
             )
 
+        self._update_run_response_from_stream(run_response, model_response)
+
         if stream_intermediate_steps:
             yield self._handle_event(create_output_model_response_completed_event(run_response), run_response)
 
@@ -6539,6 +6773,8 @@ class Agent:
             ):
                 yield event
 
+        self._update_run_response_from_stream(run_response, model_response)
+
         if stream_intermediate_steps:
             yield self._handle_event(create_output_model_response_completed_event(run_response), run_response)
 
@@ -6599,7 +6835,10 @@ class Agent:
         else:
             update_user_memory_function = update_user_memory  # type: ignore
 
-        return Function.from_callable(update_user_memory_function, name="update_user_memory")
+        update_user_memory_tool = Function.from_callable(update_user_memory_function, name="update_user_memory")
+        # Memory updates modify shared state, so they are not run concurrently with other tool calls
+        update_user_memory_tool.thread_safe = False
+        return update_user_memory_tool
 
     def get_chat_history_function(self, session_id: str) -> Callable:
         def get_chat_history(num_chats: Optional[int] = None) -> str:
@@ -390,7 +390,7 @@ def get_async_router(
                 )
             elif workflow:
                 if isinstance(workflow, Workflow):
-                    workflow_instance = workflow.deep_copy(update={"workflow_id": workflow_id})
+                    workflow_instance = workflow.run_copy(update={"workflow_id": workflow_id})
                     workflow_instance.user_id = user_id
                     workflow_instance.session_name = None
 
@@ -441,7 +441,7 @@ def get_async_router(
                 return team_run_response.to_dict()
             elif workflow:
                 if isinstance(workflow, Workflow):
-                    workflow_instance = workflow.deep_copy(update={"workflow_id": workflow_id})
+                    workflow_instance = workflow.run_copy(update={"workflow_id": workflow_id})
                     workflow_instance.user_id = user_id
                     workflow_instance.session_name = None
                     if isinstance(workflow_input, dict):
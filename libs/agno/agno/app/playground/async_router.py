@@ -10,9 +10,7 @@ from agno.agent.agent import Agent, RunResponse
 from agno.app.playground.operator import (
     format_tools,
     get_agent_by_id,
-    get_session_title,
-    get_session_title_from_team_session,
-    get_session_title_from_workflow_session,
+    get_session_title_from_list_item,
     get_team_by_id,
     get_workflow_by_id,
 )
@@ -39,9 +37,9 @@ from agno.memory.v2 import Memory
 from agno.run.response import RunResponseErrorEvent, RunResponseEvent
 from agno.run.team import RunResponseErrorEvent as TeamRunResponseErrorEvent
 from agno.run.v2.workflow import WorkflowErrorEvent
+from agno.storage.base import FIRST_RUN_FIELD, run_in_storage_executor
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
-from agno.storage.session.workflow import WorkflowSession
 from agno.team.team import Team
 from agno.utils.log import logger
 from agno.workflow.v2.workflow import Workflow as WorkflowV2
@@ -519,14 +517,15 @@ def get_async_playground_router(
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
         agent_sessions: List[AgentSessionsResponse] = []
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=user_id, entity_id=agent_id)  # type: ignore
-        for session in all_agent_sessions:
-            title = get_session_title(session)
+        session_page = await agent.storage.alist_sessions(
+            user_id=user_id, entity_id=agent_id, limit=None, fields=[FIRST_RUN_FIELD]
+        )
+        for session in session_page.sessions:
             agent_sessions.append(
                 AgentSessionsResponse(
-                    title=title,
+                    title=get_session_title_from_list_item(session, mode="agent"),
                     session_id=session.session_id,
-                    session_name=session.session_data.get("session_name") if session.session_data else None,
+                    session_name=session.session_name,
                     created_at=session.created_at,
                 )
             )
@@ -542,7 +541,7 @@ def get_async_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
-        agent_session: Optional[AgentSession] = agent.storage.read(session_id, user_id)  # type: ignore
+        agent_session: Optional[AgentSession] = await agent.storage.aread(session_id, user_id)  # type: ignore
         if agent_session is None:
             return JSONResponse(status_code=404, content="Session not found.")
 
@@ -580,11 +579,10 @@ def get_async_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=body.user_id)  # type: ignore
-        for session in all_agent_sessions:
-            if session.session_id == session_id:
-                agent.rename_session(body.name, session_id=session_id)
-                return JSONResponse(content={"message": f"successfully renamed session {session.session_id}"})
+        session_ids = await agent.storage.aget_all_session_ids(user_id=body.user_id)
+        if session_id in session_ids:
+            await run_in_storage_executor(agent.rename_session, body.name, session_id=session_id)
+            return JSONResponse(content={"message": f"successfully renamed session {session_id}"})
 
         return JSONResponse(status_code=404, content="Session not found.")
 
@@ -597,11 +595,10 @@ def get_async_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=user_id, entity_id=agent_id)  # type: ignore
-        for session in all_agent_sessions:
-            if session.session_id == session_id:
-                agent.delete_session(session_id)
-                return JSONResponse(content={"message": f"successfully deleted session {session_id}"})
+        session_ids = await agent.storage.aget_all_session_ids(user_id=user_id, entity_id=agent_id)
+        if session_id in session_ids:
+            await run_in_storage_executor(agent.delete_session, session_id)
+            return JSONResponse(content={"message": f"successfully deleted session {session_id}"})
 
         return JSONResponse(status_code=404, content="Session not found.")
 
@@ -615,7 +612,7 @@ def get_async_playground_router(
             return JSONResponse(status_code=404, content="Agent does not have memory enabled.")
 
         if isinstance(agent.memory, Memory):
-            memories = agent.memory.get_user_memories(user_id=user_id)
+            memories = await run_in_storage_executor(agent.memory.get_user_memories, user_id=user_id)
             return [
                 MemoryResponse(memory=memory.memory, topics=memory.topics, last_updated=memory.last_updated)
                 for memory in memories
@@ -674,7 +671,7 @@ def get_async_playground_router(
 
         # Create a new instance of this workflow
         if isinstance(workflow, Workflow):
-            new_workflow_instance = workflow.deep_copy(
+            new_workflow_instance = workflow.run_copy(
                 update={"workflow_id": workflow_id, "session_id": body.session_id}
             )
             new_workflow_instance.user_id = body.user_id
@@ -735,21 +732,20 @@ def get_async_playground_router(
 
         # Retrieve all sessions for the given workflow and user
         try:
-            all_workflow_sessions: List[WorkflowSession] = workflow.storage.get_all_sessions(
-                user_id=user_id, entity_id=workflow_id
-            )  # type: ignore
+            session_page = await workflow.storage.alist_sessions(
+                user_id=user_id, entity_id=workflow_id, limit=None, fields=[FIRST_RUN_FIELD]
+            )
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving sessions: {str(e)}")
 
         # Return the sessions
         workflow_sessions: List[WorkflowSessionResponse] = []
-        for session in all_workflow_sessions:
-            title = get_session_title_from_workflow_session(session)
+        for session in session_page.sessions:
             workflow_sessions.append(
                 {
-                    "title": title,
+                    "title": get_session_title_from_list_item(session, mode="workflow"),
                     "session_id": session.session_id,
-                    "session_name": session.session_data.get("session_name") if session.session_data else None,
+                    "session_name": session.session_name,
                     "created_at": session.created_at,
                 }  # type: ignore
             )
@@ -770,7 +766,7 @@ def get_async_playground_router(
 
         # Retrieve the specific session
         try:
-            workflow_session = workflow.storage.read(session_id, user_id)  # type: ignore
+            workflow_session = await workflow.storage.aread(session_id, user_id)  # type: ignore
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving session: {str(e)}")
 
@@ -789,7 +785,7 @@ def get_async_playground_router(
         if workflow is None:
             raise HTTPException(status_code=404, detail="Workflow not found")
         workflow.session_id = session_id
-        workflow.rename_session(body.name)
+        await run_in_storage_executor(workflow.rename_session, body.name)
         return JSONResponse(content={"message": f"successfully renamed workflow {workflow.name}"})
 
     @playground_router.delete("/workflows/{workflow_id}/sessions/{session_id}")
@@ -798,7 +794,7 @@ def get_async_playground_router(
         if workflow is None:
             raise HTTPException(status_code=404, detail="Workflow not found")
 
-        workflow.delete_session(session_id)
+        await run_in_storage_executor(workflow.delete_session, session_id)
         return JSONResponse(content={"message": f"successfully deleted workflow {workflow.name}"})
 
     @playground_router.get("/teams")
@@ -932,18 +928,19 @@ def get_async_playground_router(
             raise HTTPException(status_code=404, detail="Team does not have storage enabled")
 
         try:
-            all_team_sessions: List[TeamSession] = team.storage.get_all_sessions(user_id=user_id, entity_id=team_id)  # type: ignore
+            session_page = await team.storage.alist_sessions(
+                user_id=user_id, entity_id=team_id, limit=None, fields=[FIRST_RUN_FIELD]
+            )
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving sessions: {str(e)}")
 
         team_sessions: List[TeamSessionResponse] = []
-        for session in all_team_sessions:
-            title = get_session_title_from_team_session(session)
+        for session in session_page.sessions:
             team_sessions.append(
                 TeamSessionResponse(
-                    title=title,
+                    title=get_session_title_from_list_item(session, mode="team"),
                     session_id=session.session_id,
-                    session_name=session.session_data.get("session_name") if session.session_data else None,
+                    session_name=session.session_name,
                     created_at=session.created_at,
                 )
             )
@@ -959,7 +956,7 @@ def get_async_playground_router(
             raise HTTPException(status_code=404, detail="Team does not have storage enabled")
 
         try:
-            team_session: Optional[TeamSession] = team.storage.read(session_id, user_id)  # type: ignore
+            team_session: Optional[TeamSession] = await team.storage.aread(session_id, user_id)  # type: ignore
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving session: {str(e)}")
 
@@ -1004,11 +1001,10 @@ def get_async_playground_router(
         if team.storage is None:
             raise HTTPException(status_code=404, detail="Team does not have storage enabled")
 
-        all_team_sessions: List[TeamSession] = team.storage.get_all_sessions(user_id=body.user_id, entity_id=team_id)  # type: ignore
-        for session in all_team_sessions:
-            if session.session_id == session_id:
-                team.rename_session(body.name, session_id=session_id)
-                return JSONResponse(content={"message": f"successfully renamed team session {body.name}"})
+        session_ids = await team.storage.aget_all_session_ids(user_id=body.user_id, entity_id=team_id)
+        if session_id in session_ids:
+            await run_in_storage_executor(team.rename_session, body.name, session_id=session_id)
+            return JSONResponse(content={"message": f"successfully renamed team session {body.name}"})
 
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -1021,11 +1017,10 @@ def get_async_playground_router(
         if team.storage is None:
             raise HTTPException(status_code=404, detail="Team does not have storage enabled")
 
-        all_team_sessions: List[TeamSession] = team.storage.get_all_sessions(user_id=user_id, entity_id=team_id)  # type: ignore
-        for session in all_team_sessions:
-            if session.session_id == session_id:
-                team.delete_session(session_id)
-                return JSONResponse(content={"message": f"successfully deleted team session {session_id}"})
+        session_ids = await team.storage.aget_all_session_ids(user_id=user_id, entity_id=team_id)
+        if session_id in session_ids:
+            await run_in_storage_executor(team.delete_session, session_id)
+            return JSONResponse(content={"message": f"successfully deleted team session {session_id}"})
 
         raise HTTPException(status_code=404, detail="Session not found")
 
@@ -1039,7 +1034,7 @@ def get_async_playground_router(
             return JSONResponse(status_code=404, content="Team does not have memory enabled.")
 
         if isinstance(team.memory, Memory):
-            memories = team.memory.get_user_memories(user_id=user_id)
+            memories = await run_in_storage_executor(team.memory.get_user_memories, user_id=user_id)
             return [
                 MemoryResponse(memory=memory.memory, topics=memory.topics, last_updated=memory.last_updated)
                 for memory in memories
@@ -3,6 +3,7 @@ from typing import Any, List, Optional, Union, cast
 from agno.agent.agent import Agent, AgentRun, Function, Toolkit
 from agno.run.response import RunResponse
 from agno.run.team import TeamRunResponse
+from agno.storage.base import SessionListItem
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
@@ -181,3 +182,18 @@ def get_session_title_from_team_session(team_session: TeamSession) -> str:
             except Exception as e:
                 logger.error(f"Error parsing chat: {e}")
     return "Unnamed session"
+
+
+def get_session_title_from_list_item(item: SessionListItem, mode: str = "agent") -> str:
+    """Get the title of a listed session, using its session name or the first run of the session."""
+    session_data = {"session_name": item.session_name} if item.session_name is not None else None
+    memory = {"runs": [item.first_run]} if item.first_run is not None else None
+    if mode == "team":
+        return get_session_title_from_team_session(
+            TeamSession(session_id=item.session_id, session_data=session_data, memory=memory)
+        )
+    elif mode == "workflow":
+        return get_session_title_from_workflow_session(
+            WorkflowSession(session_id=item.session_id, session_data=session_data, memory=memory)
+        )
+    return get_session_title(AgentSession(session_id=item.session_id, session_data=session_data, memory=memory))
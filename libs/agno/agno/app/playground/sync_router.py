@@ -10,9 +10,7 @@ from agno.agent.agent import Agent, RunResponse
 from agno.app.playground.operator import (
     format_tools,
     get_agent_by_id,
-    get_session_title,
-    get_session_title_from_team_session,
-    get_session_title_from_workflow_session,
+    get_session_title_from_list_item,
     get_team_by_id,
     get_workflow_by_id,
 )
@@ -39,6 +37,7 @@ from agno.memory.v2 import Memory
 from agno.run.response import RunResponseErrorEvent, RunResponseEvent
 from agno.run.team import RunResponseErrorEvent as TeamRunResponseErrorEvent
 from agno.run.v2.workflow import WorkflowErrorEvent
+from agno.storage.base import FIRST_RUN_FIELD
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
@@ -519,14 +518,15 @@ def get_sync_playground_router(
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
         agent_sessions: List[AgentSessionsResponse] = []
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=user_id, entity_id=agent_id)  # type: ignore
-        for session in all_agent_sessions:
-            title = get_session_title(session)
+        session_page = agent.storage.list_sessions(
+            user_id=user_id, entity_id=agent_id, limit=None, fields=[FIRST_RUN_FIELD]
+        )
+        for session in session_page.sessions:
             agent_sessions.append(
                 AgentSessionsResponse(
-                    title=title,
+                    title=get_session_title_from_list_item(session, mode="agent"),
                     session_id=session.session_id,
-                    session_name=session.session_data.get("session_name") if session.session_data else None,
+                    session_name=session.session_name,
                     created_at=session.created_at,
                 )
             )
@@ -668,7 +668,7 @@ def get_sync_playground_router(
 
         # Create a new instance of this workflow
         if isinstance(workflow, Workflow):
-            new_workflow_instance = workflow.deep_copy(
+            new_workflow_instance = workflow.run_copy(
                 update={"workflow_id": workflow_id, "session_id": body.session_id}
             )
             new_workflow_instance.user_id = body.user_id
@@ -727,21 +727,20 @@ def get_sync_playground_router(
 
         # Retrieve all sessions for the given workflow and user
         try:
-            all_workflow_sessions: List[WorkflowSession] = workflow.storage.get_all_sessions(
-                user_id=user_id, entity_id=workflow_id
-            )  # type: ignore
+            session_page = workflow.storage.list_sessions(
+                user_id=user_id, entity_id=workflow_id, limit=None, fields=[FIRST_RUN_FIELD]
+            )
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving sessions: {str(e)}")
 
         # Return the sessions
         workflow_sessions: List[WorkflowSessionResponse] = []
-        for session in all_workflow_sessions:
-            title = get_session_title_from_workflow_session(session)
+        for session in session_page.sessions:
             workflow_sessions.append(
                 {
-                    "title": title,
+                    "title": get_session_title_from_list_item(session, mode="workflow"),
                     "session_id": session.session_id,
-                    "session_name": session.session_data.get("session_name") if session.session_data else None,
+                    "session_name": session.session_name,
                     "created_at": session.created_at,
                 }  # type: ignore
             )
@@ -927,18 +926,19 @@ def get_sync_playground_router(
             raise HTTPException(status_code=404, detail="Team does not have storage enabled")
 
         try:
-            all_team_sessions: List[TeamSession] = team.storage.get_all_sessions(user_id=user_id, entity_id=team_id)  # type: ignore
+            session_page = team.storage.list_sessions(
+                user_id=user_id, entity_id=team_id, limit=None, fields=[FIRST_RUN_FIELD]
+            )
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving sessions: {str(e)}")
 
         team_sessions: List[TeamSessionResponse] = []
-        for session in all_team_sessions:
-            title = get_session_title_from_team_session(session)
+        for session in session_page.sessions:
             team_sessions.append(
                 TeamSessionResponse(
-                    title=title,
+                    title=get_session_title_from_list_item(session, mode="team"),
                     session_id=session.session_id,
-                    session_name=session.session_data.get("session_name") if session.session_data else None,
+                    session_name=session.session_name,
                     created_at=session.created_at,
                 )
             )
@@ -1,7 +1,9 @@
+import asyncio
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 from agno.embedder import Embedder
+from agno.utils.log import logger
 
 
 @dataclass
@@ -16,6 +18,8 @@ class Document:
     embedding: Optional[List[float]] = None
     usage: Optional[Dict[str, Any]] = None
     reranking_score: Optional[float] = None
+    # The embedder that computed `embedding`, documents embedded by the same embedder are not embedded again
+    embedded_with: Optional[Embedder] = field(default=None, repr=False, compare=False)
 
     def embed(self, embedder: Optional[Embedder] = None) -> None:
         """Embed the document using the provided embedder"""
@@ -25,6 +29,89 @@ class Document:
             raise ValueError("No embedder provided")
 
         self.embedding, self.usage = _embedder.get_embedding_and_usage(self.content)
+        self.embedded_with = _embedder
+
+    @staticmethod
+    def embed_many(
+        documents: List["Document"], embedder: Optional[Embedder] = None, batch_size: Optional[int] = None
+    ) -> None:
+        """Embed a list of documents using batched requests to the embedder.
+        Documents already embedded by the same embedder, e.g. in an ingestion pipeline, are not embedded again.
+        If a batched request fails, the documents are embedded one by one and documents that fail are left without
+        an embedding.
+        """
+        if not documents:
+            return
+
+        _embedder = embedder or documents[0].embedder
+        if _embedder is None:
+            raise ValueError("No embedder provided")
+
+        documents = [doc for doc in documents if doc.embedding is None or doc.embedded_with is not _embedder]
+        if not documents:
+            return
+
+        try:
+            embeddings, usages = _embedder.get_embeddings_batch_and_usage(
+                [doc.content for doc in documents], batch_size=batch_size
+            )
+        except Exception as e:
+            logger.warning(f"Error embedding documents in batch, falling back to embedding them one by one: {e}")
+            Document._embed_each(documents, _embedder)
+            return
+        Document._set_embeddings(documents, _embedder, embeddings, usages)
+
+    @staticmethod
+    async def async_embed_many(
+        documents: List["Document"], embedder: Optional[Embedder] = None, batch_size: Optional[int] = None
+    ) -> None:
+        """Asynchronously embed a list of documents using batched requests to the embedder.
+        Documents already embedded by the same embedder, e.g. in an ingestion pipeline, are not embedded again.
+        If a batched request fails, the documents are embedded one by one and documents that fail are left without
+        an embedding.
+        """
+        if not documents:
+            return
+
+        _embedder = embedder or documents[0].embedder
+        if _embedder is None:
+            raise ValueError("No embedder provided")
+
+        documents = [doc for doc in documents if doc.embedding is None or doc.embedded_with is not _embedder]
+        if not documents:
+            return
+
+        try:
+            embeddings, usages = await _embedder.async_get_embeddings_batch_and_usage(
+                [doc.content for doc in documents], batch_size=batch_size
+            )
+        except Exception as e:
+            logger.warning(f"Error embedding documents in batch, falling back to embedding them one by one: {e}")
+            await asyncio.to_thread(Document._embed_each, documents, _embedder)
+            return
+        Document._set_embeddings(documents, _embedder, embeddings, usages)
+
+    @staticmethod
+    def _embed_each(documents: List["Document"], embedder: Embedder) -> None:
+        """Embed documents one request at a time, so one failing document does not fail the others"""
+        for doc in documents:
+            doc.embedding, doc.embedded_with = None, None
+            try:
+                doc.embed(embedder=embedder)
+            except Exception as e:
+                logger.error(f"Error embedding document '{doc.name}': {e}")
+
+    @staticmethod
+    def _set_embeddings(
+        documents: List["Document"],
+        embedder: Embedder,
+        embeddings: List[List[float]],
+        usages: List[Optional[Dict[str, Any]]],
+    ) -> None:
+        if len(embeddings) != len(documents):
+            raise ValueError(f"Embedder returned {len(embeddings)} embeddings for {len(documents)} documents")
+        for doc, embedding, usage in zip(documents, embeddings, usages):
+            doc.embedding, doc.usage, doc.embedded_with = embedding, usage, embedder
 
     def to_dict(self) -> Dict[str, Any]:
         """Returns a dictionary representation of the document"""
@@ -1,8 +1,11 @@
-from typing import List
+from typing import Iterable, Iterator, List
 
 from agno.document.base import Document
 from agno.document.chunking.strategy import ChunkingStrategy
 
+# Characters a chunk may end at without splitting a word in half
+WORD_BOUNDARIES = (" ", "\n", "\r", "\t")
+
 
 class FixedSizeChunking(ChunkingStrategy):
     """Chunking strategy that splits text into fixed-size chunks with optional overlap"""
@@ -15,43 +18,85 @@ class FixedSizeChunking(ChunkingStrategy):
         self.chunk_size = chunk_size
         self.overlap = overlap
 
+    def _get_chunk_end(self, content: str, start: int) -> int:
+        """Return the end of the chunk starting at `start`"""
+        end = min(start + self.chunk_size, len(content))
+
+        # Ensure we're not splitting a word in half: end at the last word boundary after the start of the chunk.
+        # The bounded rfind scans the content in place, without copying the chunk.
+        if end < len(content):
+            boundary = start
+            for separator in WORD_BOUNDARIES:
+                position = content.rfind(separator, boundary + 1, end + 1)
+                if position != -1:
+                    boundary = position
+            # If the entire chunk is a word, then just split it at chunk_size
+            end = boundary if boundary > start else start + self.chunk_size
+        return end
+
+    def _get_next_start(self, start: int, end: int) -> int:
+        next_start = end - self.overlap
+        # Prevent an infinite loop when the overlap reaches back to the start of the chunk
+        return next_start if next_start > start else end
+
+    def _create_chunk(self, document: Document, content: str, chunk_number: int) -> Document:
+        chunk_id = None
+        if document.id:
+            chunk_id = f"{document.id}_{chunk_number}"
+        elif document.name:
+            chunk_id = f"{document.name}_{chunk_number}"
+        return Document(
+            id=chunk_id,
+            name=document.name,
+            meta_data={**document.meta_data, "chunk": chunk_number, "chunk_size": len(content)},
+            content=content,
+        )
+
     def chunk(self, document: Document) -> List[Document]:
         """Split document into fixed-size chunks with optional overlap"""
         content = self.clean_text(document.content)
         content_length = len(content)
         chunked_documents: List[Document] = []
         chunk_number = 1
-        chunk_meta_data = document.meta_data
         start = 0
         while start + self.overlap < content_length:
-            end = min(start + self.chunk_size, content_length)
+            end = self._get_chunk_end(content, start)
+            chunked_documents.append(self._create_chunk(document, content[start:end], chunk_number))
+            chunk_number += 1
+            start = self._get_next_start(start, end)
+        return chunked_documents
 
-            # Ensure we're not splitting a word in half
-            if end < content_length:
-                while end > start and content[end] not in [" ", "\n", "\r", "\t"]:
-                    end -= 1
+    def chunk_stream(self, document: Document, texts: Iterable[str]) -> Iterator[Document]:
+        """Split a document whose content arrives in pieces into the same chunks as `chunk`.
 
-            # If the entire chunk is a word, then just split it at chunk_size
-            if end == start:
-                end = start + self.chunk_size
-
-            chunk = content[start:end]
-            meta_data = chunk_meta_data.copy()
-            meta_data["chunk"] = chunk_number
-            chunk_id = None
-            if document.id:
-                chunk_id = f"{document.id}_{chunk_number}"
-            elif document.name:
-                chunk_id = f"{document.name}_{chunk_number}"
-            meta_data["chunk_size"] = len(chunk)
-            chunked_documents.append(
-                Document(
-                    id=chunk_id,
-                    name=document.name,
-                    meta_data=meta_data,
-                    content=chunk,
-                )
-            )
+        Chunks are yielded as soon as the text following them has arrived, so at most about one chunk of
+        text is held in memory besides the current piece.
+        """
+        buffer = ""
+        pending: List[str] = []
+        pending_length = 0
+        chunk_number = 1
+        start = 0
+        for text in self.clean_text_stream(texts):
+            pending.append(text)
+            pending_length += len(text)
+            # A chunk is known once the character after its largest possible end has arrived
+            if len(buffer) - start + pending_length <= self.chunk_size:
+                continue
+            buffer = buffer[start:] + "".join(pending)
+            pending.clear()
+            pending_length = 0
+            start = 0
+            while start + self.chunk_size < len(buffer):
+                end = self._get_chunk_end(buffer, start)
+                yield self._create_chunk(document, buffer[start:end], chunk_number)
+                chunk_number += 1
+                start = self._get_next_start(start, end)
+
+        buffer = buffer[start:] + "".join(pending)
+        start = 0
+        while start + self.overlap < len(buffer):
+            end = self._get_chunk_end(buffer, start)
+            yield self._create_chunk(document, buffer[start:end], chunk_number)
             chunk_number += 1
-            start = end - self.overlap
-        return chunked_documents
+            start = self._get_next_start(start, end)
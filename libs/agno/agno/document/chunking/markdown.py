@@ -1,6 +1,6 @@
 import os
 import tempfile
-from typing import List
+from typing import List, Optional
 
 try:
     from unstructured.chunking.title import chunk_by_title  # type: ignore
@@ -10,14 +10,41 @@ except ImportError:
 
 from agno.document.base import Document
 from agno.document.chunking.strategy import ChunkingStrategy
+from agno.document.chunking.tokenizer import Tokenizer
 
 
 class MarkdownChunking(ChunkingStrategy):
     """A chunking strategy that splits markdown based on structure like headers, paragraphs and sections"""
 
-    def __init__(self, chunk_size: int = 5000, overlap: int = 0):
+    def __init__(self, chunk_size: int = 5000, overlap: int = 0, tokenizer: Optional[Tokenizer] = None):
+        """
+        Args:
+            chunk_size (int): Maximum size of a chunk, in characters or in tokens if a tokenizer is set.
+            overlap (int): Size of the text of the previous chunk added to a chunk, in characters or tokens.
+            tokenizer (Optional[Tokenizer]): Tokenizer of the embedding model, to measure chunks in tokens.
+        """
         self.chunk_size = chunk_size
         self.overlap = overlap
+        self.tokenizer = tokenizer
+
+    def _get_size(self, text: str) -> int:
+        """Size of the text in characters, or in tokens if a tokenizer is set"""
+        return len(text) if self.tokenizer is None else self.tokenizer.count_tokens(text)
+
+    def _split_section(self, section: str) -> List[str]:
+        """Split a section longer than chunk_size tokens at token boundaries"""
+        offsets = self.tokenizer.get_token_offsets(section)  # type: ignore
+        if len(offsets) <= self.chunk_size:
+            return [section]
+        starts = [0] + offsets[self.chunk_size :: self.chunk_size]
+        return [section[start:end] for start, end in zip(starts, starts[1:] + [len(section)])]
+
+    def _get_overlap(self, text: str) -> str:
+        """The last `overlap` characters or tokens of the text"""
+        if self.tokenizer is None:
+            return text[-self.overlap :]
+        offsets = self.tokenizer.get_token_offsets(text)
+        return text[offsets[-self.overlap] :] if len(offsets) > self.overlap else text
 
     def _partition_markdown_content(self, content: str) -> List[str]:
         """
@@ -69,11 +96,13 @@ class MarkdownChunking(ChunkingStrategy):
 
     def chunk(self, document: Document) -> List[Document]:
         """Split markdown document into chunks based on markdown structure"""
-        if not document.content or len(document.content) <= self.chunk_size:
+        if not document.content or self._get_size(document.content) <= self.chunk_size:
             return [document]
 
         # Split using markdown chunking logic, or fallback to paragraphs
         sections = self._partition_markdown_content(document.content)
+        if self.tokenizer is not None:
+            sections = [part for section in sections for part in self._split_section(section.strip())]
 
         chunks: List[Document] = []
         current_chunk = []
@@ -83,7 +112,7 @@ class MarkdownChunking(ChunkingStrategy):
 
         for section in sections:
             section = section.strip()
-            section_size = len(section)
+            section_size = self._get_size(section)
 
             if current_size + section_size <= self.chunk_size:
                 current_chunk.append(section)
@@ -128,7 +157,7 @@ class MarkdownChunking(ChunkingStrategy):
             for i in range(len(chunks)):
                 if i > 0:
                     # Add overlap from previous chunk
-                    prev_text = chunks[i - 1].content[-self.overlap :]
+                    prev_text = self._get_overlap(chunks[i - 1].content)
                     meta_data = chunk_meta_data.copy()
                     meta_data["chunk"] = chunks[i].meta_data["chunk"]
                     chunk_id = chunks[i].id
@@ -1,14 +1,22 @@
 import warnings
-from typing import List
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, List, Optional
 
 from agno.document.base import Document
 from agno.document.chunking.strategy import ChunkingStrategy
+from agno.document.chunking.tokenizer import Tokenizer
 
 
 class RecursiveChunking(ChunkingStrategy):
     """Chunking strategy that recursively splits text into chunks by finding natural break points"""
 
-    def __init__(self, chunk_size: int = 5000, overlap: int = 0):
+    def __init__(self, chunk_size: int = 5000, overlap: int = 0, tokenizer: Optional[Tokenizer] = None):
+        """
+        Args:
+            chunk_size (int): Maximum size of a chunk, in characters or in tokens if a tokenizer is set.
+            overlap (int): Size of the text shared by consecutive chunks, in characters or tokens.
+            tokenizer (Optional[Tokenizer]): Tokenizer of the embedding model, to measure chunks in tokens.
+        """
         # overlap must be less than chunk size
         if overlap >= chunk_size:
             raise ValueError(f"Invalid parameters: overlap ({overlap}) must be less than chunk size ({chunk_size}).")
@@ -21,43 +29,122 @@ class RecursiveChunking(ChunkingStrategy):
 
         self.chunk_size = chunk_size
         self.overlap = overlap
+        self.tokenizer = tokenizer
+
+    def _get_chunk_end(self, content: str, start: int, token_offsets: Optional[List[int]] = None) -> int:
+        """Return the end of the chunk starting at `start`, after the last natural break point in the chunk"""
+        if token_offsets is None:
+            end = min(start + self.chunk_size, len(content))
+        else:
+            # End before the token chunk_size tokens after the token the chunk starts in
+            end_token = bisect_right(token_offsets, start) - 1 + self.chunk_size
+            end = token_offsets[end_token] if end_token < len(token_offsets) else len(content)
+
+        if end < len(content):
+            # The bounded rfind scans the content in place, without copying the chunk
+            for sep in ["\n", "."]:
+                last_sep = content.rfind(sep, start, end)
+                if last_sep != -1:
+                    end = last_sep + 1
+                    break
+        return end
+
+    def _get_next_start(
+        self, content_length: int, start: int, end: int, token_offsets: Optional[List[int]] = None
+    ) -> int:
+        if token_offsets is None or self.overlap == 0:
+            new_start = end - self.overlap
+        else:
+            # Start at the first of the last `overlap` tokens before the end of the chunk
+            new_start = token_offsets[max(0, bisect_left(token_offsets, end) - self.overlap)]
+        if new_start <= start:  # Prevent infinite loop
+            new_start = min(content_length, start + max(1, self.chunk_size // 10))  # Move forward by at least 10%
+        return new_start
+
+    def _create_chunk(self, document: Document, content: str, chunk_number: int) -> Document:
+        chunk_id = None
+        if document.id:
+            chunk_id = f"{document.id}_{chunk_number}"
+        return Document(
+            id=chunk_id,
+            name=document.name,
+            meta_data={**document.meta_data, "chunk": chunk_number, "chunk_size": len(content)},
+            content=content,
+        )
 
     def chunk(self, document: Document) -> List[Document]:
         """Recursively chunk text by finding natural break points"""
-        if len(document.content) <= self.chunk_size:
+        if self.tokenizer is None:
+            if len(document.content) <= self.chunk_size:
+                return [document]
+        elif self.tokenizer.count_tokens(document.content) <= self.chunk_size:
             return [document]
 
         chunks: List[Document] = []
         start = 0
-        chunk_meta_data = document.meta_data
         chunk_number = 1
         content = self.clean_text(document.content)
+        token_offsets = self.tokenizer.get_token_offsets(content) if self.tokenizer is not None else None
 
         while start < len(content):
-            end = min(start + self.chunk_size, len(content))
-
-            if end < len(content):
-                for sep in ["\n", "."]:
-                    last_sep = content[start:end].rfind(sep)
-                    if last_sep != -1:
-                        end = start + last_sep + 1
-                        break
-
-            chunk = content[start:end]
-            meta_data = chunk_meta_data.copy()
-            meta_data["chunk"] = chunk_number
-            chunk_id = None
-            if document.id:
-                chunk_id = f"{document.id}_{chunk_number}"
+            end = self._get_chunk_end(content, start, token_offsets)
+            chunks.append(self._create_chunk(document, content[start:end], chunk_number))
             chunk_number += 1
-            meta_data["chunk_size"] = len(chunk)
-            chunks.append(Document(id=chunk_id, name=document.name, meta_data=meta_data, content=chunk))
-
-            new_start = end - self.overlap
-            if new_start <= start:  # Prevent infinite loop
-                new_start = min(
-                    len(content), start + max(1, self.chunk_size // 10)
-                )  # Move forward by at least 10% of chunk size
-            start = new_start
+            start = self._get_next_start(len(content), start, end, token_offsets)
 
         return chunks
+
+    def chunk_stream(self, document: Document, texts: Iterable[str]) -> Iterator[Document]:
+        """Recursively chunk a document whose content arrives in pieces into the same chunks as `chunk`.
+
+        Chunks are yielded as soon as the text following them has arrived, so at most about one chunk of
+        text is held in memory besides the current piece. Chunks measured in tokens are split from the joined content.
+        """
+        if self.tokenizer is not None:
+            yield from super().chunk_stream(document, texts)
+            return
+
+        # Content of at most chunk_size characters is returned as a single, uncleaned document
+        raw_texts: List[str] = []
+        raw_length = 0
+
+        def read(texts: Iterable[str]) -> Iterator[str]:
+            nonlocal raw_length
+            for text in texts:
+                if raw_length <= self.chunk_size:
+                    raw_texts.append(text)
+                    raw_length += len(text)
+                yield text
+
+        buffer = ""
+        pending: List[str] = []
+        pending_length = 0
+        chunk_number = 1
+        start = 0
+        for text in self.clean_text_stream(read(texts)):
+            pending.append(text)
+            pending_length += len(text)
+            # A chunk is known once the character after its largest possible end has arrived
+            if len(buffer) - start + pending_length <= self.chunk_size:
+                continue
+            buffer = buffer[start:] + "".join(pending)
+            pending.clear()
+            pending_length = 0
+            start = 0
+            while start + self.chunk_size < len(buffer):
+                end = self._get_chunk_end(buffer, start)
+                yield self._create_chunk(document, buffer[start:end], chunk_number)
+                chunk_number += 1
+                start = self._get_next_start(len(buffer), start, end)
+
+        if raw_length <= self.chunk_size:
+            yield Document(id=document.id, name=document.name, meta_data=document.meta_data, content="".join(raw_texts))
+            return
+
+        buffer = buffer[start:] + "".join(pending)
+        start = 0
+        while start < len(buffer):
+            end = self._get_chunk_end(buffer, start)
+            yield self._create_chunk(document, buffer[start:end], chunk_number)
+            chunk_number += 1
+            start = self._get_next_start(len(buffer), start, end)
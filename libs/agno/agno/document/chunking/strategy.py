@@ -1,8 +1,12 @@
+import re
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterable, Iterator, List
 
 from agno.document.base import Document
 
+# Runs of whitespace, collapsed into a single space by `clean_text`
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
 
 class ChunkingStrategy(ABC):
     """Base class for chunking strategies"""
@@ -11,21 +15,28 @@ class ChunkingStrategy(ABC):
     def chunk(self, document: Document) -> List[Document]:
         raise NotImplementedError
 
+    def chunk_stream(self, document: Document, texts: Iterable[str]) -> Iterator[Document]:
+        """Chunk a document whose content arrives in pieces, e.g. blocks of a large file read by a reader.
+
+        `document` provides the id, name and meta_data of the chunks, its content is ignored.
+        Strategies that can chunk incrementally override this, the default chunks the joined content.
+        """
+        yield from self.chunk(
+            Document(id=document.id, name=document.name, meta_data=document.meta_data, content="".join(texts))
+        )
+
     def clean_text(self, text: str) -> str:
-        """Clean the text by replacing multiple newlines with a single newline"""
-        import re
-
-        # Replace multiple newlines with a single newline
-        cleaned_text = re.sub(r"\n+", "\n", text)
-        # Replace multiple spaces with a single space
-        cleaned_text = re.sub(r"\s+", " ", cleaned_text)
-        # Replace multiple tabs with a single tab
-        cleaned_text = re.sub(r"\t+", "\t", cleaned_text)
-        # Replace multiple carriage returns with a single carriage return
-        cleaned_text = re.sub(r"\r+", "\r", cleaned_text)
-        # Replace multiple form feeds with a single form feed
-        cleaned_text = re.sub(r"\f+", "\f", cleaned_text)
-        # Replace multiple vertical tabs with a single vertical tab
-        cleaned_text = re.sub(r"\v+", "\v", cleaned_text)
-
-        return cleaned_text
+        """Clean the text by replacing runs of whitespace (newlines, spaces, tabs, ...) with a single space"""
+        return WHITESPACE_PATTERN.sub(" ", text)
+
+    def clean_text_stream(self, texts: Iterable[str]) -> Iterator[str]:
+        """Clean pieces of text, so that joining the cleaned pieces gives the cleaned text of the joined pieces"""
+        ends_with_space = False
+        for text in texts:
+            cleaned_text = self.clean_text(text)
+            # A run of whitespace split across two pieces collapses into a single space
+            if ends_with_space and cleaned_text.startswith(" "):
+                cleaned_text = cleaned_text[1:]
+            if cleaned_text:
+                ends_with_space = cleaned_text.endswith(" ")
+                yield cleaned_text
@@ -0,0 +1,87 @@
+from typing import List, Optional
+
+from agno.document.base import Document
+from agno.document.chunking.strategy import ChunkingStrategy
+from agno.document.chunking.tokenizer import TiktokenTokenizer, Tokenizer
+from agno.embedder.base import Embedder
+from agno.utils.log import log_warning
+
+DEFAULT_CHUNK_TOKENS = 512
+
+
+def get_chunk_tokens(chunk_size: Optional[int], embedder: Optional[Embedder]) -> int:
+    """Return the number of tokens per chunk, at most the number of tokens the embedder embeds per text"""
+    max_tokens = embedder.max_tokens if embedder is not None else None
+    if chunk_size is None:
+        return max_tokens or DEFAULT_CHUNK_TOKENS
+    if max_tokens is not None and chunk_size > max_tokens:
+        log_warning(
+            f"Chunk size ({chunk_size} tokens) exceeds the embedder limit ({max_tokens} tokens), using {max_tokens}."
+        )
+        return max_tokens
+    return chunk_size
+
+
+class TokenChunking(ChunkingStrategy):
+    """Chunking strategy that splits text into chunks of a fixed number of tokens with optional overlap in tokens.
+
+    Chunks are cut at token boundaries of the original text, so every chunk embeds without truncation.
+    """
+
+    def __init__(
+        self,
+        chunk_size: Optional[int] = None,
+        overlap: int = 0,
+        tokenizer: Optional[Tokenizer] = None,
+        embedder: Optional[Embedder] = None,
+    ):
+        """
+        Args:
+            chunk_size (Optional[int]): Tokens per chunk. Defaults to the token limit of the embedder, or 512.
+            overlap (int): Tokens shared by consecutive chunks.
+            tokenizer (Optional[Tokenizer]): Tokenizer of the embedding model. Defaults to tiktoken `cl100k_base`.
+            embedder (Optional[Embedder]): Embedder whose `max_tokens` limits the chunk size.
+        """
+        chunk_size = get_chunk_tokens(chunk_size, embedder)
+        # overlap must be less than chunk size
+        if overlap >= chunk_size:
+            raise ValueError(f"Invalid parameters: overlap ({overlap}) must be less than chunk size ({chunk_size}).")
+
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self.tokenizer: Tokenizer = tokenizer or TiktokenTokenizer()
+
+    def chunk(self, document: Document) -> List[Document]:
+        """Split document into chunks of `chunk_size` tokens"""
+        content = self.clean_text(document.content)
+        offsets = self.tokenizer.get_token_offsets(content)
+        chunked_documents: List[Document] = []
+        chunk_number = 1
+        start = 0
+        while start < len(offsets):
+            end = start + self.chunk_size
+            chunk_start = offsets[start] if start > 0 else 0
+            chunk = content[chunk_start : offsets[end] if end < len(offsets) else len(content)]
+            chunk_id = None
+            if document.id:
+                chunk_id = f"{document.id}_{chunk_number}"
+            elif document.name:
+                chunk_id = f"{document.name}_{chunk_number}"
+            chunked_documents.append(
+                Document(
+                    id=chunk_id,
+                    name=document.name,
+                    meta_data={
+                        **document.meta_data,
+                        "chunk": chunk_number,
+                        "chunk_size": len(chunk),
+                        "chunk_tokens": min(end, len(offsets)) - start,
+                    },
+                    content=chunk,
+                )
+            )
+            chunk_number += 1
+            if end >= len(offsets):
+                break
+            start = end - self.overlap
+        return chunked_documents
@@ -0,0 +1,67 @@
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, List
+
+
+@lru_cache(maxsize=None)
+def _get_tiktoken_encoding(encoding_name: str) -> Any:
+    try:
+        import tiktoken
+    except ImportError:
+        raise ImportError("`tiktoken` not installed. Please install it using `pip install tiktoken`")
+
+    return tiktoken.get_encoding(encoding_name)
+
+
+@lru_cache(maxsize=None)
+def _get_huggingface_tokenizer(model_id: str) -> Any:
+    try:
+        from tokenizers import Tokenizer as HFTokenizer  # type: ignore
+    except ImportError:
+        raise ImportError("`tokenizers` not installed. Please install it using `pip install tokenizers`")
+
+    tokenizer = HFTokenizer.from_pretrained(model_id)
+    # Count every token of a text, not just the tokens the model would embed
+    tokenizer.no_truncation()
+    tokenizer.no_padding()
+    return tokenizer
+
+
+class Tokenizer(ABC):
+    """Base class for the tokenizers used to measure chunks in tokens"""
+
+    @abstractmethod
+    def get_token_offsets(self, text: str) -> List[int]:
+        """Return the offset in `text` of the first character of each token"""
+        raise NotImplementedError
+
+    def count_tokens(self, text: str) -> int:
+        return len(self.get_token_offsets(text))
+
+
+class TiktokenTokenizer(Tokenizer):
+    """Tokenizer using a tiktoken encoding, e.g. the encoding of the OpenAI embedding models"""
+
+    def __init__(self, encoding_name: str = "cl100k_base"):
+        self.encoding_name = encoding_name
+
+    def get_token_offsets(self, text: str) -> List[int]:
+        # Encodings are loaded once per process and shared by all tokenizers
+        encoding = _get_tiktoken_encoding(self.encoding_name)
+        tokens = encoding.encode(text, disallowed_special=())
+        return encoding.decode_with_offsets(tokens)[1]
+
+    def count_tokens(self, text: str) -> int:
+        return len(_get_tiktoken_encoding(self.encoding_name).encode(text, disallowed_special=()))
+
+
+class HuggingfaceTokenizer(Tokenizer):
+    """Tokenizer using the fast tokenizer of a model on the Hugging Face Hub, e.g. a sentence transformer"""
+
+    def __init__(self, model_id: str = "sentence-transformers/all-MiniLM-L6-v2"):
+        self.model_id = model_id
+
+    def get_token_offsets(self, text: str) -> List[int]:
+        # Tokenizers are loaded once per process and shared by all tokenizers
+        encoding = _get_huggingface_tokenizer(self.model_id).encode(text, add_special_tokens=False)
+        return [start for start, _ in encoding.offsets]
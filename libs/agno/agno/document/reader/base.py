@@ -1,6 +1,6 @@
 import asyncio
 from dataclasses import dataclass, field
-from typing import Any, List, Optional
+from typing import Any, Iterable, List, Optional
 
 from agno.document.base import Document
 from agno.document.chunking.fixed import FixedSizeChunking
@@ -27,6 +27,14 @@ class Reader:
             self.chunking_strategy = FixedSizeChunking(chunk_size=self.chunk_size)
         return self.chunking_strategy.chunk(document)  # type: ignore
 
+    def chunk_document_stream(self, document: Document, texts: Iterable[str]) -> List[Document]:
+        """Chunk a document whose content is read in pieces, without holding the whole content in memory
+        if the chunking strategy supports streaming.
+        """
+        if self.chunking_strategy is None:
+            self.chunking_strategy = FixedSizeChunking(chunk_size=self.chunk_size)
+        return list(self.chunking_strategy.chunk_stream(document, texts))
+
     async def chunk_documents_async(self, documents: List[Document]) -> List[Document]:
         """
         Asynchronously chunk a list of documents using the instance's chunk_document method.
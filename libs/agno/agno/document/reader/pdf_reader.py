@@ -1,7 +1,17 @@
 import asyncio
+import atexit
+import os
 import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from io import BytesIO
+from math import ceil
+from os import cpu_count
 from pathlib import Path
-from typing import IO, Any, List, Optional, Tuple, Union
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from typing import IO, Any, Deque, Dict, Iterator, List, Optional, Tuple, Union
 from uuid import uuid4
 
 from agno.document.base import Document
@@ -19,6 +29,68 @@ except ImportError:
 PAGE_START_NUMBERING_FORMAT_DEFAULT = "<start page {page_nr}>"
 PAGE_END_NUMBERING_FORMAT_DEFAULT = "<end page {page_nr}>"
 PAGE_NUMBERING_CORRECTNESS_RATIO_FOR_REMOVAL = 0.4
+# Page ranges each worker gets per file in parallel mode, more ranges balance pages that are slow to parse
+PAGE_RANGES_PER_WORKER = 4
+
+# Process pools shared by the readers in parallel mode, keyed by the number of workers
+_process_pools: Dict[int, ProcessPoolExecutor] = {}
+_process_pools_lock = Lock()
+
+
+def _get_process_pool(workers: int) -> ProcessPoolExecutor:
+    """Get the shared process pool with the given number of workers, creating it on first use"""
+    with _process_pools_lock:
+        pool = _process_pools.get(workers)
+        if pool is None:
+            pool = ProcessPoolExecutor(max_workers=workers)
+            _process_pools[workers] = pool
+        return pool
+
+
+@atexit.register
+def _shutdown_process_pools() -> None:
+    """Shut down the shared process pools at interpreter exit"""
+    with _process_pools_lock:
+        pools = list(_process_pools.values())
+        _process_pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=True)
+
+
+@contextmanager
+def _pdf_file(pdf_source: Union[str, bytes]) -> Iterator[str]:
+    """Yield the path worker processes open a PDF from. The bytes of a PDF read from a stream or URL are written
+    to a temporary file once, instead of being sent to the workers with every page range.
+    """
+    if isinstance(pdf_source, str):
+        yield pdf_source
+        return
+    with NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
+        temp_file.write(pdf_source)
+    try:
+        yield temp_file.name
+    finally:
+        try:
+            os.unlink(temp_file.name)
+        except OSError:
+            pass
+
+
+def _extract_page_range(
+    pdf_path: str, password: Optional[str], start: int, end: int, read_images: bool
+) -> List[Tuple[str, str]]:
+    """Extract the text, and the OCR text of the images if read_images, of the pages in [start, end) of a PDF.
+    Runs in a worker process, so the PDF is opened from its path instead of sharing a reader.
+    """
+    doc_reader = DocumentReader(pdf_path)
+    if doc_reader.is_encrypted and password:
+        doc_reader.decrypt(password)
+
+    pages: List[Tuple[str, str]] = []
+    for page_index in range(start, end):
+        page = doc_reader.pages[page_index]
+        pages.append((page.extract_text(), _ocr_reader(page) if read_images else ""))
+    return pages
 
 
 def _ocr_reader(page: Any) -> str:
@@ -178,8 +250,17 @@ class BasePDFReader(Reader):
         page_start_numbering_format: Optional[str] = None,
         page_end_numbering_format: Optional[str] = None,
         password: Optional[str] = None,
+        parallel: Optional[str] = None,
+        workers: Optional[int] = None,
         **kwargs,
     ):
+        """
+        Args:
+            parallel (Optional[str]): Set to "process" to extract the pages of a PDF in a pool of worker processes.
+            workers (Optional[int]): Number of worker processes in parallel mode. Defaults to the number of CPUs.
+        """
+        if parallel not in (None, "process"):
+            raise ValueError(f"Unsupported parallel mode: {parallel}. Use 'process' or None.")
         if page_start_numbering_format is None:
             page_start_numbering_format = PAGE_START_NUMBERING_FORMAT_DEFAULT
         if page_end_numbering_format is None:
@@ -189,9 +270,48 @@ class BasePDFReader(Reader):
         self.page_start_numbering_format = page_start_numbering_format
         self.page_end_numbering_format = page_end_numbering_format
         self.password = password
+        self.parallel = parallel
+        self.workers = workers or cpu_count() or 1
 
         super().__init__(**kwargs)
 
+    @staticmethod
+    def _get_doc_name(pdf: Union[str, Path, IO[Any]]) -> str:
+        try:
+            if isinstance(pdf, str):
+                return pdf.split("/")[-1].split(".")[0].replace(" ", "_")
+            return pdf.name.split(".")[0]
+        except Exception:
+            return "pdf"
+
+    @staticmethod
+    def _get_pdf_source(pdf: Union[str, Path, IO[Any]]) -> Union[str, bytes]:
+        """Get the path or the bytes of a PDF, which worker processes open the PDF from"""
+        if isinstance(pdf, (str, Path)):
+            return str(pdf)
+        pdf.seek(0)
+        data = pdf.read()
+        pdf.seek(0)
+        return data
+
+    def _get_page_ranges(self, num_pages: int) -> List[Tuple[int, int]]:
+        """Split the pages of a PDF into the ranges extracted by the worker processes"""
+        range_size = max(1, ceil(num_pages / (self.workers * PAGE_RANGES_PER_WORKER)))
+        return [(start, min(start + range_size, num_pages)) for start in range(0, num_pages, range_size)]
+
+    def _submit_page_ranges(
+        self, pdf_path: str, password: Optional[str], num_pages: int, read_images: bool
+    ) -> List[Future]:
+        """Submit the page ranges of a PDF to the process pool, the futures are returned in page order"""
+        pool = _get_process_pool(self.workers)
+        return [
+            pool.submit(_extract_page_range, pdf_path, password, start, end, read_images)
+            for start, end in self._get_page_ranges(num_pages)
+        ]
+
+    def _use_process_pool(self, pdf_source: Optional[Union[str, bytes]], doc_reader: DocumentReader) -> bool:
+        return self.parallel == "process" and pdf_source is not None and len(doc_reader.pages) > 1
+
     def _build_chunked_documents(self, documents: List[Document]) -> List[Document]:
         chunked_documents: List[Document] = []
         for document in documents:
@@ -254,14 +374,33 @@ class BasePDFReader(Reader):
         doc_name,
         read_images=False,
         use_uuid_for_id=False,
+        pdf_source: Optional[Union[str, bytes]] = None,
+        password: Optional[str] = None,
     ):
         pdf_content = []
         pdf_images_text = []
-        for page in doc_reader.pages:
-            pdf_content.append(page.extract_text())
-            if read_images:
-                pdf_images_text.append(_ocr_reader(page))
+        if self._use_process_pool(pdf_source, doc_reader):
+            with _pdf_file(pdf_source) as pdf_path:  # type: ignore
+                futures = self._submit_page_ranges(
+                    pdf_path, password or self.password, len(doc_reader.pages), read_images
+                )
+                for future in futures:
+                    for page_text, page_images_text in future.result():
+                        pdf_content.append(page_text)
+                        if read_images:
+                            pdf_images_text.append(page_images_text)
+        else:
+            for page in doc_reader.pages:
+                pdf_content.append(page.extract_text())
+                if read_images:
+                    pdf_images_text.append(_ocr_reader(page))
+
+        return self._page_texts_to_documents(pdf_content, pdf_images_text, doc_name, use_uuid_for_id)
 
+    def _page_texts_to_documents(
+        self, pdf_content: List[str], pdf_images_text: List[str], doc_name: str, use_uuid_for_id: bool
+    ) -> List[Document]:
+        """Clean the page numbers of the page texts of a PDF, which needs all pages in order, and create the documents"""
         pdf_content, shift = _clean_page_numbers(
             page_content_list=pdf_content,
             extra_content=pdf_images_text,
@@ -270,13 +409,76 @@ class BasePDFReader(Reader):
         )
         return self._create_documents(pdf_content, doc_name, use_uuid_for_id, shift)
 
+    def _read_files(
+        self, pdfs: List[Tuple[Union[str, Path], Optional[str]]], read_images: bool, use_uuid_for_id: bool
+    ) -> Iterator[List[Document]]:
+        """Read PDF files, yielding the documents of each file in order.
+
+        In parallel mode the page ranges of up to `workers` files are extracted in the process pool at the same time,
+        so small files keep all workers busy as well as large ones.
+        """
+        if self.parallel != "process":
+            for pdf, password in pdfs:
+                yield self.read(pdf=pdf, password=password)  # type: ignore
+            return
+
+        def _submit(pdf: Union[str, Path], password: Optional[str]) -> Tuple[str, Optional[List[Future]]]:
+            doc_name = self._get_doc_name(pdf)
+            log_info(f"Reading: {doc_name}")
+            try:
+                pdf_reader = DocumentReader(pdf)
+            except PdfStreamError as e:
+                logger.error(f"Error reading PDF: {e}")
+                return doc_name, None
+            if not self._decrypt_pdf(pdf_reader, doc_name, password):
+                return doc_name, None
+            return doc_name, self._submit_page_ranges(
+                str(pdf), password or self.password, len(pdf_reader.pages), read_images
+            )
+
+        def _collect(doc_name: str, futures: Optional[List[Future]]) -> List[Document]:
+            if futures is None:
+                return []
+            pages = [page for future in futures for page in future.result()]
+            return self._page_texts_to_documents(
+                [page[0] for page in pages],
+                [page[1] for page in pages] if read_images else [],
+                doc_name,
+                use_uuid_for_id,
+            )
+
+        in_flight: Deque[Tuple[str, Optional[List[Future]]]] = deque()
+        for pdf, password in pdfs:
+            in_flight.append(_submit(pdf, password))
+            if len(in_flight) >= self.workers:
+                yield _collect(*in_flight.popleft())
+        while in_flight:
+            yield _collect(*in_flight.popleft())
+
     async def _async_pdf_reader_to_documents(
         self,
         doc_reader: DocumentReader,
         doc_name: str,
         read_images=False,
         use_uuid_for_id=False,
+        pdf_source: Optional[Union[str, bytes]] = None,
+        password: Optional[str] = None,
     ):
+        if self._use_process_pool(pdf_source, doc_reader):
+            with _pdf_file(pdf_source) as pdf_path:  # type: ignore
+                futures = self._submit_page_ranges(
+                    pdf_path, password or self.password, len(doc_reader.pages), read_images
+                )
+                page_ranges = await asyncio.gather(*[asyncio.wrap_future(future) for future in futures])
+            pages = [page for page_range in page_ranges for page in page_range]
+            # Like the pages read in this process below, the images text is always passed in async reads
+            return self._page_texts_to_documents(
+                [page[0] for page in pages],
+                [page[1] for page in pages],
+                doc_name,
+                use_uuid_for_id,
+            )
+
         async def _read_pdf_page(page, read_images) -> Tuple[str, str]:
             # We tried "asyncio.to_thread(page.extract_text)", but it maintains state internally, which leads to issues.
             page_text = page.extract_text()
@@ -306,17 +508,16 @@ class BasePDFReader(Reader):
 class PDFReader(BasePDFReader):
     """Reader for PDF files"""
 
+    def read_many(self, pdfs: List[Tuple[Union[str, Path], Optional[str]]]) -> Iterator[List[Document]]:
+        """Read PDF files given as (path, password) pairs, yielding the documents of each file in order"""
+        return self._read_files(pdfs, read_images=False, use_uuid_for_id=True)
+
     def read(self, pdf: Union[str, Path, IO[Any]], password: Optional[str] = None) -> List[Document]:
-        try:
-            if isinstance(pdf, str):
-                doc_name = pdf.split("/")[-1].split(".")[0].replace(" ", "_")
-            else:
-                doc_name = pdf.name.split(".")[0]
-        except Exception:
-            doc_name = "pdf"
+        doc_name = self._get_doc_name(pdf)
 
         log_info(f"Reading: {doc_name}")
 
+        pdf_source = self._get_pdf_source(pdf) if self.parallel == "process" else None
         try:
             pdf_reader = DocumentReader(pdf)
         except PdfStreamError as e:
@@ -328,19 +529,16 @@ class PDFReader(BasePDFReader):
             return []
 
         # Read and chunk.
-        return self._pdf_reader_to_documents(pdf_reader, doc_name, use_uuid_for_id=True)
+        return self._pdf_reader_to_documents(
+            pdf_reader, doc_name, use_uuid_for_id=True, pdf_source=pdf_source, password=password
+        )
 
     async def async_read(self, pdf: Union[str, Path, IO[Any]], password: Optional[str] = None) -> List[Document]:
-        try:
-            if isinstance(pdf, str):
-                doc_name = pdf.split("/")[-1].split(".")[0].replace(" ", "_")
-            else:
-                doc_name = pdf.name.split(".")[0]
-        except Exception:
-            doc_name = "pdf"
+        doc_name = self._get_doc_name(pdf)
 
         log_info(f"Reading: {doc_name}")
 
+        pdf_source = self._get_pdf_source(pdf) if self.parallel == "process" else None
         try:
             pdf_reader = DocumentReader(pdf)
         except PdfStreamError as e:
@@ -352,7 +550,9 @@ class PDFReader(BasePDFReader):
             return []
 
         # Read and chunk.
-        return await self._async_pdf_reader_to_documents(pdf_reader, doc_name, use_uuid_for_id=True)
+        return await self._async_pdf_reader_to_documents(
+            pdf_reader, doc_name, use_uuid_for_id=True, pdf_source=pdf_source, password=password
+        )
 
 
 class PDFUrlReader(BasePDFReader):
@@ -366,14 +566,13 @@ class PDFUrlReader(BasePDFReader):
         if not url:
             raise ValueError("No url provided")
 
-        from io import BytesIO
-
         log_info(f"Reading: {url}")
 
         # Retry the request up to 3 times with exponential backoff
         response = fetch_with_retry(url, proxy=self.proxy)
 
         doc_name = url.split("/")[-1].split(".")[0].replace("/", "_").replace(" ", "_")
+        pdf_source = response.content if self.parallel == "process" else None
         pdf_reader = DocumentReader(BytesIO(response.content))
 
         # Handle PDF decryption
@@ -381,14 +580,14 @@ class PDFUrlReader(BasePDFReader):
             return []
 
         # Read and chunk.
-        return self._pdf_reader_to_documents(pdf_reader, doc_name, use_uuid_for_id=False)
+        return self._pdf_reader_to_documents(
+            pdf_reader, doc_name, use_uuid_for_id=False, pdf_source=pdf_source, password=password
+        )
 
     async def async_read(self, url: str, password: Optional[str] = None) -> List[Document]:
         if not url:
             raise ValueError("No url provided")
 
-        from io import BytesIO
-
         import httpx
 
         log_info(f"Reading: {url}")
@@ -398,6 +597,7 @@ class PDFUrlReader(BasePDFReader):
             response = await async_fetch_with_retry(url, client=client)
 
         doc_name = url.split("/")[-1].split(".")[0].replace("/", "_").replace(" ", "_")
+        pdf_source = response.content if self.parallel == "process" else None
         pdf_reader = DocumentReader(BytesIO(response.content))
 
         # Handle PDF decryption
@@ -405,25 +605,26 @@ class PDFUrlReader(BasePDFReader):
             return []
 
         # Read and chunk.
-        return await self._async_pdf_reader_to_documents(pdf_reader, doc_name, use_uuid_for_id=False)
+        return await self._async_pdf_reader_to_documents(
+            pdf_reader, doc_name, use_uuid_for_id=False, pdf_source=pdf_source, password=password
+        )
 
 
 class PDFImageReader(BasePDFReader):
     """Reader for PDF files with text and images extraction"""
 
+    def read_many(self, pdfs: List[Tuple[Union[str, Path], Optional[str]]]) -> Iterator[List[Document]]:
+        """Read PDF files given as (path, password) pairs, yielding the documents of each file in order"""
+        return self._read_files(pdfs, read_images=True, use_uuid_for_id=False)
+
     def read(self, pdf: Union[str, Path, IO[Any]], password: Optional[str] = None) -> List[Document]:
         if not pdf:
             raise ValueError("No pdf provided")
 
-        try:
-            if isinstance(pdf, str):
-                doc_name = pdf.split("/")[-1].split(".")[0].replace(" ", "_")
-            else:
-                doc_name = pdf.name.split(".")[0]
-        except Exception:
-            doc_name = "pdf"
+        doc_name = self._get_doc_name(pdf)
 
         log_info(f"Reading: {doc_name}")
+        pdf_source = self._get_pdf_source(pdf) if self.parallel == "process" else None
         pdf_reader = DocumentReader(pdf)
 
         # Handle PDF decryption
@@ -431,21 +632,18 @@ class PDFImageReader(BasePDFReader):
             return []
 
         # Read and chunk.
-        return self._pdf_reader_to_documents(pdf_reader, doc_name, read_images=True, use_uuid_for_id=False)
+        return self._pdf_reader_to_documents(
+            pdf_reader, doc_name, read_images=True, use_uuid_for_id=False, pdf_source=pdf_source, password=password
+        )
 
     async def async_read(self, pdf: Union[str, Path, IO[Any]], password: Optional[str] = None) -> List[Document]:
         if not pdf:
             raise ValueError("No pdf provided")
 
-        try:
-            if isinstance(pdf, str):
-                doc_name = pdf.split("/")[-1].split(".")[0].replace(" ", "_")
-            else:
-                doc_name = pdf.name.split(".")[0]
-        except Exception:
-            doc_name = "pdf"
+        doc_name = self._get_doc_name(pdf)
 
         log_info(f"Reading: {doc_name}")
+        pdf_source = self._get_pdf_source(pdf) if self.parallel == "process" else None
         pdf_reader = DocumentReader(pdf)
 
         # Handle PDF decryption
@@ -453,7 +651,9 @@ class PDFImageReader(BasePDFReader):
             return []
 
         # Read and chunk.
-        return await self._async_pdf_reader_to_documents(pdf_reader, doc_name, read_images=True, use_uuid_for_id=False)
+        return await self._async_pdf_reader_to_documents(
+            pdf_reader, doc_name, read_images=True, use_uuid_for_id=False, pdf_source=pdf_source, password=password
+        )
 
 
 class PDFUrlImageReader(BasePDFReader):
@@ -467,8 +667,6 @@ class PDFUrlImageReader(BasePDFReader):
         if not url:
             raise ValueError("No url provided")
 
-        from io import BytesIO
-
         import httpx
 
         # Read the PDF from the URL
@@ -476,6 +674,7 @@ class PDFUrlImageReader(BasePDFReader):
         response = httpx.get(url, proxy=self.proxy) if self.proxy else httpx.get(url)
 
         doc_name = url.split("/")[-1].split(".")[0].replace(" ", "_")
+        pdf_source = response.content if self.parallel == "process" else None
         pdf_reader = DocumentReader(BytesIO(response.content))
 
         # Handle PDF decryption
@@ -483,14 +682,14 @@ class PDFUrlImageReader(BasePDFReader):
             return []
 
         # Read and chunk.
-        return self._pdf_reader_to_documents(pdf_reader, doc_name, read_images=True, use_uuid_for_id=False)
+        return self._pdf_reader_to_documents(
+            pdf_reader, doc_name, read_images=True, use_uuid_for_id=False, pdf_source=pdf_source, password=password
+        )
 
     async def async_read(self, url: str, password: Optional[str] = None) -> List[Document]:
         if not url:
             raise ValueError("No url provided")
 
-        from io import BytesIO
-
         import httpx
 
         log_info(f"Reading: {url}")
@@ -501,6 +700,7 @@ class PDFUrlImageReader(BasePDFReader):
             response.raise_for_status()
 
         doc_name = url.split("/")[-1].split(".")[0].replace(" ", "_")
+        pdf_source = response.content if self.parallel == "process" else None
         pdf_reader = DocumentReader(BytesIO(response.content))
 
         # Handle PDF decryption
@@ -508,4 +708,6 @@ class PDFUrlImageReader(BasePDFReader):
             return []
 
         # Read and chunk.
-        return await self._async_pdf_reader_to_documents(pdf_reader, doc_name, read_images=True, use_uuid_for_id=False)
+        return await self._async_pdf_reader_to_documents(
+            pdf_reader, doc_name, read_images=True, use_uuid_for_id=False, pdf_source=pdf_source, password=password
+        )
@@ -1,5 +1,6 @@
 import asyncio
 import uuid
+from functools import partial
 from pathlib import Path
 from typing import IO, Any, List, Union
 
@@ -7,6 +8,9 @@ from agno.document.base import Document
 from agno.document.reader.base import Reader
 from agno.utils.log import log_info, logger
 
+# Number of characters read from a text file at a time when it is chunked while reading
+READ_BLOCK_SIZE = 1024 * 1024
+
 
 class TextReader(Reader):
     """Reader for Text files"""
@@ -18,6 +22,13 @@ class TextReader(Reader):
                     raise FileNotFoundError(f"Could not find file: {file}")
                 log_info(f"Reading: {file}")
                 file_name = file.stem
+                if self.chunk:
+                    # Chunk the file while reading it in blocks
+                    with file.open("r", encoding="utf-8") as f:
+                        return self.chunk_document_stream(
+                            Document(name=file_name, id=str(uuid.uuid4()), content=""),
+                            iter(partial(f.read, READ_BLOCK_SIZE), ""),
+                        )
                 file_contents = file.read_text("utf-8")
             else:
                 log_info(f"Reading uploaded file: {file.name}")
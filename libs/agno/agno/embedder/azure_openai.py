@@ -33,6 +33,11 @@ class AzureOpenAIEmbedder(Embedder):
     client_params: Optional[Dict[str, Any]] = None
     openai_client: Optional[AzureOpenAIClient] = None
 
+    def __post_init__(self):
+        # The OpenAI embedding models embed at most 8191 tokens per text
+        if self.max_tokens is None and self.id.startswith("text-embedding-"):
+            self.max_tokens = 8191
+
     @property
     def client(self) -> AzureOpenAIClient:
         if self.openai_client:
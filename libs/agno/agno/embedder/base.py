@@ -1,3 +1,4 @@
+import asyncio
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
@@ -7,9 +8,92 @@ class Embedder:
     """Base class for managing embedders"""
 
     dimensions: Optional[int] = 1536
+    # Maximum number of texts sent to the provider in a single request
+    batch_size: int = 100
+    # Maximum number of batch requests in flight at once for the async batch API
+    batch_concurrency: int = 4
+    # Maximum number of tokens the model embeds per text, longer texts are truncated or rejected by the provider
+    max_tokens: Optional[int] = None
 
     def get_embedding(self, text: str) -> List[float]:
         raise NotImplementedError
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         raise NotImplementedError
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        """Embed a single batch of texts.
+
+        Embedders with a native batch API should override this method. The default implementation
+        falls back to one request per text and sums the usage.
+        """
+        embeddings: List[List[float]] = []
+        usage: Optional[Dict] = None
+        for text in texts:
+            embedding, text_usage = self.get_embedding_and_usage(text)
+            embeddings.append(embedding)
+            if text_usage:
+                usage = _merge_usage(usage, text_usage)
+        return embeddings, usage
+
+    async def _async_get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        """Asynchronously embed a single batch of texts. Defaults to the sync implementation in a thread."""
+        return await asyncio.to_thread(self._get_batch_embeddings_and_usage, texts)
+
+    def get_embeddings_batch_and_usage(
+        self, texts: List[str], batch_size: Optional[int] = None
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Embed a list of texts, sending at most `batch_size` texts per request.
+
+        Returns the embeddings in input order along with a usage entry per text. Usage is reported once per
+        request, on the first text of each batch, so that summing the usage entries gives the total cost.
+        """
+        _batch_size = batch_size or self.batch_size
+        embeddings: List[List[float]] = []
+        usages: List[Optional[Dict]] = []
+        for i in range(0, len(texts), _batch_size):
+            batch = texts[i : i + _batch_size]
+            batch_embeddings, batch_usage = self._get_batch_embeddings_and_usage(batch)
+            embeddings.extend(batch_embeddings)
+            usages.extend([batch_usage] + [None] * (len(batch) - 1))
+        return embeddings, usages
+
+    def get_embeddings_batch(self, texts: List[str], batch_size: Optional[int] = None) -> List[List[float]]:
+        return self.get_embeddings_batch_and_usage(texts, batch_size=batch_size)[0]
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str], batch_size: Optional[int] = None
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Asynchronously embed a list of texts, sending up to `batch_concurrency` batches concurrently."""
+        _batch_size = batch_size or self.batch_size
+        batches = [texts[i : i + _batch_size] for i in range(0, len(texts), _batch_size)]
+        semaphore = asyncio.Semaphore(max(1, self.batch_concurrency))
+
+        async def _embed(batch: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+            async with semaphore:
+                return await self._async_get_batch_embeddings_and_usage(batch)
+
+        results = await asyncio.gather(*[_embed(batch) for batch in batches])
+
+        embeddings: List[List[float]] = []
+        usages: List[Optional[Dict]] = []
+        for batch, (batch_embeddings, batch_usage) in zip(batches, results):
+            embeddings.extend(batch_embeddings)
+            usages.extend([batch_usage] + [None] * (len(batch) - 1))
+        return embeddings, usages
+
+    async def async_get_embeddings_batch(self, texts: List[str], batch_size: Optional[int] = None) -> List[List[float]]:
+        return (await self.async_get_embeddings_batch_and_usage(texts, batch_size=batch_size))[0]
+
+
+def _merge_usage(usage: Optional[Dict], other: Dict) -> Dict:
+    """Sum the numeric fields of two usage dictionaries"""
+    if usage is None:
+        return dict(other)
+    merged = dict(usage)
+    for key, value in other.items():
+        if isinstance(value, (int, float)) and isinstance(merged.get(key), (int, float)):
+            merged[key] += value
+        elif key not in merged:
+            merged[key] = value
+    return merged
@@ -0,0 +1,7 @@
+from agno.embedder.cache.base import EmbeddingCache
+from agno.embedder.cache.in_memory import InMemoryEmbeddingCache
+
+__all__ = [
+    "EmbeddingCache",
+    "InMemoryEmbeddingCache",
+]
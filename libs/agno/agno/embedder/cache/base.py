@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+
+class EmbeddingCache(ABC):
+    """Base class for embedding cache backends, keyed by `CachedEmbedder.get_cache_key`"""
+
+    @abstractmethod
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Return the cached embeddings for the keys that are in the cache"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_many(self, embeddings: Dict[str, List[float]]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
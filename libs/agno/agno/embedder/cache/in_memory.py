@@ -0,0 +1,44 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, List, Optional
+
+from agno.embedder.cache.base import EmbeddingCache
+
+
+class InMemoryEmbeddingCache(EmbeddingCache):
+    def __init__(self, max_size: Optional[int] = 10_000):
+        """
+        Least recently used embedding cache held in memory.
+
+        Args:
+            max_size: Maximum number of embeddings to keep. None means the cache is unbounded.
+        """
+        self.max_size: Optional[int] = max_size
+        self._embeddings: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            for key in keys:
+                embedding = self._embeddings.get(key)
+                if embedding is not None:
+                    self._embeddings.move_to_end(key)
+                    found[key] = embedding
+        return found
+
+    def set_many(self, embeddings: Dict[str, List[float]]) -> None:
+        with self._lock:
+            for key, embedding in embeddings.items():
+                self._embeddings[key] = embedding
+                self._embeddings.move_to_end(key)
+            if self.max_size is not None:
+                while len(self._embeddings) > self.max_size:
+                    self._embeddings.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._embeddings.clear()
+
+    def __len__(self) -> int:
+        return len(self._embeddings)
@@ -0,0 +1,63 @@
+from array import array
+from typing import Dict, List, Optional
+
+from agno.embedder.cache.base import EmbeddingCache
+from agno.utils.log import log_debug
+
+try:
+    from redis import Redis
+except ImportError:
+    raise ImportError("`redis` not installed. Please install it using `pip install redis`")
+
+
+class RedisEmbeddingCache(EmbeddingCache):
+    def __init__(
+        self,
+        prefix: str = "agno_embedding",
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        ssl: Optional[bool] = False,
+        expire: Optional[int] = None,
+        redis_client: Optional[Redis] = None,
+    ):
+        """
+        Embedding cache stored in Redis, shared by every process using the same server.
+
+        Args:
+            prefix (str): Prefix for Redis keys to namespace the embeddings
+            host (str): Redis host address
+            port (int): Redis port number
+            db (int): Redis database number
+            password (Optional[str]): Redis password if authentication is required
+            ssl (Optional[bool]): Whether to use SSL for Redis connection
+            expire (Optional[int]): TTL (time to live) in seconds for cached embeddings. None means no expiration.
+            redis_client (Optional[Redis]): An existing Redis client to use instead of creating one
+        """
+        self.prefix = prefix
+        self.expire = expire
+        self.redis_client = redis_client or Redis(host=host, port=port, db=db, password=password, ssl=bool(ssl))
+        log_debug(f"Created RedisEmbeddingCache with prefix: '{self.prefix}'")
+
+    def _get_key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        if not keys:
+            return {}
+        values = self.redis_client.mget([self._get_key(key) for key in keys])
+        return {key: array("d", value).tolist() for key, value in zip(keys, values) if value is not None}  # type: ignore
+
+    def set_many(self, embeddings: Dict[str, List[float]]) -> None:
+        if not embeddings:
+            return
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for key, embedding in embeddings.items():
+            pipeline.set(self._get_key(key), array("d", embedding).tobytes(), ex=self.expire)
+        pipeline.execute()
+
+    def clear(self) -> None:
+        keys = list(self.redis_client.scan_iter(match=f"{self.prefix}:*"))
+        if keys:
+            self.redis_client.delete(*keys)
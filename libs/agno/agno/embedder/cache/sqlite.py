@@ -0,0 +1,87 @@
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from agno.embedder.cache.base import EmbeddingCache
+from agno.utils.log import log_debug
+
+try:
+    from sqlalchemy.dialects import sqlite
+    from sqlalchemy.engine import Engine, create_engine
+    from sqlalchemy.orm import Session, sessionmaker
+    from sqlalchemy.schema import Column, MetaData, Table
+    from sqlalchemy.sql.expression import delete, select
+    from sqlalchemy.types import LargeBinary, String
+except ImportError:
+    raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
+
+
+class SqliteEmbeddingCache(EmbeddingCache):
+    def __init__(
+        self,
+        table_name: str = "embedding_cache",
+        db_url: Optional[str] = None,
+        db_file: Optional[str] = None,
+        db_engine: Optional[Engine] = None,
+    ):
+        """
+        Embedding cache persisted in a sqlite database, so it survives restarts and can be shared between processes.
+
+        The following order is used to determine the database connection:
+            1. Use the db_engine if provided
+            2. Use the db_url
+            3. Use the db_file
+            4. Create a new in-memory database
+
+        Args:
+            table_name: The name of the table to store embeddings in.
+            db_url: The database URL to connect to.
+            db_file: The database file to connect to.
+            db_engine: The SQLAlchemy database engine to use.
+        """
+        _engine: Optional[Engine] = db_engine
+        if _engine is None and db_url is not None:
+            _engine = create_engine(db_url)
+        elif _engine is None and db_file is not None:
+            db_path = Path(db_file).resolve()
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            _engine = create_engine(f"sqlite:///{db_path}")
+        elif _engine is None:
+            _engine = create_engine("sqlite://")
+
+        self.table_name: str = table_name
+        self.db_url: Optional[str] = db_url
+        self.db_engine: Engine = _engine
+        self.metadata: MetaData = MetaData()
+        self.Session: sessionmaker[Session] = sessionmaker(bind=self.db_engine)
+        self.table: Table = Table(
+            self.table_name,
+            self.metadata,
+            Column("key", String, primary_key=True),
+            # Embeddings are stored as packed doubles, which is exact and much smaller than JSON
+            Column("embedding", LargeBinary),
+            Column("created_at", sqlite.INTEGER, default=lambda: int(time.time())),
+            extend_existing=True,
+        )
+        log_debug(f"Creating table: {self.table_name}")
+        self.table.create(self.db_engine, checkfirst=True)
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        if not keys:
+            return {}
+        with self.Session() as sess:
+            rows = sess.execute(select(self.table.c.key, self.table.c.embedding).where(self.table.c.key.in_(keys)))
+            return {row.key: array("d", row.embedding).tolist() for row in rows}
+
+    def set_many(self, embeddings: Dict[str, List[float]]) -> None:
+        if not embeddings:
+            return
+        values = [{"key": key, "embedding": array("d", embedding).tobytes()} for key, embedding in embeddings.items()]
+        stmt = sqlite.insert(self.table).on_conflict_do_nothing(index_elements=["key"])
+        with self.Session() as sess, sess.begin():
+            sess.execute(stmt, values)
+
+    def clear(self) -> None:
+        with self.Session() as sess, sess.begin():
+            sess.execute(delete(self.table))
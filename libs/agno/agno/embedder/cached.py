@@ -0,0 +1,143 @@
+import asyncio
+from dataclasses import dataclass, field
+from hashlib import md5
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+from agno.embedder.base import Embedder
+from agno.embedder.cache.base import EmbeddingCache
+from agno.embedder.cache.in_memory import InMemoryEmbeddingCache
+from agno.utils.log import log_debug, log_warning
+
+
+@dataclass
+class CachedEmbedder(Embedder):
+    """Wraps an embedder and caches its embeddings, so only texts that were not embedded before hit the provider.
+
+    Embeddings are keyed by (model id, dimensions, text hash), so a cache can be shared by several embedders.
+    """
+
+    embedder: Optional[Embedder] = None
+    cache: Optional[EmbeddingCache] = None
+    # Number of texts served from the cache and sent to the embedder
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _metrics_lock: Lock = field(default_factory=Lock, init=False, repr=False)
+
+    def __post_init__(self):
+        if self.embedder is None:
+            raise ValueError("An embedder is required")
+        self.dimensions = self.embedder.dimensions
+        self.batch_size = self.embedder.batch_size
+        self.batch_concurrency = self.embedder.batch_concurrency
+        self.max_tokens = self.embedder.max_tokens
+        if self.cache is None:
+            self.cache = InMemoryEmbeddingCache()
+
+    def __deepcopy__(self, memo):
+        # The cache and its metrics are shared by every copy of an agent or knowledge base
+        return self
+
+    @property
+    def id(self) -> str:
+        return getattr(self.embedder, "id", None) or self.embedder.__class__.__name__
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def reset_metrics(self) -> None:
+        with self._metrics_lock:
+            self.hits = 0
+            self.misses = 0
+
+    def get_cache_key(self, text: str) -> str:
+        return f"{self.id}:{self.embedder.dimensions}:{md5(text.encode()).hexdigest()}"  # type: ignore
+
+    def _lookup(self, texts: List[str]) -> Tuple[List[str], Dict[str, List[float]], List[str]]:
+        """Return the cache keys of the texts, the cached embeddings and the unique texts that are not cached"""
+        keys = [self.get_cache_key(text) for text in texts]
+        try:
+            cached = self.cache.get_many(list(dict.fromkeys(keys)))  # type: ignore
+        except Exception as e:
+            # The cache is an optimization, texts are embedded by the provider if it is unavailable
+            log_warning(f"Error reading from the embedding cache: {e}")
+            cached = {}
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in cached:
+                missing.setdefault(key, text)
+
+        with self._metrics_lock:
+            self.hits += len(texts) - len(missing)
+            self.misses += len(missing)
+        log_debug(f"Embedding cache: {len(texts) - len(missing)} hits, {len(missing)} misses")
+        return keys, cached, list(missing.values())
+
+    def _store(
+        self,
+        keys: List[str],
+        cached: Dict[str, List[float]],
+        texts: List[str],
+        embeddings: List[List[float]],
+        usages: List[Optional[Dict]],
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Cache the new embeddings and assemble the results in input order. Cache hits report no usage."""
+        new_embeddings: Dict[str, List[float]] = {}
+        new_usages: Dict[str, Optional[Dict]] = {}
+        for text, embedding, usage in zip(texts, embeddings, usages):
+            key = self.get_cache_key(text)
+            new_usages[key] = usage
+            # Failed embeddings are returned empty, don't cache them
+            if embedding:
+                new_embeddings[key] = embedding
+        try:
+            self.cache.set_many(new_embeddings)  # type: ignore
+        except Exception as e:
+            log_warning(f"Error writing to the embedding cache: {e}")
+
+        results: List[List[float]] = []
+        result_usages: List[Optional[Dict]] = []
+        for key in keys:
+            if key in cached:
+                results.append(cached[key])
+                result_usages.append(None)
+            else:
+                results.append(new_embeddings.get(key, []))
+                result_usages.append(new_usages.pop(key, None))
+        return results, result_usages
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        keys, cached, missing = self._lookup([text])
+        if not missing:
+            return cached[keys[0]], None
+        embedding, usage = self.embedder.get_embedding_and_usage(text)  # type: ignore
+        embeddings, usages = self._store(keys, cached, missing, [embedding], [usage])
+        return embeddings[0], usages[0]
+
+    def get_embeddings_batch_and_usage(
+        self, texts: List[str], batch_size: Optional[int] = None
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        keys, cached, missing = self._lookup(texts)
+        embeddings: List[List[float]] = []
+        usages: List[Optional[Dict]] = []
+        if missing:
+            embeddings, usages = self.embedder.get_embeddings_batch_and_usage(missing, batch_size=batch_size)  # type: ignore
+        return self._store(keys, cached, missing, embeddings, usages)
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str], batch_size: Optional[int] = None
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        # Cache backends are synchronous, run them in a thread so remote caches don't block the event loop
+        keys, cached, missing = await asyncio.to_thread(self._lookup, texts)
+        embeddings: List[List[float]] = []
+        usages: List[Optional[Dict]] = []
+        if missing:
+            embeddings, usages = await self.embedder.async_get_embeddings_batch_and_usage(  # type: ignore
+                missing, batch_size=batch_size
+            )
+        return await asyncio.to_thread(self._store, keys, cached, missing, embeddings, usages)
@@ -5,6 +5,7 @@ from agno.embedder.base import Embedder
 from agno.utils.log import logger
 
 try:
+    from cohere import AsyncClient as AsyncCohereClient
     from cohere import Client as CohereClient
     from cohere.types.embed_response import EmbeddingsByTypeEmbedResponse, EmbeddingsFloatsEmbedResponse
 except ImportError:
@@ -20,6 +21,7 @@ class CohereEmbedder(Embedder):
     request_params: Optional[Dict[str, Any]] = None
     client_params: Optional[Dict[str, Any]] = None
     cohere_client: Optional[CohereClient] = None
+    async_client: Optional[AsyncCohereClient] = None
 
     @property
     def client(self) -> CohereClient:
@@ -31,7 +33,17 @@ class CohereEmbedder(Embedder):
         self.cohere_client = CohereClient(**client_params)
         return self.cohere_client
 
-    def response(self, text: str) -> Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]:
+    @property
+    def aclient(self) -> AsyncCohereClient:
+        if self.async_client:
+            return self.async_client
+        client_params: Dict[str, Any] = {}
+        if self.api_key:
+            client_params["api_key"] = self.api_key
+        self.async_client = AsyncCohereClient(**client_params)
+        return self.async_client
+
+    def _get_request_params(self) -> Dict[str, Any]:
         request_params: Dict[str, Any] = {}
 
         if self.id:
@@ -42,7 +54,10 @@ class CohereEmbedder(Embedder):
             request_params["embedding_types"] = self.embedding_types
         if self.request_params:
             request_params.update(self.request_params)
-        return self.client.embed(texts=[text], **request_params)
+        return request_params
+
+    def response(self, text: str) -> Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]:
+        return self.client.embed(texts=[text], **self._get_request_params())
 
     def get_embedding(self, text: str) -> List[float]:
         response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = self.response(text=text)
@@ -71,3 +86,23 @@ class CohereEmbedder(Embedder):
         if usage:
             return embedding, usage.model_dump()
         return embedding, None
+
+    def _parse_batch_response(
+        self, response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]
+    ) -> Tuple[List[List[float]], Optional[Dict[str, Any]]]:
+        embeddings: List[List[float]] = []
+        if isinstance(response, EmbeddingsFloatsEmbedResponse):
+            embeddings = response.embeddings
+        elif isinstance(response, EmbeddingsByTypeEmbedResponse):
+            embeddings = response.embeddings.float_ or []
+
+        usage = response.meta.billed_units if response.meta else None
+        return embeddings, usage.model_dump() if usage else None
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict[str, Any]]]:
+        return self._parse_batch_response(self.client.embed(texts=texts, **self._get_request_params()))
+
+    async def _async_get_batch_embeddings_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], Optional[Dict[str, Any]]]:
+        return self._parse_batch_response(await self.aclient.embed(texts=texts, **self._get_request_params()))
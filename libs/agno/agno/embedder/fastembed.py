@@ -44,3 +44,10 @@ class FastEmbedEmbedder(Embedder):
         usage = None
 
         return embedding, usage
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        model = TextEmbedding(model_name=self.id)
+        embeddings = []
+        for embedding in model.embed(texts, batch_size=len(texts)):
+            embeddings.append(embedding.tolist() if isinstance(embedding, np.ndarray) else list(embedding))
+        return embeddings, None
@@ -37,20 +37,24 @@ class JinaEmbedder(Embedder):
             headers.update(self.headers)
         return headers
 
-    def _response(self, text: str) -> Dict[str, Any]:
+    def _get_request_data(self, texts: List[str]) -> Dict[str, Any]:
         data = {
             "model": self.id,
             "late_chunking": self.late_chunking,
             "dimensions": self.dimensions,
             "embedding_type": self.embedding_type,
-            "input": [text],  # Jina API expects a list
+            "input": texts,  # Jina API expects a list
         }
         if self.user is not None:
             data["user"] = self.user
         if self.request_params:
             data.update(self.request_params)
+        return data
 
-        response = requests.post(self.base_url, headers=self._get_headers(), json=data, timeout=self.timeout)
+    def _response(self, text: str) -> Dict[str, Any]:
+        response = requests.post(
+            self.base_url, headers=self._get_headers(), json=self._get_request_data([text]), timeout=self.timeout
+        )
         response.raise_for_status()
         return response.json()
 
@@ -71,3 +75,22 @@ class JinaEmbedder(Embedder):
         except Exception as e:
             logger.warning(f"Failed to get embedding and usage: {e}")
             return [], None
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        response = requests.post(
+            self.base_url, headers=self._get_headers(), json=self._get_request_data(texts), timeout=self.timeout
+        )
+        response.raise_for_status()
+        result = response.json()
+        data = sorted(result["data"], key=lambda item: item.get("index", 0))
+        return [item["embedding"] for item in data], result.get("usage")
+
+    async def _async_get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        import httpx
+
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            response = await client.post(self.base_url, headers=self._get_headers(), json=self._get_request_data(texts))
+        response.raise_for_status()
+        result = response.json()
+        data = sorted(result["data"], key=lambda item: item.get("index", 0))
+        return [item["embedding"] for item in data], result.get("usage")
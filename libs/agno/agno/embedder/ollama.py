@@ -7,6 +7,7 @@ from agno.utils.log import logger
 try:
     import importlib.metadata as metadata
 
+    from ollama import AsyncClient as AsyncOllamaClient
     from ollama import Client as OllamaClient
     from packaging import version
 
@@ -42,12 +43,9 @@ class OllamaEmbedder(Embedder):
     options: Optional[Any] = None
     client_kwargs: Optional[Dict[str, Any]] = None
     ollama_client: Optional[OllamaClient] = None
+    async_client: Optional[AsyncOllamaClient] = None
 
-    @property
-    def client(self) -> OllamaClient:
-        if self.ollama_client:
-            return self.ollama_client
-
+    def _get_client_params(self) -> Dict[str, Any]:
         _ollama_params: Dict[str, Any] = {
             "host": self.host,
             "timeout": self.timeout,
@@ -55,15 +53,32 @@ class OllamaEmbedder(Embedder):
         _ollama_params = {k: v for k, v in _ollama_params.items() if v is not None}
         if self.client_kwargs:
             _ollama_params.update(self.client_kwargs)
-        self.ollama_client = OllamaClient(**_ollama_params)
+        return _ollama_params
+
+    @property
+    def client(self) -> OllamaClient:
+        if self.ollama_client:
+            return self.ollama_client
+
+        self.ollama_client = OllamaClient(**self._get_client_params())
         return self.ollama_client
 
-    def _response(self, text: str) -> Dict[str, Any]:
+    @property
+    def aclient(self) -> AsyncOllamaClient:
+        if self.async_client:
+            return self.async_client
+
+        self.async_client = AsyncOllamaClient(**self._get_client_params())
+        return self.async_client
+
+    def _get_request_kwargs(self) -> Dict[str, Any]:
         kwargs: Dict[str, Any] = {}
         if self.options is not None:
             kwargs["options"] = self.options
+        return kwargs
 
-        response = self.client.embed(input=text, model=self.id, **kwargs)
+    def _response(self, text: str) -> Dict[str, Any]:
+        response = self.client.embed(input=text, model=self.id, **self._get_request_kwargs())
         if response and "embeddings" in response:
             embeddings = response["embeddings"]
             if isinstance(embeddings, list) and len(embeddings) > 0 and isinstance(embeddings[0], list):
@@ -88,3 +103,24 @@ class OllamaEmbedder(Embedder):
         embedding = self.get_embedding(text=text)
         usage = None
         return embedding, usage
+
+    def _parse_batch_response(self, response: Any, num_texts: int) -> List[List[float]]:
+        embeddings = response["embeddings"] if response and "embeddings" in response else []
+        if len(embeddings) != num_texts:
+            logger.warning(f"Expected {num_texts} embeddings, but got {len(embeddings)}")
+            return [[] for _ in range(num_texts)]
+        parsed: List[List[float]] = []
+        for embedding in embeddings:
+            if len(embedding) != self.dimensions:
+                logger.warning(f"Expected embedding dimension {self.dimensions}, but got {len(embedding)}")
+                embedding = []
+            parsed.append(list(embedding))
+        return parsed
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        response = self.client.embed(input=texts, model=self.id, **self._get_request_kwargs())
+        return self._parse_batch_response(response, len(texts)), None
+
+    async def _async_get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        response = await self.aclient.embed(input=texts, model=self.id, **self._get_request_kwargs())
+        return self._parse_batch_response(response, len(texts)), None
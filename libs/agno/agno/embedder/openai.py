@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from typing_extensions import Literal
 
@@ -7,6 +7,7 @@ from agno.embedder.base import Embedder
 from agno.utils.log import logger
 
 try:
+    from openai import AsyncOpenAI as AsyncOpenAIClient
     from openai import OpenAI as OpenAIClient
     from openai.types.create_embedding_response import CreateEmbeddingResponse
 except ImportError:
@@ -25,16 +26,16 @@ class OpenAIEmbedder(Embedder):
     request_params: Optional[Dict[str, Any]] = None
     client_params: Optional[Dict[str, Any]] = None
     openai_client: Optional[OpenAIClient] = None
+    async_client: Optional[AsyncOpenAIClient] = None
 
     def __post_init__(self):
         if self.dimensions is None:
             self.dimensions = 3072 if self.id == "text-embedding-3-large" else 1536
+        # The OpenAI embedding models embed at most 8191 tokens per text
+        if self.max_tokens is None and self.id.startswith("text-embedding-"):
+            self.max_tokens = 8191
 
-    @property
-    def client(self) -> OpenAIClient:
-        if self.openai_client:
-            return self.openai_client
-
+    def _get_client_params(self) -> Dict[str, Any]:
         _client_params: Dict[str, Any] = {
             "api_key": self.api_key,
             "organization": self.organization,
@@ -43,12 +44,27 @@ class OpenAIEmbedder(Embedder):
         _client_params = {k: v for k, v in _client_params.items() if v is not None}
         if self.client_params:
             _client_params.update(self.client_params)
-        self.openai_client = OpenAIClient(**_client_params)
+        return _client_params
+
+    @property
+    def client(self) -> OpenAIClient:
+        if self.openai_client:
+            return self.openai_client
+
+        self.openai_client = OpenAIClient(**self._get_client_params())
         return self.openai_client
 
-    def response(self, text: str) -> CreateEmbeddingResponse:
+    @property
+    def aclient(self) -> AsyncOpenAIClient:
+        if self.async_client:
+            return self.async_client
+
+        self.async_client = AsyncOpenAIClient(**self._get_client_params())
+        return self.async_client
+
+    def _get_request_params(self, input: Union[str, List[str]]) -> Dict[str, Any]:
         _request_params: Dict[str, Any] = {
-            "input": text,
+            "input": input,
             "model": self.id,
             "encoding_format": self.encoding_format,
         }
@@ -58,7 +74,10 @@ class OpenAIEmbedder(Embedder):
             _request_params["dimensions"] = self.dimensions
         if self.request_params:
             _request_params.update(self.request_params)
-        return self.client.embeddings.create(**_request_params)
+        return _request_params
+
+    def response(self, text: str) -> CreateEmbeddingResponse:
+        return self.client.embeddings.create(**self._get_request_params(text))
 
     def get_embedding(self, text: str) -> List[float]:
         response: CreateEmbeddingResponse = self.response(text=text)
@@ -76,3 +95,13 @@ class OpenAIEmbedder(Embedder):
         if usage:
             return embedding, usage.model_dump()
         return embedding, None
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        response: CreateEmbeddingResponse = self.client.embeddings.create(**self._get_request_params(texts))
+        embeddings = [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+        return embeddings, response.usage.model_dump() if response.usage else None
+
+    async def _async_get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        response: CreateEmbeddingResponse = await self.aclient.embeddings.create(**self._get_request_params(texts))
+        embeddings = [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+        return embeddings, response.usage.model_dump() if response.usage else None
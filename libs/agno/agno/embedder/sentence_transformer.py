@@ -25,11 +25,13 @@ class SentenceTransformerEmbedder(Embedder):
     prompt: Optional[str] = None
     normalize_embeddings: bool = False
 
-    def get_embedding(self, text: Union[str, List[str]]) -> List[float]:
+    def _get_model(self) -> SentenceTransformer:
         if not self.sentence_transformer_client:
-            model = SentenceTransformer(model_name_or_path=self.id)
-        else:
-            model = self.sentence_transformer_client
+            self.sentence_transformer_client = SentenceTransformer(model_name_or_path=self.id)
+        return self.sentence_transformer_client
+
+    def get_embedding(self, text: Union[str, List[str]]) -> List[float]:
+        model = self._get_model()
         embedding = model.encode(text, prompt=self.prompt, normalize_embeddings=self.normalize_embeddings)
         try:
             if isinstance(embedding, np.ndarray):
@@ -42,3 +44,12 @@ class SentenceTransformerEmbedder(Embedder):
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         return self.get_embedding(text=text), None
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        # Encode the whole batch in a single forward pass
+        embeddings = self._get_model().encode(
+            texts, batch_size=len(texts), prompt=self.prompt, normalize_embeddings=self.normalize_embeddings
+        )
+        if isinstance(embeddings, np.ndarray):
+            return embeddings.tolist(), None
+        return [list(embedding) for embedding in embeddings], None
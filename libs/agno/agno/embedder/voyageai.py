@@ -5,6 +5,7 @@ from agno.embedder.base import Embedder
 from agno.utils.log import logger
 
 try:
+    from voyageai import AsyncClient as AsyncVoyageClient
     from voyageai import Client as VoyageClient
     from voyageai.object import EmbeddingsObject
 except ImportError:
@@ -22,12 +23,9 @@ class VoyageAIEmbedder(Embedder):
     timeout: Optional[float] = None
     client_params: Optional[Dict[str, Any]] = None
     voyage_client: Optional[VoyageClient] = None
+    async_client: Optional[AsyncVoyageClient] = None
 
-    @property
-    def client(self) -> VoyageClient:
-        if self.voyage_client:
-            return self.voyage_client
-
+    def _get_client_params(self) -> Dict[str, Any]:
         _client_params = {
             "api_key": self.api_key,
             "max_retries": self.max_retries,
@@ -36,17 +34,35 @@ class VoyageAIEmbedder(Embedder):
         _client_params = {k: v for k, v in _client_params.items() if v is not None}
         if self.client_params:
             _client_params.update(self.client_params)
-        self.voyage_client = VoyageClient(**_client_params)
+        return _client_params
+
+    @property
+    def client(self) -> VoyageClient:
+        if self.voyage_client:
+            return self.voyage_client
+
+        self.voyage_client = VoyageClient(**self._get_client_params())
         return self.voyage_client
 
-    def _response(self, text: str) -> EmbeddingsObject:
+    @property
+    def aclient(self) -> AsyncVoyageClient:
+        if self.async_client:
+            return self.async_client
+
+        self.async_client = AsyncVoyageClient(**self._get_client_params())
+        return self.async_client
+
+    def _get_request_params(self, texts: List[str]) -> Dict[str, Any]:
         _request_params: Dict[str, Any] = {
-            "texts": [text],
+            "texts": texts,
             "model": self.id,
         }
         if self.request_params:
             _request_params.update(self.request_params)
-        return self.client.embed(**_request_params)
+        return _request_params
+
+    def _response(self, text: str) -> EmbeddingsObject:
+        return self.client.embed(**self._get_request_params([text]))
 
     def get_embedding(self, text: str) -> List[float]:
         response: EmbeddingsObject = self._response(text=text)
@@ -62,3 +78,11 @@ class VoyageAIEmbedder(Embedder):
         embedding = response.embeddings[0]
         usage = {"total_tokens": response.total_tokens}
         return embedding, usage
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        response: EmbeddingsObject = self.client.embed(**self._get_request_params(texts))
+        return response.embeddings, {"total_tokens": response.total_tokens}
+
+    async def _async_get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        response: EmbeddingsObject = await self.aclient.embed(**self._get_request_params(texts))
+        return response.embeddings, {"total_tokens": response.total_tokens}
@@ -1,6 +1,9 @@
 import asyncio
+from collections import Counter
+from functools import partial
+from hashlib import md5
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from pydantic import BaseModel, ConfigDict, model_validator
 
@@ -8,7 +11,11 @@ from agno.document import Document
 from agno.document.chunking.fixed import FixedSizeChunking
 from agno.document.chunking.strategy import ChunkingStrategy
 from agno.document.reader.base import Reader
+from agno.knowledge.cache import KnowledgeSearchCache
+from agno.knowledge.manifest.base import KnowledgeManifest, KnowledgeSource, KnowledgeSyncResult, SourceRecord
+from agno.knowledge.pipeline import IngestionPipeline
 from agno.utils.log import log_debug, log_info, logger
+from agno.utils.string import safe_content_hash
 from agno.vectordb import VectorDb
 
 
@@ -23,6 +30,14 @@ class AgentKnowledge(BaseModel):
     num_documents: int = 5
     # Number of documents to optimize the vector db on
     optimize_on: Optional[int] = 1000
+    # Number of content hashes looked up per query when filtering out existing documents
+    existence_check_batch_size: int = 1000
+    # Records the sources loaded into the vector db, used by `sync()` to only process changed sources
+    manifest: Optional[KnowledgeManifest] = None
+    # Caches search results, invalidated whenever documents are loaded into or removed from the vector db
+    search_cache: Optional[KnowledgeSearchCache] = None
+    # Loads documents through a staged read -> embed -> write pipeline with bounded memory in `load()` and `aload()`
+    ingestion_pipeline: Optional[IngestionPipeline] = None
 
     chunking_strategy: Optional[ChunkingStrategy] = None
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -49,6 +64,57 @@ class AgentKnowledge(BaseModel):
         """
         raise NotImplementedError
 
+    @property
+    def knowledge_sources(self) -> Iterator[KnowledgeSource]:
+        """Iterator that yields the sources of the knowledge base, e.g. files or URLs.
+        Each source can be fingerprinted and read independently, which is required by `sync()`.
+        """
+        raise NotImplementedError
+
+    def _read_source(
+        self, read: Callable[[], List[Document]], metadata: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Read a source and add the source metadata to its documents"""
+        documents = read()
+        if metadata:
+            for doc in documents:
+                doc.meta_data.update(metadata)
+        return documents
+
+    def _get_file_sources(
+        self,
+        path: Union[str, Path, List[Dict[str, Any]]],
+        formats: List[str],
+        read: Callable[[Path], List[Document]],
+        exclude_files: Optional[List[str]] = None,
+    ) -> Iterator[KnowledgeSource]:
+        """Yield a source per file of a file, a directory or a list of {"path": ..., "metadata": ...} items.
+
+        Only files with a suffix in formats and a name not in exclude_files are included. read(file) reads a file.
+        """
+        exclude_files = exclude_files or []
+
+        def is_valid_file(file_path: Path) -> bool:
+            return file_path.is_file() and file_path.suffix in formats and file_path.name not in exclude_files
+
+        if isinstance(path, list):
+            for item in path:
+                if isinstance(item, dict) and "path" in item:
+                    _file_path = Path(item["path"])
+                    if is_valid_file(_file_path):
+                        yield KnowledgeSource.from_path(
+                            _file_path,
+                            read=partial(self._read_source, partial(read, _file_path), item.get("metadata")),
+                        )
+        else:
+            _path = Path(path)
+            if _path.is_dir():
+                for _file in _path.glob("**/*"):
+                    if is_valid_file(_file):
+                        yield KnowledgeSource.from_path(_file, read=partial(read, _file))
+            elif is_valid_file(_path):
+                yield KnowledgeSource.from_path(_path, read=partial(read, _path))
+
     def _upsert_warning(self, upsert) -> None:
         """Log a warning if upsert is not available"""
         if upsert and self.vector_db is not None and not self.vector_db.upsert_available():
@@ -56,12 +122,19 @@ class AgentKnowledge(BaseModel):
                 f"Vector db '{self.vector_db.__class__.__module__}' does not support upsert. Falling back to insert."
             )
 
+    def _invalidate_search_cache(self) -> None:
+        """Drop cached search results after the documents in the vector db changed"""
+        if self.search_cache is not None:
+            self.search_cache.invalidate()
+
     def _load_init(self, recreate: bool, upsert: bool) -> None:
         """Initial setup for loading knowledge base"""
         if self.vector_db is None:
             logger.warning("No vector db provided")
             return
 
+        self._invalidate_search_cache()
+
         if recreate:
             log_info("Dropping collection")
             self.vector_db.drop()
@@ -78,6 +151,8 @@ class AgentKnowledge(BaseModel):
             logger.warning("No vector db provided")
             return
 
+        self._invalidate_search_cache()
+
         if recreate:
             log_info("Dropping collection")
             try:
@@ -96,6 +171,11 @@ class AgentKnowledge(BaseModel):
 
         self._upsert_warning(upsert)
 
+    def _cache_search_results(self, cache_key: Optional[str], documents: List[Document], cache_version: int) -> None:
+        """Cache the results of a search. Empty results are not cached, as vector dbs also return them on errors."""
+        if self.search_cache is not None and cache_key is not None and documents:
+            self.search_cache.set(cache_key, documents, cache_version)
+
     def search(
         self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
@@ -106,8 +186,19 @@ class AgentKnowledge(BaseModel):
                 return []
 
             _num_documents = num_documents or self.num_documents
+            cache_key, cache_version = None, 0
+            if self.search_cache is not None:
+                cache_key = self.search_cache.get_key(query, _num_documents, filters)
+                cache_version = self.search_cache.version
+                cached_documents = self.search_cache.get(cache_key)
+                if cached_documents is not None:
+                    log_debug(f"Using cached documents for query: {query}")
+                    return cached_documents
+
             log_debug(f"Getting {_num_documents} relevant documents for query: {query}")
-            return self.vector_db.search(query=query, limit=_num_documents, filters=filters)
+            documents = self.vector_db.search(query=query, limit=_num_documents, filters=filters)
+            self._cache_search_results(cache_key, documents, cache_version)
+            return documents
         except Exception as e:
             logger.error(f"Error searching for documents: {e}")
             return []
@@ -122,12 +213,23 @@ class AgentKnowledge(BaseModel):
                 return []
 
             _num_documents = num_documents or self.num_documents
+            cache_key, cache_version = None, 0
+            if self.search_cache is not None:
+                cache_key = self.search_cache.get_key(query, _num_documents, filters)
+                cache_version = self.search_cache.version
+                cached_documents = self.search_cache.get(cache_key)
+                if cached_documents is not None:
+                    log_debug(f"Using cached documents for query: {query}")
+                    return cached_documents
+
             log_debug(f"Getting {_num_documents} relevant documents for query: {query}")
             try:
-                return await self.vector_db.async_search(query=query, limit=_num_documents, filters=filters)
+                documents = await self.vector_db.async_search(query=query, limit=_num_documents, filters=filters)
             except NotImplementedError:
                 log_info("Vector db does not support async search")
                 return self.search(query=query, num_documents=_num_documents, filters=filters)
+            self._cache_search_results(cache_key, documents, cache_version)
+            return documents
         except Exception as e:
             logger.error(f"Error searching for documents: {e}")
             return []
@@ -150,6 +252,11 @@ class AgentKnowledge(BaseModel):
             return
 
         log_info("Loading knowledge base")
+        if self.ingestion_pipeline is not None:
+            self.ingestion_pipeline.run(self, upsert=upsert, skip_existing=skip_existing)
+            self._invalidate_search_cache()
+            return
+
         num_documents = 0
         for document_list in self.document_lists:
             documents_to_load = document_list
@@ -173,6 +280,7 @@ class AgentKnowledge(BaseModel):
                     self.vector_db.insert(documents=documents_to_load, filters=doc.meta_data)
 
             num_documents += len(documents_to_load)
+        self._invalidate_search_cache()
         log_info(f"Added {num_documents} documents to knowledge base")
 
     async def aload(
@@ -193,6 +301,11 @@ class AgentKnowledge(BaseModel):
             return
 
         log_info("Loading knowledge base")
+        if self.ingestion_pipeline is not None:
+            await self.ingestion_pipeline.arun(self, upsert=upsert, skip_existing=skip_existing)
+            self._invalidate_search_cache()
+            return
+
         num_documents = 0
         document_iterator = self.async_document_lists
         async for document_list in document_iterator:  # type: ignore
@@ -216,8 +329,143 @@ class AgentKnowledge(BaseModel):
                     await self.vector_db.async_insert(documents=documents_to_load, filters=doc.meta_data)
 
             num_documents += len(documents_to_load)
+        self._invalidate_search_cache()
         log_info(f"Added {num_documents} documents to knowledge base")
 
+    def sync(self, upsert: bool = False) -> KnowledgeSyncResult:
+        """Sync the vector db with the sources of the knowledge base, using the manifest to skip unchanged sources.
+
+        Added and changed sources are read and their new documents are loaded. Documents that are no longer
+        produced by any source are deleted from the vector db, as are the documents of removed sources. If the
+        vector db cannot delete them, the manifest keeps their hashes and the delete is retried on the next sync.
+
+        Args:
+            upsert (bool): If True, upserts the documents of added and changed sources. Defaults to False.
+        """
+        if self.manifest is None:
+            raise ValueError("A manifest is required to sync the knowledge base")
+
+        result = KnowledgeSyncResult()
+        self._load_init(recreate=False, upsert=upsert)
+        if self.vector_db is None:
+            return result
+
+        log_info("Syncing knowledge base")
+        self.manifest.create()
+        records = self.manifest.read_all()
+        # Number of sources referencing each document hash, so shared documents are only deleted when unused
+        references: Counter = Counter()
+        for stored_record in records.values():
+            references.update(set(stored_record.document_hashes))
+
+        seen_uris: Set[str] = set()
+        stale_hashes: Set[str] = set()
+        # Records whose stale hashes can be cleared once the stale documents are deleted
+        pending_records: List[SourceRecord] = []
+        for source in self.knowledge_sources:
+            seen_uris.add(source.uri)
+            record = records.get(source.uri)
+            if record is not None and record.stale_hashes:
+                # Retry deleting the documents an earlier sync could not delete
+                stale_hashes.update(record.stale_hashes)
+            if record is not None and record.matches(source):
+                result.unchanged.append(source.uri)
+                if record.stale_hashes:
+                    pending_records.append(record)
+                continue
+
+            source_hash = source.get_content_hash() if source.get_content_hash is not None else None
+            if record is not None and source_hash is not None and record.content_hash == source_hash:
+                # Touched but not modified, only update the fingerprint
+                log_debug(f"Source content unchanged: {source.uri}")
+                record.size, record.modified_at, record.etag = source.size, source.modified_at, source.etag
+                self.manifest.upsert(record)
+                result.unchanged.append(source.uri)
+                if record.stale_hashes:
+                    pending_records.append(record)
+                continue
+
+            documents_by_hash = self._dedupe_documents(source.read())
+            document_hashes = list(documents_by_hash.keys())
+            if source_hash is None:
+                source_hash = md5("".join(document_hashes).encode()).hexdigest()
+            source_stale_hashes = set(record.stale_hashes) if record is not None else set()
+            if record is not None and record.content_hash == source_hash:
+                result.unchanged.append(source.uri)
+            else:
+                old_hashes = set(record.document_hashes) if record is not None else set()
+                documents = [doc for content_hash, doc in documents_by_hash.items() if content_hash not in old_hashes]
+                for doc in documents:
+                    if doc.meta_data:
+                        self._track_metadata_structure(doc.meta_data)
+
+                if documents:
+                    if upsert and self.vector_db.upsert_available():
+                        self.vector_db.upsert(documents=documents, filters=documents[-1].meta_data)
+                    else:
+                        documents_to_load = self.filter_existing_documents(documents)
+                        if documents_to_load:
+                            self.vector_db.insert(documents=documents_to_load, filters=documents[-1].meta_data)
+
+                references.subtract(old_hashes)
+                references.update(document_hashes)
+                stale_hashes.update(old_hashes.difference(document_hashes))
+                source_stale_hashes.update(old_hashes)
+                (result.changed if record is not None else result.added).append(source.uri)
+
+            # Keep the old hashes of the source until they are deleted, so a failed delete is retried
+            source_stale_hashes.difference_update(document_hashes)
+            new_record = SourceRecord(
+                uri=source.uri,
+                size=source.size,
+                modified_at=source.modified_at,
+                etag=source.etag,
+                content_hash=source_hash,
+                document_hashes=document_hashes,
+                stale_hashes=sorted(source_stale_hashes),
+            )
+            self.manifest.upsert(new_record)
+            if new_record.stale_hashes:
+                pending_records.append(new_record)
+
+        for uri, record in records.items():
+            if uri in seen_uris:
+                continue
+            references.subtract(set(record.document_hashes))
+            stale_hashes.update(record.document_hashes)
+            stale_hashes.update(record.stale_hashes)
+            result.removed.append(uri)
+
+        hashes_to_delete = [content_hash for content_hash in stale_hashes if references[content_hash] <= 0]
+        deleted = True
+        if hashes_to_delete:
+            try:
+                deleted = self.vector_db.delete_by_content_hashes(hashes_to_delete)
+            except NotImplementedError:
+                logger.warning(f"Vector db '{self.vector_db.__class__.__module__}' does not support deleting documents")
+                deleted = False
+            except Exception as e:
+                logger.error(f"Error deleting stale documents: {e}")
+                deleted = False
+        self._invalidate_search_cache()
+        # Only forget stale documents and removed sources once the documents are deleted
+        if deleted:
+            for pending_record in pending_records:
+                pending_record.stale_hashes = []
+                self.manifest.upsert(pending_record)
+            for uri in result.removed:
+                self.manifest.delete(uri)
+        else:
+            logger.warning(
+                f"{len(hashes_to_delete)} stale documents were not removed, they will be retried on the next sync"
+            )
+
+        log_info(
+            f"Synced knowledge base: {len(result.added)} added, {len(result.changed)} changed, "
+            f"{len(result.removed)} removed, {len(result.unchanged)} unchanged sources"
+        )
+        return result
+
     def load_documents(
         self,
         documents: List[Document],
@@ -256,6 +504,7 @@ class AgentKnowledge(BaseModel):
                 log_info(f"Loaded {len(documents_to_load)} documents to knowledge base")
             else:
                 log_info("No new documents to load")
+        self._invalidate_search_cache()
 
     async def async_load_documents(
         self,
@@ -316,6 +565,7 @@ class AgentKnowledge(BaseModel):
                 log_info(f"Loaded {len(documents_to_load)} documents to knowledge base")
             else:
                 log_info("No new documents to load")
+        self._invalidate_search_cache()
 
     def load_document(
         self,
@@ -415,13 +665,27 @@ class AgentKnowledge(BaseModel):
             logger.warning("No vector db available")
             return True
 
-        return self.vector_db.delete()
+        deleted = self.vector_db.delete()
+        self._invalidate_search_cache()
+        return deleted
+
+    def _dedupe_documents(self, documents: List[Document]) -> Dict[str, Document]:
+        """Map content hash to document, dropping documents with duplicate content"""
+        documents_by_hash: Dict[str, Document] = {}
+        for doc in documents:
+            content_hash = safe_content_hash(doc.content)
+            if content_hash in documents_by_hash:
+                log_debug(f"Skipping duplicate document: {doc.name}")
+                continue
+            documents_by_hash[content_hash] = doc
+        return documents_by_hash
 
     def filter_existing_documents(self, documents: List[Document]) -> List[Document]:
         """Filter out documents that already exist in the vector database.
 
         This helper method is used across various knowledge base implementations
-        to avoid inserting duplicate documents.
+        to avoid inserting duplicate documents. Existence is checked in bulk, with one
+        query per `existence_check_batch_size` documents where the vector db supports it.
 
         Args:
             documents (List[Document]): List of documents to filter
@@ -433,19 +697,22 @@ class AgentKnowledge(BaseModel):
             log_debug("No vector database configured, skipping document filtering")
             return documents
 
-        # Use set for O(1) lookups
-        seen_content = set()
         original_count = len(documents)
-        filtered_documents = []
+        documents_by_hash = self._dedupe_documents(documents)
+        content_hashes = list(documents_by_hash.keys())
 
-        for doc in documents:
-            # Check hash and existence in DB
-            content_hash = doc.content  # Assuming doc.content is reliable hash key
-            if content_hash not in seen_content and not self.vector_db.doc_exists(doc):
-                seen_content.add(content_hash)
-                filtered_documents.append(doc)
-            else:
-                log_debug(f"Skipping existing document: {doc.name} (or duplicate content)")
+        try:
+            existing_hashes: Set[str] = set()
+            for i in range(0, len(content_hashes), self.existence_check_batch_size):
+                existing_hashes.update(
+                    self.vector_db.existing_content_hashes(content_hashes[i : i + self.existence_check_batch_size])
+                )
+            filtered_documents = [
+                doc for content_hash, doc in documents_by_hash.items() if content_hash not in existing_hashes
+            ]
+        except NotImplementedError:
+            # The vector db cannot check content hashes in bulk, check each document instead
+            filtered_documents = [doc for doc in documents_by_hash.values() if not self.vector_db.doc_exists(doc)]
 
         if len(filtered_documents) < original_count:
             log_info(f"Skipped {original_count - len(filtered_documents)} existing/duplicate documents.")
@@ -456,7 +723,8 @@ class AgentKnowledge(BaseModel):
         """Filter out documents that already exist in the vector database.
 
         This helper method is used across various knowledge base implementations
-        to avoid inserting duplicate documents.
+        to avoid inserting duplicate documents. Existence is checked in bulk, with one
+        query per `existence_check_batch_size` documents where the vector db supports it.
 
         Args:
             documents (List[Document]): List of documents to filter
@@ -464,25 +732,30 @@ class AgentKnowledge(BaseModel):
         Returns:
             List[Document]: Filtered list of documents that don't exist in the database
         """
-        from agno.utils.log import log_debug, log_info
-
         if not self.vector_db:
             log_debug("No vector database configured, skipping document filtering")
             return documents
 
-        # Use set for O(1) lookups
-        seen_content = set()
         original_count = len(documents)
-        filtered_documents = []
+        documents_by_hash = self._dedupe_documents(documents)
+        content_hashes = list(documents_by_hash.keys())
 
-        for doc in documents:
-            # Check hash and existence in DB
-            content_hash = doc.content  # Assuming doc.content is reliable hash key
-            if content_hash not in seen_content and not await self.vector_db.async_doc_exists(doc):
-                seen_content.add(content_hash)
-                filtered_documents.append(doc)
-            else:
-                log_debug(f"Skipping existing document: {doc.name} (or duplicate content)")
+        try:
+            existing_hashes: Set[str] = set()
+            for i in range(0, len(content_hashes), self.existence_check_batch_size):
+                existing_hashes.update(
+                    await self.vector_db.async_existing_content_hashes(
+                        content_hashes[i : i + self.existence_check_batch_size]
+                    )
+                )
+            filtered_documents = [
+                doc for content_hash, doc in documents_by_hash.items() if content_hash not in existing_hashes
+            ]
+        except NotImplementedError:
+            # The vector db cannot check content hashes in bulk, check each document instead
+            filtered_documents = [
+                doc for doc in documents_by_hash.values() if not await self.vector_db.async_doc_exists(doc)
+            ]
 
         if len(filtered_documents) < original_count:
             log_info(f"Skipped {original_count - len(filtered_documents)} existing/duplicate documents.")
@@ -652,6 +925,7 @@ class AgentKnowledge(BaseModel):
             else:
                 log_info("No new documents to insert after filtering.")
 
+        self._invalidate_search_cache()
         log_info(f"Finished loading documents from {source_info}.")
 
     async def aprocess_documents(
@@ -695,4 +969,5 @@ class AgentKnowledge(BaseModel):
             else:
                 log_info("No new documents to insert after filtering.")
 
+        self._invalidate_search_cache()
         log_info(f"Finished loading documents from {source_info}.")
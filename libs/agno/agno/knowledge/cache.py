@@ -0,0 +1,97 @@
+import json
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import replace
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, List, Optional, Tuple
+
+from agno.document import Document
+
+
+class KnowledgeSearchCache:
+    """LRU cache of knowledge search results with an optional time-to-live.
+
+    Entries are tagged with the collection version they were searched at. `invalidate()` bumps the version
+    and clears the cache, and results of searches that started before an invalidation are never stored.
+    Operations hold a lock for their duration only, so the cache can be shared by threads and coroutines.
+    Documents are copied in and out of the cache, so callers can modify the documents they get back.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = 300, lowercase_queries: bool = False):
+        """
+        Args:
+            max_size (int): Maximum number of cached searches. The least recently used search is evicted first.
+            ttl (Optional[float]): Seconds a cached search stays valid. None keeps searches until evicted or invalidated.
+            lowercase_queries (bool): Treat queries that only differ in case as the same search. Only enable this
+                if the vector db search is case-insensitive, e.g. with a case-insensitive embedder.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size: int = max_size
+        self.ttl: Optional[float] = ttl
+        self.lowercase_queries: bool = lowercase_queries
+        # Incremented every time the underlying collection changes
+        self.version: int = 0
+
+        self._entries: OrderedDict[str, Tuple[float, List[Document]]] = OrderedDict()
+        self._lock = Lock()
+
+    def get_key(self, query: str, num_documents: int, filters: Optional[Dict[str, Any]] = None) -> str:
+        """Build the cache key for a search from the normalized query, the filters and the number of documents.
+        Whitespace in the query is normalized, and the query is lowercased if `lowercase_queries` is set.
+        """
+        normalized_query = " ".join(query.split())
+        if self.lowercase_queries:
+            normalized_query = normalized_query.lower()
+        return json.dumps([normalized_query, num_documents, filters], sort_keys=True, default=str)
+
+    def get(self, key: str) -> Optional[List[Document]]:
+        """Return the cached documents for a key, or None if the key is missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, documents = entry
+            if self.ttl is not None and monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return self._copy_documents(documents)
+
+    def set(self, key: str, documents: List[Document], version: int) -> None:
+        """Cache the documents for a key, unless the collection changed since the search started at `version`"""
+        with self._lock:
+            if version != self.version:
+                return
+            expires_at = monotonic() + self.ttl if self.ttl is not None else 0.0
+            self._entries[key] = (expires_at, self._copy_documents(documents))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    @staticmethod
+    def _copy_documents(documents: List[Document]) -> List[Document]:
+        """Copy documents so the cached documents are not changed through the documents returned to callers"""
+        return [
+            replace(
+                doc,
+                meta_data=deepcopy(doc.meta_data),
+                embedding=list(doc.embedding) if doc.embedding is not None else None,
+                usage=deepcopy(doc.usage),
+            )
+            for doc in documents
+        ]
+
+    def invalidate(self) -> None:
+        """Mark the collection as changed, dropping all cached searches"""
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __deepcopy__(self, memo):
+        """Copies of a knowledge base, e.g. in per-run copies of an agent, share the cache"""
+        return self
@@ -2,6 +2,7 @@ from typing import AsyncIterator, Iterator, List
 
 from agno.document import Document
 from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.manifest.base import KnowledgeSource
 from agno.utils.log import log_debug
 
 
@@ -34,3 +35,9 @@ class CombinedKnowledgeBase(AgentKnowledge):
             log_debug(f"Loading documents from {kb.__class__.__name__}")
             async for document in kb.async_document_lists:  # type: ignore
                 yield document
+
+    @property
+    def knowledge_sources(self) -> Iterator[KnowledgeSource]:
+        """Iterate over knowledge bases and yield their sources."""
+        for kb in self.sources:
+            yield from kb.knowledge_sources
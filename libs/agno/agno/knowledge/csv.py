@@ -6,6 +6,7 @@ from pydantic import Field
 from agno.document import Document
 from agno.document.reader.csv_reader import CSVReader
 from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.manifest import KnowledgeSource
 from agno.utils.log import log_info, logger
 
 
@@ -49,6 +50,14 @@ class CSVKnowledgeBase(AgentKnowledge):
         """Helper to check if path is a valid CSV file."""
         return path.exists() and path.is_file() and path.suffix == ".csv" and path.name not in self.exclude_files
 
+    @property
+    def knowledge_sources(self) -> Iterator[KnowledgeSource]:
+        """Iterate over CSV files and yield a source per file."""
+        if self.path is None:
+            raise ValueError("Path is not set")
+
+        yield from self._get_file_sources(self.path, self.formats, self.reader.read, exclude_files=self.exclude_files)
+
     @property
     async def async_document_lists(self) -> AsyncIterator[List[Document]]:
         """Iterate over CSV files and yield lists of documents asynchronously."""
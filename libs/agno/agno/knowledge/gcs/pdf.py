@@ -70,6 +70,7 @@ class GCSPDFKnowledgeBase(GCSKnowledgeBase):
                     self.vector_db.insert(documents=documents_to_load, filters=filters_metadata)
 
             num_documents += len(documents_to_load)
+        self._invalidate_search_cache()
         log_info(f"Added {num_documents} documents to knowledge base")
 
     async def aload(
@@ -122,4 +123,5 @@ class GCSPDFKnowledgeBase(GCSKnowledgeBase):
                     await self.vector_db.async_insert(documents=documents_to_load, filters=filters_metadata)
 
             num_documents += len(documents_to_load)
+        self._invalidate_search_cache()
         log_info(f"Added {num_documents} documents to knowledge base")
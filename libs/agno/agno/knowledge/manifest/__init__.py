@@ -0,0 +1,8 @@
+from agno.knowledge.manifest.base import KnowledgeManifest, KnowledgeSource, KnowledgeSyncResult, SourceRecord
+
+__all__ = [
+    "KnowledgeManifest",
+    "KnowledgeSource",
+    "KnowledgeSyncResult",
+    "SourceRecord",
+]
@@ -0,0 +1,147 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from hashlib import md5
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from agno.document import Document
+from agno.utils.log import log_debug
+
+
+def file_content_hash(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Hash the contents of a file without loading it into memory"""
+    file_hash = md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+@dataclass
+class KnowledgeSource:
+    """A single source of a knowledge base, e.g. a file or a URL, that can be read independently"""
+
+    # Path or URL identifying the source
+    uri: str
+    # Reads the source into documents
+    read: Callable[[], List[Document]]
+    size: Optional[int] = None
+    # Modification time of the source, as a unix timestamp
+    modified_at: Optional[float] = None
+    etag: Optional[str] = None
+    # Computes the hash of the raw source content. Used to detect sources that were touched but not changed.
+    get_content_hash: Optional[Callable[[], str]] = None
+
+    @classmethod
+    def from_path(cls, path: Path, read: Callable[[], List[Document]]) -> "KnowledgeSource":
+        stat = path.stat()
+        return cls(
+            uri=str(path.resolve()),
+            read=read,
+            size=stat.st_size,
+            modified_at=stat.st_mtime,
+            get_content_hash=lambda: file_content_hash(path),
+        )
+
+    @classmethod
+    def from_url(cls, url: str, read: Callable[[], List[Document]]) -> "KnowledgeSource":
+        """Create a source for a URL, using a HEAD request to fingerprint it"""
+        import httpx
+
+        size: Optional[int] = None
+        etag: Optional[str] = None
+        try:
+            response = httpx.head(url, follow_redirects=True)
+            response.raise_for_status()
+            etag = response.headers.get("etag") or response.headers.get("last-modified")
+            content_length = response.headers.get("content-length")
+            size = int(content_length) if content_length is not None else None
+        except Exception as e:
+            log_debug(f"Could not fingerprint {url}: {e}")
+        return cls(uri=url, read=read, size=size, etag=etag)
+
+    @property
+    def has_fingerprint(self) -> bool:
+        return self.modified_at is not None or self.etag is not None
+
+
+@dataclass
+class SourceRecord:
+    """Manifest entry for a source that was loaded into the vector db"""
+
+    uri: str
+    size: Optional[int] = None
+    modified_at: Optional[float] = None
+    etag: Optional[str] = None
+    # Hash of the raw source content, or of its document hashes if the raw content cannot be hashed cheaply
+    content_hash: Optional[str] = None
+    # Content hashes of the documents the source was chunked into
+    document_hashes: List[str] = field(default_factory=list)
+    # Content hashes of documents from earlier versions of the source that are not yet deleted from the vector db
+    stale_hashes: List[str] = field(default_factory=list)
+    updated_at: Optional[int] = None
+
+    def matches(self, source: KnowledgeSource) -> bool:
+        """Returns True if the source fingerprint is unchanged since it was recorded"""
+        if not source.has_fingerprint:
+            return False
+        return self.size == source.size and self.modified_at == source.modified_at and self.etag == source.etag
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "uri": self.uri,
+            "size": self.size,
+            "modified_at": self.modified_at,
+            "etag": self.etag,
+            "content_hash": self.content_hash,
+            "document_hashes": self.document_hashes,
+            "stale_hashes": self.stale_hashes,
+            "updated_at": self.updated_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SourceRecord":
+        return cls(
+            uri=data["uri"],
+            size=data.get("size"),
+            modified_at=data.get("modified_at"),
+            etag=data.get("etag"),
+            content_hash=data.get("content_hash"),
+            document_hashes=data.get("document_hashes") or [],
+            stale_hashes=data.get("stale_hashes") or [],
+            updated_at=data.get("updated_at"),
+        )
+
+
+@dataclass
+class KnowledgeSyncResult:
+    """Sources processed by `AgentKnowledge.sync()`"""
+
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+
+
+class KnowledgeManifest(ABC):
+    """Records the sources loaded into a knowledge base so that only changed sources are processed on sync"""
+
+    @abstractmethod
+    def create(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def read_all(self) -> Dict[str, SourceRecord]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def upsert(self, record: SourceRecord) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, uri: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def drop(self) -> None:
+        raise NotImplementedError
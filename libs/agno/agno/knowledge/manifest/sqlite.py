@@ -0,0 +1,111 @@
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from agno.knowledge.manifest.base import KnowledgeManifest, SourceRecord
+from agno.utils.log import log_debug, logger
+
+try:
+    from sqlalchemy.dialects import sqlite
+    from sqlalchemy.engine import Engine, create_engine
+    from sqlalchemy.inspection import inspect
+    from sqlalchemy.orm import Session, sessionmaker
+    from sqlalchemy.schema import Column, MetaData, Table
+    from sqlalchemy.sql.expression import delete, select
+    from sqlalchemy.types import String
+except ImportError:
+    raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
+
+
+class SqliteKnowledgeManifest(KnowledgeManifest):
+    def __init__(
+        self,
+        table_name: str = "knowledge_manifest",
+        db_url: Optional[str] = None,
+        db_file: Optional[str] = None,
+        db_engine: Optional[Engine] = None,
+    ):
+        """
+        This class stores the knowledge manifest in a sqlite database.
+
+        The following order is used to determine the database connection:
+            1. Use the db_engine if provided
+            2. Use the db_url
+            3. Use the db_file
+            4. Create a new in-memory database
+
+        Args:
+            table_name: The name of the table to store the manifest in.
+            db_url: The database URL to connect to.
+            db_file: The database file to connect to.
+            db_engine: The SQLAlchemy database engine to use.
+        """
+        _engine: Optional[Engine] = db_engine
+        if _engine is None and db_url is not None:
+            _engine = create_engine(db_url)
+        elif _engine is None and db_file is not None:
+            db_path = Path(db_file).resolve()
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            _engine = create_engine(f"sqlite:///{db_path}")
+        elif _engine is None:
+            _engine = create_engine("sqlite://")
+
+        self.table_name: str = table_name
+        self.db_url: Optional[str] = db_url
+        self.db_engine: Engine = _engine
+        self.metadata: MetaData = MetaData()
+        self.Session: sessionmaker[Session] = sessionmaker(bind=self.db_engine)
+        self.table: Table = self.get_table()
+
+    def get_table(self) -> Table:
+        return Table(
+            self.table_name,
+            self.metadata,
+            Column("uri", String, primary_key=True),
+            Column("size", sqlite.INTEGER),
+            Column("modified_at", sqlite.FLOAT),
+            Column("etag", String),
+            Column("content_hash", String),
+            Column("document_hashes", sqlite.JSON),
+            Column("stale_hashes", sqlite.JSON),
+            Column("updated_at", sqlite.INTEGER),
+            extend_existing=True,
+        )
+
+    def table_exists(self) -> bool:
+        try:
+            return inspect(self.db_engine).has_table(self.table.name)
+        except Exception as e:
+            logger.error(f"Error checking if table exists: {e}")
+            return False
+
+    def create(self) -> None:
+        if not self.table_exists():
+            log_debug(f"Creating table: {self.table_name}")
+            self.table.create(self.db_engine, checkfirst=True)
+
+    def read_all(self) -> Dict[str, SourceRecord]:
+        if not self.table_exists():
+            return {}
+        with self.Session() as sess:
+            rows = sess.execute(select(self.table)).fetchall()
+            return {row.uri: SourceRecord.from_dict(dict(row._mapping)) for row in rows}
+
+    def upsert(self, record: SourceRecord) -> None:
+        record.updated_at = int(time.time())
+        values = record.to_dict()
+        stmt = sqlite.insert(self.table).values(**values)
+        stmt = stmt.on_conflict_do_update(index_elements=["uri"], set_={k: v for k, v in values.items() if k != "uri"})
+        with self.Session() as sess, sess.begin():
+            sess.execute(stmt)
+
+    def delete(self, uri: str) -> None:
+        if not self.table_exists():
+            return
+        with self.Session() as sess, sess.begin():
+            sess.execute(delete(self.table).where(self.table.c.uri == uri))
+
+    def drop(self) -> None:
+        if self.table_exists():
+            log_debug(f"Deleting table: {self.table_name}")
+            self.table.drop(self.db_engine)
@@ -7,6 +7,7 @@ from agno.document import Document
 from agno.document.chunking.markdown import MarkdownChunking
 from agno.document.reader.markdown_reader import MarkdownReader
 from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.manifest import KnowledgeSource
 from agno.utils.log import log_info, logger
 
 
@@ -56,6 +57,15 @@ class MarkdownKnowledgeBase(AgentKnowledge):
         """Helper to check if path is a valid text file."""
         return path.exists() and path.is_file() and path.suffix in self.formats
 
+    @property
+    def knowledge_sources(self) -> Iterator[KnowledgeSource]:
+        """Iterate over markdown files and yield a source per file."""
+        self.reader = cast(MarkdownReader, self.reader)
+        if self.path is None:
+            raise ValueError("Path is not set")
+
+        yield from self._get_file_sources(self.path, self.formats, self.reader.read)
+
     @property
     async def async_document_lists(self) -> AsyncIterator[List[Document]]:
         """Iterate over text files and yield lists of documents asynchronously."""
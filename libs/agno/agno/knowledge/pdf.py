@@ -1,5 +1,6 @@
+from functools import partial
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 
 from pydantic import Field
 from typing_extensions import TypedDict
@@ -7,6 +8,7 @@ from typing_extensions import TypedDict
 from agno.document import Document
 from agno.document.reader.pdf_reader import PDFImageReader, PDFReader
 from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.manifest import KnowledgeSource
 from agno.utils.log import log_error, log_info, logger
 
 
@@ -28,31 +30,40 @@ class PDFKnowledgeBase(AgentKnowledge):
         if self.path is None:
             raise ValueError("Path is not set")
 
+        pdf_files = list(self._get_pdf_files())
+        if self.reader.parallel == "process":
+            # Extract the pages of several files at once in the reader's process pool
+            document_lists = self.reader.read_many([(pdf_path, password) for pdf_path, password, _ in pdf_files])
+        else:
+            document_lists = (self.reader.read(pdf=pdf_path, password=password) for pdf_path, password, _ in pdf_files)
+
+        for (_, _, config), documents in zip(pdf_files, document_lists):
+            if config:
+                for doc in documents:
+                    log_info(f"Adding metadata {config} to document: {doc.name}")
+                    doc.meta_data.update(config)  # type: ignore
+            yield documents
+
+    def _get_pdf_files(self) -> Iterator[Tuple[Path, Optional[str], Dict[str, Any]]]:
+        """Iterate over the PDF files of the knowledge base and yield their path, password and metadata."""
         if isinstance(self.path, list):
             for item in self.path:
                 if isinstance(item, dict) and "path" in item:
-                    file_path = item["path"]
-                    config = item.get("metadata", {})
                     file_password = item.get("password")
                     if file_password is not None and not isinstance(file_password, str):
                         file_password = None
 
-                    _pdf_path = Path(file_path)  # type: ignore
+                    _pdf_path = Path(item["path"])  # type: ignore
                     if self._is_valid_pdf(_pdf_path):
-                        documents = self.reader.read(pdf=_pdf_path, password=file_password)
-                        if config:
-                            for doc in documents:
-                                log_info(f"Adding metadata {config} to document: {doc.name}")
-                                doc.meta_data.update(config)  # type: ignore
-                        yield documents
+                        yield _pdf_path, file_password, item.get("metadata") or {}  # type: ignore
         else:
-            _pdf_path = Path(self.path)
+            _pdf_path = Path(self.path)  # type: ignore
             if _pdf_path.is_dir():
                 for _pdf in _pdf_path.glob("**/*.pdf"):
                     if _pdf.name not in self.exclude_files:
-                        yield self.reader.read(pdf=_pdf)
+                        yield _pdf, None, {}
             elif self._is_valid_pdf(_pdf_path):
-                yield self.reader.read(pdf=_pdf_path)
+                yield _pdf_path, None, {}
 
     def _is_valid_pdf(self, path: Path) -> bool:
         """Helper to check if path is a valid PDF file."""
@@ -70,6 +81,18 @@ class PDFKnowledgeBase(AgentKnowledge):
             return False
         return True
 
+    @property
+    def knowledge_sources(self) -> Iterator[KnowledgeSource]:
+        """Iterate over PDFs and yield a source per file."""
+        if self.path is None:
+            raise ValueError("Path is not set")
+
+        for pdf_path, password, config in self._get_pdf_files():
+            yield KnowledgeSource.from_path(
+                pdf_path,
+                read=partial(self._read_source, partial(self.reader.read, pdf=pdf_path, password=password), config),
+            )
+
     @property
     async def async_document_lists(self) -> AsyncIterator[List[Document]]:
         """Iterate over PDFs and yield lists of documents asynchronously."""
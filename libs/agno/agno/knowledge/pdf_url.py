@@ -1,8 +1,10 @@
-from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
+from functools import partial
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 
 from agno.document import Document
 from agno.document.reader.pdf_reader import PDFUrlImageReader, PDFUrlReader
 from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.manifest import KnowledgeSource
 from agno.utils.log import log_info, logger
 
 
@@ -45,6 +47,33 @@ class PDFUrlKnowledgeBase(AgentKnowledge):
             return False
         return True
 
+    def _get_pdf_urls(self) -> Iterator[Tuple[str, Optional[str], Dict[str, Any]]]:
+        """Iterate over the PDF URLs of the knowledge base and yield their url, password and metadata."""
+        for item in self.urls or []:
+            if isinstance(item, dict) and "url" in item:
+                url = item["url"]
+                pdf_password = item.get("password")
+                if pdf_password is not None and not isinstance(pdf_password, str):
+                    pdf_password = None
+
+                metadata = item.get("metadata")
+                if isinstance(url, str) and self._is_valid_url(url):
+                    yield url, pdf_password, metadata if isinstance(metadata, dict) else {}
+            elif isinstance(item, str) and self._is_valid_url(item):
+                yield item, None, {}
+
+    @property
+    def knowledge_sources(self) -> Iterator[KnowledgeSource]:
+        """Iterate over PDF URLs and yield a source per URL."""
+        if self.urls is None:
+            raise ValueError("URLs are not set")
+
+        for url, password, config in self._get_pdf_urls():
+            yield KnowledgeSource.from_url(
+                url,
+                read=partial(self._read_source, partial(self.reader.read, url=url, password=password), config),
+            )
+
     @property
     async def async_document_lists(self) -> AsyncIterator[List[Document]]:
         """Iterate over PDF URLs and yield lists of documents asynchronously."""
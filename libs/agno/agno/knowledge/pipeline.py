@@ -0,0 +1,317 @@
+import asyncio
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional
+
+from agno.document import Document
+from agno.embedder import Embedder
+from agno.utils.log import log_debug, log_info, logger
+
+if TYPE_CHECKING:
+    from agno.knowledge.agent import AgentKnowledge
+
+# Seconds a blocked stage waits before checking whether another stage failed
+_QUEUE_POLL_INTERVAL = 0.1
+
+
+@dataclass
+class IngestionMetrics:
+    """Progress and throughput of an ingestion run"""
+
+    sources_read: int = 0
+    documents_read: int = 0
+    documents_embedded: int = 0
+    documents_written: int = 0
+    batches_written: int = 0
+    # Seconds each stage spent working, excluding time waiting on the other stages
+    read_time: float = 0.0
+    embed_time: float = 0.0
+    write_time: float = 0.0
+    elapsed: float = 0.0
+
+    @property
+    def documents_per_second(self) -> float:
+        return self.documents_written / self.elapsed if self.elapsed > 0 else 0.0
+
+
+@dataclass
+class _Batch:
+    """Documents passed between the stages, written to the vector db with the same filters"""
+
+    documents: List[Document]
+    filters: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class IngestionPipeline:
+    """Loads a knowledge base into its vector db in stages: read -> embed -> write.
+
+    Stages run concurrently and are connected by bounded queues, so a slow stage applies backpressure to the
+    stages before it and at most `queue_size` batches are held in memory between two stages. Documents are
+    embedded in batches of `embed_batch_size` by `embed_concurrency` workers and written in batches of up to
+    `write_batch_size`, so ingestion keeps the embedder busy while the vector db writes the previous batches.
+    Sources are read one at a time from `document_lists`, chunking happens in the reader.
+    """
+
+    # Number of documents embedded per request
+    embed_batch_size: int = 100
+    # Number of embedding requests in flight
+    embed_concurrency: int = 4
+    # Maximum number of documents written to the vector db per call
+    write_batch_size: int = 500
+    # Maximum number of batches waiting between two stages
+    queue_size: int = 8
+    # Called with the metrics after every write
+    progress_callback: Optional[Callable[[IngestionMetrics], None]] = None
+    # Metrics of the last run
+    metrics: IngestionMetrics = field(default_factory=IngestionMetrics)
+
+    def _get_embedder(self, knowledge: "AgentKnowledge") -> Optional[Embedder]:
+        """The embedder of the vector db, or None if the vector db embeds documents itself"""
+        return getattr(knowledge.vector_db, "embedder", None)
+
+    def _split(self, documents: List[Document], filters: Optional[Dict[str, Any]]) -> Iterator[_Batch]:
+        for i in range(0, len(documents), self.embed_batch_size):
+            yield _Batch(documents=documents[i : i + self.embed_batch_size], filters=filters)
+
+    def _read_source(self, knowledge: "AgentKnowledge", document_list: List[Document]) -> Optional[Dict[str, Any]]:
+        """Track the metadata of a source and return the filters its documents are written with"""
+        self.metrics.sources_read += 1
+        self.metrics.documents_read += len(document_list)
+        for doc in document_list:
+            if doc.meta_data:
+                knowledge._track_metadata_structure(doc.meta_data)
+        return document_list[-1].meta_data if document_list else None
+
+    def _record_write(self, batch: _Batch) -> None:
+        self.metrics.documents_written += len(batch.documents)
+        self.metrics.batches_written += 1
+        log_debug(f"Wrote {self.metrics.documents_written} documents to the vector db")
+        if self.progress_callback is not None:
+            self.progress_callback(self.metrics)
+
+    def _merge(self, pending: Optional[_Batch], batch: _Batch) -> Optional[_Batch]:
+        """Add a batch to the pending write if it has the same filters and fits, otherwise return None"""
+        if (
+            pending is not None
+            and pending.filters == batch.filters
+            and len(pending.documents) + len(batch.documents) <= self.write_batch_size
+        ):
+            pending.documents.extend(batch.documents)
+            return pending
+        return None
+
+    def _log_metrics(self) -> None:
+        log_info(
+            f"Added {self.metrics.documents_written} documents from {self.metrics.sources_read} sources to knowledge "
+            f"base in {self.metrics.elapsed:.2f}s ({self.metrics.documents_per_second:.1f} documents/s, "
+            f"read {self.metrics.read_time:.2f}s, embed {self.metrics.embed_time:.2f}s, "
+            f"write {self.metrics.write_time:.2f}s)"
+        )
+
+    def run(self, knowledge: "AgentKnowledge", upsert: bool = False, skip_existing: bool = True) -> IngestionMetrics:
+        """Load the documents of a knowledge base into its vector db
+
+        The reader and the embedding workers run in threads, the calling thread writes to the vector db.
+
+        Args:
+            knowledge (AgentKnowledge): The knowledge base to load.
+            upsert (bool): If True, upserts documents to the vector db. Defaults to False.
+            skip_existing (bool): If True, skips documents which already exist in the vector db when inserting.
+        """
+        vector_db = knowledge.vector_db
+        if vector_db is None:
+            logger.warning("No vector db provided")
+            return self.metrics
+
+        self.metrics = IngestionMetrics()
+        start = perf_counter()
+        use_upsert = upsert and vector_db.upsert_available()
+        embedder = self._get_embedder(knowledge)
+        embed_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        write_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        failed = threading.Event()
+        lock = threading.Lock()
+
+        def put(q: queue.Queue, item: Optional[_Batch]) -> None:
+            while not failed.is_set():
+                try:
+                    q.put(item, timeout=_QUEUE_POLL_INTERVAL)
+                    return
+                except queue.Full:
+                    continue
+
+        def get(q: queue.Queue) -> Optional[_Batch]:
+            while not failed.is_set():
+                try:
+                    return q.get(timeout=_QUEUE_POLL_INTERVAL)
+                except queue.Empty:
+                    continue
+            return None
+
+        def read() -> None:
+            try:
+                document_lists = iter(knowledge.document_lists)
+                while not failed.is_set():
+                    read_start = perf_counter()
+                    document_list = next(document_lists, None)
+                    if document_list is None:
+                        break
+                    filters = self._read_source(knowledge, document_list)
+                    if not use_upsert and skip_existing:
+                        document_list = knowledge.filter_existing_documents(document_list)
+                    self.metrics.read_time += perf_counter() - read_start
+                    for batch in self._split(document_list, filters):
+                        put(embed_queue, batch)
+            except BaseException:
+                failed.set()
+                raise
+            finally:
+                for _ in range(self.embed_concurrency):
+                    put(embed_queue, None)
+
+        def embed() -> None:
+            try:
+                while (batch := get(embed_queue)) is not None:
+                    if embedder is not None:
+                        embed_start = perf_counter()
+                        Document.embed_many(batch.documents, embedder=embedder)
+                        with lock:
+                            self.metrics.embed_time += perf_counter() - embed_start
+                            self.metrics.documents_embedded += len(batch.documents)
+                    put(write_queue, batch)
+            except BaseException:
+                failed.set()
+                raise
+            finally:
+                put(write_queue, None)
+
+        def write(batch: _Batch) -> None:
+            write_start = perf_counter()
+            if use_upsert:
+                vector_db.upsert(documents=batch.documents, filters=batch.filters)
+            else:
+                vector_db.insert(documents=batch.documents, filters=batch.filters)
+            self.metrics.write_time += perf_counter() - write_start
+            self._record_write(batch)
+
+        with ThreadPoolExecutor(max_workers=self.embed_concurrency + 1, thread_name_prefix="agno-ingest") as executor:
+            futures = [executor.submit(read)] + [executor.submit(embed) for _ in range(self.embed_concurrency)]
+            try:
+                pending: Optional[_Batch] = None
+                finished_workers = 0
+                while finished_workers < self.embed_concurrency and not failed.is_set():
+                    batch = get(write_queue)
+                    if batch is None:
+                        finished_workers += 1
+                        continue
+                    if self._merge(pending, batch) is None:
+                        if pending is not None:
+                            write(pending)
+                        pending = _Batch(documents=list(batch.documents), filters=batch.filters)
+                if pending is not None and not failed.is_set():
+                    write(pending)
+            except BaseException:
+                failed.set()
+                raise
+            # Raise the first error of the reader or the embedding workers
+            for future in futures:
+                future.result()
+
+        self.metrics.elapsed = perf_counter() - start
+        self._log_metrics()
+        return self.metrics
+
+    async def arun(
+        self, knowledge: "AgentKnowledge", upsert: bool = False, skip_existing: bool = True
+    ) -> IngestionMetrics:
+        """Asynchronously load the documents of a knowledge base into its vector db
+
+        Args:
+            knowledge (AgentKnowledge): The knowledge base to load.
+            upsert (bool): If True, upserts documents to the vector db. Defaults to False.
+            skip_existing (bool): If True, skips documents which already exist in the vector db when inserting.
+        """
+        vector_db = knowledge.vector_db
+        if vector_db is None:
+            logger.warning("No vector db provided")
+            return self.metrics
+
+        self.metrics = IngestionMetrics()
+        start = perf_counter()
+        use_upsert = upsert and vector_db.upsert_available()
+        embedder = self._get_embedder(knowledge)
+        embed_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        write_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+
+        async def read() -> None:
+            read_start = perf_counter()
+            async for document_list in knowledge.async_document_lists:  # type: ignore
+                filters = self._read_source(knowledge, document_list)
+                if not use_upsert and skip_existing:
+                    document_list = await knowledge.async_filter_existing_documents(document_list)
+                self.metrics.read_time += perf_counter() - read_start
+                for batch in self._split(document_list, filters):
+                    await embed_queue.put(batch)
+                read_start = perf_counter()
+            for _ in range(self.embed_concurrency):
+                await embed_queue.put(None)
+
+        async def embed() -> None:
+            while (batch := await embed_queue.get()) is not None:
+                if embedder is not None:
+                    embed_start = perf_counter()
+                    await Document.async_embed_many(batch.documents, embedder=embedder)
+                    self.metrics.embed_time += perf_counter() - embed_start
+                    self.metrics.documents_embedded += len(batch.documents)
+                await write_queue.put(batch)
+
+        async def embed_stage() -> None:
+            await asyncio.gather(*[embed() for _ in range(self.embed_concurrency)])
+            await write_queue.put(None)
+
+        async def write(batch: _Batch) -> None:
+            write_start = perf_counter()
+            if use_upsert:
+                try:
+                    await vector_db.async_upsert(documents=batch.documents, filters=batch.filters)
+                except NotImplementedError:
+                    vector_db.upsert(documents=batch.documents, filters=batch.filters)
+            else:
+                try:
+                    await vector_db.async_insert(documents=batch.documents, filters=batch.filters)
+                except NotImplementedError:
+                    vector_db.insert(documents=batch.documents, filters=batch.filters)
+            self.metrics.write_time += perf_counter() - write_start
+            self._record_write(batch)
+
+        async def write_stage() -> None:
+            pending: Optional[_Batch] = None
+            while (batch := await write_queue.get()) is not None:
+                if self._merge(pending, batch) is None:
+                    if pending is not None:
+                        await write(pending)
+                    pending = _Batch(documents=list(batch.documents), filters=batch.filters)
+            if pending is not None:
+                await write(pending)
+
+        tasks = [asyncio.create_task(read()), asyncio.create_task(embed_stage()), asyncio.create_task(write_stage())]
+        try:
+            done, pending_tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        # A stage failed, stop the others and raise its error
+        for task in pending_tasks:
+            task.cancel()
+        for task in tasks:
+            if task.done() and not task.cancelled() and task.exception() is not None:
+                raise task.exception()  # type: ignore
+
+        self.metrics.elapsed = perf_counter() - start
+        self._log_metrics()
+        return self.metrics
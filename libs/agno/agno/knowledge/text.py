@@ -4,6 +4,7 @@ from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
 from agno.document import Document
 from agno.document.reader.text_reader import TextReader
 from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.manifest import KnowledgeSource
 from agno.utils.log import log_info, logger
 
 
@@ -46,6 +47,14 @@ class TextKnowledgeBase(AgentKnowledge):
         """Helper to check if path is a valid text file."""
         return path.exists() and path.is_file() and path.suffix in self.formats
 
+    @property
+    def knowledge_sources(self) -> Iterator[KnowledgeSource]:
+        """Iterate over text files and yield a source per file."""
+        if self.path is None:
+            raise ValueError("Path is not set")
+
+        yield from self._get_file_sources(self.path, self.formats, self.reader.read)
+
     @property
     async def async_document_lists(self) -> AsyncIterator[List[Document]]:
         """Iterate over text files and yield lists of documents asynchronously."""
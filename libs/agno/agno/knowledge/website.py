@@ -72,6 +72,7 @@ class WebsiteKnowledgeBase(AgentKnowledge):
         if recreate:
             log_debug("Dropping collection")
             self.vector_db.drop()
+            self._invalidate_search_cache()
 
         log_debug("Creating collection")
         self.vector_db.create()
@@ -102,6 +103,7 @@ class WebsiteKnowledgeBase(AgentKnowledge):
                     self.vector_db.insert(documents=document_list, filters=filters)
                 num_documents += len(document_list)
                 log_info(f"Loaded {num_documents} documents to knowledge base")
+        self._invalidate_search_cache()
 
         if self.optimize_on is not None and num_documents > self.optimize_on:
             log_debug("Optimizing Vector DB")
@@ -130,6 +132,7 @@ class WebsiteKnowledgeBase(AgentKnowledge):
         if recreate:
             log_debug("Dropping collection asynchronously")
             await vector_db.async_drop()
+            self._invalidate_search_cache()
 
         log_debug("Creating collection asynchronously")
         await vector_db.async_create()
@@ -173,6 +176,7 @@ class WebsiteKnowledgeBase(AgentKnowledge):
                     await vector_db.async_insert(documents=document_list, filters=filters)
                 num_documents += len(document_list)
                 log_info(f"Loaded {num_documents} documents to knowledge base asynchronously")
+        self._invalidate_search_cache()
 
         if self.optimize_on is not None and num_documents > self.optimize_on:
             log_debug("Optimizing Vector DB")
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from agno.memory.v2.db.schema import MemoryRow
 
@@ -40,3 +40,28 @@ class MemoryDb(ABC):
     @abstractmethod
     def clear(self) -> bool:
         raise NotImplementedError
+
+    def upsert_memory_embedding(
+        self, memory_id: str, embedding: List[float], content_hash: str, user_id: Optional[str] = None
+    ) -> None:
+        """Store the embedding of a memory in a sidecar table, used for semantic memory retrieval.
+
+        Memory dbs that do not implement this only keep embeddings in-process.
+        """
+        raise NotImplementedError
+
+    def upsert_memory_embeddings(
+        self, embeddings: Dict[str, Tuple[str, List[float]]], user_id: Optional[str] = None
+    ) -> None:
+        """Store the embeddings of several memories, as a mapping of memory ID to (content hash, embedding).
+
+        Memory dbs that do not implement a bulk upsert store the embeddings one at a time.
+        """
+        for memory_id, (content_hash, embedding) in embeddings.items():
+            self.upsert_memory_embedding(
+                memory_id=memory_id, embedding=embedding, content_hash=content_hash, user_id=user_id
+            )
+
+    def read_memory_embeddings(self, user_id: Optional[str] = None) -> Dict[str, Tuple[str, List[float]]]:
+        """Read stored memory embeddings, as a mapping of memory ID to (content hash, embedding)."""
+        raise NotImplementedError
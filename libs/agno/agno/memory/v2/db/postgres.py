@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     from sqlalchemy.dialects import postgresql
@@ -52,6 +52,9 @@ class PostgresMemoryDb(MemoryDb):
         self.metadata: MetaData = MetaData(schema=self.schema)
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
         self.table: Table = self.get_table()
+        # Sidecar table for memory embeddings, created on the first write
+        self.embeddings_table: Table = self.get_embeddings_table()
+        self._embeddings_table_created: bool = False
 
     def __dict__(self) -> Dict[str, Any]:
         return {
@@ -72,6 +75,18 @@ class PostgresMemoryDb(MemoryDb):
             extend_existing=True,
         )
 
+    def get_embeddings_table(self) -> Table:
+        return Table(
+            f"{self.table_name}_embeddings",
+            self.metadata,
+            Column("memory_id", String, primary_key=True),
+            Column("user_id", String, index=True),
+            Column("content_hash", String),
+            Column("embedding", postgresql.JSONB),
+            Column("updated_at", DateTime(timezone=True), server_default=text("now()"), onupdate=text("now()")),
+            extend_existing=True,
+        )
+
     def create(self) -> None:
         if not self.table_exists():
             try:
@@ -156,11 +171,69 @@ class PostgresMemoryDb(MemoryDb):
         with self.Session() as sess, sess.begin():
             stmt = delete(self.table).where(self.table.c.id == memory_id)
             sess.execute(stmt)
+            if self.embeddings_table_exists():
+                sess.execute(delete(self.embeddings_table).where(self.embeddings_table.c.memory_id == memory_id))
+
+    def embeddings_table_exists(self) -> bool:
+        try:
+            return inspect(self.db_engine).has_table(self.embeddings_table.name, schema=self.schema)
+        except Exception as e:
+            logger.error(e)
+            return False
+
+    def _create_embeddings_table(self) -> None:
+        """Create the embeddings table once, instead of checking for it on every write"""
+        if not self._embeddings_table_created:
+            self.embeddings_table.create(self.db_engine, checkfirst=True)
+            self._embeddings_table_created = True
+
+    def upsert_memory_embedding(
+        self, memory_id: str, embedding: List[float], content_hash: str, user_id: Optional[str] = None
+    ) -> None:
+        self.upsert_memory_embeddings({memory_id: (content_hash, embedding)}, user_id=user_id)
+
+    def upsert_memory_embeddings(
+        self, embeddings: Dict[str, Tuple[str, List[float]]], user_id: Optional[str] = None
+    ) -> None:
+        if not embeddings:
+            return
+        self._create_embeddings_table()
+        with self.Session() as sess, sess.begin():
+            stmt = postgresql.insert(self.embeddings_table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["memory_id"],
+                set_=dict(
+                    user_id=stmt.excluded.user_id,
+                    content_hash=stmt.excluded.content_hash,
+                    embedding=stmt.excluded.embedding,
+                ),
+            )
+            sess.execute(
+                stmt,
+                [
+                    dict(memory_id=memory_id, user_id=user_id, content_hash=content_hash, embedding=embedding)
+                    for memory_id, (content_hash, embedding) in embeddings.items()
+                ],
+            )
+
+    def read_memory_embeddings(self, user_id: Optional[str] = None) -> Dict[str, Tuple[str, List[float]]]:
+        embeddings: Dict[str, Tuple[str, List[float]]] = {}
+        if not self.embeddings_table_exists():
+            return embeddings
+        with self.Session() as sess, sess.begin():
+            stmt = select(self.embeddings_table)
+            if user_id is not None:
+                stmt = stmt.where(self.embeddings_table.c.user_id == user_id)
+            for row in sess.execute(stmt).fetchall():
+                embeddings[row.memory_id] = (row.content_hash, row.embedding)
+        return embeddings
 
     def drop_table(self) -> None:
         if self.table_exists():
             log_debug(f"Deleting table: {self.table_name}")
             self.table.drop(self.db_engine)
+        self.embeddings_table.drop(self.db_engine, checkfirst=True)
+        self._embeddings_table_created = False
 
     def table_exists(self) -> bool:
         log_debug(f"Checking if table exists: {self.table.name}")
@@ -176,6 +249,8 @@ class PostgresMemoryDb(MemoryDb):
                 stmt = delete(self.table)
                 log_info(f"Clearing table: {self.table.name}")
                 sess.execute(stmt)
+                if self.embeddings_table_exists():
+                    sess.execute(delete(self.embeddings_table))
                 return True
         return False
 
@@ -199,7 +274,7 @@ class PostgresMemoryDb(MemoryDb):
         # Deep copy attributes
 
         for k, v in self.__dict__().items():
-            if k in {"metadata", "table"}:
+            if k in {"metadata", "table", "embeddings_table"}:
                 continue
             # Reuse db_engine and Session without copying
             elif k in {"db_engine", "Session"}:
@@ -210,5 +285,7 @@ class PostgresMemoryDb(MemoryDb):
         # Recreate metadata and table for the copied instance
         copied_obj.metadata = MetaData(schema=copied_obj.schema)
         copied_obj.table = copied_obj.get_table()
+        copied_obj.embeddings_table = copied_obj.get_embeddings_table()
+        copied_obj._embeddings_table_created = False
 
         return copied_obj
@@ -43,7 +43,7 @@ class RedisMemoryDb(MemoryDb):
             db=db,
             password=password,
             decode_responses=True,  # Automatically decode responses to str
-            ssl=ssl,
+            ssl=bool(ssl),
         )
         log_debug(f"Created RedisMemoryDb with prefix: '{self.prefix}'")
 
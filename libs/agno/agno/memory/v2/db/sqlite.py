@@ -1,5 +1,6 @@
+import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     from sqlalchemy import (
@@ -15,6 +16,7 @@ try:
         select,
         text,
     )
+    from sqlalchemy.dialects import sqlite
     from sqlalchemy.exc import SQLAlchemyError
     from sqlalchemy.orm import scoped_session, sessionmaker
 except ImportError:
@@ -75,6 +77,9 @@ class SqliteMemoryDb(MemoryDb):
         self.Session = scoped_session(sessionmaker(bind=self.db_engine))
         # Database table for memories
         self.table: Table = self.get_table()
+        # Sidecar table for memory embeddings, created on the first write
+        self.embeddings_table: Table = self.get_embeddings_table()
+        self._embeddings_table_created: bool = False
 
     def __dict__(self) -> Dict[str, Any]:
         return {
@@ -97,6 +102,18 @@ class SqliteMemoryDb(MemoryDb):
             extend_existing=True,
         )
 
+    def get_embeddings_table(self) -> Table:
+        return Table(
+            f"{self.table_name}_embeddings",
+            self.metadata,
+            Column("memory_id", String, primary_key=True),
+            Column("user_id", String, index=True),
+            Column("content_hash", String),
+            Column("embedding", String),
+            Column("updated_at", DateTime, server_default=text("CURRENT_TIMESTAMP")),
+            extend_existing=True,
+        )
+
     def create(self) -> None:
         if not self.table_exists():
             try:
@@ -181,12 +198,77 @@ class SqliteMemoryDb(MemoryDb):
         with self.Session() as session:
             stmt = delete(self.table).where(self.table.c.id == memory_id)
             session.execute(stmt)
+            if self.embeddings_table_exists():
+                session.execute(delete(self.embeddings_table).where(self.embeddings_table.c.memory_id == memory_id))
             session.commit()
 
+    def embeddings_table_exists(self) -> bool:
+        try:
+            return inspect(self.db_engine).has_table(self.embeddings_table.name)
+        except Exception as e:
+            logger.error(e)
+            return False
+
+    def _create_embeddings_table(self) -> None:
+        """Create the embeddings table once, instead of checking for it on every write"""
+        if not self._embeddings_table_created:
+            self.embeddings_table.create(self.db_engine, checkfirst=True)
+            self._embeddings_table_created = True
+
+    def upsert_memory_embedding(
+        self, memory_id: str, embedding: List[float], content_hash: str, user_id: Optional[str] = None
+    ) -> None:
+        self.upsert_memory_embeddings({memory_id: (content_hash, embedding)}, user_id=user_id)
+
+    def upsert_memory_embeddings(
+        self, embeddings: Dict[str, Tuple[str, List[float]]], user_id: Optional[str] = None
+    ) -> None:
+        if not embeddings:
+            return
+        self._create_embeddings_table()
+        with self.Session() as session:
+            stmt = sqlite.insert(self.embeddings_table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["memory_id"],
+                set_=dict(
+                    user_id=stmt.excluded.user_id,
+                    content_hash=stmt.excluded.content_hash,
+                    embedding=stmt.excluded.embedding,
+                    updated_at=text("CURRENT_TIMESTAMP"),
+                ),
+            )
+            session.execute(
+                stmt,
+                [
+                    dict(
+                        memory_id=memory_id,
+                        user_id=user_id,
+                        content_hash=content_hash,
+                        embedding=json.dumps(embedding),
+                    )
+                    for memory_id, (content_hash, embedding) in embeddings.items()
+                ],
+            )
+            session.commit()
+
+    def read_memory_embeddings(self, user_id: Optional[str] = None) -> Dict[str, Tuple[str, List[float]]]:
+        embeddings: Dict[str, Tuple[str, List[float]]] = {}
+        if not self.embeddings_table_exists():
+            return embeddings
+        with self.Session() as session:
+            stmt = select(self.embeddings_table)
+            if user_id is not None:
+                stmt = stmt.where(self.embeddings_table.c.user_id == user_id)
+            for row in session.execute(stmt):
+                embeddings[row.memory_id] = (row.content_hash, json.loads(row.embedding))
+        return embeddings
+
     def drop_table(self) -> None:
         if self.table_exists():
             log_debug(f"Deleting table: {self.table_name}")
             self.table.drop(self.db_engine)
+        self.embeddings_table.drop(self.db_engine, checkfirst=True)
+        self._embeddings_table_created = False
 
     def table_exists(self) -> bool:
         log_debug(f"Checking if table exists: {self.table.name}")
@@ -201,7 +283,9 @@ class SqliteMemoryDb(MemoryDb):
             if self.table_exists():
                 stmt = delete(self.table)
                 session.execute(stmt)
-                session.commit()
+            if self.embeddings_table_exists():
+                session.execute(delete(self.embeddings_table))
+            session.commit()
         return True
 
     def __del__(self):
@@ -3,22 +3,27 @@ from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime
 from os import getenv
-from typing import Any, Dict, List, Literal, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Type, Union
 
 from pydantic import BaseModel, Field
 
+from agno.document.chunking.tokenizer import Tokenizer
+from agno.embedder.base import Embedder
 from agno.media import AudioArtifact, ImageArtifact, VideoArtifact
 from agno.memory.v2.db.base import MemoryDb
 from agno.memory.v2.db.schema import MemoryRow
 from agno.memory.v2.manager import MemoryManager
 from agno.memory.v2.schema import SessionSummary, UserMemory
 from agno.memory.v2.summarizer import SessionSummarizer
+from agno.memory.v2.vector_index import MemoryVectorIndex, get_memory_content_hash
+from agno.memory.v2.worker import MemoryWorker
 from agno.models.base import Model
 from agno.models.message import Message
 from agno.run.base import RunStatus
 from agno.run.response import RunResponse
 from agno.run.team import TeamRunResponse
 from agno.utils.log import log_debug, log_warning, logger, set_log_level_to_debug, set_log_level_to_info
+from agno.utils.message import estimate_message_tokens
 from agno.utils.prompts import get_json_output_prompt
 from agno.utils.string import parse_response_model_str
 
@@ -95,6 +100,12 @@ class Memory:
 
     db: Optional[MemoryDb] = None
 
+    # Embedder used for semantic retrieval of user memories.
+    # If set, memories are embedded when they are added or replaced.
+    embedder: Optional[Embedder] = None
+    # If True, memory embeddings are also stored in the MemoryDb (if it supports it)
+    persist_embeddings: bool = True
+
     # runs per session
     runs: Optional[Dict[str, List[Union[RunResponse, TeamRunResponse]]]] = None
 
@@ -106,6 +117,15 @@ class Memory:
     # Whether to clear memories
     clear_memories: bool = False
 
+    # If True, agents and teams schedule memory and summary updates on a background worker instead of
+    # waiting for them at the end of every run. Pending updates for the same user or session are coalesced.
+    defer_updates: bool = False
+    # Number of threads running deferred updates
+    max_update_workers: int = 2
+
+    # Tokenizer used to count the tokens of history messages. If not set, tokens are estimated from the text length.
+    tokenizer: Optional[Tokenizer] = None
+
     debug_mode: bool = False
     version: int = 2
 
@@ -121,6 +141,11 @@ class Memory:
         debug_mode: bool = False,
         delete_memories: bool = False,
         clear_memories: bool = False,
+        embedder: Optional[Embedder] = None,
+        persist_embeddings: bool = True,
+        defer_updates: bool = False,
+        max_update_workers: int = 2,
+        tokenizer: Optional[Tokenizer] = None,
     ):
         self.memories = memories or {}
         self.summaries = summaries or {}
@@ -142,6 +167,21 @@ class Memory:
 
         self.db = db
 
+        self.embedder = embedder
+        self.persist_embeddings = persist_embeddings
+        # In-process vector index of memory embeddings per user
+        self._memory_index = MemoryVectorIndex()
+
+        self.defer_updates = defer_updates
+        self.max_update_workers = max_update_workers
+        # Background worker running deferred updates, shared with the copies of this Memory so updates of the same
+        # user or session are coalesced and never run concurrently. Its threads are only started on first use.
+        self._update_worker: MemoryWorker = MemoryWorker(max_workers=max_update_workers)
+
+        self.tokenizer = tokenizer
+        # Token count of each message per run ID per session, so history budgets don't recount every turn
+        self._history_token_counts: Dict[str, Dict[str, List[int]]] = {}
+
         # We are making memories
         if self.model is not None:
             if self.memory_manager is None:
@@ -183,6 +223,13 @@ class Memory:
             self.model = OpenAIChat(id="gpt-4o")
         return self.model
 
+    def get_embedder(self) -> Embedder:
+        if self.embedder is None:
+            from agno.embedder.openai import OpenAIEmbedder
+
+            self.embedder = OpenAIEmbedder()
+        return self.embedder
+
     def refresh_from_db(self, user_id: Optional[str] = None):
         if self.db:
             # If no user_id is provided, read all memories
@@ -208,7 +255,7 @@ class Memory:
         self.set_log_level()
         self.refresh_from_db(user_id=user_id)
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, include_runs: bool = True) -> Dict[str, Any]:
         _memory_dict = {}
         # Add summary if it exists
         if self.summaries is not None:
@@ -223,7 +270,7 @@ class Memory:
                 for user_id, user_memories in self.memories.items()
             }
         # Add runs if they exist
-        if self.runs is not None:
+        if include_runs and self.runs is not None:
             _memory_dict["runs"] = {}
             for session_id, runs in self.runs.items():
                 if session_id is not None:
@@ -314,6 +361,7 @@ class Memory:
                     last_updated=memory.last_updated or datetime.now(),
                 )
             )
+        self._embed_user_memory(user_id=user_id, memory_id=memory_id, memory=memory)
 
         return memory_id
 
@@ -357,6 +405,7 @@ class Memory:
                     last_updated=memory.last_updated or datetime.now(),
                 )
             )
+        self._embed_user_memory(user_id=user_id, memory_id=memory_id, memory=memory)
 
         return memory_id
 
@@ -383,6 +432,7 @@ class Memory:
             return None
 
         del self.memories[user_id][memory_id]  # type: ignore
+        self._memory_index.remove(user_id=user_id, memory_id=memory_id)
         if self.db:
             self._delete_db_memory(memory_id=memory_id)
 
@@ -409,10 +459,20 @@ class Memory:
 
         self.set_log_level()
 
+        return self._summarize_conversation(
+            conversation=self.get_messages_for_session(session_id=session_id), session_id=session_id, user_id=user_id
+        )
+
+    def _summarize_conversation(
+        self, conversation: List[Message], session_id: str, user_id: Optional[str] = None
+    ) -> Optional[SessionSummary]:
+        if not self.summary_manager:
+            raise ValueError("Summarizer not initialized")
+
         if user_id is None:
             user_id = "default"
 
-        summary_response = self.summary_manager.run(conversation=self.get_messages_for_session(session_id=session_id))
+        summary_response = self.summary_manager.run(conversation=conversation)
         if summary_response is None:
             return None
         session_summary = SessionSummary(
@@ -541,6 +601,57 @@ class Memory:
 
         return response
 
+    # -*- Deferred Updates
+    def get_update_worker(self) -> MemoryWorker:
+        return self._update_worker
+
+    def schedule_user_memories(self, messages: List[Message], user_id: Optional[str] = None) -> None:
+        """Create memories from the messages in the background. Messages scheduled for the same user before the
+        update starts are sent to the model in a single call."""
+        if user_id is None:
+            user_id = "default"
+        self.get_update_worker().submit(
+            key=("memories", user_id),
+            func=lambda pending_messages: self.create_user_memories(messages=pending_messages, user_id=user_id),
+            items=messages,
+        )
+
+    def schedule_session_summary(
+        self,
+        session_id: str,
+        user_id: Optional[str] = None,
+        on_complete: Optional[Callable[[Optional[SessionSummary]], None]] = None,
+    ) -> None:
+        """Summarize the session in the background. If the session is scheduled again before the summary starts,
+        only the latest conversation is summarized.
+
+        Args:
+            on_complete: Called with the summary once it is made, e.g. to persist it
+        """
+        # The conversation is read now, as the runs of the session may be removed from memory after the run
+        conversation = self.get_messages_for_session(session_id=session_id)
+        self.get_update_worker().submit(
+            key=("summary", session_id, user_id),
+            func=lambda conversations: self._summarize_conversation(
+                conversation=conversations[-1], session_id=session_id, user_id=user_id
+            ),
+            items=[conversation],
+            on_complete=on_complete,
+        )
+
+    def flush_updates(self, timeout: Optional[float] = None) -> bool:
+        """Wait for all deferred updates to complete. Returns False if some were still running after `timeout`."""
+        return self._update_worker.flush(timeout=timeout)
+
+    async def aflush_updates(self, timeout: Optional[float] = None) -> bool:
+        """Wait for all deferred updates to complete without blocking the event loop."""
+        return await self._update_worker.aflush(timeout=timeout)
+
+    def shutdown_updates(self, wait: bool = True) -> None:
+        """Stop the background worker, completing the pending updates if `wait` is True.
+        Updates scheduled afterwards, by this Memory or its copies, run in the caller's thread."""
+        self._update_worker.shutdown(wait=wait)
+
     def update_memory_task(self, task: str, user_id: Optional[str] = None) -> str:
         """Updates the memory with a task"""
         if not self.memory_manager:
@@ -631,6 +742,87 @@ class Memory:
             logger.warning(f"Error deleting memory in db: {e}")
             return f"Error deleting memory: {e}"
 
+    # -*- Embedding Functions
+    def _embed_user_memory(self, user_id: str, memory_id: str, memory: UserMemory) -> None:
+        """Embed a memory when it is written, so semantic search does not have to. Skipped if no embedder is set."""
+        if self.embedder is None:
+            return
+        try:
+            embedding = self.embedder.get_embedding(memory.memory)
+        except Exception as e:
+            log_warning(f"Error embedding memory {memory_id}: {e}")
+            return
+        self._store_memory_embedding(
+            user_id=user_id,
+            memory_id=memory_id,
+            content_hash=get_memory_content_hash(memory.memory, embedder=self.embedder),
+            embedding=embedding,
+        )
+
+    def _store_memory_embedding(self, user_id: str, memory_id: str, content_hash: str, embedding: List[float]) -> None:
+        self._store_memory_embeddings(user_id=user_id, embeddings={memory_id: (content_hash, embedding)})
+
+    def _store_memory_embeddings(self, user_id: str, embeddings: Dict[str, Tuple[str, List[float]]]) -> None:
+        """Add embeddings, as a mapping of memory ID to (content hash, embedding), to the index and the MemoryDb"""
+        for memory_id, (content_hash, embedding) in embeddings.items():
+            self._memory_index.add(user_id=user_id, memory_id=memory_id, content_hash=content_hash, embedding=embedding)
+        if self.db is not None and self.persist_embeddings:
+            try:
+                self.db.upsert_memory_embeddings(embeddings, user_id=user_id)
+            except NotImplementedError:
+                pass
+            except Exception as e:
+                log_warning(f"Error storing memory embeddings in db: {e}")
+
+    def _update_memory_index(self, user_id: str) -> None:
+        """Make sure every memory of the user has an up to date embedding in the index.
+
+        Memories written without an embedding (e.g. by the MemoryManager) or changed since they were embedded
+        are loaded from the MemoryDb if stored there, and embedded in batches otherwise.
+        """
+        user_memories = self.memories.get(user_id, {}) if self.memories else {}
+        embedder = self.get_embedder()
+        # The hashes include the embedder, so embeddings made by another model or with other dimensions are redone
+        content_hashes = {
+            memory_id: get_memory_content_hash(memory.memory, embedder=embedder)
+            for memory_id, memory in user_memories.items()
+        }
+        missing = [
+            memory_id
+            for memory_id, content_hash in content_hashes.items()
+            if not self._memory_index.has(user_id=user_id, memory_id=memory_id, content_hash=content_hash)
+        ]
+        if not missing:
+            return
+
+        # Load the embeddings stored in the db before embedding anything
+        if self.db is not None and self.persist_embeddings:
+            stored_embeddings = {}
+            try:
+                stored_embeddings = self.db.read_memory_embeddings(user_id=user_id)
+            except NotImplementedError:
+                pass
+            except Exception as e:
+                log_warning(f"Error reading memory embeddings from db: {e}")
+            for memory_id in list(missing):
+                stored = stored_embeddings.get(memory_id)
+                if stored is not None and stored[0] == content_hashes[memory_id]:
+                    self._memory_index.add(
+                        user_id=user_id, memory_id=memory_id, content_hash=stored[0], embedding=stored[1]
+                    )
+                    missing.remove(memory_id)
+        if not missing:
+            return
+
+        log_debug(f"Embedding {len(missing)} memories for user {user_id}")
+        embeddings = embedder.get_embeddings_batch([user_memories[memory_id].memory for memory_id in missing])
+        self._store_memory_embeddings(
+            user_id=user_id,
+            embeddings={
+                memory_id: (content_hashes[memory_id], embedding) for memory_id, embedding in zip(missing, embeddings)
+            },
+        )
+
     # -*- Utility Functions
     def get_messages_for_session(
         self,
@@ -703,6 +895,7 @@ class Memory:
         skip_role: Optional[str] = None,
         skip_status: Optional[List[RunStatus]] = None,
         skip_history_messages: bool = True,
+        max_tokens: Optional[int] = None,
     ) -> List[Message]:
         """Returns the messages from the last_n runs, excluding previously tagged history messages.
         Args:
@@ -713,6 +906,7 @@ class Memory:
             skip_role: Skip messages with this role.
             skip_status: Skip messages with this status.
             skip_history_messages: Skip messages that were tagged as history in previous runs.
+            max_tokens: Only return the most recent runs whose messages fit in this number of tokens.
         Returns:
             A list of Messages from the specified runs, excluding history messages.
         """
@@ -734,6 +928,14 @@ class Memory:
 
         # Filter by last_n
         runs_to_process = session_runs[-last_n:] if last_n is not None else session_runs
+        if max_tokens is not None:
+            runs_to_process = self._get_runs_within_token_budget(
+                session_id=session_id,
+                runs=runs_to_process,
+                max_tokens=max_tokens,
+                skip_role=skip_role,
+                skip_history_messages=skip_history_messages,
+            )
         messages_from_history = []
         system_message = None
         for run_response in runs_to_process:
@@ -758,6 +960,58 @@ class Memory:
         log_debug(f"Getting messages from previous runs: {len(messages_from_history)}")
         return messages_from_history
 
+    def _get_message_token_counts(self, session_id: str, run: Union[RunResponse, TeamRunResponse]) -> List[int]:
+        """Returns the token count of each message of the run, counting the messages of a run only once"""
+        messages = run.messages or []
+        session_token_counts = self._history_token_counts.setdefault(session_id, {})
+        token_counts = session_token_counts.get(run.run_id) if run.run_id is not None else None
+        if token_counts is None or len(token_counts) != len(messages):
+            token_counts = [estimate_message_tokens(message, tokenizer=self.tokenizer) for message in messages]
+            if run.run_id is not None:
+                session_token_counts[run.run_id] = token_counts
+        return token_counts
+
+    def _get_runs_within_token_budget(
+        self,
+        session_id: str,
+        runs: List[Union[RunResponse, TeamRunResponse]],
+        max_tokens: int,
+        skip_role: Optional[str] = None,
+        skip_history_messages: bool = True,
+    ) -> List[Union[RunResponse, TeamRunResponse]]:
+        """Returns the most recent runs whose history messages fit in max_tokens, in chronological order.
+
+        Runs are included whole, so a tool call is never separated from its result.
+        """
+        # Forget the token counts of runs that are no longer in memory
+        session_runs = self.runs.get(session_id, []) if self.runs else []
+        session_token_counts = self._history_token_counts.get(session_id)
+        if session_token_counts is not None and len(session_token_counts) > len(session_runs):
+            run_ids = {run.run_id for run in session_runs}
+            self._history_token_counts[session_id] = {
+                run_id: counts for run_id, counts in session_token_counts.items() if run_id in run_ids
+            }
+
+        selected_runs: List[Union[RunResponse, TeamRunResponse]] = []
+        total_tokens = 0
+        for run in reversed(runs):
+            if not (run and run.messages):
+                continue
+            run_tokens = sum(
+                token_count
+                for message, token_count in zip(run.messages, self._get_message_token_counts(session_id, run))
+                if not (skip_role and message.role == skip_role)
+                and not (message.from_history and skip_history_messages)
+            )
+            if total_tokens + run_tokens > max_tokens:
+                break
+            total_tokens += run_tokens
+            selected_runs.append(run)
+
+        log_debug(f"Adding {len(selected_runs)} runs ({total_tokens} tokens) from history")
+        selected_runs.reverse()
+        return selected_runs
+
     def get_tool_calls(self, session_id: str, num_calls: Optional[int] = None) -> List[Dict[str, Any]]:
         """Returns a list of tool calls from the messages"""
 
@@ -777,19 +1031,20 @@ class Memory:
         self,
         query: Optional[str] = None,
         limit: Optional[int] = None,
-        retrieval_method: Optional[Literal["last_n", "first_n", "agentic"]] = None,
+        retrieval_method: Optional[Literal["last_n", "first_n", "agentic", "semantic"]] = None,
         user_id: Optional[str] = None,
         refresh_from_db: bool = True,
     ) -> List[UserMemory]:
         """Search through user memories using the specified retrieval method.
 
         Args:
-            query: The search query for agentic search. Required if retrieval_method is "agentic".
+            query: The search query. Required if retrieval_method is "agentic" or "semantic".
             limit: Maximum number of memories to return. Defaults to self.retrieval_limit if not specified. Optional.
             retrieval_method: The method to use for retrieving memories. Defaults to self.retrieval if not specified.
                 - "last_n": Return the most recent memories
                 - "first_n": Return the oldest memories
                 - "agentic": Return memories most similar to the query, but using an agentic approach
+                - "semantic": Return memories most similar to the query by cosine similarity of their embeddings
             user_id: The user to search for. Optional.
 
         Returns:
@@ -819,6 +1074,12 @@ class Memory:
 
             return self._search_user_memories_agentic(user_id=user_id, query=query, limit=limit)
 
+        elif retrieval_method == "semantic":
+            if not query:
+                raise ValueError("Query is required for semantic search")
+
+            return self._search_user_memories_semantic(user_id=user_id, query=query, limit=limit)
+
         elif retrieval_method == "first_n":
             return self._get_first_n_memories(user_id=user_id, limit=limit)
 
@@ -909,6 +1170,22 @@ class Memory:
                 memories_to_return.append(user_memories[memory_id])
         return memories_to_return[:limit]
 
+    def _search_user_memories_semantic(self, user_id: str, query: str, limit: Optional[int] = None) -> List[UserMemory]:
+        """Search through user memories by the cosine similarity of their embeddings to the query."""
+        if not self.memories:
+            return []
+
+        user_memories: Dict[str, UserMemory] = self.memories.get(user_id, {})
+        if not user_memories:
+            return []
+
+        self._update_memory_index(user_id=user_id)
+        query_embedding = self.get_embedder().get_embedding(query)
+        results = self._memory_index.search(
+            user_id=user_id, query_embedding=query_embedding, memory_ids=list(user_memories.keys()), limit=limit
+        )
+        return [user_memories[memory_id] for memory_id, _ in results]
+
     def _get_last_n_memories(self, user_id: str, limit: Optional[int] = None) -> List[UserMemory]:
         """Get the most recent user memories.
 
@@ -982,6 +1259,7 @@ class Memory:
         self.memories = {}
         self.summaries = {}
         self.runs = {}
+        self._memory_index.clear()
 
     # -*- Team Functions
     def add_interaction_to_team_context(
@@ -1090,7 +1368,15 @@ class Memory:
         memo[id(self)] = copied_obj
 
         # Copy attributes, reusing specific objects
-        shared_objects = {"db", "memory_manager", "summary_manager", "team_context"}
+        shared_objects = {
+            "db",
+            "memory_manager",
+            "summary_manager",
+            "team_context",
+            "embedder",
+            "_memory_index",
+            "_update_worker",
+        }
         for k, v in self.__dict__.items():
             setattr(copied_obj, k, v if k in shared_objects else deepcopy(v, memo))
 
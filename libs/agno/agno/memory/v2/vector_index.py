@@ -0,0 +1,78 @@
+import heapq
+import math
+from dataclasses import dataclass, field
+from hashlib import md5
+from typing import Dict, List, Optional, Tuple
+
+from agno.embedder.base import Embedder
+from agno.utils.log import log_warning
+
+
+def get_memory_content_hash(memory: str, embedder: Optional[Embedder] = None) -> str:
+    """Hash of the memory text and of the embedder model and dimensions, used to detect embeddings that are out of
+    date or were made by another embedder"""
+    if embedder is not None:
+        memory = f"{type(embedder).__name__}:{getattr(embedder, 'id', None)}:{embedder.dimensions}:{memory}"
+    return md5(memory.encode("utf-8")).hexdigest()
+
+
+def _normalize(embedding: List[float]) -> List[float]:
+    norm = math.sqrt(sum(x * x for x in embedding))
+    if norm == 0:
+        return list(embedding)
+    return [x / norm for x in embedding]
+
+
+@dataclass
+class MemoryVectorIndex:
+    """In-process vector index of user memory embeddings, kept per user.
+
+    Embeddings are stored normalized, so the cosine similarity of a query is a single dot product per memory.
+    """
+
+    # Normalized embedding and content hash per memory ID per user
+    vectors: Dict[str, Dict[str, Tuple[str, List[float]]]] = field(default_factory=dict)
+
+    def add(self, user_id: str, memory_id: str, content_hash: str, embedding: List[float]) -> None:
+        self.vectors.setdefault(user_id, {})[memory_id] = (content_hash, _normalize(embedding))
+
+    def remove(self, user_id: str, memory_id: str) -> None:
+        self.vectors.get(user_id, {}).pop(memory_id, None)
+
+    def clear(self, user_id: Optional[str] = None) -> None:
+        if user_id is None:
+            self.vectors = {}
+        else:
+            self.vectors.pop(user_id, None)
+
+    def has(self, user_id: str, memory_id: str, content_hash: str) -> bool:
+        """True if the index holds an up to date embedding for the memory"""
+        entry = self.vectors.get(user_id, {}).get(memory_id)
+        return entry is not None and entry[0] == content_hash
+
+    def search(
+        self, user_id: str, query_embedding: List[float], memory_ids: List[str], limit: Optional[int] = None
+    ) -> List[Tuple[str, float]]:
+        """Return the (memory_id, cosine similarity) pairs of `memory_ids` closest to the query, best match first."""
+        query = _normalize(query_embedding)
+        user_vectors = self.vectors.get(user_id, {})
+
+        scores: List[Tuple[str, float]] = []
+        mismatched = 0
+        for memory_id in memory_ids:
+            entry = user_vectors.get(memory_id)
+            if entry is None:
+                continue
+            if len(entry[1]) != len(query):
+                mismatched += 1
+                continue
+            scores.append((memory_id, sum(q * v for q, v in zip(query, entry[1]))))
+        if mismatched:
+            log_warning(
+                f"Skipped {mismatched} memories of user {user_id} whose embeddings do not have the "
+                f"{len(query)} dimensions of the query embedding. Set the dimensions of the embedder to match its model."
+            )
+
+        if limit is not None and limit > 0:
+            return heapq.nlargest(limit, scores, key=lambda item: item[1])
+        return sorted(scores, key=lambda item: item[1], reverse=True)
@@ -0,0 +1,164 @@
+import asyncio
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_for_futures
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, AsyncIterator, Callable, Dict, Hashable, Iterator, List, Optional, Set
+
+from agno.utils.log import log_debug, log_warning
+
+
+@dataclass
+class MemoryJob:
+    """A memory or summary update waiting to run"""
+
+    # Called with all items scheduled for the job since it was created
+    func: Callable[[List[Any]], Any]
+    items: List[Any] = field(default_factory=list)
+    # Called with the result of func once it completes
+    callbacks: List[Callable[[Any], None]] = field(default_factory=list)
+
+
+class MemoryWorker:
+    """Runs memory and summary updates in a long-lived thread pool, off the critical path of agent runs.
+
+    Jobs are identified by a key. A job scheduled while another job with the same key is still waiting to run
+    is merged into it, so the messages of several runs of a user become a single memory update and repeated
+    summaries of a session are only made once. Jobs with the same key never run concurrently.
+
+    Pending jobs are completed before the interpreter exits. Use `flush` to wait for them, e.g. in tests.
+    """
+
+    def __init__(self, max_workers: int = 2):
+        self.max_workers = max_workers
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Dict[Hashable, MemoryJob] = {}
+        # Keys with a job running, further jobs with the key are run by the same task once it completes
+        self._running: Set[Hashable] = set()
+        self._futures: Set[Future] = set()
+        self._lock = Lock()
+        self._shutdown = False
+        # Held while a session is written to storage, so a summary persisted by a job (read, update, upsert) is not
+        # interleaved with the writes of the runs of the session
+        self._session_write_lock = Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="agno-memory")
+        return self._executor
+
+    def submit(
+        self,
+        key: Hashable,
+        func: Callable[[List[Any]], Any],
+        items: Optional[List[Any]] = None,
+        on_complete: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        """Schedule `func`, or add `items` to the pending job with the same key."""
+        with self._lock:
+            job = self._pending.get(key)
+            if job is not None:
+                log_debug(f"Coalescing memory update {key}")
+                job.items.extend(items or [])
+                if on_complete is not None:
+                    job.callbacks.append(on_complete)
+                return
+
+            job = MemoryJob(func=func, items=list(items or []))
+            if on_complete is not None:
+                job.callbacks.append(on_complete)
+            future: Optional[Future] = None
+            if not self._shutdown:
+                self._pending[key] = job
+                if key in self._running:
+                    return
+                self._running.add(key)
+                future = self._get_executor().submit(self._run, key)
+                self._futures.add(future)
+
+        if future is None:
+            # No more background work is accepted, run the job in the caller's thread
+            self._run_job(job)
+        else:
+            future.add_done_callback(self._discard_future)
+
+    def _discard_future(self, future: Future) -> None:
+        with self._lock:
+            self._futures.discard(future)
+
+    def _run(self, key: Hashable) -> None:
+        """Run the jobs scheduled with `key` one after the other, until none is pending"""
+        while True:
+            with self._lock:
+                job = self._pending.pop(key, None)
+                if job is None:
+                    self._running.discard(key)
+                    return
+            self._run_job(job)
+
+    def _run_job(self, job: MemoryJob) -> None:
+        try:
+            result = job.func(job.items)
+        except Exception as e:
+            log_warning(f"Error in memory/summary operation: {str(e)}")
+            return
+        for callback in job.callbacks:
+            try:
+                callback(result)
+            except Exception as e:
+                log_warning(f"Error handling the result of a memory/summary operation: {str(e)}")
+
+    @contextmanager
+    def lock_session_writes(self) -> Iterator[None]:
+        """Hold the session write lock, shared by the jobs of this worker and the agents or teams scheduling them"""
+        with self._session_write_lock:
+            yield
+
+    @asynccontextmanager
+    async def alock_session_writes(self) -> AsyncIterator[None]:
+        """Hold the session write lock, waiting for it in a thread so the event loop is not blocked"""
+        if not self._session_write_lock.acquire(blocking=False):
+            acquired = asyncio.get_running_loop().run_in_executor(None, self._session_write_lock.acquire)
+            try:
+                await asyncio.shield(acquired)
+            except asyncio.CancelledError:
+                # The lock is still acquired by the thread, release it once it is
+                acquired.add_done_callback(lambda _: self._session_write_lock.release())
+                raise
+        try:
+            yield
+        finally:
+            self._session_write_lock.release()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all scheduled jobs have completed.
+
+        Returns:
+            bool: False if jobs were still running after `timeout` seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                futures = set(self._futures)
+            if not futures:
+                return True
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            _, not_done = wait_for_futures(futures, timeout=remaining)
+            if not_done:
+                return False
+
+    async def aflush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all scheduled jobs have completed, without blocking the event loop."""
+        return await asyncio.get_running_loop().run_in_executor(None, self.flush, timeout)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads. Jobs scheduled afterwards run in the caller's thread."""
+        with self._lock:
+            self._shutdown = True
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=wait)
@@ -641,7 +641,7 @@ class AwsBedrock(Model):
                     tool_use = {}
                 else:
                     # Finish collecting text content
-                    content.append({"text": stream_data.response_content})
+                    content.append({"text": stream_data.response_content.getvalue()})
 
             elif "messageStop" in response_delta or "metadata" in response_delta:
                 body = response_delta.get("metadata") or response_delta.get("messageStop") or {}
@@ -747,7 +747,7 @@ class AwsBedrock(Model):
                     tool_use = {}
                 else:
                     # Finish collecting text content
-                    content.append({"text": stream_data.response_content})
+                    content.append({"text": stream_data.response_content.getvalue()})
 
             elif "messageStop" in response_delta or "metadata" in response_delta:
                 body = response_delta.get("metadata") or response_delta.get("messageStop") or {}
@@ -1,6 +1,8 @@
 import asyncio
 import collections.abc
+import contextvars
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from types import AsyncGeneratorType, GeneratorType
 from typing import (
@@ -28,8 +30,10 @@ from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecutio
 from agno.run.response import RunResponseContentEvent, RunResponseEvent
 from agno.run.team import RunResponseContentEvent as TeamRunResponseContentEvent
 from agno.run.team import TeamRunResponseEvent
-from agno.tools.function import Function, FunctionCall, FunctionExecutionResult, UserInputField
-from agno.utils.log import log_debug, log_error, log_warning
+from agno.tools.function import Function, FunctionCall, UserInputField
+from agno.utils.debug_trace import DebugTrace
+from agno.utils.log import is_log_enabled, log_debug, log_error, log_warning
+from agno.utils.stream_buffer import StreamBuffer
 from agno.utils.timer import Timer
 from agno.utils.tools import get_function_call_for_tool_call, get_function_call_for_tool_execution
 
@@ -37,13 +41,16 @@ from agno.utils.tools import get_function_call_for_tool_call, get_function_call_
 @dataclass
 class MessageData:
     response_role: Optional[Literal["system", "user", "assistant", "tool"]] = None
-    response_content: Any = ""
-    response_thinking: Any = ""
-    response_redacted_thinking: Any = ""
+    # Streamed text is accumulated in buffers and joined once the stream ends
+    response_content: StreamBuffer = field(default_factory=StreamBuffer)
+    response_thinking: StreamBuffer = field(default_factory=StreamBuffer)
+    response_redacted_thinking: StreamBuffer = field(default_factory=StreamBuffer)
     response_citations: Optional[Citations] = None
     response_tool_calls: List[Dict[str, Any]] = field(default_factory=list)
 
     response_audio: Optional[AudioResponse] = None
+    response_audio_content: StreamBuffer = field(default_factory=StreamBuffer)
+    response_audio_transcript: StreamBuffer = field(default_factory=StreamBuffer)
     response_image: Optional[ImageArtifact] = None
 
     # Data from the provider that we might need on subsequent messages
@@ -56,6 +63,8 @@ def _log_messages(messages: List[Message]) -> None:
     """
     Log messages for debugging.
     """
+    if not is_log_enabled("debug"):
+        return
     for m in messages:
         # Don't log metrics for input messages
         m.log(metrics=False)
@@ -231,6 +240,12 @@ class Model(ABC):
     # Provider for this Model. This is not sent to the Model API.
     provider: Optional[str] = None
 
+    # If True, independent tool calls from one model response are run concurrently in a thread pool
+    # in the sync run path. The async run path always runs them concurrently.
+    run_tools_in_parallel: bool = False
+    # Maximum number of threads used to run tool calls in parallel. Defaults to the ThreadPoolExecutor default.
+    max_tool_workers: Optional[int] = None
+
     # -*- Do not set the following attributes directly -*-
     # -*- Set them on the Agent instead -*-
 
@@ -257,6 +272,9 @@ class Model(ABC):
     # The role of the assistant message.
     assistant_message_role: str = "assistant"
 
+    # Sink for structured debug records of the messages sent to and received from the model
+    debug_trace: Optional[DebugTrace] = None
+
     def __post_init__(self):
         if self.provider is None and self.name is not None:
             self.provider = f"{self.name} ({self.id})"
@@ -269,6 +287,13 @@ class Model(ABC):
     def get_provider(self) -> str:
         return self.provider or self.name or self.__class__.__name__
 
+    def _trace_messages(self, event: str, messages: List[Message]) -> None:
+        """Record the messages in the debug trace, if one is set"""
+        if self.debug_trace is not None:
+            self.debug_trace.emit(
+                event, model=self.id, provider=self.get_provider(), messages=[m.to_dict() for m in messages]
+            )
+
     @abstractmethod
     def invoke(self, *args, **kwargs) -> Any:
         pass
@@ -328,6 +353,7 @@ class Model(ABC):
         log_debug(f"Model: {self.id}", center=True, symbol="-")
 
         _log_messages(messages)
+        self._trace_messages("request", messages)
         model_response = ModelResponse()
 
         function_call_count = 0
@@ -349,6 +375,7 @@ class Model(ABC):
 
             # Log response and metrics
             assistant_message.log(metrics=True)
+            self._trace_messages("assistant_message", [assistant_message])
 
             # Handle tool calls if present
             if assistant_message.tool_calls:
@@ -397,6 +424,7 @@ class Model(ABC):
                 )
                 for function_call_result in function_call_results:
                     function_call_result.log(metrics=True)
+                self._trace_messages("tool_results", function_call_results)
 
                 # Check if we should stop after tool calls
                 if any(m.stop_after_tool_call for m in function_call_results):
@@ -439,6 +467,7 @@ class Model(ABC):
         log_debug(f"{self.get_provider()} Async Response Start", center=True, symbol="-")
         log_debug(f"Model: {self.id}", center=True, symbol="-")
         _log_messages(messages)
+        self._trace_messages("request", messages)
         model_response = ModelResponse()
 
         function_call_count = 0
@@ -460,6 +489,7 @@ class Model(ABC):
 
             # Log response and metrics
             assistant_message.log(metrics=True)
+            self._trace_messages("assistant_message", [assistant_message])
 
             # Handle tool calls if present
             if assistant_message.tool_calls:
@@ -507,6 +537,7 @@ class Model(ABC):
                 )
                 for function_call_result in function_call_results:
                     function_call_result.log(metrics=True)
+                self._trace_messages("tool_results", function_call_results)
 
                 # Check if we should stop after tool calls
                 if any(m.stop_after_tool_call for m in function_call_results):
@@ -750,6 +781,7 @@ class Model(ABC):
         log_debug(f"{self.get_provider()} Response Stream Start", center=True, symbol="-")
         log_debug(f"Model: {self.id}", center=True, symbol="-")
         _log_messages(messages)
+        self._trace_messages("request", messages)
 
         function_call_count = 0
 
@@ -770,16 +802,18 @@ class Model(ABC):
 
                 # Populate assistant message from stream data
                 if stream_data.response_content:
-                    assistant_message.content = stream_data.response_content
+                    assistant_message.content = stream_data.response_content.getvalue()
                 if stream_data.response_thinking:
-                    assistant_message.thinking = stream_data.response_thinking
+                    assistant_message.thinking = stream_data.response_thinking.getvalue()
                 if stream_data.response_redacted_thinking:
-                    assistant_message.redacted_thinking = stream_data.response_redacted_thinking
+                    assistant_message.redacted_thinking = stream_data.response_redacted_thinking.getvalue()
                 if stream_data.response_provider_data:
                     assistant_message.provider_data = stream_data.response_provider_data
                 if stream_data.response_citations:
                     assistant_message.citations = stream_data.response_citations
                 if stream_data.response_audio:
+                    stream_data.response_audio.content = stream_data.response_audio_content.getvalue()
+                    stream_data.response_audio.transcript = stream_data.response_audio_transcript.getvalue()
                     assistant_message.audio_output = stream_data.response_audio
                 if stream_data.response_tool_calls and len(stream_data.response_tool_calls) > 0:
                     assistant_message.tool_calls = self.parse_tool_calls(stream_data.response_tool_calls)
@@ -799,6 +833,7 @@ class Model(ABC):
             # Add assistant message to messages
             messages.append(assistant_message)
             assistant_message.log(metrics=True)
+            self._trace_messages("assistant_message", [assistant_message])
 
             # Handle tool calls if present
             if assistant_message.tool_calls is not None:
@@ -830,6 +865,7 @@ class Model(ABC):
 
                 for function_call_result in function_call_results:
                     function_call_result.log(metrics=True)
+                self._trace_messages("tool_results", function_call_results)
 
                 # Check if we should stop after tool calls
                 if any(m.stop_after_tool_call for m in function_call_results):
@@ -898,6 +934,7 @@ class Model(ABC):
         log_debug(f"{self.get_provider()} Async Response Stream Start", center=True, symbol="-")
         log_debug(f"Model: {self.id}", center=True, symbol="-")
         _log_messages(messages)
+        self._trace_messages("request", messages)
 
         function_call_count = 0
 
@@ -919,14 +956,16 @@ class Model(ABC):
 
                 # Populate assistant message from stream data
                 if stream_data.response_content:
-                    assistant_message.content = stream_data.response_content
+                    assistant_message.content = stream_data.response_content.getvalue()
                 if stream_data.response_thinking:
-                    assistant_message.thinking = stream_data.response_thinking
+                    assistant_message.thinking = stream_data.response_thinking.getvalue()
                 if stream_data.response_redacted_thinking:
-                    assistant_message.redacted_thinking = stream_data.response_redacted_thinking
+                    assistant_message.redacted_thinking = stream_data.response_redacted_thinking.getvalue()
                 if stream_data.response_provider_data:
                     assistant_message.provider_data = stream_data.response_provider_data
                 if stream_data.response_audio:
+                    stream_data.response_audio.content = stream_data.response_audio_content.getvalue()
+                    stream_data.response_audio.transcript = stream_data.response_audio_transcript.getvalue()
                     assistant_message.audio_output = stream_data.response_audio
                 if stream_data.response_tool_calls and len(stream_data.response_tool_calls) > 0:
                     assistant_message.tool_calls = self.parse_tool_calls(stream_data.response_tool_calls)
@@ -946,6 +985,7 @@ class Model(ABC):
             # Add assistant message to messages
             messages.append(assistant_message)
             assistant_message.log(metrics=True)
+            self._trace_messages("assistant_message", [assistant_message])
 
             # Handle tool calls if present
             if assistant_message.tool_calls is not None:
@@ -977,6 +1017,7 @@ class Model(ABC):
 
                 for function_call_result in function_call_results:
                     function_call_result.log(metrics=True)
+                self._trace_messages("tool_results", function_call_results)
 
                 # Check if we should stop after tool calls
                 if any(m.stop_after_tool_call for m in function_call_results):
@@ -1057,9 +1098,9 @@ class Model(ABC):
             if model_response_delta.audio.id is not None:
                 stream_data.response_audio.id = model_response_delta.audio.id  # type: ignore
             if model_response_delta.audio.content is not None:
-                stream_data.response_audio.content += model_response_delta.audio.content  # type: ignore
+                stream_data.response_audio_content.append(model_response_delta.audio.content)
             if model_response_delta.audio.transcript is not None:
-                stream_data.response_audio.transcript += model_response_delta.audio.transcript  # type: ignore
+                stream_data.response_audio_transcript.append(model_response_delta.audio.transcript)
             if model_response_delta.audio.expires_at is not None:
                 stream_data.response_audio.expires_at = model_response_delta.audio.expires_at
             if model_response_delta.audio.mime_type is not None:
@@ -1168,17 +1209,29 @@ class Model(ABC):
             tool_call_error=True,
         )
 
-    def run_function_call(
+    def _execute_function_call(
         self,
         function_call: FunctionCall,
-        function_call_results: List[Message],
-        additional_messages: Optional[List[Message]] = None,
-    ) -> Iterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
-        # Start function call
+    ) -> Tuple[Union[bool, AgentRunException], Timer, FunctionCall]:
+        """Execute a single function call and return its success status, timer, and the FunctionCall object."""
         function_call_timer = Timer()
         function_call_timer.start()
-        # Yield a tool_call_started event
-        yield ModelResponse(
+        success: Union[bool, AgentRunException] = False
+
+        try:
+            function_execution_result = function_call.execute()
+            success = function_execution_result.status == "success"
+        except AgentRunException as a_exc:
+            success = a_exc
+        except Exception as e:
+            log_error(f"Error executing function {function_call.function.name}: {e}")
+            raise e
+
+        function_call_timer.stop()
+        return success, function_call_timer, function_call
+
+    def create_tool_call_started_response(self, function_call: FunctionCall) -> ModelResponse:
+        return ModelResponse(
             content=function_call.get_call_str(),
             tool_executions=[
                 ToolExecution(
@@ -1190,22 +1243,21 @@ class Model(ABC):
             event=ModelResponseEvent.tool_call_started.value,
         )
 
-        # Run function calls sequentially
-        function_execution_result: FunctionExecutionResult = FunctionExecutionResult(status="failure")
-        try:
-            function_execution_result = function_call.execute()
-        except AgentRunException as a_exc:
+    def _process_function_call_result(
+        self,
+        function_call: FunctionCall,
+        success: Union[bool, AgentRunException],
+        function_call_timer: Timer,
+        function_call_results: List[Message],
+        additional_messages: Optional[List[Message]] = None,
+    ) -> Iterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
+        """Process the output of an executed function call and yield its events."""
+        if isinstance(success, AgentRunException):
             # Update additional messages from function call
-            _handle_agent_exception(a_exc, additional_messages)
+            _handle_agent_exception(success, additional_messages)
             # Set function call success to False if an exception occurred
-        except Exception as e:
-            log_error(f"Error executing function {function_call.function.name}: {e}")
-            raise e
-
-        function_call_success = function_execution_result.status == "success"
-
-        # Stop function call timer
-        function_call_timer.stop()
+            success = False
+        function_call_success = success
 
         # Process function call output
         function_call_output: str = ""
@@ -1262,6 +1314,63 @@ class Model(ABC):
         # Add function call to function call results
         function_call_results.append(function_call_result)
 
+    def run_function_call(
+        self,
+        function_call: FunctionCall,
+        function_call_results: List[Message],
+        additional_messages: Optional[List[Message]] = None,
+    ) -> Iterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
+        # Yield a tool_call_started event
+        yield self.create_tool_call_started_response(function_call)
+
+        success, function_call_timer, _ = self._execute_function_call(function_call)
+
+        yield from self._process_function_call_result(
+            function_call,
+            success=success,
+            function_call_timer=function_call_timer,
+            function_call_results=function_call_results,
+            additional_messages=additional_messages,
+        )
+
+    def run_function_calls_in_parallel(
+        self,
+        function_calls: List[FunctionCall],
+        function_call_results: List[Message],
+        additional_messages: Optional[List[Message]] = None,
+    ) -> Iterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
+        """Run function calls concurrently in a thread pool.
+
+        Events and results are produced in the order of `function_calls`, regardless of which call finishes first.
+        Functions that are not thread safe are run one at a time in the calling thread, after the pool has finished.
+        """
+        # Yield tool_call_started events for all function calls
+        for fc in function_calls:
+            yield self.create_tool_call_started_response(fc)
+
+        futures: Dict[int, Future] = {}
+        thread_safe_calls = [i for i, fc in enumerate(function_calls) if fc.function.thread_safe]
+        if len(thread_safe_calls) > 1:
+            with ThreadPoolExecutor(max_workers=self.max_tool_workers, thread_name_prefix="agno-tool") as executor:
+                for i in thread_safe_calls:
+                    # Run each call in a copy of the current context, so context variables are visible in the tool
+                    futures[i] = executor.submit(
+                        contextvars.copy_context().run, self._execute_function_call, function_calls[i]
+                    )
+
+        for i, fc in enumerate(function_calls):
+            if i in futures:
+                success, function_call_timer, _ = futures[i].result()
+            else:
+                success, function_call_timer, _ = self._execute_function_call(fc)
+            yield from self._process_function_call_result(
+                fc,
+                success=success,
+                function_call_timer=function_call_timer,
+                function_call_results=function_call_results,
+                additional_messages=additional_messages,
+            )
+
     def run_function_calls(
         self,
         function_calls: List[FunctionCall],
@@ -1274,6 +1383,8 @@ class Model(ABC):
         if additional_messages is None:
             additional_messages = []
 
+        # Function calls to run in parallel once all function calls are checked
+        function_calls_to_run: List[FunctionCall] = []
         for fc in function_calls:
             if function_call_limit is not None:
                 current_function_call_count += 1
@@ -1357,8 +1468,20 @@ class Model(ABC):
                 # We don't execute the function calls here
                 continue
 
-            yield from self.run_function_call(
-                function_call=fc, function_call_results=function_call_results, additional_messages=additional_messages
+            if self.run_tools_in_parallel:
+                function_calls_to_run.append(fc)
+            else:
+                yield from self.run_function_call(
+                    function_call=fc,
+                    function_call_results=function_call_results,
+                    additional_messages=additional_messages,
+                )
+
+        if function_calls_to_run:
+            yield from self.run_function_calls_in_parallel(
+                function_calls=function_calls_to_run,
+                function_call_results=function_call_results,
+                additional_messages=additional_messages,
             )
 
         # Add any additional messages at the end
@@ -6,7 +6,7 @@ from typing import Any, Dict, List, Optional, Sequence, Union
 from pydantic import BaseModel, ConfigDict, Field
 
 from agno.media import Audio, AudioResponse, File, Image, ImageArtifact, Video
-from agno.utils.log import log_debug, log_error, log_info, log_warning
+from agno.utils.log import is_log_enabled, log_debug, log_error, log_info, log_warning
 from agno.utils.timer import Timer
 
 
@@ -302,6 +302,10 @@ class Message(BaseModel):
         elif level == "error":
             _logger = log_error
 
+        # Skip formatting the message if it would not be logged
+        if not is_log_enabled(level if level in ("info", "warning", "error") else "debug"):  # type: ignore
+            return
+
         try:
             import shutil
 
@@ -2,10 +2,12 @@ from dataclasses import asdict, dataclass, field
 from enum import Enum
 from time import time
 from typing import Any, Dict, List, Optional
+from uuid import uuid4
 
 from agno.media import AudioResponse, ImageArtifact
 from agno.models.message import Citations, MessageMetrics
 from agno.tools.function import UserInputField
+from agno.utils.stream_buffer import StreamBuffer
 
 
 class ModelResponseEvent(str, Enum):
@@ -111,6 +113,39 @@ class ModelResponse:
 
     extra: Optional[Dict[str, Any]] = None
 
+    # Chunks of streamed fields waiting to be joined, see `append_chunk`
+    stream_buffers: Dict[str, StreamBuffer] = field(default_factory=dict, repr=False)
+
+    def append_chunk(self, name: str, chunk: Any) -> None:
+        """Buffer a chunk of a streamed field, e.g. `content` or `audio_transcript`.
+
+        The field itself is only updated by `join_chunks`, so accumulating a long stream takes linear time.
+        """
+        buffer = self.stream_buffers.get(name)
+        if buffer is None:
+            buffer = self.stream_buffers[name] = StreamBuffer()
+        buffer.append(chunk)
+
+    def join_chunks(self) -> List[str]:
+        """Append the buffered chunks to their fields and return the names of the updated fields"""
+        updated = []
+        for name, buffer in self.stream_buffers.items():
+            if not buffer:
+                continue
+            # Audio chunks are appended to the fields of the audio response, e.g. `audio_content` to `audio.content`
+            target: Any = self
+            attribute = name
+            if name.startswith("audio_"):
+                if self.audio is None:
+                    self.audio = AudioResponse(id=str(uuid4()))
+                target, attribute = self.audio, name[len("audio_") :]
+            current = getattr(target, attribute)
+            value = buffer.getvalue()
+            setattr(target, attribute, current + value if current else value)
+            updated.append(name)
+        self.stream_buffers = {}
+        return updated
+
 
 class FileType(str, Enum):
     MP4 = "mp4"
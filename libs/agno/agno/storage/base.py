@@ -1,8 +1,75 @@
+import asyncio
+import base64
+import json
 from abc import ABC, abstractmethod
-from typing import List, Literal, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import partial
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Tuple, TypeVar
 
 from agno.storage.session import Session
 
+# Name of the optional field that adds the first run of each session to a session listing
+FIRST_RUN_FIELD = "first_run"
+
+# Maximum number of threads running blocking storage calls on behalf of async code
+STORAGE_EXECUTOR_MAX_WORKERS = 16
+
+# Number of sessions whose runs are read from a run log table per query, below the bound parameter limits of databases
+READ_RUNS_BATCH_SIZE = 500
+
+T = TypeVar("T")
+
+_storage_executor: Optional[ThreadPoolExecutor] = None
+_storage_executor_lock = Lock()
+
+
+def get_storage_executor() -> ThreadPoolExecutor:
+    """Get the bounded thread pool shared by all storages to run blocking calls off the event loop."""
+    global _storage_executor
+    if _storage_executor is None:
+        with _storage_executor_lock:
+            if _storage_executor is None:
+                _storage_executor = ThreadPoolExecutor(
+                    max_workers=STORAGE_EXECUTOR_MAX_WORKERS, thread_name_prefix="agno-storage"
+                )
+    return _storage_executor
+
+
+async def run_in_storage_executor(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking storage call in the shared storage thread pool, keeping the event loop free."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_storage_executor(), partial(func, *args, **kwargs))
+
+
+@dataclass
+class SessionListItem:
+    """Lightweight summary of a stored session, used to list sessions without loading their memory"""
+
+    session_id: str
+    user_id: Optional[str] = None
+    # ID of the agent, team or workflow this session is associated with
+    entity_id: Optional[str] = None
+    session_name: Optional[str] = None
+    # The unix timestamp when this session was created
+    created_at: Optional[int] = None
+    # The unix timestamp when this session was last updated
+    updated_at: Optional[int] = None
+    # The first run of the session, only set if FIRST_RUN_FIELD is requested
+    first_run: Optional[Dict[str, Any]] = None
+    # Additional session columns requested with `fields`
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class SessionListPage:
+    """A page of session summaries, ordered by created_at descending"""
+
+    sessions: List[SessionListItem]
+    # Pass this cursor to list_sessions to get the next page. None if this is the last page.
+    next_cursor: Optional[str] = None
+
 
 class Storage(ABC):
     def __init__(self, mode: Optional[Literal["agent", "team", "workflow", "workflow_v2"]] = "agent"):
@@ -43,6 +110,100 @@ class Storage(ABC):
     ) -> List[Session]:
         raise NotImplementedError
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 20,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> SessionListPage:
+        """List session summaries ordered by created_at descending, using keyset pagination.
+
+        Args:
+            user_id: Filter by user ID
+            entity_id: Filter by entity ID (agent_id, team_id, or workflow_id)
+            limit: Maximum number of sessions in the page. None returns all remaining sessions.
+            cursor: The next_cursor of the previous page
+            fields: Additional session columns to include in SessionListItem.data, and FIRST_RUN_FIELD to
+                include the first run of each session.
+
+        Backends that can project columns override this method. The default implementation reads full sessions.
+        """
+        items = (
+            self.get_session_list_item(session, fields=fields)
+            for session in self.get_all_sessions(user_id=user_id, entity_id=entity_id)
+        )
+        return self.paginate_session_list_items(items, limit=limit, cursor=cursor)
+
+    @property
+    def entity_id_field(self) -> str:
+        """Name of the session field holding the ID of the agent, team or workflow."""
+        if self.mode == "agent":
+            return "agent_id"
+        elif self.mode == "team":
+            return "team_id"
+        return "workflow_id"
+
+    @staticmethod
+    def encode_session_cursor(item: SessionListItem) -> str:
+        """Encode the position of a session in a listing as an opaque cursor."""
+        position = json.dumps([item.created_at or 0, item.session_id])
+        return base64.urlsafe_b64encode(position.encode("utf-8")).decode("utf-8")
+
+    @staticmethod
+    def decode_session_cursor(cursor: str) -> Tuple[int, str]:
+        """Decode a cursor into the (created_at, session_id) of the last session of the previous page."""
+        try:
+            created_at, session_id = json.loads(base64.urlsafe_b64decode(cursor.encode("utf-8")))
+            return int(created_at), str(session_id)
+        except Exception:
+            raise ValueError(f"Invalid session cursor: {cursor}")
+
+    def get_session_list_item(self, session: Session, fields: Optional[List[str]] = None) -> SessionListItem:
+        """Build a SessionListItem from a full session."""
+        first_run: Optional[Dict[str, Any]] = None
+        data: Dict[str, Any] = {}
+        for field_name in fields or []:
+            if field_name == FIRST_RUN_FIELD:
+                runs = getattr(session, "runs", None)
+                memory = getattr(session, "memory", None)
+                if runs is None and isinstance(memory, dict):
+                    runs = memory.get("runs")
+                if runs:
+                    first_run = runs[0] if isinstance(runs[0], dict) else runs[0].to_dict()
+            elif hasattr(session, field_name):
+                data[field_name] = getattr(session, field_name)
+
+        session_data = getattr(session, "session_data", None) or {}
+        return SessionListItem(
+            session_id=session.session_id,
+            user_id=session.user_id,
+            entity_id=getattr(session, self.entity_id_field, None),
+            session_name=session_data.get("session_name"),
+            created_at=session.created_at,
+            updated_at=session.updated_at,
+            first_run=first_run,
+            data=data,
+        )
+
+    def paginate_session_list_items(
+        self, items: Iterable[SessionListItem], limit: Optional[int] = 20, cursor: Optional[str] = None
+    ) -> SessionListPage:
+        """Sort session summaries by (created_at, session_id) descending and return the page after `cursor`."""
+        ordered = sorted(items, key=lambda item: (item.created_at or 0, item.session_id), reverse=True)
+        if cursor is not None:
+            position = self.decode_session_cursor(cursor)
+            ordered = [item for item in ordered if (item.created_at or 0, item.session_id) < position]
+        return self.build_session_list_page(ordered, limit=limit)
+
+    def build_session_list_page(self, items: List[SessionListItem], limit: Optional[int] = 20) -> SessionListPage:
+        """Build a page from ordered session summaries, fetched with up to `limit + 1` items."""
+        if limit is None or len(items) <= limit:
+            return SessionListPage(sessions=items)
+        page = items[:limit]
+        return SessionListPage(sessions=page, next_cursor=self.encode_session_cursor(page[-1]))
+
     @abstractmethod
     def upsert(self, session: Session) -> Optional[Session]:
         raise NotImplementedError
@@ -51,6 +212,48 @@ class Storage(ABC):
     def delete_session(self, session_id: Optional[str] = None):
         raise NotImplementedError
 
+    async def run_in_executor(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking storage call in the shared storage thread pool, keeping the event loop free."""
+        return await run_in_storage_executor(func, *args, **kwargs)
+
+    # Async interface. Backends with an async driver override these methods, the defaults run the
+    # synchronous methods in the bounded storage thread pool.
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        return await self.run_in_executor(self.read, session_id, user_id)
+
+    async def aget_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
+        return await self.run_in_executor(self.get_all_session_ids, user_id, entity_id)
+
+    async def aget_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
+        return await self.run_in_executor(self.get_all_sessions, user_id, entity_id)
+
+    async def aget_recent_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 2,
+    ) -> List[Session]:
+        return await self.run_in_executor(self.get_recent_sessions, user_id=user_id, entity_id=entity_id, limit=limit)
+
+    async def alist_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 20,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> SessionListPage:
+        return await self.run_in_executor(
+            self.list_sessions, user_id=user_id, entity_id=entity_id, limit=limit, cursor=cursor, fields=fields
+        )
+
+    async def aupsert(self, session: Session) -> Optional[Session]:
+        return await self.run_in_executor(self.upsert, session)
+
+    async def adelete_session(self, session_id: Optional[str] = None):
+        return await self.run_in_executor(self.delete_session, session_id)
+
     @abstractmethod
     def drop(self) -> None:
         raise NotImplementedError
@@ -58,3 +261,113 @@ class Storage(ABC):
     @abstractmethod
     def upgrade_schema(self) -> None:
         raise NotImplementedError
+
+    @property
+    def stores_runs_separately(self) -> bool:
+        """True if runs are kept in an append-only run log instead of the session `memory` column.
+
+        When this is True, callers only need to include new or updated runs in `session.memory["runs"]`
+        on upsert, and `read()` attaches the stored runs back onto the session.
+        """
+        return False
+
+    def upsert_runs(self, session_id: str, runs: List[Dict[str, Any]], user_id: Optional[str] = None) -> None:
+        """Insert or update runs in the run log, keyed by (session_id, run_id)."""
+        raise NotImplementedError
+
+    def read_runs(self, session_id: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Read the most recent `limit` runs of a session from the run log, oldest first."""
+        raise NotImplementedError
+
+    def read_runs_for_sessions(
+        self, session_ids: List[str], limit: Optional[int] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Read the most recent `limit` runs of each session from the run log, oldest first.
+
+        Storages backed by a database override this to read the runs of all sessions in a single query.
+        """
+        return {session_id: self.read_runs(session_id=session_id, limit=limit) for session_id in session_ids}
+
+    async def aupsert_runs(self, session_id: str, runs: List[Dict[str, Any]], user_id: Optional[str] = None) -> None:
+        return await self.run_in_executor(self.upsert_runs, session_id, runs, user_id)
+
+    async def aread_runs(self, session_id: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        return await self.run_in_executor(self.read_runs, session_id, limit)
+
+    @staticmethod
+    def get_run_id(run: Dict[str, Any]) -> Optional[str]:
+        """Get the run_id of a serialized run (RunResponse dicts or legacy AgentRun/TeamRun dicts)"""
+        run_id = run.get("run_id")
+        if run_id is None and isinstance(run.get("response"), dict):
+            run_id = run["response"].get("run_id")
+        return run_id
+
+    def split_runs(self, session: Session) -> Tuple[Session, Optional[List[Dict[str, Any]]]]:
+        """Separate the runs from the session memory, so they can be written to the run log.
+
+        Returns a copy of the session without runs in its memory along with the runs, or the session
+        unchanged and None if runs are not stored separately.
+        """
+        memory = getattr(session, "memory", None)
+        if not self.stores_runs_separately or not isinstance(memory, dict) or not isinstance(memory.get("runs"), list):
+            return session, None
+        session_memory = {k: v for k, v in memory.items() if k != "runs"}
+        return replace(session, memory=session_memory), memory["runs"]  # type: ignore
+
+    @staticmethod
+    def _set_runs(
+        session: Session, runs: List[Dict[str, Any]], limit: Optional[int] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Set the runs read from the run log as `session.memory["runs"]`.
+
+        Sessions written before the run log was enabled still carry their runs in the memory column. Those runs are
+        kept if the run log has none, and returned so they can be copied into the run log.
+        """
+        memory: Dict[str, Any] = dict(getattr(session, "memory", None) or {})
+        legacy_runs = memory.get("runs")
+        if len(runs) == 0 and isinstance(legacy_runs, list) and len(legacy_runs) > 0:
+            memory["runs"] = legacy_runs[-limit:] if limit else legacy_runs
+            session.memory = memory  # type: ignore
+            return legacy_runs
+        memory["runs"] = runs
+        session.memory = memory  # type: ignore
+        return None
+
+    def load_runs(
+        self, session: Optional[Session], limit: Optional[int] = None, migrate: bool = False
+    ) -> Optional[Session]:
+        """Attach the most recent `limit` runs from the run log to `session.memory["runs"]`.
+
+        Sessions written before the run log was enabled still carry their runs in the memory column.
+        Those runs are kept and, if `migrate` is True, copied into the run log so they survive the next upsert.
+        """
+        if session is None or not self.stores_runs_separately:
+            return session
+
+        legacy_runs = self._set_runs(session, self.read_runs(session_id=session.session_id, limit=limit), limit=limit)
+        if migrate and legacy_runs is not None:
+            self.upsert_runs(session_id=session.session_id, runs=legacy_runs, user_id=session.user_id)
+        return session
+
+    def load_runs_for_sessions(self, sessions: List[Session], limit: Optional[int] = None) -> List[Session]:
+        """Attach the most recent `limit` runs from the run log to each of the sessions, see load_runs."""
+        if len(sessions) == 0 or not self.stores_runs_separately:
+            return sessions
+
+        runs = self.read_runs_for_sessions([session.session_id for session in sessions], limit=limit)
+        for session in sessions:
+            self._set_runs(session, runs.get(session.session_id, []), limit=limit)
+        return sessions
+
+    async def aload_runs(
+        self, session: Optional[Session], limit: Optional[int] = None, migrate: bool = False
+    ) -> Optional[Session]:
+        """Async version of load_runs"""
+        if session is None or not self.stores_runs_separately:
+            return session
+
+        runs = await self.aread_runs(session_id=session.session_id, limit=limit)
+        legacy_runs = self._set_runs(session, runs, limit=limit)
+        if migrate and legacy_runs is not None:
+            await self.aupsert_runs(session_id=session.session_id, runs=legacy_runs, user_id=session.user_id)
+        return session
@@ -3,7 +3,7 @@ from dataclasses import asdict
 from decimal import Decimal
 from typing import Any, Dict, List, Literal, Optional
 
-from agno.storage.base import Storage
+from agno.storage.base import FIRST_RUN_FIELD, SessionListItem, SessionListPage, Storage
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
@@ -13,7 +13,7 @@ from agno.utils.log import log_debug, log_info, logger
 
 try:
     import boto3
-    from boto3.dynamodb.conditions import Key
+    from boto3.dynamodb.conditions import Attr, Key
     from botocore.exceptions import ClientError
 except ImportError:
     raise ImportError("`boto3` not installed. Please install using `pip install boto3`.")
@@ -557,6 +557,116 @@ class DynamoDbStorage(Storage):
 
         return sessions
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 20,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> SessionListPage:
+        """
+        List session summaries ordered by created_at descending, projecting only the requested attributes.
+
+        Uses the user_id or entity index when a filter is given, continuing from the cursor with ExclusiveStartKey.
+
+        Args:
+            user_id (Optional[str]): Filter by user ID.
+            entity_id (Optional[str]): Filter by entity ID (agent_id, team_id, or workflow_id).
+            limit (Optional[int]): Maximum number of sessions in the page. None returns all remaining sessions.
+            cursor (Optional[str]): The next_cursor of the previous page.
+            fields (Optional[List[str]]): Additional attributes to include in SessionListItem.data, and
+                FIRST_RUN_FIELD to include the first run of each session.
+
+        Returns:
+            SessionListPage: The sessions in this page and the cursor for the next page.
+        """
+        extra_fields = [f for f in fields or [] if f != FIRST_RUN_FIELD]
+        include_first_run = fields is not None and FIRST_RUN_FIELD in fields
+
+        # Use attribute name placeholders, as attribute names can be reserved words
+        attribute_names: Dict[str, str] = {}
+        projection: List[str] = []
+        for i, path in enumerate(
+            ["session_id", "user_id", self.entity_id_field, "created_at", "updated_at", *extra_fields]
+        ):
+            attribute_names[f"#a{i}"] = path
+            projection.append(f"#a{i}")
+        attribute_names["#session_data"] = "session_data"
+        attribute_names["#session_name"] = "session_name"
+        if "session_data" not in extra_fields:
+            projection.append("#session_data.#session_name")
+        if include_first_run:
+            attribute_names["#runs"] = "runs"
+            if self.mode == "workflow_v2":
+                projection.append("#runs[0]")
+            else:
+                attribute_names["#memory"] = "memory"
+                projection.append("#memory.#runs[0]")
+
+        query_kwargs: Dict[str, Any] = {
+            "ProjectionExpression": ", ".join(projection),
+            "ExpressionAttributeNames": attribute_names,
+        }
+        items: List[SessionListItem] = []
+        try:
+            if user_id is None and entity_id is None:
+                # Without a filter there is no index to read in order, so scan and sort the summaries
+                while True:
+                    response = self.table.scan(**query_kwargs)
+                    items.extend(self._get_session_list_item(item, extra_fields) for item in response.get("Items", []))
+                    if "LastEvaluatedKey" not in response:
+                        break
+                    query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+                return self.paginate_session_list_items(items, limit=limit, cursor=cursor)
+
+            # Read the user_id index if filtering by user, the index of the entity otherwise
+            index_name, index_key, index_value = f"{self.entity_id_field}-index", self.entity_id_field, entity_id
+            if user_id is not None:
+                index_name, index_key, index_value = "user_id-index", "user_id", user_id
+                if entity_id is not None:
+                    query_kwargs["FilterExpression"] = Attr(self.entity_id_field).eq(entity_id)
+            query_kwargs.update(
+                IndexName=index_name,
+                KeyConditionExpression=Key(index_key).eq(index_value),
+                ScanIndexForward=False,
+            )
+            if cursor is not None:
+                cursor_created_at, cursor_session_id = self.decode_session_cursor(cursor)
+                query_kwargs["ExclusiveStartKey"] = {
+                    "session_id": cursor_session_id,
+                    "created_at": cursor_created_at,
+                    index_key: index_value,
+                }
+
+            while limit is None or len(items) <= limit:
+                if limit is not None:
+                    query_kwargs["Limit"] = limit + 1 - len(items)
+                response = self.table.query(**query_kwargs)
+                items.extend(self._get_session_list_item(item, extra_fields) for item in response.get("Items", []))
+                if "LastEvaluatedKey" not in response:
+                    break
+                query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+            return self.build_session_list_page(items, limit=limit)
+        except Exception as e:
+            logger.error(f"Error listing sessions: {e}")
+            return SessionListPage(sessions=[])
+
+    def _get_session_list_item(self, item: Dict[str, Any], extra_fields: List[str]) -> SessionListItem:
+        """Build a SessionListItem from a projected DynamoDB item."""
+        item = self._deserialize_item(item)
+        runs = item.get("runs") if self.mode == "workflow_v2" else (item.get("memory") or {}).get("runs")
+        return SessionListItem(
+            session_id=item["session_id"],
+            user_id=item.get("user_id"),
+            entity_id=item.get(self.entity_id_field),
+            session_name=(item.get("session_data") or {}).get("session_name"),
+            created_at=item.get("created_at"),
+            updated_at=item.get("updated_at"),
+            first_run=runs[0] if runs else None,
+            data={f: item.get(f) for f in extra_fields},
+        )
+
     def upsert(self, session: Session) -> Optional[Session]:
         """
         Create or update a Session in the database.
@@ -2,6 +2,7 @@ import json
 import time
 from typing import Any, List, Literal, Optional
 
+from agno.storage.base import SessionListPage
 from agno.storage.json import JsonStorage, Storage
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
@@ -214,6 +215,21 @@ class GCSJsonStorage(JsonStorage):
 
         return sessions
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 20,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> SessionListPage:
+        """
+        List session summaries by reading the session blobs, the bucket has no session index.
+        """
+        return Storage.list_sessions(
+            self, user_id=user_id, entity_id=entity_id, limit=limit, cursor=cursor, fields=fields
+        )
+
     def upsert(self, session: Session) -> Optional[Session]:
         """
         Inserts or updates a session JSON blob in the GCS bucket.
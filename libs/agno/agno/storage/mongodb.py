@@ -1,8 +1,8 @@
 from datetime import datetime, timezone
-from typing import List, Literal, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple
 from uuid import UUID
 
-from agno.storage.base import Storage
+from agno.storage.base import FIRST_RUN_FIELD, SessionListItem, SessionListPage, Storage
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
@@ -18,6 +18,9 @@ try:
 except ImportError:
     raise ImportError("`pymongo` not installed. Please install it with `pip install pymongo`")
 
+if TYPE_CHECKING:
+    from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+
 
 class MongoDbStorage(Storage):
     def __init__(
@@ -27,6 +30,7 @@ class MongoDbStorage(Storage):
         db_name: str = "agno",
         client: Optional[MongoClient] = None,
         mode: Optional[Literal["agent", "team", "workflow", "workflow_v2"]] = "agent",
+        async_client: Optional["AsyncIOMotorClient"] = None,
     ):
         """
         This class provides agent storage using MongoDB.
@@ -36,8 +40,16 @@ class MongoDbStorage(Storage):
             db_url: MongoDB connection URL
             db_name: Name of the database
             client: Optional existing MongoDB client
+            async_client: Optional existing motor client used by the async methods. If not provided, a motor client
+                is created from db_url on first use, unless only a synchronous client was provided.
         """
         super().__init__(mode)
+        self.db_url: Optional[str] = db_url
+        # A motor client can only be created when the connection is not defined by a synchronous client
+        self._async_client_from_url: bool = client is None
+        self._async_client: Optional["AsyncIOMotorClient"] = async_client
+        self._async_collection: Optional["AsyncIOMotorCollection"] = None
+        self._async_unavailable: bool = False
         self._client: Optional[MongoClient] = client
         if self._client is None and db_url is not None:
             self._client = MongoClient(db_url)
@@ -52,6 +64,29 @@ class MongoDbStorage(Storage):
         self.db: Database = self._client[self.db_name]
         self.collection: Collection = self.db[self.collection_name]
 
+    def get_async_collection(self) -> Optional["AsyncIOMotorCollection"]:
+        """
+        Get the motor collection used by the async methods, creating the motor client on first use.
+
+        Returns:
+            The motor collection, or None if motor is not available, in which case the async methods run the
+            synchronous methods in the storage thread pool.
+        """
+        if self._async_collection is None and not self._async_unavailable:
+            if self._async_client is None:
+                if not self._async_client_from_url:
+                    self._async_unavailable = True
+                    return None
+                try:
+                    from motor.motor_asyncio import AsyncIOMotorClient
+                except ImportError:
+                    log_debug("`motor` not installed, async methods run in a thread pool")
+                    self._async_unavailable = True
+                    return None
+                self._async_client = AsyncIOMotorClient(self.db_url) if self.db_url else AsyncIOMotorClient()
+            self._async_collection = self._async_client[self.db_name][self.collection_name]
+        return self._async_collection
+
     def create(self) -> None:
         """Create necessary indexes for the collection"""
         try:
@@ -84,23 +119,46 @@ class MongoDbStorage(Storage):
             if user_id:
                 query["user_id"] = user_id
 
-            doc = self.collection.find_one(query)
-            if doc:
-                # Remove MongoDB _id before converting to AgentSession
-                doc.pop("_id", None)
-                if self.mode == "agent":
-                    return AgentSession.from_dict(doc)
-                elif self.mode == "team":
-                    return TeamSession.from_dict(doc)
-                elif self.mode == "workflow":
-                    return WorkflowSession.from_dict(doc)
-                elif self.mode == "workflow_v2":
-                    return WorkflowSessionV2.from_dict(doc)
+            return self._get_session_from_doc(self.collection.find_one(query))
+        except PyMongoError as e:
+            logger.error(f"Error reading session: {e}")
             return None
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """Read a Session from MongoDB using motor
+        Args:
+            session_id: ID of the session to read
+            user_id: ID of the user to read
+        Returns:
+            Optional[Session]: The session if found, otherwise None
+        """
+        collection = self.get_async_collection()
+        if collection is None:
+            return await super().aread(session_id=session_id, user_id=user_id)
+        try:
+            query = {"session_id": session_id}
+            if user_id:
+                query["user_id"] = user_id
+            return self._get_session_from_doc(await collection.find_one(query))
         except PyMongoError as e:
             logger.error(f"Error reading session: {e}")
             return None
 
+    def _get_session_from_doc(self, doc: Optional[Dict[str, Any]]) -> Optional[Session]:
+        """Create a Session of the storage mode from a MongoDB document"""
+        if doc:
+            # Remove MongoDB _id before converting to AgentSession
+            doc.pop("_id", None)
+            if self.mode == "agent":
+                return AgentSession.from_dict(doc)
+            elif self.mode == "team":
+                return TeamSession.from_dict(doc)
+            elif self.mode == "workflow":
+                return WorkflowSession.from_dict(doc)
+            elif self.mode == "workflow_v2":
+                return WorkflowSessionV2.from_dict(doc)
+        return None
+
     def get_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
         """Get all session IDs matching the criteria
         Args:
@@ -172,6 +230,86 @@ class MongoDbStorage(Storage):
             logger.error(f"Error getting sessions: {e}")
             return []
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 20,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> SessionListPage:
+        """List session summaries ordered by created_at descending, projecting only the requested fields.
+
+        Args:
+            user_id: Filter by user ID
+            entity_id: Filter by entity ID (agent_id, team_id, or workflow_id)
+            limit: Maximum number of sessions in the page. None returns all remaining sessions.
+            cursor: The next_cursor of the previous page
+            fields: Additional fields to include in SessionListItem.data, and FIRST_RUN_FIELD to include
+                the first run of each session.
+        Returns:
+            SessionListPage: The sessions in this page and the cursor for the next page
+        """
+        try:
+            query: Dict[str, Any] = {}
+            if user_id is not None:
+                query["user_id"] = user_id
+            if entity_id is not None:
+                query[self.entity_id_field] = entity_id
+            if cursor is not None:
+                cursor_created_at, cursor_session_id = self.decode_session_cursor(cursor)
+                query["$or"] = [
+                    {"created_at": {"$lt": cursor_created_at}},
+                    {"created_at": cursor_created_at, "session_id": {"$lt": cursor_session_id}},
+                ]
+
+            extra_fields = [f for f in fields or [] if f != FIRST_RUN_FIELD]
+            projection: Dict[str, Any] = {
+                "_id": 0,
+                "session_id": 1,
+                "user_id": 1,
+                self.entity_id_field: 1,
+                "created_at": 1,
+                "updated_at": 1,
+                **{f: 1 for f in extra_fields},
+            }
+            # Projecting both a document and one of its fields is a path collision
+            if "session_data" not in extra_fields:
+                projection["session_data.session_name"] = 1
+            include_first_run = fields is not None and FIRST_RUN_FIELD in fields
+            if include_first_run:
+                if self.mode == "workflow_v2":
+                    projection["runs"] = {"$slice": 1}
+                else:
+                    projection["memory.runs"] = {"$slice": 1}
+
+            docs = self.collection.find(query, projection).sort([("created_at", -1), ("session_id", -1)])
+            if limit is not None:
+                docs = docs.limit(limit + 1)
+
+            items: List[SessionListItem] = []
+            for doc in docs:
+                first_run = None
+                if include_first_run:
+                    runs = doc.get("runs") if self.mode == "workflow_v2" else (doc.get("memory") or {}).get("runs")
+                    first_run = runs[0] if runs else None
+                items.append(
+                    SessionListItem(
+                        session_id=doc["session_id"],
+                        user_id=doc.get("user_id"),
+                        entity_id=doc.get(self.entity_id_field),
+                        session_name=(doc.get("session_data") or {}).get("session_name"),
+                        created_at=doc.get("created_at"),
+                        updated_at=doc.get("updated_at"),
+                        first_run=first_run,
+                        data={f: doc.get(f) for f in extra_fields},
+                    )
+                )
+            return self.build_session_list_page(items, limit=limit)
+        except PyMongoError as e:
+            logger.error(f"Error listing sessions: {e}")
+            return SessionListPage(sessions=[])
+
     def get_recent_sessions(
         self,
         user_id: Optional[str] = None,
@@ -240,26 +378,9 @@ class MongoDbStorage(Storage):
             Optional[Session]: The upserted session, otherwise None
         """
         try:
-            # Convert session to dict and add timestamps
-            session_dict = session.to_dict()
-            now = datetime.now(timezone.utc)
-            timestamp = int(now.timestamp())
-
-            # Handle UUID serialization
-            if isinstance(session.session_id, UUID):
-                session_dict["session_id"] = str(session.session_id)
-
-            # Add version field for optimistic locking
-            if "_version" not in session_dict:
-                session_dict["_version"] = 1
-            else:
-                session_dict["_version"] += 1
-
-            update_data = {**session_dict, "updated_at": timestamp}
+            query, update_data, timestamp = self._get_upsert_data(session)
 
             # For new documents, set created_at
-            query = {"session_id": session_dict["session_id"]}
-
             doc = self.collection.find_one(query)
             if not doc:
                 update_data["created_at"] = timestamp
@@ -267,13 +388,62 @@ class MongoDbStorage(Storage):
             result = self.collection.update_one(query, {"$set": update_data}, upsert=True)
 
             if result.acknowledged:
-                return self.read(session_id=session_dict["session_id"])
+                return self.read(session_id=query["session_id"])
             return None
 
         except PyMongoError as e:
             logger.warning(f"Error upserting session: {e}")
             return None
 
+    async def aupsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
+        """Upsert a session using motor
+        Args:
+            session (Session): The session to upsert
+            create_and_retry (bool): Whether to create a new session if the session_id already exists
+        Returns:
+            Optional[Session]: The upserted session, otherwise None
+        """
+        collection = self.get_async_collection()
+        if collection is None:
+            return await self.run_in_executor(self.upsert, session, create_and_retry)
+        try:
+            query, update_data, timestamp = self._get_upsert_data(session)
+
+            # For new documents, set created_at
+            doc = await collection.find_one(query, {"_id": 1})
+            if not doc:
+                update_data["created_at"] = timestamp
+
+            result = await collection.update_one(query, {"$set": update_data}, upsert=True)
+
+            if result.acknowledged:
+                return await self.aread(session_id=query["session_id"])
+            return None
+
+        except PyMongoError as e:
+            logger.warning(f"Error upserting session: {e}")
+            return None
+
+    def _get_upsert_data(self, session: Session) -> Tuple[Dict[str, Any], Dict[str, Any], int]:
+        """Get the query, the fields to set and the current timestamp used to upsert a session"""
+        # Convert session to dict and add timestamps
+        session_dict = session.to_dict()
+        now = datetime.now(timezone.utc)
+        timestamp = int(now.timestamp())
+
+        # Handle UUID serialization
+        if isinstance(session.session_id, UUID):
+            session_dict["session_id"] = str(session.session_id)
+
+        # Add version field for optimistic locking
+        if "_version" not in session_dict:
+            session_dict["_version"] = 1
+        else:
+            session_dict["_version"] += 1
+
+        update_data = {**session_dict, "updated_at": timestamp}
+        return {"session_id": session_dict["session_id"]}, update_data, timestamp
+
     def delete_session(self, session_id: Optional[str] = None) -> None:
         """Delete an agent session
         Args:
@@ -294,6 +464,29 @@ class MongoDbStorage(Storage):
         except PyMongoError as e:
             logger.error(f"Error deleting session: {e}")
 
+    async def adelete_session(self, session_id: Optional[str] = None) -> None:
+        """Delete an agent session using motor
+        Args:
+            session_id: ID of the session to delete
+        Returns:
+            None
+        """
+        collection = self.get_async_collection()
+        if collection is None:
+            return await super().adelete_session(session_id=session_id)
+        if session_id is None:
+            logger.warning("No session_id provided for deletion")
+            return
+
+        try:
+            result = await collection.delete_one({"session_id": session_id})
+            if result.deleted_count == 0:
+                log_debug(f"No session found with session_id: {session_id}")
+            else:
+                log_debug(f"Successfully deleted session with session_id: {session_id}")
+        except PyMongoError as e:
+            logger.error(f"Error deleting session: {e}")
+
     def drop(self) -> None:
         """Drop the collection
         Returns:
@@ -319,7 +512,7 @@ class MongoDbStorage(Storage):
 
         # Deep copy attributes
         for k, v in self.__dict__.items():
-            if k in {"_client", "db", "collection"}:
+            if k in {"_client", "db", "collection", "_async_client", "_async_collection"}:
                 # Reuse MongoDB connections without copying
                 setattr(copied_obj, k, v)
             else:
@@ -1,7 +1,7 @@
 import time
 from typing import List, Literal, Optional
 
-from agno.storage.base import Storage
+from agno.storage.base import FIRST_RUN_FIELD, SessionListItem, SessionListPage, Storage
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
@@ -15,7 +15,8 @@ try:
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import scoped_session, sessionmaker
     from sqlalchemy.schema import Column, MetaData, Table
-    from sqlalchemy.sql.expression import select, text
+    from sqlalchemy.sql import func
+    from sqlalchemy.sql.expression import and_, or_, select, text
     from sqlalchemy.types import JSON, BigInteger, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy pymysql`")
@@ -448,6 +449,88 @@ class MySQLStorage(Storage):
                 log_debug(f"Exception reading from table: {e}")
             return []
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 20,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> SessionListPage:
+        """
+        List session summaries ordered by created_at descending, reading only the requested columns.
+
+        Args:
+            user_id: Filter by user ID
+            entity_id: Filter by entity ID (agent_id, team_id, or workflow_id)
+            limit: Maximum number of sessions in the page. None returns all remaining sessions.
+            cursor: The next_cursor of the previous page
+            fields: Additional columns to include in SessionListItem.data, and FIRST_RUN_FIELD to include
+                the first run of each session.
+
+        Returns:
+            SessionListPage: The sessions in this page and the cursor for the next page
+        """
+        extra_fields = [f for f in fields or [] if f != FIRST_RUN_FIELD and f in self.table.c]
+        created_at = func.coalesce(self.table.c.created_at, 0)
+        columns = [
+            self.table.c.session_id,
+            self.table.c.user_id,
+            self.table.c[self.entity_id_field].label("entity_id"),
+            self.table.c.session_data["session_name"].as_string().label("session_name"),
+            self.table.c.created_at,
+            self.table.c.updated_at,
+            *[self.table.c[f] for f in extra_fields],
+        ]
+        if fields is not None and FIRST_RUN_FIELD in fields:
+            columns.append(self._get_first_run_column().label(FIRST_RUN_FIELD))
+
+        try:
+            with self.Session() as sess, sess.begin():
+                stmt = select(*columns)
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                if entity_id is not None:
+                    stmt = stmt.where(self.table.c[self.entity_id_field] == entity_id)
+                if cursor is not None:
+                    cursor_created_at, cursor_session_id = self.decode_session_cursor(cursor)
+                    stmt = stmt.where(
+                        or_(
+                            created_at < cursor_created_at,
+                            and_(created_at == cursor_created_at, self.table.c.session_id < cursor_session_id),
+                        )
+                    )
+                stmt = stmt.order_by(created_at.desc(), self.table.c.session_id.desc())
+                if limit is not None:
+                    stmt = stmt.limit(limit + 1)
+
+                items = [
+                    SessionListItem(
+                        session_id=row.session_id,
+                        user_id=row.user_id,
+                        entity_id=row.entity_id,
+                        session_name=row.session_name,
+                        created_at=row.created_at,
+                        updated_at=row.updated_at,
+                        first_run=row._mapping.get(FIRST_RUN_FIELD),
+                        data={f: row._mapping[f] for f in extra_fields},
+                    )
+                    for row in sess.execute(stmt).fetchall()
+                ]
+                return self.build_session_list_page(items, limit=limit)
+        except Exception as e:
+            log_debug(f"Exception reading from table: {e}")
+            log_debug(f"Table does not exist: {self.table.name}")
+            log_debug("Creating table for future transactions")
+            self.create()
+        return SessionListPage(sessions=[])
+
+    def _get_first_run_column(self):
+        """Get a column expression that selects only the first run of each session."""
+        if self.mode == "workflow_v2":
+            return self.table.c.runs[0]
+        return self.table.c.memory[("runs", 0)]
+
     def upgrade_schema(self) -> None:
         """
         Upgrade the schema to the latest version.
@@ -1,10 +1,10 @@
 import json
 import time
 from dataclasses import asdict
-from typing import List, Literal, Optional
+from typing import Iterator, List, Literal, Optional, Tuple, TypedDict, Union, cast
 from uuid import UUID
 
-from agno.storage.base import Storage
+from agno.storage.base import SessionListItem, SessionListPage, Storage
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
@@ -14,6 +14,7 @@ from agno.utils.log import log_debug, log_info, logger
 
 try:
     from redis import ConnectionError, Redis
+    from redis.asyncio import Redis as AsyncRedis
 except ImportError:
     raise ImportError("`redis` not installed. Please install it using `pip install redis`")
 
@@ -25,6 +26,17 @@ class UUIDEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+class _RedisConnectionKwargs(TypedDict):
+    """Connection arguments shared by the sync and async Redis clients."""
+
+    host: str
+    port: int
+    db: int
+    password: Optional[str]
+    decode_responses: bool
+    ssl: bool
+
+
 class RedisStorage(Storage):
     def __init__(
         self,
@@ -36,6 +48,7 @@ class RedisStorage(Storage):
         mode: Optional[Literal["agent", "team", "workflow", "workflow_v2"]] = "agent",
         ssl: Optional[bool] = False,
         expire: Optional[int] = None,
+        index_batch_size: int = 500,
     ):
         """
         Initialize Redis storage for sessions.
@@ -49,20 +62,34 @@ class RedisStorage(Storage):
             mode (Optional[Literal["agent", "team", "workflow", "workflow_v2"]]): Storage mode
             ssl (Optional[bool]): Whether to use SSL for Redis connection
             expire (Optional[int]): TTL (time to live) in seconds for Redis keys. None means no expiration.
+            index_batch_size (int): Number of sessions fetched per MGET when reading or indexing sessions
         """
         super().__init__(mode)
         self.prefix = prefix
         self.expire = expire
-        self.redis_client = Redis(
+        self.index_batch_size = index_batch_size
+        # Set once the sorted-set session indexes are known to cover the whole keyspace
+        self._indexes_ready = False
+        self._connection_kwargs = _RedisConnectionKwargs(
             host=host,
             port=port,
             db=db,
             password=password,
             decode_responses=True,  # Automatically decode responses to str
-            ssl=ssl,
+            ssl=bool(ssl),
         )
+        self.redis_client = Redis(**self._connection_kwargs)
+        # Async Redis client used by the async methods, created on first use
+        self._async_redis_client: Optional[AsyncRedis] = None
         log_debug(f"Created RedisStorage with prefix: '{self.prefix}'")
 
+    @property
+    def async_redis_client(self) -> AsyncRedis:
+        """Get the async Redis client, creating it on first use."""
+        if self._async_redis_client is None:
+            self._async_redis_client = AsyncRedis(**self._connection_kwargs)
+        return self._async_redis_client
+
     def _get_key(self, session_id: str) -> str:
         """Generate Redis key for a session."""
         return f"{self.prefix}:{session_id}"
@@ -71,7 +98,7 @@ class RedisStorage(Storage):
         """Serialize data to JSON string."""
         return json.dumps(data, ensure_ascii=False, cls=UUIDEncoder)
 
-    def deserialize(self, data: str) -> dict:
+    def deserialize(self, data: Union[str, bytes]) -> dict:
         """Deserialize JSON string to dict."""
         return json.loads(data)
 
@@ -98,123 +125,254 @@ class RedisStorage(Storage):
             session_data = self.deserialize(data)  # type: ignore
             if user_id and session_data.get("user_id") != user_id:
                 return None
+            return self._session_from_dict(session_data)
+        except Exception as e:
+            logger.error(f"Error reading session: {e}")
+            return None
 
-            if self.mode == "agent":
-                return AgentSession.from_dict(session_data)
-            elif self.mode == "team":
-                return TeamSession.from_dict(session_data)
-            elif self.mode == "workflow":
-                return WorkflowSession.from_dict(session_data)
-            elif self.mode == "workflow_v2":
-                return WorkflowSessionV2.from_dict(session_data)
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """Read a Session from Redis using the async client."""
+        try:
+            data = await self.async_redis_client.get(self._get_key(session_id))
+            if data is None:
+                return None
 
+            session_data = self.deserialize(data)  # type: ignore
+            if user_id and session_data.get("user_id") != user_id:
+                return None
+            return self._session_from_dict(session_data)
         except Exception as e:
             logger.error(f"Error reading session: {e}")
             return None
 
+    def _get_index_key(self, name: str) -> str:
+        """Generate the Redis key of a session index. Index keys are kept outside of the `prefix:*` keyspace."""
+        return f"{self.prefix}__index:{name}"
+
+    def _get_index_keys(self, data: dict) -> List[str]:
+        """Get the keys of all indexes a session belongs to."""
+        user_id = data.get("user_id")
+        entity_id = data.get(self.entity_id_field)
+        index_keys = [self._get_index_key("sessions")]
+        if user_id is not None:
+            index_keys.append(self._get_index_key(f"user:{user_id}"))
+        if entity_id is not None:
+            index_keys.append(self._get_index_key(f"entity:{entity_id}"))
+        if user_id is not None and entity_id is not None:
+            index_keys.append(self._get_index_key(f"user:{user_id}:entity:{entity_id}"))
+        return index_keys
+
+    def _get_filter_index_key(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> str:
+        """Get the key of the index holding the sessions matching the given filters."""
+        if user_id is not None and entity_id is not None:
+            return self._get_index_key(f"user:{user_id}:entity:{entity_id}")
+        elif user_id is not None:
+            return self._get_index_key(f"user:{user_id}")
+        elif entity_id is not None:
+            return self._get_index_key(f"entity:{entity_id}")
+        return self._get_index_key("sessions")
+
+    def _add_to_indexes(self, pipeline, data: dict) -> None:
+        """Add a session to its indexes, scored by created_at."""
+        score = data.get("created_at") or 0
+        for index_key in self._get_index_keys(data):
+            pipeline.zadd(index_key, {data["session_id"]: score})
+
+    def build_indexes(self) -> int:
+        """
+        Build the session indexes for an existing keyspace.
+
+        Sessions written by RedisStorage keep their indexes up to date on upsert and delete_session. This
+        migration helper indexes sessions written before indexes were introduced. It runs automatically the
+        first time sessions are listed, and can be run ahead of time to avoid that one-off keyspace scan.
+
+        Returns:
+            int: The number of sessions indexed
+        """
+        num_indexed = 0
+        keys: List[str] = []
+        for key in self.redis_client.scan_iter(match=f"{self.prefix}:*"):
+            keys.append(key)
+            if len(keys) >= self.index_batch_size:
+                num_indexed += self._index_keys(keys)
+                keys = []
+        if keys:
+            num_indexed += self._index_keys(keys)
+
+        self.redis_client.set(self._get_index_key("ready"), "1")
+        self._indexes_ready = True
+        log_info(f"Indexed {num_indexed} sessions with prefix: {self.prefix}")
+        return num_indexed
+
+    def _index_keys(self, keys: List[str]) -> int:
+        """Add the sessions stored at the given keys to their indexes."""
+        num_indexed = 0
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for value in self.redis_client.mget(keys):
+            if value is None:
+                continue
+            try:
+                data = self.deserialize(value)
+                if "session_id" not in data:
+                    continue
+                self._add_to_indexes(pipeline, data)
+                num_indexed += 1
+            except Exception as e:
+                logger.warning(f"Skipping session that could not be indexed: {e}")
+        pipeline.execute()
+        return num_indexed
+
+    def _ensure_indexes(self) -> None:
+        """Build the session indexes if this keyspace has not been indexed yet."""
+        if self._indexes_ready:
+            return
+        if self.redis_client.exists(self._get_index_key("ready")):
+            self._indexes_ready = True
+            return
+        log_debug(f"Session indexes not found for prefix: {self.prefix}. Building them.")
+        self.build_indexes()
+
+    def _get_indexed_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
+        """Get the IDs of all indexed sessions matching the filters, most recently created first."""
+        self._ensure_indexes()
+        # The client decodes responses, so the members are str
+        return cast(List[str], self.redis_client.zrevrange(self._get_filter_index_key(user_id, entity_id), 0, -1))
+
+    def _fetch_session_data(
+        self, session_ids: List[str], user_id: Optional[str] = None, entity_id: Optional[str] = None
+    ) -> List[dict]:
+        """
+        Fetch sessions with MGET, preserving the order of session_ids.
+
+        Index entries of sessions that have expired, were deleted, or no longer match the filters are removed.
+        """
+        sessions_data, stale_session_ids = self._read_session_data(session_ids, user_id=user_id, entity_id=entity_id)
+        if stale_session_ids:
+            self.redis_client.zrem(self._get_filter_index_key(user_id, entity_id), *stale_session_ids)
+        return sessions_data
+
+    def _read_session_data(
+        self, session_ids: List[str], user_id: Optional[str] = None, entity_id: Optional[str] = None
+    ) -> Tuple[List[dict], List[str]]:
+        """
+        Read sessions with MGET, preserving the order of session_ids.
+
+        Returns:
+            The sessions, and the IDs of the sessions that have expired, were deleted, or no longer match the filters.
+        """
+        if not session_ids:
+            return [], []
+
+        sessions_data: List[dict] = []
+        stale_session_ids: List[str] = []
+        for i in range(0, len(session_ids), self.index_batch_size):
+            batch = session_ids[i : i + self.index_batch_size]
+            values = self.redis_client.mget([self._get_key(session_id) for session_id in batch])
+            for session_id, value in zip(batch, values):
+                if value is None:
+                    stale_session_ids.append(session_id)
+                    continue
+                try:
+                    data = self.deserialize(value)
+                except Exception as e:
+                    logger.error(f"Error processing session data: {e}")
+                    continue
+                if (user_id is not None and data.get("user_id") != user_id) or (
+                    entity_id is not None and data.get(self.entity_id_field) != entity_id
+                ):
+                    stale_session_ids.append(session_id)
+                    continue
+                sessions_data.append(data)
+
+        return sessions_data, stale_session_ids
+
+    def _session_from_dict(self, data: dict) -> Optional[Session]:
+        """Create a Session of the storage mode from its stored dict."""
+        if self.mode == "agent":
+            return AgentSession.from_dict(data)
+        elif self.mode == "team":
+            return TeamSession.from_dict(data)
+        elif self.mode == "workflow":
+            return WorkflowSession.from_dict(data)
+        elif self.mode == "workflow_v2":
+            return WorkflowSessionV2.from_dict(data)
+        return None
+
     def get_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
         """Get all session IDs, optionally filtered by user_id and/or entity_id."""
-        session_ids = []
         try:
-            # Get all keys matching the prefix pattern
-            pattern = f"{self.prefix}:*"
-            for key in self.redis_client.scan_iter(match=pattern):
-                data = self.deserialize(self.redis_client.get(key))  # type: ignore
-
-                if user_id or entity_id:
-                    if user_id and entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id and data["user_id"] == user_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "team" and data["team_id"] == entity_id and data["user_id"] == user_id:
-                            session_ids.append(data["session_id"])
-                        elif (
-                            self.mode == "workflow" and data["workflow_id"] == entity_id and data["user_id"] == user_id
-                        ):
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "workflow_v2" and data["workflow_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                    elif user_id and data["user_id"] == user_id:
-                        session_ids.append(data["session_id"])
-                    elif entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "team" and data["team_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "workflow" and data["workflow_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "workflow_v2" and data["workflow_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                else:
-                    # No filters applied, add all session_ids
-                    session_ids.append(data["session_id"])
-
+            session_ids = self._get_indexed_session_ids(user_id=user_id, entity_id=entity_id)
+            if self.expire is None:
+                return session_ids
+            # Indexed sessions may have expired, only return sessions that still exist
+            return [
+                data["session_id"]
+                for data in self._fetch_session_data(session_ids, user_id=user_id, entity_id=entity_id)
+            ]
         except Exception as e:
             logger.error(f"Error getting session IDs: {e}")
-
-        return session_ids
+        return []
 
     def get_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
         """Get all sessions, optionally filtered by user_id and/or entity_id."""
         sessions: List[Session] = []
         try:
-            pattern = f"{self.prefix}:*"
-            for key in self.redis_client.scan_iter(match=pattern):
-                data = self.deserialize(self.redis_client.get(key))  # type: ignore
-
-                if user_id or entity_id:
-                    _session: Optional[Session] = None
-
-                    if user_id and entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id and data["user_id"] == user_id:
-                            _session = AgentSession.from_dict(data)
-                        elif self.mode == "team" and data["team_id"] == entity_id and data["user_id"] == user_id:
-                            _session = TeamSession.from_dict(data)
-                        elif (
-                            self.mode == "workflow" and data["workflow_id"] == entity_id and data["user_id"] == user_id
-                        ):
-                            _session = WorkflowSession.from_dict(data)
-                        elif self.mode == "workflow_v2" and data["workflow_id"] == entity_id:
-                            _session = WorkflowSessionV2.from_dict(data)
-                    elif user_id and data["user_id"] == user_id:
-                        if self.mode == "agent":
-                            _session = AgentSession.from_dict(data)
-                        elif self.mode == "team":
-                            _session = TeamSession.from_dict(data)
-                        elif self.mode == "workflow":
-                            _session = WorkflowSession.from_dict(data)
-                        elif self.mode == "workflow_v2" and data["workflow_id"] == entity_id:
-                            _session = WorkflowSessionV2.from_dict(data)
-                    elif entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id:
-                            _session = AgentSession.from_dict(data)
-                        elif self.mode == "team" and data["team_id"] == entity_id:
-                            _session = TeamSession.from_dict(data)
-                        elif self.mode == "workflow" and data["workflow_id"] == entity_id:
-                            _session = WorkflowSession.from_dict(data)
-                        elif self.mode == "workflow_v2" and data["workflow_id"] == entity_id:
-                            _session = WorkflowSessionV2.from_dict(data)
-
-                    if _session:
-                        sessions.append(_session)
-                else:
-                    _session = None
-                    # No filters applied, add all sessions
-                    if self.mode == "agent":
-                        _session = AgentSession.from_dict(data)
-                    elif self.mode == "team":
-                        _session = TeamSession.from_dict(data)
-                    elif self.mode == "workflow":
-                        _session = WorkflowSession.from_dict(data)
-                    elif self.mode == "workflow_v2":
-                        _session = WorkflowSessionV2.from_dict(data)
-                    if _session:
-                        sessions.append(_session)
-
+            session_ids = self._get_indexed_session_ids(user_id=user_id, entity_id=entity_id)
+            for data in self._fetch_session_data(session_ids, user_id=user_id, entity_id=entity_id):
+                _session = self._session_from_dict(data)
+                if _session is not None:
+                    sessions.append(_session)
         except Exception as e:
             logger.error(f"Error getting all sessions: {e}")
-
         return sessions
 
+    def _iter_indexed_sessions(
+        self,
+        batch_size: int,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        position: Optional[Tuple[int, str]] = None,
+    ) -> Iterator[Session]:
+        """
+        Iterate over the sessions of a filter index ordered by created_at descending, reading them in batches.
+
+        Args:
+            batch_size: Number of index entries to read at a time
+            user_id: Filter by user ID
+            entity_id: Filter by entity ID (agent_id, team_id, or workflow_id)
+            position: The (created_at, session_id) of a cursor. Only sessions after it are returned.
+        """
+        index_key = self._get_filter_index_key(user_id, entity_id)
+        max_score: Union[int, str] = "+inf" if position is None else position[0]
+        offset = 0
+        # Sessions created in the same second share a score and are returned in reverse
+        # lexicographical order, which matches the (created_at, session_id) ordering of the cursor
+        while True:
+            batch = cast(
+                List[Tuple[str, float]],
+                self.redis_client.zrevrangebyscore(
+                    index_key, max_score, "-inf", start=offset, num=batch_size, withscores=True
+                ),
+            )
+            if not batch:
+                return
+            session_ids = [
+                session_id for session_id, score in batch if position is None or (int(score), session_id) < position
+            ]
+            sessions_data, stale_session_ids = self._read_session_data(
+                session_ids, user_id=user_id, entity_id=entity_id
+            )
+            # Stale index entries are dropped as they are found, so they neither shorten a page nor hide the
+            # sessions after it
+            if stale_session_ids:
+                self.redis_client.zrem(index_key, *stale_session_ids)
+            # Removing the stale entries moves the following entries up in the index
+            offset += len(batch) - len(stale_session_ids)
+            for data in sessions_data:
+                session = self._session_from_dict(data)
+                if session is not None:
+                    yield session
+
     def get_recent_sessions(
         self,
         user_id: Optional[str] = None,
@@ -224,7 +382,7 @@ class RedisStorage(Storage):
         """Get the last N sessions, ordered by created_at descending.
 
         Args:
-            num_history_sessions: Number of most recent sessions to return
+            limit: Number of most recent sessions to return
             user_id: Filter by user ID
             entity_id: Filter by entity ID (agent_id, team_id, or workflow_id)
 
@@ -232,98 +390,143 @@ class RedisStorage(Storage):
             List[Session]: List of most recent sessions
         """
         sessions: List[Session] = []
-        # List of (created_at, data) tuples for sorting
-        session_data: List[tuple[int, dict]] = []
-
+        if limit is not None and limit <= 0:
+            return sessions
         try:
-            pattern = f"{self.prefix}:*"
-            for key in self.redis_client.scan_iter(match=pattern):
-                try:
-                    data = self.deserialize(self.redis_client.get(key))  # type: ignore
-
-                    # Apply filters
-                    if user_id and data["user_id"] != user_id:
-                        continue
-
-                    if entity_id:
-                        if self.mode == "agent" and data["agent_id"] != entity_id:
-                            continue
-                        elif self.mode == "team" and data["team_id"] != entity_id:
-                            continue
-                        elif self.mode == "workflow" and data["workflow_id"] != entity_id:
-                            continue
-                        elif self.mode == "workflow_v2" and data["workflow_id"] != entity_id:
-                            continue
-                    # Store with created_at for sorting
-                    created_at = data.get("created_at", 0)
-                    session_data.append((created_at, data))
-
-                except Exception as e:
-                    logger.error(f"Error processing session data: {e}")
-                    continue
-
-            # Sort by created_at descending and take only num_history_sessions
-            session_data.sort(key=lambda x: x[0], reverse=True)
-            if limit is not None:
-                session_data = session_data[:limit]
-
-            # Convert filtered and sorted data to Session objects
-            for _, data in session_data:
-                session: Optional[Session] = None
-                if self.mode == "agent":
-                    session = AgentSession.from_dict(data)
-                elif self.mode == "team":
-                    session = TeamSession.from_dict(data)
-                elif self.mode == "workflow":
-                    session = WorkflowSession.from_dict(data)
-                elif self.mode == "workflow_v2":
-                    session = WorkflowSessionV2.from_dict(data)
-                if session is not None:
-                    sessions.append(session)
-
+            self._ensure_indexes()
+            batch_size = self.index_batch_size if limit is None else limit
+            for session in self._iter_indexed_sessions(batch_size, user_id=user_id, entity_id=entity_id):
+                sessions.append(session)
+                if limit is not None and len(sessions) >= limit:
+                    break
         except Exception as e:
             logger.error(f"Error getting last {limit} sessions: {e}")
 
         return sessions
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 20,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> SessionListPage:
+        """
+        List session summaries ordered by created_at descending, reading only the sessions in the page.
+
+        Args:
+            user_id: Filter by user ID
+            entity_id: Filter by entity ID (agent_id, team_id, or workflow_id)
+            limit: Maximum number of sessions in the page. None returns all remaining sessions.
+            cursor: The next_cursor of the previous page
+            fields: Additional session fields to include in SessionListItem.data, and FIRST_RUN_FIELD to include
+                the first run of each session.
+
+        Returns:
+            SessionListPage: The sessions in this page and the cursor for the next page
+        """
+        try:
+            self._ensure_indexes()
+            position: Optional[Tuple[int, str]] = None
+            if cursor is not None:
+                position = self.decode_session_cursor(cursor)
+
+            items: List[SessionListItem] = []
+            batch_size = self.index_batch_size if limit is None else limit + 1
+            for session in self._iter_indexed_sessions(
+                batch_size, user_id=user_id, entity_id=entity_id, position=position
+            ):
+                items.append(self.get_session_list_item(session, fields=fields))
+                if limit is not None and len(items) > limit:
+                    break
+            return self.build_session_list_page(items, limit=limit)
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"Error listing sessions: {e}")
+        return SessionListPage(sessions=[])
+
     def upsert(self, session: Session) -> Optional[Session]:
-        """Insert or update a Session in Redis."""
+        """Insert or update a Session in Redis, keeping its indexes up to date."""
+        try:
+            pipeline = self.redis_client.pipeline(transaction=False)
+            self._add_upsert_commands(pipeline, session)
+            pipeline.execute()
+            return session
+        except Exception as e:
+            logger.error(f"Error upserting session: {e}")
+            return None
+
+    async def aupsert(self, session: Session) -> Optional[Session]:
+        """Insert or update a Session in Redis using the async client."""
         try:
-            if self.mode == "workflow_v2":
-                data = session.to_dict()
-            else:
-                data = asdict(session)
-            data["updated_at"] = int(time.time())
-            if "created_at" not in data or data["created_at"] is None:
-                data["created_at"] = data["updated_at"]
-
-            key = self._get_key(session.session_id)
-            if self.expire is not None:
-                self.redis_client.set(key, self.serialize(data), ex=self.expire)
-            else:
-                self.redis_client.set(key, self.serialize(data))
+            pipeline = self.async_redis_client.pipeline(transaction=False)
+            self._add_upsert_commands(pipeline, session)
+            await pipeline.execute()
             return session
         except Exception as e:
             logger.error(f"Error upserting session: {e}")
             return None
 
+    def _add_upsert_commands(self, pipeline, session: Session) -> None:
+        """Queue the commands that store a session and add it to its indexes."""
+        if self.mode == "workflow_v2":
+            data = session.to_dict()
+        else:
+            data = asdict(session)
+        data["updated_at"] = int(time.time())
+        if "created_at" not in data or data["created_at"] is None:
+            data["created_at"] = data["updated_at"]
+
+        key = self._get_key(session.session_id)
+        if self.expire is not None:
+            pipeline.set(key, self.serialize(data), ex=self.expire)
+        else:
+            pipeline.set(key, self.serialize(data))
+        self._add_to_indexes(pipeline, data)
+
     def delete_session(self, session_id: Optional[str] = None):
-        """Delete a session from Redis."""
+        """Delete a session and its index entries from Redis."""
+        if session_id is None:
+            return
+        try:
+            key = self._get_key(session_id)
+            value = self.redis_client.get(key)
+            pipeline = self.redis_client.pipeline(transaction=False)
+            if value is not None:
+                for index_key in self._get_index_keys(self.deserialize(value)):  # type: ignore
+                    pipeline.zrem(index_key, session_id)
+            pipeline.delete(key)
+            pipeline.execute()
+            log_debug(f"Deleted session: {session_id}")
+        except Exception as e:
+            logger.error(f"Error deleting session: {e}")
+
+    async def adelete_session(self, session_id: Optional[str] = None):
+        """Delete a session and its index entries from Redis using the async client."""
         if session_id is None:
             return
         try:
             key = self._get_key(session_id)
-            self.redis_client.delete(key)
+            value = await self.async_redis_client.get(key)
+            pipeline = self.async_redis_client.pipeline(transaction=False)
+            if value is not None:
+                for index_key in self._get_index_keys(self.deserialize(value)):  # type: ignore
+                    pipeline.zrem(index_key, session_id)
+            pipeline.delete(key)
+            await pipeline.execute()
             log_debug(f"Deleted session: {session_id}")
         except Exception as e:
             logger.error(f"Error deleting session: {e}")
 
     def drop(self) -> None:
-        """Drop all sessions from storage."""
+        """Drop all sessions and session indexes from storage."""
         try:
-            pattern = f"{self.prefix}:*"
-            for key in self.redis_client.scan_iter(match=pattern):
-                self.redis_client.delete(key)
+            for pattern in (f"{self.prefix}:*", self._get_index_key("*")):
+                for key in self.redis_client.scan_iter(match=pattern):
+                    self.redis_client.delete(key)
+            self._indexes_ready = False
             log_info(f"Dropped all sessions with prefix: {self.prefix}")
         except Exception as e:
             logger.error(f"Error dropping sessions: {e}")
@@ -0,0 +1,166 @@
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import RLock
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows, where the index is only locked within the process
+    fcntl = None  # type: ignore
+
+# The index log is compacted once it holds this many lines more than twice the number of sessions
+COMPACT_MIN_LINES = 1000
+
+# Session fields holding the ID of the agent, team or workflow of the session
+ENTITY_ID_FIELDS = ("agent_id", "team_id", "workflow_id")
+
+
+class SessionIndex:
+    """Index of the sessions stored as files in a directory, kept in an append-only log file.
+
+    Each line of the log upserts or deletes the entry of one session, so keeping the index up to date costs a
+    single small append per write. Listing and recency queries read the entries from memory, after picking up
+    lines appended by other processes since the last query. The log is compacted into one line per session
+    once it holds more than twice as many lines as sessions.
+
+    Processes sharing the index take a lock on its directory: a shared lock to append and an exclusive lock to
+    replace the log, so no line is appended to a log that is being replaced.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        # Number of lines and bytes of the log read so far, and the file they were read from
+        self._lines: int = 0
+        self._offset: int = 0
+        self._file_id: Optional[Tuple[int, int]] = None
+        self._lock = RLock()
+
+    @staticmethod
+    def get_entry(data: Dict[str, Any], size: int) -> Dict[str, Any]:
+        """Build the index entry of a serialized session of `size` bytes"""
+        entry = {
+            "session_id": data["session_id"],
+            "user_id": data.get("user_id"),
+            "created_at": data.get("created_at"),
+            "updated_at": data.get("updated_at"),
+            "session_name": (data.get("session_data") or {}).get("session_name"),
+            "size": size,
+        }
+        for field_name in ENTITY_ID_FIELDS:
+            if data.get(field_name) is not None:
+                entry[field_name] = data[field_name]
+        return entry
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def _reset(self, file_id: Optional[Tuple[int, int]] = None) -> None:
+        self._entries = {}
+        self._lines = 0
+        self._offset = 0
+        self._file_id = file_id
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        self._lines += 1
+        session_id = record.pop("session_id")
+        if record.pop("deleted", False):
+            self._entries.pop(session_id, None)
+        else:
+            self._entries[session_id] = {"session_id": session_id, **record}
+
+    def _refresh(self) -> None:
+        """Apply the lines appended to the log since the last refresh, reloading it if it was replaced"""
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            self._reset()
+            return
+        file_id = (stat.st_dev, stat.st_ino)
+        if file_id != self._file_id or stat.st_size < self._offset:
+            self._reset(file_id)
+        if stat.st_size == self._offset:
+            return
+
+        with self.path.open("rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+        # Only apply complete lines, a line still being appended is applied on the next refresh
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            if line.strip():
+                self._apply(json.loads(line))
+        self._offset += end
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool = False) -> Iterator[None]:
+        """Hold a lock on the directory of the index, shared with the other processes using it"""
+        if fcntl is None:
+            yield
+            return
+        fd = os.open(self.path.parent, os.O_RDONLY)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+        finally:
+            # Closing the file descriptor releases the lock
+            os.close(fd)
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            line = (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+            # A single write in append mode, so lines appended concurrently by other processes never interleave
+            with self._file_lock(), self.path.open("ab") as f:
+                f.write(line)
+            self._refresh()
+            if self._lines > 2 * len(self._entries) + COMPACT_MIN_LINES:
+                self._compact()
+
+    def _compact(self) -> None:
+        """Replace the log with one line per session"""
+        with self._lock, self._file_lock(exclusive=True):
+            # Apply the lines appended by other processes since the last refresh, so they are kept
+            self._refresh()
+            self._replace(list(self._entries.values()))
+
+    def _replace(self, entries: List[Dict[str, Any]]) -> None:
+        """Replace the log atomically with one line per entry, holding the exclusive lock"""
+        # A unique temporary file in the same directory, so concurrent rebuilds never write to the same file
+        f = NamedTemporaryFile(
+            "w", encoding="utf-8", dir=self.path.parent, prefix=f"{self.path.name}.", suffix=".tmp", delete=False
+        )
+        try:
+            with f:
+                for entry in entries:
+                    f.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+            os.replace(f.name, self.path)
+        except BaseException:
+            Path(f.name).unlink(missing_ok=True)
+            raise
+        self._refresh()
+
+    def get_entries(self) -> List[Dict[str, Any]]:
+        """Return the entries of all sessions, in the order they were first added"""
+        with self._lock:
+            self._refresh()
+            return list(self._entries.values())
+
+    def upsert(self, entry: Dict[str, Any]) -> None:
+        self._append(entry)
+
+    def delete(self, session_id: str) -> None:
+        self._append({"session_id": session_id, "deleted": True})
+
+    def rebuild(self, entries: List[Dict[str, Any]]) -> None:
+        """Replace the log atomically with one line per entry"""
+        with self._lock, self._file_lock(exclusive=True):
+            self._replace(entries)
+
+    def clear(self) -> None:
+        with self._lock, self._file_lock(exclusive=True):
+            self.path.unlink(missing_ok=True)
+            self._reset()
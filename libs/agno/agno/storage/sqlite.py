@@ -1,28 +1,34 @@
+import asyncio
 import time
 from pathlib import Path
-from typing import List, Literal, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional
 
-from agno.storage.base import Storage
+from agno.storage.base import FIRST_RUN_FIELD, READ_RUNS_BATCH_SIZE, SessionListItem, SessionListPage, Storage
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
 from agno.storage.session.v2.workflow import WorkflowSession as WorkflowSessionV2
 from agno.storage.session.workflow import WorkflowSession
+from agno.utils.async_engine import dispose_async_engine
 from agno.utils.log import log_debug, log_info, log_warning, logger
 
 try:
     from sqlalchemy.dialects import sqlite
     from sqlalchemy.engine import Engine, create_engine
+    from sqlalchemy.exc import ArgumentError
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session as SqlSession
     from sqlalchemy.orm import sessionmaker
-    from sqlalchemy.schema import Column, MetaData, Table
-    from sqlalchemy.sql import text
-    from sqlalchemy.sql.expression import select
+    from sqlalchemy.schema import Column, Index, MetaData, Table
+    from sqlalchemy.sql import func, text
+    from sqlalchemy.sql.expression import and_, or_, select
     from sqlalchemy.types import String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
 
 class SqliteStorage(Storage):
     def __init__(
@@ -34,6 +40,10 @@ class SqliteStorage(Storage):
         schema_version: int = 1,
         auto_upgrade_schema: bool = False,
         mode: Optional[Literal["agent", "team", "workflow", "workflow_v2"]] = "agent",
+        runs_table_name: Optional[str] = None,
+        num_runs_to_read: Optional[int] = None,
+        async_db_url: Optional[str] = None,
+        async_db_engine: Optional["AsyncEngine"] = None,
     ):
         """
         This class provides agent storage using a sqlite database.
@@ -49,6 +59,13 @@ class SqliteStorage(Storage):
             db_url: The database URL to connect to.
             db_file: The database file to connect to.
             db_engine: The SQLAlchemy database engine to use.
+            runs_table_name: If provided, agent and team runs are stored in this append-only table keyed by
+                (session_id, run_id), so each upsert only writes the new runs instead of the full run history.
+            num_runs_to_read: When using a runs table, the number of most recent runs attached to a session on read.
+                Defaults to all runs.
+            async_db_url: The database URL used by the async methods. Defaults to the URL of the database file
+                with the aiosqlite driver. In-memory databases and missing drivers fall back to a thread pool.
+            async_db_engine: The SQLAlchemy async database engine used by the async methods.
         """
         super().__init__(mode)
         _engine: Optional[Engine] = db_engine
@@ -79,10 +96,20 @@ class SqliteStorage(Storage):
         self.auto_upgrade_schema: bool = auto_upgrade_schema
         self._schema_up_to_date: bool = False
 
+        # Append-only run log
+        self.runs_table_name: Optional[str] = runs_table_name
+        self.num_runs_to_read: Optional[int] = num_runs_to_read
+
         # Database session
         self.SqlSession: sessionmaker[SqlSession] = sessionmaker(bind=self.db_engine)
+        # Async database sessions, created on first use in each event loop
+        self.async_db_url: Optional[str] = async_db_url
+        self.async_db_engine: Optional["AsyncEngine"] = async_db_engine
+        self._async_sessions: Dict[asyncio.AbstractEventLoop, "async_sessionmaker[AsyncSession]"] = {}
+        self._async_unavailable: bool = False
         # Database table for storage
         self.table: Table = self.get_table()
+        self.runs_table: Optional[Table] = self.get_runs_table()
 
     @property
     def mode(self) -> Optional[Literal["agent", "team", "workflow", "workflow_v2"]]:
@@ -96,6 +123,58 @@ class SqliteStorage(Storage):
         if value is not None:
             self.table = self.get_table()
 
+    def _get_async_db_url(self) -> Optional[str]:
+        """Get the URL of the database file with the aiosqlite driver, or None for in-memory databases."""
+        if self.async_db_url is not None:
+            return self.async_db_url
+        url = self.db_engine.url
+        if url.get_backend_name() != "sqlite" or url.database in (None, "", ":memory:"):
+            return None
+        return url.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+
+    def get_async_session(self) -> Optional["async_sessionmaker[AsyncSession]"]:
+        """
+        Get the async session factory for the running event loop, creating its async engine on first use.
+
+        Async connections are bound to the event loop that opened them, so every event loop gets its own engine.
+        An `async_db_engine` passed to the storage is used as is.
+
+        Returns:
+            The async session factory, or None if async database access is unavailable, in which case the async
+            methods run the synchronous methods in the storage thread pool.
+        """
+        if self._async_unavailable:
+            return None
+        loop = asyncio.get_running_loop()
+        async_session = self._async_sessions.get(loop)
+        if async_session is None:
+            try:
+                from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+                async_db_engine = self.async_db_engine
+                if async_db_engine is None:
+                    async_db_url = self._get_async_db_url()
+                    if async_db_url is None:
+                        self._async_unavailable = True
+                        return None
+                    async_db_engine = create_async_engine(async_db_url)
+            except (ImportError, ArgumentError) as e:
+                # The async driver is not installed or does not support the database URL
+                log_warning(f"Async database access unavailable, falling back to a thread pool: {e}")
+                self._async_unavailable = True
+                return None
+            except Exception as e:
+                log_warning(f"Error creating async engine, falling back to a thread pool for this call: {e}")
+                return None
+            async_session = async_sessionmaker(bind=async_db_engine, expire_on_commit=False)
+            # Drop and dispose the engines of event loops that have been closed, e.g. by earlier `asyncio.run` calls
+            for closed_loop in [loop for loop in self._async_sessions if loop.is_closed()]:
+                closed_session = self._async_sessions.pop(closed_loop)
+                if self.async_db_engine is None:
+                    dispose_async_engine(closed_session.kw["bind"])
+            self._async_sessions[loop] = async_session
+        return async_session
+
     def get_table_v1(self) -> Table:
         """
         Define the table schema for version 1.
@@ -152,6 +231,35 @@ class SqliteStorage(Storage):
 
         return table
 
+    def get_runs_table(self) -> Optional[Table]:
+        """
+        Define the table schema for the run log.
+
+        Returns:
+            Optional[Table]: SQLAlchemy Table object for the run log, or None if no runs_table_name is set.
+        """
+        if self.runs_table_name is None:
+            return None
+
+        return Table(
+            self.runs_table_name,
+            self.metadata,
+            Column("session_id", String, primary_key=True),
+            Column("run_id", String, primary_key=True),
+            Column("user_id", String, index=True),
+            # Position of the run within its session, used to read runs in order
+            Column("run_index", sqlite.INTEGER),
+            Column("run_data", sqlite.JSON),
+            Column("created_at", sqlite.INTEGER, default=lambda: int(time.time())),
+            Column("updated_at", sqlite.INTEGER, onupdate=lambda: int(time.time())),
+            Index(f"idx_{self.runs_table_name}_session_run_index", "session_id", "run_index"),
+            extend_existing=True,
+        )
+
+    @property
+    def stores_runs_separately(self) -> bool:
+        return self.runs_table_name is not None and self.mode in ("agent", "team")
+
     def get_table(self) -> Table:
         """
         Get the table schema based on the schema version.
@@ -186,6 +294,26 @@ class SqliteStorage(Storage):
             logger.error(f"Error checking if table exists: {e}")
             return False
 
+    def runs_table_exists(self) -> bool:
+        """
+        Check if the runs table exists in the database.
+
+        Returns:
+            bool: True if the runs table exists or no runs table is used, False otherwise.
+        """
+        if self.runs_table_name is None:
+            return True
+        try:
+            with self.SqlSession() as sess:
+                result = sess.execute(
+                    text("SELECT name FROM sqlite_master WHERE type='table' AND name=:table_name"),
+                    {"table_name": self.runs_table_name},
+                ).scalar()
+                return result is not None
+        except Exception as e:
+            logger.error(f"Error checking if runs table exists: {e}")
+            return False
+
     def create(self) -> None:
         """
         Create the table if it doesn't exist.
@@ -226,6 +354,10 @@ class SqliteStorage(Storage):
                 logger.error(f"Error creating table: {e}")
                 raise
 
+        if self.runs_table is not None:
+            log_debug(f"Creating runs table: {self.runs_table.name}")
+            self.runs_table.create(self.db_engine, checkfirst=True)
+
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
         """
         Read a Session from the database.
@@ -237,26 +369,70 @@ class SqliteStorage(Storage):
         Returns:
             Optional[Session]: Session object if found, None otherwise.
         """
+        session: Optional[Session] = None
         try:
             with self.SqlSession() as sess:
-                stmt = select(self.table).where(self.table.c.session_id == session_id)
-                if user_id:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                result = sess.execute(stmt).fetchone()
-                if self.mode == "agent":
-                    return AgentSession.from_dict(result._mapping) if result is not None else None  # type: ignore
-                elif self.mode == "team":
-                    return TeamSession.from_dict(result._mapping) if result is not None else None  # type: ignore
-                elif self.mode == "workflow":
-                    return WorkflowSession.from_dict(result._mapping) if result is not None else None  # type: ignore
-                elif self.mode == "workflow_v2":
-                    return WorkflowSessionV2.from_dict(result._mapping) if result is not None else None  # type: ignore
+                result = sess.execute(self._get_read_statement(session_id=session_id, user_id=user_id)).fetchone()
+                session = self._get_session_from_row(result)
         except Exception as e:
             if "no such table" in str(e):
                 log_debug(f"Table does not exist: {self.table.name}")
                 self.create()
             else:
                 log_debug(f"Exception reading from table: {e}")
+            return None
+        return self.load_runs(session, limit=self.num_runs_to_read, migrate=True)
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """
+        Read a Session from the database using the async engine.
+
+        Args:
+            session_id (str): ID of the session to read.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+
+        Returns:
+            Optional[Session]: Session object if found, None otherwise.
+        """
+        async_session = self.get_async_session()
+        if async_session is None:
+            return await super().aread(session_id=session_id, user_id=user_id)
+
+        session: Optional[Session] = None
+        try:
+            async with async_session() as sess:
+                result = (
+                    await sess.execute(self._get_read_statement(session_id=session_id, user_id=user_id))
+                ).fetchone()
+                session = self._get_session_from_row(result)
+        except Exception as e:
+            if "no such table" in str(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                await self.run_in_executor(self.create)
+            else:
+                log_debug(f"Exception reading from table: {e}")
+            return None
+        return await self.aload_runs(session, limit=self.num_runs_to_read, migrate=True)
+
+    def _get_read_statement(self, session_id: str, user_id: Optional[str] = None):
+        """Get the statement that selects a session by session_id, and optionally user_id."""
+        stmt = select(self.table).where(self.table.c.session_id == session_id)
+        if user_id:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        return stmt
+
+    def _get_session_from_row(self, row) -> Optional[Session]:
+        """Create a Session of the storage mode from a table row."""
+        if row is None:
+            return None
+        if self.mode == "agent":
+            return AgentSession.from_dict(dict(row._mapping))
+        elif self.mode == "team":
+            return TeamSession.from_dict(dict(row._mapping))
+        elif self.mode == "workflow":
+            return WorkflowSession.from_dict(dict(row._mapping))
+        elif self.mode == "workflow_v2":
+            return WorkflowSessionV2.from_dict(dict(row._mapping))
         return None
 
     def get_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
@@ -326,17 +502,9 @@ class SqliteStorage(Storage):
                 stmt = stmt.order_by(self.table.c.created_at.desc())
 
                 rows = sess.execute(stmt).fetchall()
-                if rows is not None:
-                    if self.mode == "agent":
-                        return [AgentSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "team":
-                        return [TeamSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "workflow":
-                        return [WorkflowSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "workflow_v2":
-                        return [WorkflowSessionV2.from_dict(row._mapping) for row in rows]  # type: ignore
-                else:
-                    return []
+            sessions = [session for session in map(self._get_session_from_row, rows) if session is not None]
+            # Read the runs of all sessions at once instead of one query per session
+            return self.load_runs_for_sessions(sessions, limit=self.num_runs_to_read)
         except Exception as e:
             if "no such table" in str(e):
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -383,16 +551,9 @@ class SqliteStorage(Storage):
 
                 # Execute query
                 rows = sess.execute(stmt).fetchall()
-                if rows is not None:
-                    if self.mode == "agent":  # type: ignore
-                        return [AgentSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "team":
-                        return [TeamSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "workflow":
-                        return [WorkflowSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "workflow_v2":
-                        return [WorkflowSessionV2.from_dict(row._mapping) for row in rows]  # type: ignore
-                return []
+            sessions = [session for session in map(self._get_session_from_row, rows) if session is not None]
+            # Read the runs of all sessions at once instead of one query per session
+            return self.load_runs_for_sessions(sessions, limit=self.num_runs_to_read)
         except Exception as e:
             if "no such table" in str(e):
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -401,6 +562,101 @@ class SqliteStorage(Storage):
                 log_debug(f"Exception reading from table: {e}")
         return []
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 20,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> SessionListPage:
+        """
+        List session summaries ordered by created_at descending, reading only the requested columns.
+
+        Args:
+            user_id: Filter by user ID
+            entity_id: Filter by entity ID (agent_id, team_id, or workflow_id)
+            limit: Maximum number of sessions in the page. None returns all remaining sessions.
+            cursor: The next_cursor of the previous page
+            fields: Additional columns to include in SessionListItem.data, and FIRST_RUN_FIELD to include
+                the first run of each session.
+
+        Returns:
+            SessionListPage: The sessions in this page and the cursor for the next page
+        """
+        extra_fields = [f for f in fields or [] if f != FIRST_RUN_FIELD and f in self.table.c]
+        created_at = func.coalesce(self.table.c.created_at, 0)
+        columns = [
+            self.table.c.session_id,
+            self.table.c.user_id,
+            self.table.c[self.entity_id_field].label("entity_id"),
+            self.table.c.session_data["session_name"].as_string().label("session_name"),
+            self.table.c.created_at,
+            self.table.c.updated_at,
+            *[self.table.c[f] for f in extra_fields],
+        ]
+        if fields is not None and FIRST_RUN_FIELD in fields:
+            columns.append(self._get_first_run_column().label(FIRST_RUN_FIELD))
+
+        try:
+            with self.SqlSession() as sess, sess.begin():
+                stmt = select(*columns)
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                if entity_id is not None:
+                    stmt = stmt.where(self.table.c[self.entity_id_field] == entity_id)
+                if cursor is not None:
+                    cursor_created_at, cursor_session_id = self.decode_session_cursor(cursor)
+                    stmt = stmt.where(
+                        or_(
+                            created_at < cursor_created_at,
+                            and_(created_at == cursor_created_at, self.table.c.session_id < cursor_session_id),
+                        )
+                    )
+                stmt = stmt.order_by(created_at.desc(), self.table.c.session_id.desc())
+                if limit is not None:
+                    stmt = stmt.limit(limit + 1)
+
+                items = [
+                    SessionListItem(
+                        session_id=row.session_id,
+                        user_id=row.user_id,
+                        entity_id=row.entity_id,
+                        session_name=row.session_name,
+                        created_at=row.created_at,
+                        updated_at=row.updated_at,
+                        first_run=row._mapping.get(FIRST_RUN_FIELD),
+                        data={f: row._mapping[f] for f in extra_fields},
+                    )
+                    for row in sess.execute(stmt).fetchall()
+                ]
+                return self.build_session_list_page(items, limit=limit)
+        except Exception as e:
+            if "no such table" in str(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                self.create()
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return SessionListPage(sessions=[])
+
+    def _get_first_run_column(self):
+        """Get a column expression that selects only the first run of each session."""
+        if self.mode == "workflow_v2":
+            return self.table.c.runs[0]
+
+        first_run_in_memory = self.table.c.memory[("runs", 0)]
+        if self.stores_runs_separately and self.runs_table is not None:
+            # Sessions written before the run log was enabled still carry their runs in the memory column
+            first_logged_run = (
+                select(self.runs_table.c.run_data)
+                .where(self.runs_table.c.session_id == self.table.c.session_id)
+                .order_by(self.runs_table.c.run_index)
+                .limit(1)
+                .scalar_subquery()
+            )
+            return func.coalesce(first_logged_run, first_run_in_memory)
+        return first_run_in_memory
+
     def upgrade_schema(self) -> None:
         """
         Upgrade the schema of the storage table.
@@ -444,134 +700,398 @@ class SqliteStorage(Storage):
         if self.auto_upgrade_schema and not self._schema_up_to_date:
             self.upgrade_schema()
 
+        # When using a runs table, the runs are written to the run log instead of the memory column
+        session_to_upsert = session
+        session, runs = self.split_runs(session)
+
+        row = None
         try:
             with self.SqlSession() as sess, sess.begin():
-                if self.mode == "agent":
-                    # Create an insert statement
-                    stmt = sqlite.insert(self.table).values(
-                        session_id=session.session_id,
-                        agent_id=session.agent_id,  # type: ignore
-                        team_session_id=session.team_session_id,  # type: ignore
-                        user_id=session.user_id,
-                        memory=getattr(session, "memory", None),
-                        agent_data=session.agent_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
+                stmt = self._get_upsert_statement(session)
+                if self._insert_returning:
+                    row = sess.execute(stmt.returning(self.table)).fetchone()
+                else:
+                    sess.execute(stmt)
+                if runs:
+                    self._upsert_runs(sess, session_id=session.session_id, runs=runs, user_id=session.user_id)
+        except Exception as e:
+            if create_and_retry and (not self.table_exists() or not self.runs_table_exists()):
+                log_debug(f"Table does not exist: {self.table.name}")
+                log_debug("Creating table and retrying upsert")
+                self.create()
+                return self.upsert(session_to_upsert, create_and_retry=False)
+            else:
+                log_warning(f"Exception upserting into table: {e}")
+                log_warning(
+                    "A table upgrade might be required, please review these docs for more information: https://agno.link/upgrade-schema"
+                )
+                return None
+        if row is None:
+            return self.read(session_id=session.session_id)
+        return self._get_upserted_session(row, runs)
 
-                    # Define the upsert if the session_id already exists
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            agent_id=session.agent_id,  # type: ignore
-                            team_session_id=session.team_session_id,  # type: ignore
-                            user_id=session.user_id,
-                            memory=getattr(session, "memory", None),
-                            agent_data=session.agent_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),
-                    )
-                elif self.mode == "team":
-                    # Create an insert statement
-                    stmt = sqlite.insert(self.table).values(
-                        session_id=session.session_id,
-                        team_id=session.team_id,  # type: ignore
-                        user_id=session.user_id,
-                        team_session_id=session.team_session_id,  # type: ignore
-                        memory=getattr(session, "memory", None),
-                        team_data=session.team_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
+    async def aupsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
+        """
+        Insert or update a Session in the database using the async engine.
 
-                    # Define the upsert if the session_id already exists
-                    # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            team_id=session.team_id,  # type: ignore
-                            user_id=session.user_id,
-                            team_session_id=session.team_session_id,  # type: ignore
-                            memory=getattr(session, "memory", None),
-                            team_data=session.team_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),
-                    )
-                elif self.mode == "workflow":
-                    # Create an insert statement
-                    stmt = sqlite.insert(self.table).values(
-                        session_id=session.session_id,
-                        workflow_id=session.workflow_id,  # type: ignore
-                        user_id=session.user_id,
-                        memory=getattr(session, "memory", None),
-                        workflow_data=session.workflow_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
+        Args:
+            session (Session): The session data to upsert.
+            create_and_retry (bool): Retry upsert if table does not exist.
 
-                    # Define the upsert if the session_id already exists
-                    # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            workflow_id=session.workflow_id,  # type: ignore
-                            user_id=session.user_id,
-                            memory=getattr(session, "memory", None),
-                            workflow_data=session.workflow_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),
-                    )
-                elif self.mode == "workflow_v2":
-                    # Convert session to dict to ensure proper serialization
-                    session_dict = session.to_dict()
-
-                    # Create an insert statement for WorkflowSessionV2
-                    stmt = sqlite.insert(self.table).values(
-                        session_id=session.session_id,
-                        workflow_id=session.workflow_id,  # type: ignore
-                        workflow_name=session.workflow_name,  # type: ignore
-                        user_id=session.user_id,
-                        runs=session_dict.get("runs"),
-                        workflow_data=session.workflow_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
+        Returns:
+            Optional[Session]: The upserted Session, or None if operation failed.
+        """
+        async_session = self.get_async_session()
+        if async_session is None:
+            return await self.run_in_executor(self.upsert, session, create_and_retry)
 
-                    # Define the upsert if the session_id already exists
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            workflow_id=session.workflow_id,  # type: ignore
-                            workflow_name=session.workflow_name,  # type: ignore
-                            user_id=session.user_id,
-                            runs=session_dict.get("runs"),
-                            workflow_data=session.workflow_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),
-                    )
+        if self.auto_upgrade_schema and not self._schema_up_to_date:
+            await self.run_in_executor(self.upgrade_schema)
 
-                sess.execute(stmt)
+        session_to_upsert = session
+        session, runs = self.split_runs(session)
+
+        row = None
+        try:
+            async with async_session() as sess, sess.begin():
+                stmt = self._get_upsert_statement(session)
+                if self._insert_returning:
+                    row = (await sess.execute(stmt.returning(self.table))).fetchone()
+                else:
+                    await sess.execute(stmt)
+                if runs:
+                    await self._aupsert_runs(sess, session_id=session.session_id, runs=runs, user_id=session.user_id)
         except Exception as e:
-            if create_and_retry and not self.table_exists():
+            if create_and_retry and not await self.run_in_executor(self._tables_exist):
                 log_debug(f"Table does not exist: {self.table.name}")
                 log_debug("Creating table and retrying upsert")
-                self.create()
-                return self.upsert(session, create_and_retry=False)
+                await self.run_in_executor(self.create)
+                return await self.aupsert(session_to_upsert, create_and_retry=False)
             else:
                 log_warning(f"Exception upserting into table: {e}")
                 log_warning(
                     "A table upgrade might be required, please review these docs for more information: https://agno.link/upgrade-schema"
                 )
                 return None
-        return self.read(session_id=session.session_id)
+        if row is None:
+            return await self.aread(session_id=session.session_id)
+        return self._get_upserted_session(row, runs)
+
+    @property
+    def _insert_returning(self) -> bool:
+        """Whether an upsert can return the written row, so the session does not have to be read back (SQLite 3.35+)"""
+        return self.db_engine.dialect.insert_returning
+
+    def _get_upserted_session(self, row, runs: Optional[List[Dict[str, Any]]]) -> Optional[Session]:
+        """Create the Session written by an upsert from the returned row and the runs written to the run log."""
+        session = self._get_session_from_row(row)
+        if session is not None and runs is not None:
+            self._set_runs(session, runs)
+        return session
+
+    def _tables_exist(self) -> bool:
+        """Check if the sessions table and, if used, the runs table exist."""
+        return self.table_exists() and self.runs_table_exists()
+
+    def _get_upsert_statement(self, session: Session):
+        """Get the insert statement that creates or updates a session."""
+        if self.mode == "agent":
+            # Create an insert statement
+            stmt = sqlite.insert(self.table).values(
+                session_id=session.session_id,
+                agent_id=session.agent_id,  # type: ignore
+                team_session_id=session.team_session_id,  # type: ignore
+                user_id=session.user_id,
+                memory=getattr(session, "memory", None),
+                agent_data=session.agent_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+
+            # Define the upsert if the session_id already exists
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id"],
+                set_=dict(
+                    agent_id=session.agent_id,  # type: ignore
+                    team_session_id=session.team_session_id,  # type: ignore
+                    user_id=session.user_id,
+                    memory=getattr(session, "memory", None),
+                    agent_data=session.agent_data,  # type: ignore
+                    session_data=session.session_data,
+                    extra_data=session.extra_data,
+                    updated_at=int(time.time()),
+                ),
+            )
+        elif self.mode == "team":
+            # Create an insert statement
+            stmt = sqlite.insert(self.table).values(
+                session_id=session.session_id,
+                team_id=session.team_id,  # type: ignore
+                user_id=session.user_id,
+                team_session_id=session.team_session_id,  # type: ignore
+                memory=getattr(session, "memory", None),
+                team_data=session.team_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+
+            # Define the upsert if the session_id already exists
+            # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id"],
+                set_=dict(
+                    team_id=session.team_id,  # type: ignore
+                    user_id=session.user_id,
+                    team_session_id=session.team_session_id,  # type: ignore
+                    memory=getattr(session, "memory", None),
+                    team_data=session.team_data,  # type: ignore
+                    session_data=session.session_data,
+                    extra_data=session.extra_data,
+                    updated_at=int(time.time()),
+                ),
+            )
+        elif self.mode == "workflow":
+            # Create an insert statement
+            stmt = sqlite.insert(self.table).values(
+                session_id=session.session_id,
+                workflow_id=session.workflow_id,  # type: ignore
+                user_id=session.user_id,
+                memory=getattr(session, "memory", None),
+                workflow_data=session.workflow_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+
+            # Define the upsert if the session_id already exists
+            # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id"],
+                set_=dict(
+                    workflow_id=session.workflow_id,  # type: ignore
+                    user_id=session.user_id,
+                    memory=getattr(session, "memory", None),
+                    workflow_data=session.workflow_data,  # type: ignore
+                    session_data=session.session_data,
+                    extra_data=session.extra_data,
+                    updated_at=int(time.time()),
+                ),
+            )
+        elif self.mode == "workflow_v2":
+            # Convert session to dict to ensure proper serialization
+            session_dict = session.to_dict()
+
+            # Create an insert statement for WorkflowSessionV2
+            stmt = sqlite.insert(self.table).values(
+                session_id=session.session_id,
+                workflow_id=session.workflow_id,  # type: ignore
+                workflow_name=session.workflow_name,  # type: ignore
+                user_id=session.user_id,
+                runs=session_dict.get("runs"),
+                workflow_data=session.workflow_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+
+            # Define the upsert if the session_id already exists
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id"],
+                set_=dict(
+                    workflow_id=session.workflow_id,  # type: ignore
+                    workflow_name=session.workflow_name,  # type: ignore
+                    user_id=session.user_id,
+                    runs=session_dict.get("runs"),
+                    workflow_data=session.workflow_data,  # type: ignore
+                    session_data=session.session_data,
+                    extra_data=session.extra_data,
+                    updated_at=int(time.time()),
+                ),
+            )
+        return stmt
+
+    def _upsert_runs(
+        self, sess: SqlSession, session_id: str, runs: List[Dict[str, Any]], user_id: Optional[str] = None
+    ) -> None:
+        """Insert or update runs in the run log using an open database session."""
+        if self.runs_table is None:
+            raise ValueError("No runs_table_name provided")
+
+        # New runs are appended after the last run of the session
+        next_run_index = sess.execute(self._get_last_run_index_statement(session_id)).scalar_one() + 1
+        for run in runs:
+            stmt = self._get_run_upsert_statement(session_id, run, run_index=next_run_index, user_id=user_id)
+            if stmt is not None:
+                sess.execute(stmt)
+                next_run_index += 1
+
+    async def _aupsert_runs(
+        self, sess: "AsyncSession", session_id: str, runs: List[Dict[str, Any]], user_id: Optional[str] = None
+    ) -> None:
+        """Insert or update runs in the run log using an open async database session."""
+        if self.runs_table is None:
+            raise ValueError("No runs_table_name provided")
+
+        next_run_index = (await sess.execute(self._get_last_run_index_statement(session_id))).scalar_one() + 1
+        for run in runs:
+            stmt = self._get_run_upsert_statement(session_id, run, run_index=next_run_index, user_id=user_id)
+            if stmt is not None:
+                await sess.execute(stmt)
+                next_run_index += 1
+
+    def _get_last_run_index_statement(self, session_id: str):
+        """Get the statement that selects the index of the last run of a session, or -1 if it has no runs."""
+        return select(func.coalesce(func.max(self.runs_table.c.run_index), -1)).where(  # type: ignore
+            self.runs_table.c.session_id == session_id  # type: ignore
+        )
+
+    def _get_run_upsert_statement(
+        self, session_id: str, run: Dict[str, Any], run_index: int, user_id: Optional[str] = None
+    ):
+        """Get the insert statement that adds a run to the run log, or None if the run has no run_id."""
+        run_id = self.get_run_id(run)
+        if run_id is None:
+            log_warning(f"Skipping run without run_id in session: {session_id}")
+            return None
+        if self.runs_table is None:
+            raise ValueError("No runs_table_name provided")
+        stmt = sqlite.insert(self.runs_table).values(
+            session_id=session_id,
+            run_id=run_id,
+            user_id=user_id,
+            run_index=run_index,
+            run_data=run,
+        )
+        # The run_index is kept on conflict so that updated runs keep their position
+        return stmt.on_conflict_do_update(
+            index_elements=["session_id", "run_id"],
+            set_=dict(
+                user_id=user_id,
+                run_data=run,
+                updated_at=int(time.time()),
+            ),
+        )
+
+    def upsert_runs(self, session_id: str, runs: List[Dict[str, Any]], user_id: Optional[str] = None) -> None:
+        """
+        Insert or update runs in the run log.
+
+        Args:
+            session_id (str): ID of the session the runs belong to.
+            runs (List[Dict[str, Any]]): The serialized runs to upsert.
+            user_id (Optional[str]): ID of the user the runs belong to.
+        """
+        if self.runs_table is None:
+            raise ValueError("No runs_table_name provided")
+        try:
+            with self.SqlSession() as sess, sess.begin():
+                self._upsert_runs(sess, session_id=session_id, runs=runs, user_id=user_id)
+        except Exception as e:
+            log_warning(f"Exception upserting into runs table: {e}")
+
+    async def aupsert_runs(self, session_id: str, runs: List[Dict[str, Any]], user_id: Optional[str] = None) -> None:
+        """Insert or update runs in the run log using the async engine."""
+        async_session = self.get_async_session()
+        if async_session is None:
+            return await super().aupsert_runs(session_id=session_id, runs=runs, user_id=user_id)
+        if self.runs_table is None:
+            raise ValueError("No runs_table_name provided")
+        try:
+            async with async_session() as sess, sess.begin():
+                await self._aupsert_runs(sess, session_id=session_id, runs=runs, user_id=user_id)
+        except Exception as e:
+            log_warning(f"Exception upserting into runs table: {e}")
+
+    def read_runs(self, session_id: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Read the runs of a session from the run log.
+
+        Args:
+            session_id (str): ID of the session to read runs for.
+            limit (Optional[int]): Only read the most recent `limit` runs. Defaults to all runs.
+
+        Returns:
+            List[Dict[str, Any]]: The serialized runs, oldest first.
+        """
+        if self.runs_table is None:
+            raise ValueError("No runs_table_name provided")
+        try:
+            with self.SqlSession() as sess:
+                rows = sess.execute(self._get_read_runs_statement(session_id, limit=limit)).fetchall()
+                return [row[0] for row in reversed(rows)]
+        except Exception as e:
+            log_debug(f"Exception reading from runs table: {e}")
+        return []
+
+    async def aread_runs(self, session_id: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Read the runs of a session from the run log using the async engine, oldest first."""
+        async_session = self.get_async_session()
+        if async_session is None:
+            return await super().aread_runs(session_id=session_id, limit=limit)
+        if self.runs_table is None:
+            raise ValueError("No runs_table_name provided")
+        try:
+            async with async_session() as sess:
+                rows = (await sess.execute(self._get_read_runs_statement(session_id, limit=limit))).fetchall()
+                return [row[0] for row in reversed(rows)]
+        except Exception as e:
+            log_debug(f"Exception reading from runs table: {e}")
+        return []
+
+    def _get_read_runs_statement(self, session_id: str, limit: Optional[int] = None):
+        """Get the statement that selects the most recent `limit` runs of a session, newest first."""
+        stmt = (
+            select(self.runs_table.c.run_data)  # type: ignore
+            .where(self.runs_table.c.session_id == session_id)  # type: ignore
+            .order_by(self.runs_table.c.run_index.desc())  # type: ignore
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return stmt
+
+    def read_runs_for_sessions(
+        self, session_ids: List[str], limit: Optional[int] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Read the runs of several sessions from the run log, with one query per READ_RUNS_BATCH_SIZE sessions.
+
+        Args:
+            session_ids (List[str]): IDs of the sessions to read runs for.
+            limit (Optional[int]): Only read the most recent `limit` runs of each session. Defaults to all runs.
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: The serialized runs of each session, oldest first.
+        """
+        if self.runs_table is None:
+            raise ValueError("No runs_table_name provided")
+        runs: Dict[str, List[Dict[str, Any]]] = {session_id: [] for session_id in session_ids}
+        try:
+            with self.SqlSession() as sess:
+                for i in range(0, len(session_ids), READ_RUNS_BATCH_SIZE):
+                    batch = session_ids[i : i + READ_RUNS_BATCH_SIZE]
+                    stmt = self._get_read_runs_for_sessions_statement(self.runs_table, batch, limit=limit)
+                    for session_id, run_data in sess.execute(stmt):
+                        runs[session_id].append(run_data)
+        except Exception as e:
+            log_debug(f"Exception reading from runs table: {e}")
+        return runs
+
+    @staticmethod
+    def _get_read_runs_for_sessions_statement(runs_table: Table, session_ids: List[str], limit: Optional[int] = None):
+        """Get the statement that selects the most recent `limit` runs of each session, oldest first."""
+        stmt = select(runs_table.c.session_id, runs_table.c.run_data, runs_table.c.run_index).where(
+            runs_table.c.session_id.in_(session_ids)
+        )
+        if limit is None:
+            return stmt.with_only_columns(runs_table.c.session_id, runs_table.c.run_data).order_by(
+                runs_table.c.session_id, runs_table.c.run_index
+            )
+        # Number the runs of each session from the most recent one, to keep the most recent `limit` runs
+        position = func.row_number().over(partition_by=runs_table.c.session_id, order_by=runs_table.c.run_index.desc())
+        recent_runs = stmt.add_columns(position.label("position")).subquery()
+        return (
+            select(recent_runs.c.session_id, recent_runs.c.run_data)
+            .where(recent_runs.c.position <= limit)
+            .order_by(recent_runs.c.session_id, recent_runs.c.run_index)
+        )
 
     def delete_session(self, session_id: Optional[str] = None):
         """
@@ -587,11 +1107,15 @@ class SqliteStorage(Storage):
             logger.warning("No session_id provided for deletion.")
             return
 
+        delete_runs = self.runs_table is not None and self.runs_table_exists()
         try:
             with self.SqlSession() as sess, sess.begin():
                 # Delete the session with the given session_id
                 delete_stmt = self.table.delete().where(self.table.c.session_id == session_id)
                 result = sess.execute(delete_stmt)
+                # Delete the runs of the session from the run log
+                if delete_runs:
+                    sess.execute(self.runs_table.delete().where(self.runs_table.c.session_id == session_id))  # type: ignore
                 if result.rowcount == 0:
                     log_debug(f"No session found with session_id: {session_id}")
                 else:
@@ -599,6 +1123,33 @@ class SqliteStorage(Storage):
         except Exception as e:
             logger.error(f"Error deleting session: {e}")
 
+    async def adelete_session(self, session_id: Optional[str] = None):
+        """
+        Delete a session from the database using the async engine.
+
+        Args:
+            session_id (Optional[str]): The ID of the session to delete.
+        """
+        async_session = self.get_async_session()
+        if async_session is None:
+            return await super().adelete_session(session_id=session_id)
+        if session_id is None:
+            logger.warning("No session_id provided for deletion.")
+            return
+
+        delete_runs = self.runs_table is not None and await self.run_in_executor(self.runs_table_exists)
+        try:
+            async with async_session() as sess, sess.begin():
+                result = await sess.execute(self.table.delete().where(self.table.c.session_id == session_id))
+                if delete_runs:
+                    await sess.execute(self.runs_table.delete().where(self.runs_table.c.session_id == session_id))  # type: ignore
+                if result.rowcount == 0:  # type: ignore
+                    log_debug(f"No session found with session_id: {session_id}")
+                else:
+                    log_debug(f"Successfully deleted session with session_id: {session_id}")
+        except Exception as e:
+            logger.error(f"Error deleting session: {e}")
+
     def drop(self) -> None:
         """
         Drop the table from the database if it exists.
@@ -607,9 +1158,13 @@ class SqliteStorage(Storage):
             log_debug(f"Deleting table: {self.table_name}")
             # Drop with checkfirst=True to avoid errors if the table doesn't exist
             self.table.drop(self.db_engine, checkfirst=True)
-            # Clear metadata to ensure indexes are recreated properly
-            self.metadata = MetaData()
-            self.table = self.get_table()
+        if self.runs_table is not None:
+            log_debug(f"Deleting runs table: {self.runs_table_name}")
+            self.runs_table.drop(self.db_engine, checkfirst=True)
+        # Clear metadata to ensure indexes are recreated properly
+        self.metadata = MetaData()
+        self.table = self.get_table()
+        self.runs_table = self.get_runs_table()
 
     def __deepcopy__(self, memo):
         """
@@ -630,10 +1185,10 @@ class SqliteStorage(Storage):
 
         # Deep copy attributes
         for k, v in self.__dict__.items():
-            if k in {"metadata", "table", "inspector"}:
+            if k in {"metadata", "table", "runs_table", "inspector"}:
                 continue
             # Reuse db_engine and Session without copying
-            elif k in {"db_engine", "SqlSession"}:
+            elif k in {"db_engine", "SqlSession", "async_db_engine", "_async_sessions"}:
                 setattr(copied_obj, k, v)
             else:
                 setattr(copied_obj, k, deepcopy(v, memo))
@@ -642,5 +1197,6 @@ class SqliteStorage(Storage):
         copied_obj.metadata = MetaData()
         copied_obj.inspector = inspect(copied_obj.db_engine)
         copied_obj.table = copied_obj.get_table()
+        copied_obj.runs_table = copied_obj.get_runs_table()
 
         return copied_obj
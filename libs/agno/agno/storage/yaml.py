@@ -1,141 +1,125 @@
+import os
+import tempfile
 import time
 from dataclasses import asdict
 from pathlib import Path
-from typing import List, Literal, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Union
 
 import yaml
 
-from agno.storage.base import Storage
+from agno.storage.base import SessionListItem, SessionListPage, Storage
 from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
 from agno.storage.session.v2.workflow import WorkflowSession as WorkflowSessionV2
 from agno.storage.session.workflow import WorkflowSession
+from agno.storage.session_index import SessionIndex
 from agno.utils.log import logger
 
+# The LibYAML based loader is much faster, fall back to the pure Python one if PyYAML was built without it
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class YamlStorage(Storage):
+    """Stores each session in a YAML file in `dir_path`.
+
+    A manifest of the sessions is kept in `dir_path/.sessions.index.jsonl` and updated on every upsert and
+    delete, so listing sessions and finding the most recent ones only reads the files of the returned sessions.
+    The manifest is rebuilt from the session files if it is missing.
+
+    Args:
+        dir_path: Directory of the session files
+        mode: One of "agent", "team", "workflow" or "workflow_v2"
+        compact: Write the session files in flow style, which makes them smaller and faster to write
+    """
+
     def __init__(
-        self, dir_path: Union[str, Path], mode: Optional[Literal["agent", "team", "workflow", "workflow_v2"]] = "agent"
+        self,
+        dir_path: Union[str, Path],
+        mode: Optional[Literal["agent", "team", "workflow", "workflow_v2"]] = "agent",
+        compact: bool = False,
     ):
         super().__init__(mode)
         self.dir_path = Path(dir_path)
         self.dir_path.mkdir(parents=True, exist_ok=True)
+        self.compact = compact
+        self.session_index = SessionIndex(self.dir_path / ".sessions.index.jsonl")
 
     def serialize(self, data: dict) -> str:
-        return yaml.dump(data, default_flow_style=False)
+        return yaml.dump(data, default_flow_style=self.compact)
 
     def deserialize(self, data: str) -> dict:
-        return yaml.safe_load(data)
+        return yaml.load(data, Loader=SafeLoader)
 
     def create(self) -> None:
         """Create the storage if it doesn't exist."""
         if not self.dir_path.exists():
             self.dir_path.mkdir(parents=True, exist_ok=True)
 
-    def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
-        """Read a Session from storage."""
+    def _get_session_path(self, session_id: str) -> Path:
+        return self.dir_path / f"{session_id}.yaml"
+
+    def _read_data(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Read the data of a session, or None if its file doesn't exist"""
         try:
-            with open(self.dir_path / f"{session_id}.yaml", "r", encoding="utf-8") as f:
-                data = self.deserialize(f.read())
-                if user_id and data["user_id"] != user_id:
-                    return None
-                if self.mode == "agent":
-                    return AgentSession.from_dict(data)
-                elif self.mode == "team":
-                    return TeamSession.from_dict(data)
-                elif self.mode == "workflow":
-                    return WorkflowSession.from_dict(data)
-                elif self.mode == "workflow_v2":
-                    return WorkflowSessionV2.from_dict(data)
+            with open(self._get_session_path(session_id), "r", encoding="utf-8") as f:
+                return self.deserialize(f.read())
         except FileNotFoundError:
             return None
 
+    def _get_session(self, data: Dict[str, Any]) -> Optional[Session]:
+        if self.mode == "agent":
+            return AgentSession.from_dict(data)
+        elif self.mode == "team":
+            return TeamSession.from_dict(data)
+        elif self.mode == "workflow":
+            return WorkflowSession.from_dict(data)
+        elif self.mode == "workflow_v2":
+            return WorkflowSessionV2.from_dict(data)
+        return None
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the session index from the session files"""
+        entries = []
+        for file in self.dir_path.glob("*.yaml"):
+            try:
+                serialized = file.read_text(encoding="utf-8")
+                entries.append(SessionIndex.get_entry(self.deserialize(serialized), len(serialized.encode("utf-8"))))
+            except Exception as e:
+                logger.error(f"Error reading session file {file}: {e}")
+        self.session_index.rebuild(entries)
+
+    def _get_index_entries(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[dict]:
+        """Get the index entries of the sessions, optionally filtered by user_id and/or entity_id."""
+        if not self.session_index.exists():
+            self._rebuild_index()
+        entity_id_field = self.entity_id_field
+        return [
+            entry
+            for entry in self.session_index.get_entries()
+            if (not user_id or entry.get("user_id") == user_id)
+            and (not entity_id or entry.get(entity_id_field) == entity_id)
+        ]
+
+    def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """Read a Session from storage."""
+        data = self._read_data(session_id)
+        if data is None or (user_id and data["user_id"] != user_id):
+            return None
+        return self._get_session(data)
+
     def get_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
         """Get all session IDs, optionally filtered by user_id and/or entity_id."""
-        session_ids = []
-        for file in self.dir_path.glob("*.yaml"):
-            with open(file, "r", encoding="utf-8") as f:
-                data = self.deserialize(f.read())
-                if user_id or entity_id:
-                    if user_id and entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id and data["user_id"] == user_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "team" and data["team_id"] == entity_id and data["user_id"] == user_id:
-                            session_ids.append(data["session_id"])
-                        elif (
-                            self.mode == "workflow" and data["workflow_id"] == entity_id and data["user_id"] == user_id
-                        ):
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "workflow_v2" and data["workflow_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                    elif user_id and data["user_id"] == user_id:
-                        session_ids.append(data["session_id"])
-                    elif entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "team" and data["team_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "workflow" and data["workflow_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                        elif self.mode == "workflow_v2" and data["workflow_id"] == entity_id:
-                            session_ids.append(data["session_id"])
-                else:
-                    # No filters applied, add all session_ids
-                    session_ids.append(data["session_id"])
-        return session_ids
+        return [entry["session_id"] for entry in self._get_index_entries(user_id, entity_id)]
 
     def get_all_sessions(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[Session]:
         """Get all sessions, optionally filtered by user_id and/or entity_id."""
         sessions: List[Session] = []
-        for file in self.dir_path.glob("*.yaml"):
-            with open(file, "r", encoding="utf-8") as f:
-                data = self.deserialize(f.read())
-                if user_id or entity_id:
-                    _session: Optional[Session] = None
-                    if user_id and entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id and data["user_id"] == user_id:
-                            _session = AgentSession.from_dict(data)
-                        elif self.mode == "team" and data["team_id"] == entity_id and data["user_id"] == user_id:
-                            _session = TeamSession.from_dict(data)
-                        elif (
-                            self.mode == "workflow" and data["workflow_id"] == entity_id and data["user_id"] == user_id
-                        ):
-                            _session = WorkflowSession.from_dict(data)
-                        elif self.mode == "workflow_v2" and data["workflow_id"] == entity_id:
-                            _session = WorkflowSessionV2.from_dict(data)
-                    elif user_id and data["user_id"] == user_id:
-                        if self.mode == "agent":
-                            _session = AgentSession.from_dict(data)
-                        elif self.mode == "team":
-                            _session = TeamSession.from_dict(data)
-                        elif self.mode == "workflow":
-                            _session = WorkflowSession.from_dict(data)
-                        elif self.mode == "workflow_v2":
-                            _session = WorkflowSessionV2.from_dict(data)
-                    elif entity_id:
-                        if self.mode == "agent" and data["agent_id"] == entity_id:
-                            _session = AgentSession.from_dict(data)
-                        elif self.mode == "team" and data["team_id"] == entity_id:
-                            _session = TeamSession.from_dict(data)
-                        elif self.mode == "workflow" and data["workflow_id"] == entity_id:
-                            _session = WorkflowSession.from_dict(data)
-                        elif self.mode == "workflow_v2" and data["workflow_id"] == entity_id:
-                            _session = WorkflowSessionV2.from_dict(data)
-                    if _session:
-                        sessions.append(_session)
-                else:
-                    # No filters applied, add all sessions
-                    if self.mode == "agent":
-                        _session = AgentSession.from_dict(data)
-                    elif self.mode == "team":
-                        _session = TeamSession.from_dict(data)
-                    elif self.mode == "workflow":
-                        _session = WorkflowSession.from_dict(data)
-                    elif self.mode == "workflow_v2":
-                        _session = WorkflowSessionV2.from_dict(data)
-                    if _session:
-                        sessions.append(_session)
+        for entry in self._get_index_entries(user_id, entity_id):
+            data = self._read_data(entry["session_id"])
+            _session = self._get_session(data) if data is not None else None
+            if _session:
+                sessions.append(_session)
         return sessions
 
     def get_recent_sessions(
@@ -155,68 +139,95 @@ class YamlStorage(Storage):
             List[Session]: List of most recent sessions
         """
         sessions: List[Session] = []
-        # List of (created_at, data) tuples for sorting
-        session_data: List[tuple[int, dict]] = []
+        entries = self._get_index_entries(user_id, entity_id)
+        entries.sort(key=lambda entry: entry.get("created_at") or 0, reverse=True)
 
-        # First pass: collect and filter sessions
-        for file in self.dir_path.glob("*.yaml"):
+        # Only read the files of the most recent sessions
+        for entry in entries:
+            if limit is not None and len(sessions) >= limit:
+                break
             try:
-                with open(file, "r", encoding="utf-8") as f:
-                    data = self.deserialize(f.read())
-
-                    if user_id and data["user_id"] != user_id:
-                        continue
-
-                    if entity_id:
-                        if self.mode == "agent" and data["agent_id"] != entity_id:
-                            continue
-                        elif self.mode == "team" and data["team_id"] != entity_id:
-                            continue
-                        elif self.mode == "workflow" and data["workflow_id"] != entity_id:
-                            continue
-                        elif self.mode == "workflow_v2" and data["workflow_id"] != entity_id:
-                            continue
-                    # Store with created_at for sorting
-                    created_at = data.get("created_at", 0)
-                    session_data.append((created_at, data))
-
+                data = self._read_data(entry["session_id"])
+                session = self._get_session(data) if data is not None else None
             except Exception as e:
-                logger.error(f"Error reading session file {file}: {e}")
+                logger.error(f"Error reading session {entry['session_id']}: {e}")
                 continue
-
-        # Sort by created_at descending and take only num_history_sessions
-        session_data.sort(key=lambda x: x[0], reverse=True)
-        if limit is not None:
-            session_data = session_data[:limit]
-
-        # Convert filtered and sorted data to Session objects
-        for _, data in session_data:
-            session: Optional[Session] = None
-            if self.mode == "agent":
-                session = AgentSession.from_dict(data)
-            elif self.mode == "team":
-                session = TeamSession.from_dict(data)
-            elif self.mode == "workflow":
-                session = WorkflowSession.from_dict(data)
-            elif self.mode == "workflow_v2":
-                session = WorkflowSessionV2.from_dict(data)
             if session is not None:
                 sessions.append(session)
 
         return sessions
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 20,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> SessionListPage:
+        """
+        List session summaries ordered by created_at descending, using the session index.
+
+        Args:
+            user_id: Filter by user ID
+            entity_id: Filter by entity ID (agent_id, team_id, or workflow_id)
+            limit: Maximum number of sessions in the page. None returns all remaining sessions.
+            cursor: The next_cursor of the previous page
+            fields: Additional session fields to include in SessionListItem.data, and FIRST_RUN_FIELD to include
+                the first run of each session. Only the files of the sessions in the page are read.
+
+        Returns:
+            SessionListPage: The sessions in this page and the cursor for the next page
+        """
+        entity_id_field = self.entity_id_field
+        items = (
+            SessionListItem(
+                session_id=entry["session_id"],
+                user_id=entry.get("user_id"),
+                entity_id=entry.get(entity_id_field),
+                session_name=entry.get("session_name"),
+                created_at=entry.get("created_at"),
+                updated_at=entry.get("updated_at"),
+            )
+            for entry in self._get_index_entries(user_id, entity_id)
+        )
+        page = self.paginate_session_list_items(items, limit=limit, cursor=cursor)
+        if fields:
+            detailed_items = []
+            for item in page.sessions:
+                session = self.read(item.session_id)
+                detailed_items.append(self.get_session_list_item(session, fields=fields) if session else item)
+            page.sessions = detailed_items
+        return page
+
     def upsert(self, session: Session) -> Optional[Session]:
-        """Insert or update an Session in storage."""
+        """Insert or update a Session in storage."""
         try:
             if self.mode == "workflow_v2":
                 data = session.to_dict()
             else:
                 data = asdict(session)
+
             data["updated_at"] = int(time.time())
             if "created_at" not in data or data["created_at"] is None:
                 data["created_at"] = data["updated_at"]
-            with open(self.dir_path / f"{session.session_id}.yaml", "w", encoding="utf-8") as f:
-                f.write(self.serialize(data))
+
+            if not self.session_index.exists():
+                self._rebuild_index()
+            serialized = self.serialize(data).encode("utf-8")
+            # Write to a temporary file and rename it, so readers never see a partially written session
+            session_path = self._get_session_path(session.session_id)
+            temp_file = tempfile.NamedTemporaryFile(
+                dir=session_path.parent, prefix=f".{session_path.name}.", suffix=".tmp", delete=False
+            )
+            try:
+                with temp_file:
+                    temp_file.write(serialized)
+                os.replace(temp_file.name, session_path)
+            except Exception:
+                Path(temp_file.name).unlink(missing_ok=True)
+                raise
+            self.session_index.upsert(SessionIndex.get_entry(data, len(serialized)))
             return session
         except Exception as e:
             logger.error(f"Error upserting session: {e}")
@@ -227,7 +238,9 @@ class YamlStorage(Storage):
         if session_id is None:
             return
         try:
-            (self.dir_path / f"{session_id}.yaml").unlink(missing_ok=True)
+            self._get_session_path(session_id).unlink(missing_ok=True)
+            if self.session_index.exists():
+                self.session_index.delete(session_id)
         except Exception as e:
             logger.error(f"Error deleting session: {e}")
 
@@ -235,6 +248,7 @@ class YamlStorage(Storage):
         """Drop all sessions from storage."""
         for file in self.dir_path.glob("*.yaml"):
             file.unlink()
+        self.session_index.clear()
 
     def upgrade_schema(self) -> None:
         """Upgrade the schema of the storage."""
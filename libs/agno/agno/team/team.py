@@ -2,7 +2,7 @@ import asyncio
 import contextlib
 import json
 from collections import ChainMap, defaultdict, deque
-from copy import deepcopy
+from copy import copy, deepcopy
 from dataclasses import asdict, dataclass, replace
 from os import getenv
 from textwrap import dedent
@@ -48,6 +48,7 @@ from agno.storage.base import Storage
 from agno.storage.session.team import TeamSession
 from agno.tools.function import Function
 from agno.tools.toolkit import Toolkit
+from agno.utils.debug_trace import DebugTrace
 from agno.utils.events import (
     create_team_memory_update_completed_event,
     create_team_memory_update_started_event,
@@ -263,6 +264,8 @@ class Team:
     num_of_interactions_from_history: Optional[int] = None
     # Number of historical runs to include in the messages
     num_history_runs: int = 3
+    # Maximum number of tokens of history to include in the messages. The most recent runs that fit are included.
+    max_history_tokens: Optional[int] = None
 
     # --- Team Storage ---
     storage: Optional[Storage] = None
@@ -296,6 +299,8 @@ class Team:
     debug_mode: bool = False
     # Debug level: 1 = basic, 2 = detailed
     debug_level: Literal[1, 2] = 1
+    # Sink for structured debug records of the model calls, independent of debug_mode and the log level
+    debug_trace: Optional[DebugTrace] = None
     # Enable member logs - Sets the debug_mode for team and members
     show_members_responses: bool = False
     # monitoring=True logs Team information to agno.com for monitoring
@@ -366,6 +371,7 @@ class Team:
         add_history_to_messages: bool = False,
         num_of_interactions_from_history: Optional[int] = None,
         num_history_runs: int = 3,
+        max_history_tokens: Optional[int] = None,
         storage: Optional[Storage] = None,
         extra_data: Optional[Dict[str, Any]] = None,
         reasoning: bool = False,
@@ -380,6 +386,7 @@ class Team:
         stream_member_events: bool = True,
         debug_mode: bool = False,
         debug_level: Literal[1, 2] = 1,
+        debug_trace: Optional[DebugTrace] = None,
         show_members_responses: bool = False,
         monitoring: bool = False,
         telemetry: bool = True,
@@ -458,6 +465,7 @@ class Team:
         self.add_history_to_messages = add_history_to_messages
         self.num_of_interactions_from_history = num_of_interactions_from_history
         self.num_history_runs = num_history_runs
+        self.max_history_tokens = max_history_tokens
 
         self.storage = storage
         self.extra_data = extra_data
@@ -485,6 +493,7 @@ class Team:
             log_warning(f"Invalid debug level: {debug_level}. Setting to 1.")
             debug_level = 1
         self.debug_level = debug_level
+        self.debug_trace = debug_trace
         self.show_members_responses = show_members_responses
 
         self.monitoring = monitoring
@@ -639,6 +648,10 @@ class Team:
 
         # Set debug mode
         self._set_debug()
+        if self.debug_trace is not None and self.model is not None and self.model.debug_trace is not self.debug_trace:
+            # Trace a copy of the model, so a model shared with other agents or teams is left untouched
+            self.model = copy(self.model)
+            self.model.debug_trace = self.debug_trace
 
         # Set monitoring and telemetry
         self._set_monitoring()
@@ -1232,7 +1245,7 @@ class Team:
         self.initialize_team(session_id=session_id)
 
         # Read existing session from storage
-        self.read_from_storage(session_id=session_id)
+        await self.aread_from_storage(session_id=session_id)
 
         effective_filters = knowledge_filters
 
@@ -1480,7 +1493,7 @@ class Team:
         self._convert_response_to_structured_format(run_response=run_response)
 
         # 7. Save session to storage
-        self.write_to_storage(session_id=session_id, user_id=user_id)
+        await self.awrite_to_storage(session_id=session_id, user_id=user_id)
 
         # 8. Log Team Run
         await self._alog_team_run(session_id=session_id, user_id=user_id)
@@ -1584,7 +1597,7 @@ class Team:
             )
 
         # 5. Save session to storage
-        self.write_to_storage(session_id=session_id, user_id=user_id)
+        await self.awrite_to_storage(session_id=session_id, user_id=user_id)
 
         # 6. Log Team Run
         await self._alog_team_run(session_id=session_id, user_id=user_id)
@@ -1829,6 +1842,7 @@ class Team:
             )
 
         # 3. Update TeamRunResponse
+        full_model_response.join_chunks()
         run_response.created_at = full_model_response.created_at
         if full_model_response.content is not None:
             run_response.content = full_model_response.content
@@ -1916,6 +1930,7 @@ class Team:
             run_response.content = full_model_response.parsed
 
         # Update TeamRunResponse
+        full_model_response.join_chunks()
         run_response.created_at = full_model_response.created_at
         if full_model_response.content is not None:
             run_response.content = full_model_response.content
@@ -1991,15 +2006,13 @@ class Team:
                         content_type = self._member_response_model.__name__  # type: ignore
                         run_response.content_type = content_type
                     elif isinstance(model_response_event.content, str):
-                        full_model_response.content = (full_model_response.content or "") + model_response_event.content
+                        # Streamed chunks are joined once the stream ends
+                        full_model_response.append_chunk("content", model_response_event.content)
                     should_yield = True
 
                 # Process thinking
                 if model_response_event.thinking is not None:
-                    if not full_model_response.thinking:
-                        full_model_response.thinking = model_response_event.thinking
-                    else:
-                        full_model_response.thinking += model_response_event.thinking
+                    full_model_response.append_chunk("thinking", model_response_event.thinking)
                     should_yield = True
 
                 if model_response_event.citations is not None:
@@ -2015,9 +2028,9 @@ class Team:
                     if model_response_event.audio.id is not None:
                         full_model_response.audio.id = model_response_event.audio.id  # type: ignore
                     if model_response_event.audio.content is not None:
-                        full_model_response.audio.content += model_response_event.audio.content  # type: ignore
+                        full_model_response.append_chunk("audio_content", model_response_event.audio.content)
                     if model_response_event.audio.transcript is not None:
-                        full_model_response.audio.transcript += model_response_event.audio.transcript  # type: ignore
+                        full_model_response.append_chunk("audio_transcript", model_response_event.audio.transcript)
                     if model_response_event.audio.expires_at is not None:
                         full_model_response.audio.expires_at = model_response_event.audio.expires_at  # type: ignore
                     if model_response_event.audio.mime_type is not None:
@@ -2044,7 +2057,7 @@ class Team:
                                 content=model_response_event.content,
                                 thinking=model_response_event.thinking,
                                 redacted_thinking=model_response_event.redacted_thinking,
-                                response_audio=full_model_response.audio,
+                                response_audio=model_response_event.audio,
                                 citations=model_response_event.citations,
                                 image=model_response_event.image,
                             ),
@@ -2193,6 +2206,10 @@ class Team:
         self.run_response = cast(TeamRunResponse, self.run_response)
         self.memory = cast(Memory, self.memory)
 
+        if self.memory.defer_updates:
+            self._schedule_memories_and_summaries(run_messages, session_id, user_id)
+            return
+
         # Create a thread pool with a reasonable number of workers
         with ThreadPoolExecutor(max_workers=3) as executor:
             futures = []
@@ -2234,6 +2251,11 @@ class Team:
     ) -> AsyncIterator[TeamRunResponseEvent]:
         self.memory = cast(Memory, self.memory)
         self.run_response = cast(TeamRunResponse, self.run_response)
+
+        if self.memory.defer_updates:
+            self._schedule_memories_and_summaries(run_messages, session_id, user_id)
+            return
+
         tasks = []
 
         user_message_str = (
@@ -2263,6 +2285,61 @@ class Team:
                     create_team_memory_update_completed_event(from_run_response=self.run_response), self.run_response
                 )
 
+    def _schedule_memories_and_summaries(
+        self, run_messages: RunMessages, session_id: str, user_id: Optional[str] = None
+    ) -> None:
+        """Schedule the memory and summary updates of the run on the background worker of the Memory"""
+        self.memory = cast(Memory, self.memory)
+
+        user_message_str = (
+            run_messages.user_message.get_content_string() if run_messages.user_message is not None else None
+        )
+        if self.enable_user_memories and user_message_str:
+            log_debug("Scheduling user memories.")
+            self.memory.schedule_user_memories(
+                messages=[Message(role="user", content=user_message_str)], user_id=user_id
+            )
+
+        if self.enable_session_summaries:
+            log_debug("Scheduling session summary.")
+            self.memory.schedule_session_summary(
+                session_id=session_id,
+                user_id=user_id,
+                on_complete=lambda summary: self._persist_session_summary(session_id, user_id, summary),
+            )
+
+    def _persist_session_summary(
+        self, session_id: str, user_id: Optional[str], summary: Optional[SessionSummary]
+    ) -> None:
+        """Write a summary made in the background to the stored session"""
+        if summary is None or self.storage is None:
+            return
+        with self._lock_session_writes():
+            stored_session = self.storage.read(session_id=session_id)
+            if not isinstance(stored_session, TeamSession):
+                return
+            memory_dict = stored_session.memory or {}
+            memory_dict.setdefault("summaries", {}).setdefault(user_id or "default", {})[session_id] = summary.to_dict()
+            stored_session.memory = memory_dict
+            self.storage.upsert(session=stored_session)
+
+    @contextlib.contextmanager
+    def _lock_session_writes(self) -> Iterator[None]:
+        """Serialize writes of the session with the summaries persisted by the background worker of the Memory"""
+        if isinstance(self.memory, Memory) and self.memory.defer_updates:
+            with self.memory.get_update_worker().lock_session_writes():
+                yield
+        else:
+            yield
+
+    @contextlib.asynccontextmanager
+    async def _alock_session_writes(self) -> AsyncIterator[None]:
+        if isinstance(self.memory, Memory) and self.memory.defer_updates:
+            async with self.memory.get_update_worker().alock_session_writes():
+                yield
+        else:
+            yield
+
     def _get_response_format(self, model: Optional[Model] = None) -> Optional[Union[Dict, Type[BaseModel]]]:
         model = cast(Model, model or self.model)
         if self.response_model is None:
@@ -2492,6 +2569,7 @@ class Team:
             )
 
         # Update the TeamRunResponse content
+        model_response.join_chunks()
         run_response.content = model_response.content
         run_response.created_at = model_response.created_at
 
@@ -2543,6 +2621,7 @@ class Team:
                 yield event
 
         # Update the TeamRunResponse content
+        model_response.join_chunks()
         run_response.content = model_response.content
         run_response.created_at = model_response.created_at
 
@@ -5566,8 +5645,6 @@ class Team:
 
         # 2. Add history to run_messages
         if self.enable_team_history or self.add_history_to_messages:
-            from copy import deepcopy
-
             history = []
             if isinstance(self.memory, TeamMemory):
                 history = self.memory.get_messages_from_last_n_runs(
@@ -5578,17 +5655,15 @@ class Team:
                     session_id=session_id,
                     last_n=self.num_history_runs,
                     skip_role=self.system_message_role,
+                    max_tokens=self.max_history_tokens,
                     # Only filter by team_id if this is part of a team
                     team_id=self.team_id if self.team_session_id is not None else None,
                 )
 
             if len(history) > 0:
-                # Create a deep copy of the history messages to avoid modifying the original messages
-                history_copy = [deepcopy(msg) for msg in history]
-
-                # Tag each message as coming from history
-                for _msg in history_copy:
-                    _msg.from_history = True
+                # Tag each message as coming from history on a shallow copy, the original messages are not modified
+                # and their content, media and tool results are shared rather than copied
+                history_copy = [msg.model_copy(update={"from_history": True}) for msg in history]
 
                 log_debug(f"Adding {len(history_copy)} messages from history")
 
@@ -5988,7 +6063,10 @@ class Team:
         else:
             update_memory_function = update_user_memory  # type: ignore
 
-        return Function.from_callable(update_memory_function, name="update_user_memory")
+        update_user_memory_tool = Function.from_callable(update_memory_function, name="update_user_memory")
+        # Memory updates modify shared state, so they are not run concurrently with other tool calls
+        update_user_memory_tool.thread_safe = False
+        return update_user_memory_tool
 
     def get_member_information(self) -> str:
         """Get information about the members of the team, including their IDs, names, and roles."""
@@ -7179,6 +7257,18 @@ class Team:
                 self.load_team_session(session=self.team_session)
         return self.team_session
 
+    async def aread_from_storage(self, session_id: str) -> Optional[TeamSession]:
+        """Load the TeamSession from storage without blocking the event loop
+
+        Returns:
+            Optional[TeamSession]: The loaded TeamSession or None if not found.
+        """
+        if self.storage is not None and session_id is not None:
+            self.team_session = cast(TeamSession, await self.storage.aread(session_id=session_id))
+            if self.team_session is not None:
+                self.load_team_session(session=self.team_session)
+        return self.team_session
+
     def write_to_storage(self, session_id: str, user_id: Optional[str] = None) -> Optional[TeamSession]:
         """Save the TeamSession to storage
 
@@ -7186,9 +7276,30 @@ class Team:
             Optional[TeamSession]: The saved TeamSession or None if not saved.
         """
         if self.storage is not None:
-            self.team_session = cast(
-                TeamSession, self.storage.upsert(session=self._get_team_session(session_id=session_id, user_id=user_id))
-            )
+            with self._lock_session_writes():
+                self.team_session = cast(
+                    TeamSession,
+                    self.storage.upsert(session=self._get_team_session(session_id=session_id, user_id=user_id)),
+                )
+
+        # Remove session from memory
+        if not self.cache_session:
+            if self.memory is not None and self.memory.runs is not None and session_id in self.memory.runs:
+                self.memory.runs.pop(session_id)  # type: ignore
+        return self.team_session
+
+    async def awrite_to_storage(self, session_id: str, user_id: Optional[str] = None) -> Optional[TeamSession]:
+        """Save the TeamSession to storage without blocking the event loop
+
+        Returns:
+            Optional[TeamSession]: The saved TeamSession or None if not saved.
+        """
+        if self.storage is not None:
+            async with self._alock_session_writes():
+                self.team_session = cast(
+                    TeamSession,
+                    await self.storage.aupsert(session=self._get_team_session(session_id=session_id, user_id=user_id)),
+                )
 
         # Remove session from memory
         if not self.cache_session:
@@ -8085,10 +8196,17 @@ class Team:
                 self.memory = cast(Memory, self.memory)
                 # We fake the structure on storage, to maintain the interface with the legacy implementation
                 if self.memory.runs is not None:
-                    memory_dict = self.memory.to_dict()
-                    run_responses = self.memory.runs.get(session_id)
-                    if run_responses is not None:
-                        memory_dict["runs"] = [rr.to_dict() for rr in run_responses]
+                    # If the storage keeps an append-only run log, only the current run needs to be written
+                    if self.storage is not None and self.storage.stores_runs_separately:
+                        memory_dict = self.memory.to_dict(include_runs=False)
+                        memory_dict["runs"] = [
+                            rr.to_dict() for rr in self.memory.runs.get(session_id, []) if rr.run_id == self.run_id
+                        ]
+                    else:
+                        memory_dict = self.memory.to_dict()
+                        run_responses = self.memory.runs.get(session_id)
+                        if run_responses is not None:
+                            memory_dict["runs"] = [rr.to_dict() for rr in run_responses]
 
         return TeamSession(
             session_id=session_id,
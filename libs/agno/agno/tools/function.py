@@ -1,7 +1,10 @@
-from dataclasses import dataclass
-from functools import partial
+from copy import deepcopy
+from dataclasses import dataclass, replace
+from functools import lru_cache, partial
 from importlib.metadata import version
-from typing import Any, Callable, Dict, List, Literal, Optional, Type, TypeVar, get_type_hints
+from threading import Lock
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Type, TypeVar, get_type_hints
+from weakref import WeakKeyDictionary
 
 from docstring_parser import parse
 from packaging.version import Version
@@ -13,6 +16,12 @@ from agno.utils.log import log_debug, log_error, log_exception, log_warning
 T = TypeVar("T")
 
 
+@lru_cache(maxsize=None)
+def _get_pydantic_version() -> Version:
+    # Reading package metadata parses the METADATA file, so only do it once
+    return Version(version("pydantic"))
+
+
 def get_entrypoint_docstring(entrypoint: Callable) -> str:
     from inspect import getdoc
 
@@ -60,6 +69,53 @@ class UserInputField:
         )
 
 
+@dataclass
+class EntrypointSchema:
+    """The result of inspecting an entrypoint, cached so it is computed once per function"""
+
+    parameters: Dict[str, Any]
+    # Parameters without a default value
+    required: List[str]
+    excluded_params: List[str]
+    description: str
+    user_input_schema: Optional[List[UserInputField]] = None
+
+
+# Process-wide cache of entrypoint schemas, keyed by the underlying function so that it is shared by
+# bound methods of different toolkit instances and by deep copies of agents.
+_entrypoint_schema_cache: "WeakKeyDictionary[Any, Dict[Tuple, EntrypointSchema]]" = WeakKeyDictionary()
+_entrypoint_schema_cache_lock = Lock()
+
+
+def get_entrypoint_schema(
+    entrypoint: Callable, key: Tuple, build_schema: Callable[[], EntrypointSchema]
+) -> EntrypointSchema:
+    """Return the cached schema of an entrypoint for the given options, building it on a miss"""
+    from inspect import ismethod, unwrap
+
+    # Entrypoints wrapped by validate_call keep a reference to the original callable
+    original = unwrap(entrypoint)
+    cache_key = (ismethod(original), *key)
+    try:
+        with _entrypoint_schema_cache_lock:
+            schema = _entrypoint_schema_cache.get(getattr(original, "__func__", original), {}).get(cache_key)
+    except TypeError:
+        # Callables that can't be weakly referenced or hashed are not cached
+        return build_schema()
+
+    if schema is None:
+        schema = build_schema()
+        with _entrypoint_schema_cache_lock:
+            _entrypoint_schema_cache.setdefault(getattr(original, "__func__", original), {})[cache_key] = schema
+    return schema
+
+
+def clear_entrypoint_schema_cache() -> None:
+    """Clear the entrypoint schema cache, e.g. after reloading tool modules"""
+    with _entrypoint_schema_cache_lock:
+        _entrypoint_schema_cache.clear()
+
+
 class Function(BaseModel):
     """Model for storing functions that can be called by an agent."""
 
@@ -113,6 +169,9 @@ class Function(BaseModel):
     # If True, the function will be executed outside the agent's control.
     external_execution: Optional[bool] = None
 
+    # If False, the function is never run concurrently with other tool calls (see Model.run_tools_in_parallel)
+    thread_safe: bool = True
+
     # Caching configuration
     cache_results: bool = False
     cache_dir: Optional[str] = None
@@ -132,64 +191,13 @@ class Function(BaseModel):
 
     @classmethod
     def from_callable(cls, c: Callable, name: Optional[str] = None, strict: bool = False) -> "Function":
-        from inspect import getdoc, signature
-
-        from agno.utils.json_schema import get_json_schema
-
         function_name = name or c.__name__
         parameters = {"type": "object", "properties": {}, "required": []}
+        description: Optional[str] = None
         try:
-            sig = signature(c)
-            type_hints = get_type_hints(c)
-
-            # If function has an the agent argument, remove the agent parameter from the type hints
-            if "agent" in sig.parameters:
-                del type_hints["agent"]
-            if "team" in sig.parameters:
-                del type_hints["team"]
-            # log_info(f"Type hints for {function_name}: {type_hints}")
-
-            # Filter out return type and only process parameters
-            param_type_hints = {
-                name: type_hints.get(name)
-                for name in sig.parameters
-                if name != "return" and name not in ["agent", "team", "self"]
-            }
-
-            # Parse docstring for parameters
-            param_descriptions: Dict[str, Any] = {}
-            if docstring := getdoc(c):
-                parsed_doc = parse(docstring)
-                param_docs = parsed_doc.params
-
-                if param_docs is not None:
-                    for param in param_docs:
-                        param_name = param.arg_name
-                        param_type = param.type_name
-                        if param_type is None:
-                            param_descriptions[param_name] = param.description
-                        else:
-                            param_descriptions[param_name] = f"({param_type}) {param.description}"
-
-            # Get JSON schema for parameters only
-            parameters = get_json_schema(
-                type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict
-            )
-
-            # If strict=True mark all fields as required
-            # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
-            if strict:
-                parameters["required"] = [
-                    name for name in parameters["properties"] if name not in ["agent", "team", "self"]
-                ]
-            else:
-                # Mark a field as required if it has no default value (this would include optional fields)
-                parameters["required"] = [
-                    name
-                    for name, param in sig.parameters.items()
-                    if param.default == param.empty and name != "self" and name not in ["agent", "team"]
-                ]
-
+            schema = get_entrypoint_schema(c, ("callable", strict), partial(cls._build_callable_schema, c, strict))
+            parameters = deepcopy(schema.parameters)
+            description = schema.description
             # log_debug(f"JSON schema for {function_name}: {parameters}")
         except Exception as e:
             log_warning(f"Could not parse args for {function_name}: {e}", exc_info=True)
@@ -198,17 +206,76 @@ class Function(BaseModel):
 
         return cls(
             name=function_name,
-            description=get_entrypoint_docstring(entrypoint=c),
+            description=description if description is not None else get_entrypoint_docstring(entrypoint=c),
             parameters=parameters,
             entrypoint=entrypoint,
         )
 
-    def process_entrypoint(self, strict: bool = False):
-        """Process the entrypoint and make it ready for use by an agent."""
+    @staticmethod
+    def _build_callable_schema(c: Callable, strict: bool) -> EntrypointSchema:
         from inspect import getdoc, signature
 
         from agno.utils.json_schema import get_json_schema
 
+        sig = signature(c)
+        type_hints = get_type_hints(c)
+
+        # If function has an the agent argument, remove the agent parameter from the type hints
+        if "agent" in sig.parameters:
+            del type_hints["agent"]
+        if "team" in sig.parameters:
+            del type_hints["team"]
+        # log_info(f"Type hints for {c.__name__}: {type_hints}")
+
+        # Filter out return type and only process parameters
+        param_type_hints = {
+            name: type_hints.get(name)
+            for name in sig.parameters
+            if name != "return" and name not in ["agent", "team", "self"]
+        }
+
+        # Parse docstring for parameters
+        param_descriptions: Dict[str, Any] = {}
+        if docstring := getdoc(c):
+            parsed_doc = parse(docstring)
+            param_docs = parsed_doc.params
+
+            if param_docs is not None:
+                for param in param_docs:
+                    param_name = param.arg_name
+                    param_type = param.type_name
+                    if param_type is None:
+                        param_descriptions[param_name] = param.description
+                    else:
+                        param_descriptions[param_name] = f"({param_type}) {param.description}"
+
+        # Get JSON schema for parameters only
+        parameters = get_json_schema(type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict)
+
+        # Mark a field as required if it has no default value (this would include optional fields)
+        required = [
+            name
+            for name, param in sig.parameters.items()
+            if param.default == param.empty and name != "self" and name not in ["agent", "team"]
+        ]
+        # If strict=True mark all fields as required
+        # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
+        if strict:
+            parameters["required"] = [
+                name for name in parameters["properties"] if name not in ["agent", "team", "self"]
+            ]
+        else:
+            parameters["required"] = required
+
+        return EntrypointSchema(
+            parameters=parameters,
+            required=required,
+            excluded_params=["return", "agent", "team", "self"],
+            description=get_entrypoint_docstring(entrypoint=c),
+        )
+
+    def process_entrypoint(self, strict: bool = False):
+        """Process the entrypoint and make it ready for use by an agent."""
         if self.skip_entrypoint_processing:
             if strict:
                 self.process_schema_for_strict()
@@ -228,71 +295,19 @@ class Function(BaseModel):
             self.user_input_schema = self.user_input_schema or []
 
         try:
-            sig = signature(self.entrypoint)
-            type_hints = get_type_hints(self.entrypoint)
-
-            # If function has an the agent argument, remove the agent parameter from the type hints
-            if "agent" in sig.parameters:
-                del type_hints["agent"]
-            if "team" in sig.parameters:
-                del type_hints["team"]
-            # log_info(f"Type hints for {self.name}: {type_hints}")
-
-            # Filter out return type and only process parameters
-            excluded_params = ["return", "agent", "team", "self"]
-            if self.requires_user_input and self.user_input_fields:
-                if len(self.user_input_fields) == 0:
-                    excluded_params.extend(list(type_hints.keys()))
-                else:
-                    excluded_params.extend(self.user_input_fields)
-
-            # Get filtered list of parameter types
-            param_type_hints = {name: type_hints.get(name) for name in sig.parameters if name not in excluded_params}
-
-            # Parse docstring for parameters
-            param_descriptions = {}
-            param_descriptions_clean = {}
-            if docstring := getdoc(self.entrypoint):
-                parsed_doc = parse(docstring)
-                param_docs = parsed_doc.params
-
-                if param_docs is not None:
-                    for param in param_docs:
-                        param_name = param.arg_name
-                        param_type = param.type_name
-
-                        # TODO: We should use type hints first, then map param types in docs to json schema types.
-                        # This is temporary to not lose information
-                        param_descriptions[param_name] = f"({param_type}) {param.description}"
-                        param_descriptions_clean[param_name] = param.description
+            user_input_fields = tuple(self.user_input_fields) if self.user_input_fields is not None else None
+            schema = get_entrypoint_schema(
+                self.entrypoint,
+                ("entrypoint", strict, self.requires_user_input, user_input_fields),
+                partial(self._build_entrypoint_schema, self.entrypoint, strict),
+            )
+            excluded_params = schema.excluded_params
 
             # If the function requires user input, we should set the user_input_schema to all parameters. The arguments provided by the model are filled in later.
-            if self.requires_user_input:
-                self.user_input_schema = [
-                    UserInputField(
-                        name=name,
-                        description=param_descriptions_clean.get(name),
-                        field_type=type_hints.get(name, str),
-                    )
-                    for name in sig.parameters
-                ]
-
-            # Get JSON schema for parameters only
-            parameters = get_json_schema(
-                type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict
-            )
+            if self.requires_user_input and schema.user_input_schema is not None:
+                self.user_input_schema = [replace(user_input_field) for user_input_field in schema.user_input_schema]
 
-            # If strict=True mark all fields as required
-            # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
-            if strict:
-                parameters["required"] = [name for name in parameters["properties"] if name not in excluded_params]
-            else:
-                # Mark a field as required if it has no default value
-                parameters["required"] = [
-                    name
-                    for name, param in sig.parameters.items()
-                    if param.default == param.empty and name != "self" and name not in excluded_params
-                ]
+            parameters = deepcopy(schema.parameters)
 
             if params_set_by_user:
                 self.parameters["additionalProperties"] = False
@@ -302,13 +317,9 @@ class Function(BaseModel):
                     ]
                 else:
                     # Mark a field as required if it has no default value
-                    self.parameters["required"] = [
-                        name
-                        for name, param in sig.parameters.items()
-                        if param.default == param.empty and name != "self" and name not in excluded_params
-                    ]
+                    self.parameters["required"] = list(schema.required)
 
-            self.description = self.description or get_entrypoint_docstring(self.entrypoint)
+            self.description = self.description or schema.description
 
             # log_debug(f"JSON schema for {self.name}: {parameters}")
         except Exception as e:
@@ -322,12 +333,91 @@ class Function(BaseModel):
         except Exception as e:
             log_warning(f"Failed to add validate decorator to entrypoint: {e}")
 
+    def _build_entrypoint_schema(self, entrypoint: Callable, strict: bool) -> EntrypointSchema:
+        """Inspect the entrypoint signature, type hints and docstring to build its JSON schema"""
+        from inspect import getdoc, signature
+
+        from agno.utils.json_schema import get_json_schema
+
+        sig = signature(entrypoint)
+        type_hints = get_type_hints(entrypoint)
+
+        # If function has an the agent argument, remove the agent parameter from the type hints
+        if "agent" in sig.parameters:
+            del type_hints["agent"]
+        if "team" in sig.parameters:
+            del type_hints["team"]
+        # log_info(f"Type hints for {self.name}: {type_hints}")
+
+        # Filter out return type and only process parameters
+        excluded_params = ["return", "agent", "team", "self"]
+        if self.requires_user_input and self.user_input_fields:
+            if len(self.user_input_fields) == 0:
+                excluded_params.extend(list(type_hints.keys()))
+            else:
+                excluded_params.extend(self.user_input_fields)
+
+        # Get filtered list of parameter types
+        param_type_hints = {name: type_hints.get(name) for name in sig.parameters if name not in excluded_params}
+
+        # Parse docstring for parameters
+        param_descriptions = {}
+        param_descriptions_clean = {}
+        if docstring := getdoc(entrypoint):
+            parsed_doc = parse(docstring)
+            param_docs = parsed_doc.params
+
+            if param_docs is not None:
+                for param in param_docs:
+                    param_name = param.arg_name
+                    param_type = param.type_name
+
+                    # TODO: We should use type hints first, then map param types in docs to json schema types.
+                    # This is temporary to not lose information
+                    param_descriptions[param_name] = f"({param_type}) {param.description}"
+                    param_descriptions_clean[param_name] = param.description
+
+        user_input_schema = None
+        if self.requires_user_input:
+            user_input_schema = [
+                UserInputField(
+                    name=name,
+                    description=param_descriptions_clean.get(name),
+                    field_type=type_hints.get(name, str),
+                )
+                for name in sig.parameters
+            ]
+
+        # Get JSON schema for parameters only
+        parameters = get_json_schema(type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict)
+
+        # Mark a field as required if it has no default value
+        required = [
+            name
+            for name, param in sig.parameters.items()
+            if param.default == param.empty and name != "self" and name not in excluded_params
+        ]
+        # If strict=True mark all fields as required
+        # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
+        if strict:
+            parameters["required"] = [name for name in parameters["properties"] if name not in excluded_params]
+        else:
+            parameters["required"] = required
+
+        return EntrypointSchema(
+            parameters=parameters,
+            required=required,
+            excluded_params=excluded_params,
+            description=get_entrypoint_docstring(entrypoint),
+            user_input_schema=user_input_schema,
+        )
+
     @staticmethod
     def _wrap_callable(func: Callable) -> Callable:
         """Wrap a callable with Pydantic's validate_call decorator, if relevant"""
         from inspect import isasyncgenfunction, iscoroutinefunction
 
-        pydantic_version = Version(version("pydantic"))
+        pydantic_version = _get_pydantic_version()
 
         # Don't wrap async generators validate_call
         if isasyncgenfunction(func):
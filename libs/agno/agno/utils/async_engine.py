@@ -0,0 +1,28 @@
+import asyncio
+from typing import TYPE_CHECKING, Set
+
+from agno.utils.log import log_debug
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Running dispose tasks, referenced so they are not garbage collected before they finish
+_dispose_tasks: Set["asyncio.Task[None]"] = set()
+
+
+async def _dispose(async_engine: "AsyncEngine") -> None:
+    try:
+        await async_engine.dispose()
+    except Exception as e:
+        log_debug(f"Error disposing async engine: {e}")
+
+
+def dispose_async_engine(async_engine: "AsyncEngine") -> None:
+    """Dispose an async engine in the background on the running event loop.
+
+    Used for the engines of event loops that have been closed. Their pooled connections are closed if the driver
+    allows it from another event loop, and are dropped either way.
+    """
+    task = asyncio.get_running_loop().create_task(_dispose(async_engine))
+    _dispose_tasks.add(task)
+    task.add_done_callback(_dispose_tasks.discard)
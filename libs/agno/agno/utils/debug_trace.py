@@ -0,0 +1,56 @@
+import json
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Union
+
+
+class DebugTrace(ABC):
+    """Sink for structured debug records of model calls.
+
+    Set `debug_trace` on an Agent or Team to record the messages sent to and received from its model,
+    independently of the log level. A trace is shared, not copied, when the agent or model is copied.
+    """
+
+    @abstractmethod
+    def write(self, record: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def emit(self, event: str, **data: Any) -> None:
+        self.write({"event": event, "timestamp": time.time(), **data})
+
+    def __deepcopy__(self, memo):
+        return self
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: Any) -> Any:
+        # Models are also fields of pydantic models (e.g. the MemoryManager), which only need an instance check
+        from pydantic_core import core_schema
+
+        return core_schema.is_instance_schema(cls)
+
+
+class InMemoryDebugTrace(DebugTrace):
+    """Keeps the records in a list, e.g. to inspect them in tests"""
+
+    def __init__(self):
+        self.records: List[Dict[str, Any]] = []
+
+    def write(self, record: Dict[str, Any]) -> None:
+        self.records.append(record)
+
+
+class JsonlDebugTrace(DebugTrace):
+    """Appends the records to a file, one JSON object per line"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(line)
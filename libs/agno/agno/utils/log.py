@@ -174,6 +174,13 @@ def use_workflow_logger():
     logger = workflow_logger
 
 
+def is_log_enabled(level: Literal["debug", "info", "warning", "error"] = "debug", log_level: Literal[1, 2] = 1) -> bool:
+    """Return True if a message at this level would be logged, so callers can skip building it otherwise"""
+    if level == "debug":
+        return debug_on and debug_level >= log_level and logger.isEnabledFor(logging.DEBUG)
+    return logger.isEnabledFor(logging.getLevelName(level.upper()))
+
+
 def log_debug(msg, center: bool = False, symbol: str = "*", log_level: Literal[1, 2] = 1, *args, **kwargs):
     global logger
     global debug_on
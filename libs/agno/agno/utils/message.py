@@ -1,9 +1,19 @@
-from typing import Dict, List, Union
+import json
+from math import ceil
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 from pydantic import BaseModel
 
 from agno.models.message import Message
 
+if TYPE_CHECKING:
+    from agno.document.chunking.tokenizer import Tokenizer
+
+# Tokens added by the chat format to every message, on top of its content
+MESSAGE_TOKEN_OVERHEAD = 4
+# Average number of characters per token of English text, used when no tokenizer is provided
+CHARS_PER_TOKEN = 4
+
 
 def get_text_from_message(message: Union[List, Dict, str, Message, BaseModel]) -> str:
     """Return the user texts from the message"""
@@ -45,3 +55,16 @@ def get_text_from_message(message: Union[List, Dict, str, Message, BaseModel]) -
     if isinstance(message, Message) and message.content is not None:
         return get_text_from_message(message.content)
     return ""
+
+
+def estimate_message_tokens(message: Message, tokenizer: Optional["Tokenizer"] = None) -> int:
+    """Estimate the number of tokens the text content and tool calls of a message take in the context window.
+
+    The text is counted with `tokenizer` if provided, otherwise it is estimated from its length.
+    """
+    text = message.get_content_string()
+    if message.tool_calls:
+        text += json.dumps(message.tool_calls, default=str)
+    if tokenizer is not None:
+        return tokenizer.count_tokens(text) + MESSAGE_TOKEN_OVERHEAD
+    return ceil(len(text) / CHARS_PER_TOKEN) + MESSAGE_TOKEN_OVERHEAD
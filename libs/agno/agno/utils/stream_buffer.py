@@ -0,0 +1,52 @@
+from typing import Any, List, Optional
+
+
+class StreamBuffer:
+    """Accumulates the chunks of a streamed string or bytes value in linear time.
+
+    Appending a chunk to a string copies everything received so far, so building a long response one chunk at a
+    time costs O(n^2). The buffer keeps the chunks in a list and only joins them when the value is read, keeping
+    the joined value until the next chunk arrives.
+    """
+
+    __slots__ = ("_parts", "_length")
+
+    def __init__(self, initial: Optional[Any] = None):
+        self._parts: List[Any] = []
+        self._length: int = 0
+        if initial:
+            self.append(initial)
+
+    def append(self, chunk: Any) -> None:
+        if chunk:
+            self._parts.append(chunk)
+            self._length += len(chunk)
+
+    def __iadd__(self, chunk: Any) -> "StreamBuffer":
+        self.append(chunk)
+        return self
+
+    def getvalue(self, default: Any = "") -> Any:
+        """Return the joined chunks, or `default` if nothing was appended"""
+        if not self._parts:
+            return default
+        if len(self._parts) > 1:
+            # Join with an empty value of the chunks' type, so str and bytes chunks are both supported
+            self._parts = [self._parts[0][:0].join(self._parts)]
+        return self._parts[0]
+
+    def clear(self) -> None:
+        self._parts = []
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    def __str__(self) -> str:
+        return str(self.getvalue())
+
+    def __repr__(self) -> str:
+        return f"StreamBuffer(parts={len(self._parts)}, length={self._length})"
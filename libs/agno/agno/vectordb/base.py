@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from agno.document import Document
 
@@ -34,6 +35,17 @@ class VectorDb(ABC):
     def id_exists(self, id: str) -> bool:
         raise NotImplementedError
 
+    def existing_content_hashes(self, content_hashes: List[str]) -> Set[str]:
+        """Return the subset of `content_hashes` that are already stored, using as few queries as possible.
+
+        Content hashes are computed with `agno.utils.string.safe_content_hash`. Vector dbs that cannot
+        look up hashes in bulk raise NotImplementedError, and callers fall back to `doc_exists`.
+        """
+        raise NotImplementedError
+
+    async def async_existing_content_hashes(self, content_hashes: List[str]) -> Set[str]:
+        return await asyncio.to_thread(self.existing_content_hashes, content_hashes)
+
     @abstractmethod
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         raise NotImplementedError
@@ -94,3 +106,7 @@ class VectorDb(ABC):
     @abstractmethod
     def delete(self) -> bool:
         raise NotImplementedError
+
+    def delete_by_content_hashes(self, content_hashes: List[str]) -> bool:
+        """Delete the documents with the given content hashes, as computed by `agno.utils.string.safe_content_hash`"""
+        raise NotImplementedError
@@ -1,6 +1,6 @@
 import asyncio
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     from chromadb import Client as ChromaDbClient
@@ -113,6 +113,23 @@ class ChromaDb(VectorDb):
             logger.error(f"Document does not exist: {e}")
         return False
 
+    def existing_content_hashes(self, content_hashes: List[str]) -> Set[str]:
+        """Return the content hashes that already exist in the collection, looking them up by id.
+        Args:
+            content_hashes (List[str]): Content hashes to check.
+        Returns:
+            Set[str]: The subset of content hashes that exist in the collection."""
+        if not content_hashes or not self.client:
+            return set()
+
+        try:
+            collection: Collection = self.client.get_collection(name=self.collection_name)
+            collection_data: GetResult = collection.get(ids=content_hashes, include=[])  # type: ignore
+            return set(collection_data.get("ids", []))
+        except Exception as e:
+            logger.error(f"Error checking document existence: {e}")
+        return set()
+
     async def async_doc_exists(self, document: Document) -> bool:
         """Check if a document exists asynchronously."""
         return await asyncio.to_thread(self.doc_exists, document)
@@ -153,8 +170,8 @@ class ChromaDb(VectorDb):
         if not self._collection:
             self._collection = self.client.get_collection(name=self.collection_name)
 
+        Document.embed_many(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
 
@@ -200,8 +217,8 @@ class ChromaDb(VectorDb):
         if not self._collection:
             self._collection = self.client.get_collection(name=self.collection_name)
 
+        Document.embed_many(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             docs_embeddings.append(document.embedding)
@@ -360,3 +377,12 @@ class ChromaDb(VectorDb):
         except Exception as e:
             logger.error(f"Error clearing collection: {e}")
             return False
+
+    def delete_by_content_hashes(self, content_hashes: List[str]) -> bool:
+        try:
+            collection: Collection = self.client.get_collection(name=self.collection_name)
+            collection.delete(ids=content_hashes)
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting documents: {e}")
+            return False
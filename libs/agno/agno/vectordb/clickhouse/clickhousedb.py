@@ -1,5 +1,5 @@
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from agno.vectordb.clickhouse.index import HNSW
 
@@ -242,6 +242,39 @@ class Clickhouse(VectorDb):
         )
         return bool(result.result_rows)
 
+    def existing_content_hashes(self, content_hashes: List[str]) -> Set[str]:
+        """
+        Return the content hashes that already exist in the table, using a single query
+
+        Args:
+            content_hashes (List[str]): Content hashes to check
+        """
+        if not content_hashes:
+            return set()
+        parameters = self._get_base_parameters()
+        parameters["content_hashes"] = content_hashes
+
+        result = self.client.query(
+            "SELECT content_hash FROM {database_name:Identifier}.{table_name:Identifier} WHERE content_hash IN {content_hashes:Array(String)}",
+            parameters=parameters,
+        )
+        return {row[0] for row in result.result_rows}
+
+    async def async_existing_content_hashes(self, content_hashes: List[str]) -> Set[str]:
+        """Return the content hashes that already exist in the table asynchronously."""
+        if not content_hashes:
+            return set()
+        async_client = await self._ensure_async_client()
+
+        parameters = self._get_base_parameters()
+        parameters["content_hashes"] = content_hashes
+
+        result = await async_client.query(
+            "SELECT content_hash FROM {database_name:Identifier}.{table_name:Identifier} WHERE content_hash IN {content_hashes:Array(String)}",
+            parameters=parameters,
+        )
+        return {row[0] for row in result.result_rows}
+
     def name_exists(self, name: str) -> bool:
         """
         Validate if a row with this name exists or not
@@ -293,8 +326,8 @@ class Clickhouse(VectorDb):
         filters: Optional[Dict[str, Any]] = None,
     ) -> None:
         rows: List[List[Any]] = []
+        Document.embed_many(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             content_hash = md5(cleaned_content.encode()).hexdigest()
             _id = document.id or content_hash
@@ -332,8 +365,8 @@ class Clickhouse(VectorDb):
         rows: List[List[Any]] = []
         async_client = await self._ensure_async_client()
 
+        await Document.async_embed_many(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             content_hash = md5(cleaned_content.encode()).hexdigest()
             _id = document.id or content_hash
@@ -573,3 +606,16 @@ class Clickhouse(VectorDb):
             parameters=parameters,
         )
         return True
+
+    def delete_by_content_hashes(self, content_hashes: List[str]) -> bool:
+        parameters = self._get_base_parameters()
+        parameters["content_hashes"] = content_hashes
+        try:
+            self.client.command(
+                "DELETE FROM {database_name:Identifier}.{table_name:Identifier} WHERE content_hash IN {content_hashes:Array(String)}",
+                parameters=parameters,
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting documents: {e}")
+            return False
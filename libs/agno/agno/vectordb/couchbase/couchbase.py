@@ -302,6 +302,8 @@ class CouchbaseSearch(VectorDb):
         """
         log_debug(f"Inserting {len(documents)} documents")
 
+        Document.embed_many([doc for doc in documents if doc.content and doc.embedding is None], embedder=self.embedder)
+
         docs_to_insert: Dict[str, Any] = {}
         for document in documents:
             try:
@@ -377,6 +379,8 @@ class CouchbaseSearch(VectorDb):
         """
         logger.info(f"Upserting {len(documents)} documents")
 
+        Document.embed_many([doc for doc in documents if doc.content and doc.embedding is None], embedder=self.embedder)
+
         docs_to_upsert: Dict[str, Any] = {}
         for document in documents:
             try:
@@ -841,6 +845,9 @@ class CouchbaseSearch(VectorDb):
         async_collection_instance = await self.get_async_collection()
         all_docs_to_insert: Dict[str, Any] = {}
 
+        await Document.async_embed_many(
+            [doc for doc in documents if doc.content and doc.embedding is None], embedder=self.embedder
+        )
         for document in documents:
             try:
                 # User edit: self.prepare_doc is no longer awaited with to_thread
@@ -894,6 +901,9 @@ class CouchbaseSearch(VectorDb):
         async_collection_instance = await self.get_async_collection()
         all_docs_to_upsert: Dict[str, Any] = {}
 
+        await Document.async_embed_many(
+            [doc for doc in documents if doc.content and doc.embedding is None], embedder=self.embedder
+        )
         for document in documents:
             try:
                 # Consistent with async_insert, prepare_doc is not awaited with to_thread based on prior user edits
@@ -1,7 +1,7 @@
 import json
 from hashlib import md5
 from os import getenv
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     import lancedb
@@ -198,6 +198,29 @@ class LanceDb(VectorDb):
 
         return False
 
+    def existing_content_hashes(self, content_hashes: List[str]) -> Set[str]:
+        """
+        Return the content hashes that already exist in the table, using a single query
+
+        Args:
+            content_hashes (List[str]): Content hashes to check
+        """
+        if not content_hashes or self.table is None:
+            return set()
+        try:
+            ids = ", ".join(f"'{content_hash}'" for content_hash in content_hashes)
+            result = (
+                self.table.search()
+                .where(f"{self._id} IN ({ids})")
+                .select([self._id])
+                .limit(len(content_hashes))
+                .to_arrow()
+            )
+            return set(result.column(self._id).to_pylist())
+        except Exception:
+            # Search sometimes fails with stale cache data, it means the docs don't exist
+            return set()
+
     async def async_doc_exists(self, document: Document) -> bool:
         """
         Asynchronously validate if the document exists
@@ -227,6 +250,7 @@ class LanceDb(VectorDb):
         log_debug(f"Inserting {len(documents)} documents")
         data = []
 
+        new_documents: List[Document] = []
         for document in documents:
             if self.doc_exists(document):
                 continue
@@ -236,8 +260,12 @@ class LanceDb(VectorDb):
                 meta_data = document.meta_data.copy() if document.meta_data else {}
                 meta_data.update(filters)
                 document.meta_data = meta_data
+            new_documents.append(document)
 
-            document.embed(embedder=self.embedder)
+        # Embed all new documents in batches
+        Document.embed_many(new_documents, embedder=self.embedder)
+
+        for document in new_documents:
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = str(md5(cleaned_content.encode()).hexdigest())
             payload = {
@@ -286,6 +314,7 @@ class LanceDb(VectorDb):
         data = []
 
         # Prepare documents for insertion
+        new_documents: List[Document] = []
         for document in documents:
             if await self.async_doc_exists(document):
                 continue
@@ -295,8 +324,12 @@ class LanceDb(VectorDb):
                 meta_data = document.meta_data.copy() if document.meta_data else {}
                 meta_data.update(filters)
                 document.meta_data = meta_data
+            new_documents.append(document)
+
+        # Embed all new documents in batches
+        await Document.async_embed_many(new_documents, embedder=self.embedder)
 
-            document.embed(embedder=self.embedder)
+        for document in new_documents:
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = str(md5(cleaned_content.encode()).hexdigest())
             payload = {
@@ -588,6 +621,17 @@ class LanceDb(VectorDb):
     def delete(self) -> bool:
         return False
 
+    def delete_by_content_hashes(self, content_hashes: List[str]) -> bool:
+        if self.table is None:
+            return False
+        try:
+            ids = ", ".join(f"'{content_hash}'" for content_hash in content_hashes)
+            self.table.delete(f"{self._id} IN ({ids})")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting documents: {e}")
+            return False
+
     def name_exists(self, name: str) -> bool:
         """Check if a document with the given name exists in the database"""
         if self.table is None:
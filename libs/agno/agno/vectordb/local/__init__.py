@@ -0,0 +1,9 @@
+from agno.vectordb.distance import Distance
+from agno.vectordb.local.index import Ivf
+from agno.vectordb.local.numpy_db import NumpyVectorDb
+
+__all__ = [
+    "Distance",
+    "Ivf",
+    "NumpyVectorDb",
+]
@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+
+
+class Ivf(BaseModel):
+    """Inverted file index: vectors are clustered with k-means and a search only scans the `probes` nearest clusters"""
+
+    lists: int = 100
+    probes: int = 10
+    # The index is built once the collection holds this many documents, smaller collections are searched exactly
+    min_rows: int = 10000
+    train_iterations: int = 10
+    # Maximum number of vectors the clusters are trained on
+    train_sample_size: int = 100000
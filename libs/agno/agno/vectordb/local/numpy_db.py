@@ -0,0 +1,679 @@
+import asyncio
+import json
+import os
+import shutil
+from collections import Counter
+from pathlib import Path
+from threading import RLock
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("`numpy` not installed. Please install using `pip install numpy`")
+
+from agno.document import Document
+from agno.embedder import Embedder
+from agno.reranker.base import Reranker
+from agno.utils.log import log_debug, log_info, logger
+from agno.utils.string import safe_content_hash
+from agno.vectordb.base import VectorDb
+from agno.vectordb.distance import Distance
+from agno.vectordb.local.index import Ivf
+
+# Rows preallocated for the embeddings of a new collection, the matrix doubles in size when it is full
+INITIAL_CAPACITY = 1024
+# Number of vectors assigned to the clusters of the index at once
+ASSIGN_BATCH_SIZE = 65536
+# Fraction of replaced rows in a persisted collection above which it is compacted
+COMPACT_DEAD_FRACTION = 0.25
+
+MANIFEST_FILE = "manifest.json"
+VECTORS_FILE = "vectors.f32"
+DOCUMENTS_FILE = "documents.jsonl"
+
+
+def _get_index_key(value: Any) -> Hashable:
+    """Key of a metadata value in the metadata index. Unhashable values are indexed by their JSON representation."""
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return json.dumps(value, sort_keys=True, default=str)
+
+
+def _decrement(counter: Counter, key: Hashable) -> None:
+    counter[key] -= 1
+    if counter[key] <= 0:
+        del counter[key]
+
+
+class NumpyVectorDb(VectorDb):
+    """In-process vector db storing the embeddings in a contiguous float32 NumPy matrix.
+
+    Searches are exact by default: one matrix-vector product scores every document and `argpartition` selects the
+    top results. With a `path`, the matrix is persisted in a memory-mapped file and the documents in a JSON lines
+    file next to it. Metadata filters are answered from an in-memory index of the metadata values, and an optional
+    `Ivf` index restricts searches of large collections to the clusters nearest to the query.
+
+    Upserts to a persisted collection append the replacement documents and mark the rows they replace as dead, the
+    files are only rewritten once the dead rows make up `COMPACT_DEAD_FRACTION` of the collection.
+
+    Args:
+        collection: Name of the collection.
+        embedder: Embedder for the documents and queries. Defaults to OpenAIEmbedder.
+        distance: Distance metric used to rank the documents.
+        path: Directory the collection is persisted in. If None, the collection only lives in memory.
+        index: Approximate index for large collections. If None, every search is exact.
+        reranker: Reranker applied to the search results.
+    """
+
+    def __init__(
+        self,
+        collection: str,
+        embedder: Optional[Embedder] = None,
+        distance: Distance = Distance.cosine,
+        path: Optional[str] = None,
+        index: Optional[Ivf] = None,
+        reranker: Optional[Reranker] = None,
+    ):
+        self.collection_name: str = collection
+
+        # Embedder for embedding the document contents
+        if embedder is None:
+            from agno.embedder.openai import OpenAIEmbedder
+
+            embedder = OpenAIEmbedder()
+            log_info("Embedder not provided, using OpenAIEmbedder as default.")
+        self.embedder: Embedder = embedder
+        self.distance: Distance = distance
+        self.path: Optional[Path] = Path(path) / collection if path is not None else None
+        self.index: Optional[Ivf] = index
+        self.reranker: Optional[Reranker] = reranker
+
+        # Embedding of each document, rows past _count are preallocated
+        self._vectors: Optional[np.ndarray] = None
+        self._squared_norms: np.ndarray = np.zeros(0, dtype=np.float32)
+        # Rows that are not replaced by a later row with the same id, and the number of replaced rows
+        self._live: np.ndarray = np.zeros(0, dtype=bool)
+        self._dead_count: int = 0
+        self._count: int = 0
+        self._records: List[Dict[str, Any]] = []
+        self._created: bool = False
+        # Generation of the persisted files listed in the manifest, and of the vectors file currently mapped. They
+        # differ while the collection is being rewritten to the files of the next generation.
+        self._generation: int = 0
+        self._vectors_generation: int = 0
+
+        # Row of each document id, and number of documents per content hash and per name
+        self._rows_by_id: Dict[str, int] = {}
+        self._content_hashes: Counter = Counter()
+        self._names: Counter = Counter()
+        # Rows of the documents with each value of a metadata key
+        self._metadata_index: Dict[str, Dict[Hashable, Set[int]]] = {}
+
+        # Centroids of the clusters of the index and the cluster of each row, built on the first large search
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments: np.ndarray = np.zeros(0, dtype=np.int32)
+
+        self._lock = RLock()
+
+    def _get_file(self, name: str) -> Path:
+        return self.path / name  # type: ignore
+
+    def _get_data_file(self, name: str, generation: int) -> Path:
+        """Path of the vectors or documents file of a generation of the collection"""
+        if generation == 0:
+            return self._get_file(name)
+        stem, suffix = name.split(".", 1)
+        return self._get_file(f"{stem}.{generation}.{suffix}")
+
+    def _write_manifest(self, dimensions: Optional[int]) -> None:
+        """Write the manifest, replacing it atomically"""
+        temp_file = self._get_file(MANIFEST_FILE + ".tmp")
+        temp_file.write_text(
+            json.dumps({"dimensions": dimensions, "distance": self.distance.value, "generation": self._generation})
+        )
+        os.replace(temp_file, self._get_file(MANIFEST_FILE))
+
+    def _write_records(self, generation: int) -> None:
+        with self._get_data_file(DOCUMENTS_FILE, generation).open("w", encoding="utf-8") as f:
+            for record in self._records[: self._count]:
+                f.write(json.dumps(record, default=str, ensure_ascii=False) + "\n")
+
+    def _append_records(self, records: List[Dict[str, Any]]) -> None:
+        with self._get_data_file(DOCUMENTS_FILE, self._generation).open("a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, default=str, ensure_ascii=False) + "\n")
+
+    def _load(self) -> None:
+        """Load a persisted collection, memory-mapping its embeddings"""
+        manifest = json.loads(self._get_file(MANIFEST_FILE).read_text())
+        self._generation = self._vectors_generation = manifest.get("generation", 0)
+        # Remove the files of a rewrite interrupted before it was committed, or of the generation it replaced
+        for name in (VECTORS_FILE, DOCUMENTS_FILE):
+            self._get_data_file(name, self._generation + 1).unlink(missing_ok=True)
+            if self._generation > 0:
+                self._get_data_file(name, self._generation - 1).unlink(missing_ok=True)
+        with self._get_data_file(DOCUMENTS_FILE, self._generation).open("r", encoding="utf-8") as f:
+            self._records = [json.loads(line) for line in f if line.strip()]
+        self._count = len(self._records)
+
+        dimensions = manifest.get("dimensions")
+        if dimensions:
+            vectors_file = self._get_data_file(VECTORS_FILE, self._generation)
+            capacity = vectors_file.stat().st_size // (np.dtype(np.float32).itemsize * dimensions)
+            if capacity < self._count:
+                logger.warning(f"Embeddings missing for {self._count - capacity} documents, ignoring them")
+                self._records = self._records[:capacity]
+                self._count = capacity
+            self._vectors = np.memmap(vectors_file, dtype=np.float32, mode="r+", shape=(capacity, dimensions))
+            self._squared_norms = np.zeros(capacity, dtype=np.float32)
+            self._squared_norms[: self._count] = np.einsum(
+                "ij,ij->i", self._vectors[: self._count], self._vectors[: self._count]
+            )
+            # The last row written for an id replaces the earlier ones
+            self._live = np.zeros(capacity, dtype=bool)
+            self._live[list({record["id"]: row for row, record in enumerate(self._records)}.values())] = True
+            self._dead_count = self._count - int(self._live.sum())
+        self._rebuild_indexes()
+        log_debug(f"Loaded {self._count} documents from {self.path}")
+
+    def create(self) -> None:
+        """Create the collection, or load it if it is persisted."""
+        with self._lock:
+            if self._created:
+                return
+            if self.path is not None:
+                if self._get_file(MANIFEST_FILE).exists():
+                    self._load()
+                else:
+                    log_debug(f"Creating collection: {self.collection_name}")
+                    self.path.mkdir(parents=True, exist_ok=True)
+                    self._get_file(DOCUMENTS_FILE).touch()
+                    self._write_manifest(None)
+            self._created = True
+
+    async def async_create(self) -> None:
+        """Create the collection asynchronously by running in a thread."""
+        await asyncio.to_thread(self.create)
+
+    def _load_if_persisted(self) -> None:
+        """Load a persisted collection on first use"""
+        if not self._created and self.exists():
+            self.create()
+
+    def _reserve(self, rows: int, dimensions: int) -> None:
+        """Make room for `rows` more embeddings, growing the matrix geometrically"""
+        capacity = self._vectors.shape[0] if self._vectors is not None else 0
+        if self._vectors is not None and self._vectors.shape[1] != dimensions:
+            raise ValueError(
+                f"Embedding dimensions ({dimensions}) do not match the collection ({self._vectors.shape[1]})"
+            )
+        if self._count + rows <= capacity:
+            return
+
+        new_capacity = max(self._count + rows, 2 * capacity, INITIAL_CAPACITY)
+        log_debug(f"Growing collection {self.collection_name} to {new_capacity} rows")
+        if self.path is None:
+            vectors = np.zeros((new_capacity, dimensions), dtype=np.float32)
+            if self._vectors is not None:
+                vectors[: self._count] = self._vectors[: self._count]
+        else:
+            # Copy the embeddings to a larger file and swap it in
+            vectors_file = self._get_data_file(VECTORS_FILE, self._vectors_generation)
+            temp_file = self._get_file(VECTORS_FILE + ".tmp")
+            new_vectors = np.memmap(temp_file, dtype=np.float32, mode="w+", shape=(new_capacity, dimensions))
+            if self._vectors is not None:
+                new_vectors[: self._count] = self._vectors[: self._count]
+            new_vectors.flush()
+            del new_vectors
+            self._vectors = None
+            os.replace(temp_file, vectors_file)
+            vectors = np.memmap(vectors_file, dtype=np.float32, mode="r+", shape=(new_capacity, dimensions))
+            self._write_manifest(dimensions)
+        self._vectors = vectors
+
+        squared_norms = np.zeros(new_capacity, dtype=np.float32)
+        squared_norms[: self._count] = self._squared_norms[: self._count]
+        self._squared_norms = squared_norms
+        live = np.zeros(new_capacity, dtype=bool)
+        live[: self._count] = self._live[: self._count]
+        self._live = live
+
+    def _start_rewrite(self, rows: np.ndarray) -> None:
+        """Copy the embeddings of `rows` to the vectors file of the next generation and map it.
+
+        Changes made afterwards only reach the files of the next generation, which replace the current ones when the
+        rewrite is committed. A crash before then leaves the current files untouched.
+        """
+        generation = self._generation + 1
+        self._vectors_generation = generation
+        if self._vectors is None:
+            return
+        vectors = np.memmap(
+            self._get_data_file(VECTORS_FILE, generation), dtype=np.float32, mode="w+", shape=self._vectors.shape
+        )
+        for start in range(0, len(rows), ASSIGN_BATCH_SIZE):
+            batch = rows[start : start + ASSIGN_BATCH_SIZE]
+            vectors[start : start + len(batch)] = self._vectors[batch]
+        self._vectors = vectors
+
+    def _commit_rewrite(self) -> None:
+        """Write the documents of the next generation and switch the manifest to it"""
+        previous_generation, generation = self._generation, self._vectors_generation
+        if self._vectors is not None:
+            self._vectors.flush()  # type: ignore
+        self._write_records(generation)
+        self._generation = generation
+        self._write_manifest(self._vectors.shape[1] if self._vectors is not None else None)
+        for name in (VECTORS_FILE, DOCUMENTS_FILE):
+            self._get_data_file(name, previous_generation).unlink(missing_ok=True)
+
+    def _index_row(self, row: int) -> None:
+        record = self._records[row]
+        self._rows_by_id[record["id"]] = row
+        self._content_hashes[record["content_hash"]] += 1
+        if record["name"]:
+            self._names[record["name"]] += 1
+        for key, value in (record["meta_data"] or {}).items():
+            self._metadata_index.setdefault(key, {}).setdefault(_get_index_key(value), set()).add(row)
+
+    def _unindex_row(self, row: int) -> None:
+        record = self._records[row]
+        self._rows_by_id.pop(record["id"], None)
+        _decrement(self._content_hashes, record["content_hash"])
+        if record["name"]:
+            _decrement(self._names, record["name"])
+        for key, value in (record["meta_data"] or {}).items():
+            self._metadata_index.get(key, {}).get(_get_index_key(value), set()).discard(row)
+
+    def _rebuild_indexes(self) -> None:
+        self._rows_by_id = {}
+        self._content_hashes = Counter()
+        self._names = Counter()
+        self._metadata_index = {}
+        for row in np.flatnonzero(self._live[: self._count]).tolist():
+            self._index_row(row)
+
+    def _get_document_record(self, document: Document, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        content_hash = safe_content_hash(document.content)
+        meta_data = dict(document.meta_data or {})
+        if filters:
+            meta_data.update(filters)
+        return {
+            "id": document.id or content_hash,
+            "name": document.name,
+            "meta_data": meta_data,
+            "content": document.content,
+            "usage": document.usage,
+            "content_hash": content_hash,
+        }
+
+    def _set_row(self, row: int, embedding: np.ndarray) -> None:
+        self._vectors[row] = embedding  # type: ignore
+        self._squared_norms[row] = embedding @ embedding
+        if self._centroids is not None:
+            self._assignments[row] = self._assign_clusters(embedding[None, :])[0]
+
+    def _write_documents(
+        self, documents: List[Document], filters: Optional[Dict[str, Any]] = None, upsert: bool = False
+    ) -> None:
+        """Add embedded documents to the collection. Existing documents are replaced if upserting, else skipped."""
+        with self._lock:
+            self.create()
+            new_records: List[Dict[str, Any]] = []
+            new_embeddings: List[List[float]] = []
+            new_rows: Dict[str, int] = {}
+            for document in documents:
+                if document.embedding is None:
+                    logger.error(f"Document '{document.name}' has no embedding, skipping it")
+                    continue
+                record = self._get_document_record(document, filters)
+                row = self._rows_by_id.get(record["id"])
+                if row is not None:
+                    if upsert:
+                        self._reserve(0, len(document.embedding))
+                        self._unindex_row(row)
+                        if self.path is None:
+                            self._records[row] = record
+                            self._set_row(row, np.asarray(document.embedding, dtype=np.float32))
+                            self._index_row(row)
+                        else:
+                            # Persisted files are only appended to, the replacement is written as a new row
+                            self._live[row] = False
+                            self._dead_count += 1
+                            new_rows[record["id"]] = len(new_records)
+                            new_records.append(record)
+                            new_embeddings.append(document.embedding)
+                    else:
+                        log_debug(f"Document already exists: {record['id']}")
+                elif record["id"] in new_rows:
+                    if upsert:
+                        new_records[new_rows[record["id"]]] = record
+                        new_embeddings[new_rows[record["id"]]] = document.embedding
+                else:
+                    new_rows[record["id"]] = len(new_records)
+                    new_records.append(record)
+                    new_embeddings.append(document.embedding)
+
+            if new_records:
+                embeddings = np.asarray(new_embeddings, dtype=np.float32)
+                self._reserve(len(new_records), embeddings.shape[1])
+                start, end = self._count, self._count + len(new_records)
+                self._vectors[start:end] = embeddings  # type: ignore
+                self._squared_norms[start:end] = np.einsum("ij,ij->i", embeddings, embeddings)
+                self._live[start:end] = True
+                if self._centroids is not None:
+                    self._assignments = np.concatenate([self._assignments[:start], self._assign_clusters(embeddings)])
+                if self.path is not None:
+                    # Embeddings are written before the documents, so every persisted document has its embedding
+                    self._vectors.flush()  # type: ignore
+                    self._append_records(new_records)
+                self._records[start:] = new_records
+                self._count = end
+                for row in range(start, end):
+                    self._index_row(row)
+            if self._dead_count > COMPACT_DEAD_FRACTION * self._count:
+                log_debug(f"Compacting {self._dead_count} replaced documents of {self.collection_name}")
+                self._keep_rows(self._live[: self._count])
+            log_debug(
+                f"Added {len(new_records)} documents to {self.collection_name}, "
+                f"{self._count - self._dead_count} in total"
+            )
+
+    def doc_exists(self, document: Document) -> bool:
+        """Check if a document with the same content exists in the collection."""
+        self._load_if_persisted()
+        return safe_content_hash(document.content) in self._content_hashes
+
+    async def async_doc_exists(self, document: Document) -> bool:
+        return self.doc_exists(document)
+
+    def name_exists(self, name: str) -> bool:
+        """Check if a document with the given name exists in the collection."""
+        self._load_if_persisted()
+        return name in self._names
+
+    async def async_name_exists(self, name: str) -> bool:
+        return self.name_exists(name)
+
+    def id_exists(self, id: str) -> bool:
+        self._load_if_persisted()
+        return id in self._rows_by_id
+
+    def existing_content_hashes(self, content_hashes: List[str]) -> Set[str]:
+        self._load_if_persisted()
+        return {content_hash for content_hash in content_hashes if content_hash in self._content_hashes}
+
+    async def async_existing_content_hashes(self, content_hashes: List[str]) -> Set[str]:
+        return self.existing_content_hashes(content_hashes)
+
+    def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Embed documents and add them to the collection, skipping documents whose id already exists.
+
+        Args:
+            documents (List[Document]): List of documents to insert
+            filters (Optional[Dict[str, Any]]): Filters to merge with document metadata
+        """
+        Document.embed_many(documents, embedder=self.embedder)
+        self._write_documents(documents, filters)
+
+    async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        await Document.async_embed_many(documents, embedder=self.embedder)
+        await asyncio.to_thread(self._write_documents, documents, filters)
+
+    def upsert_available(self) -> bool:
+        return True
+
+    def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Embed documents and add them to the collection, replacing documents with the same id.
+
+        Args:
+            documents (List[Document]): List of documents to upsert
+            filters (Optional[Dict[str, Any]]): Filters to merge with document metadata
+        """
+        Document.embed_many(documents, embedder=self.embedder)
+        self._write_documents(documents, filters, upsert=True)
+
+    async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        await Document.async_embed_many(documents, embedder=self.embedder)
+        await asyncio.to_thread(self._write_documents, documents, filters, True)
+
+    def _get_filtered_rows(self, filters: Optional[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """Rows matching every filter, or None if there are no filters. A list of values matches any of them."""
+        if not filters:
+            return None
+        rows: Optional[Set[int]] = None
+        for key, value in filters.items():
+            values_index = self._metadata_index.get(key, {})
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            matches: Set[int] = set()
+            for v in values:
+                matches |= values_index.get(_get_index_key(v), set())
+            rows = matches if rows is None else rows & matches
+            if not rows:
+                break
+        return np.fromiter(sorted(rows or ()), dtype=np.int64)
+
+    def _get_scores(self, vectors: np.ndarray, squared_norms: np.ndarray, query: np.ndarray) -> np.ndarray:
+        """Similarity of each vector to the query, higher is more similar"""
+        dot_products = vectors @ query
+        if self.distance == Distance.max_inner_product:
+            return dot_products
+        if self.distance == Distance.l2:
+            return -(squared_norms - 2 * dot_products + query @ query)
+        return dot_products / np.maximum(np.sqrt(squared_norms) * np.linalg.norm(query), 1e-12)
+
+    def _get_cluster_vectors(self, vectors: np.ndarray) -> np.ndarray:
+        """Vectors as clustered by the index, normalized for the cosine distance"""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if self.distance == Distance.cosine:
+            return vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+        return vectors
+
+    @staticmethod
+    def _get_nearest_centroids(cluster_vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        # Nearest in L2 distance: argmin |c|^2 - 2 x.c
+        return np.argmin(np.einsum("ij,ij->i", centroids, centroids) - 2 * cluster_vectors @ centroids.T, axis=1)
+
+    def _assign_clusters(self, vectors: np.ndarray) -> np.ndarray:
+        """Cluster of each vector in the index"""
+        assignments = np.empty(len(vectors), dtype=np.int32)
+        for i in range(0, len(vectors), ASSIGN_BATCH_SIZE):
+            cluster_vectors = self._get_cluster_vectors(vectors[i : i + ASSIGN_BATCH_SIZE])
+            assignments[i : i + ASSIGN_BATCH_SIZE] = self._get_nearest_centroids(cluster_vectors, self._centroids)  # type: ignore
+        return assignments
+
+    def _train_index(self) -> None:
+        """Cluster the embeddings with k-means and assign every row to its cluster"""
+        if self.index is None or self._vectors is None or self._count == 0:
+            return
+        rng = np.random.default_rng(0)
+        live_rows = np.flatnonzero(self._live[: self._count])
+        sample_size = min(len(live_rows), self.index.train_sample_size)
+        sample_rows = np.sort(rng.choice(live_rows, size=sample_size, replace=False))
+        sample = self._get_cluster_vectors(self._vectors[sample_rows])
+        lists = min(self.index.lists, sample_size)
+        centroids = sample[rng.choice(sample_size, size=lists, replace=False)].copy()
+        for _ in range(self.index.train_iterations):
+            assignments = self._get_nearest_centroids(sample, centroids)
+            order = np.argsort(assignments, kind="stable")
+            counts = np.bincount(assignments, minlength=lists)
+            non_empty = np.flatnonzero(counts)
+            starts = np.concatenate([[0], np.cumsum(counts)[:-1]])[non_empty]
+            centroids[non_empty] = np.add.reduceat(sample[order], starts, axis=0) / counts[non_empty, None]
+        self._centroids = self._get_cluster_vectors(centroids) if self.distance == Distance.cosine else centroids
+        self._assignments = self._assign_clusters(self._vectors[: self._count])
+        log_debug(f"Trained index of {lists} clusters on {sample_size} documents")
+
+    def _get_probe_rows(self, query: np.ndarray) -> np.ndarray:
+        """Rows in the `probes` clusters nearest to the query"""
+        centroids: np.ndarray = self._centroids  # type: ignore
+        cluster_query = self._get_cluster_vectors(query[None, :])[0]
+        distances = np.einsum("ij,ij->i", centroids, centroids) - 2 * centroids @ cluster_query
+        probes = min(self.index.probes, len(centroids))  # type: ignore
+        nearest = np.argpartition(distances, probes - 1)[:probes]
+        return np.flatnonzero(np.isin(self._assignments[: self._count], nearest))
+
+    def _search_rows(
+        self, query_embedding: List[float], limit: int, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[int, float]]:
+        """Rows of the `limit` documents most similar to the query embedding, with their scores"""
+        if self._vectors is None or self._count == self._dead_count or limit <= 0:
+            return []
+        query = np.asarray(query_embedding, dtype=np.float32)
+        if query.shape[0] != self._vectors.shape[1]:
+            raise ValueError(
+                f"Query embedding dimensions ({query.shape[0]}) do not match the collection ({self._vectors.shape[1]})"
+            )
+
+        rows = self._get_filtered_rows(filters)
+        if self.index is not None:
+            if self._centroids is None and self._count >= self.index.min_rows:
+                self._train_index()
+            if self._centroids is not None:
+                probe_rows = self._get_probe_rows(query)
+                rows = probe_rows if rows is None else np.intersect1d(rows, probe_rows, assume_unique=True)
+                if self._dead_count:
+                    rows = rows[self._live[rows]]
+
+        if rows is None:
+            scores = self._get_scores(self._vectors[: self._count], self._squared_norms[: self._count], query)
+            if self._dead_count:
+                scores[~self._live[: self._count]] = -np.inf
+        elif len(rows) == 0:
+            return []
+        else:
+            scores = self._get_scores(self._vectors[rows], self._squared_norms[rows], query)
+
+        k = min(limit, len(scores) if rows is not None else self._count - self._dead_count)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        top_rows = top if rows is None else rows[top]
+        return list(zip(top_rows.tolist(), scores[top].tolist()))
+
+    def _get_document(self, row: int) -> Document:
+        record = self._records[row]
+        return Document(
+            id=record["id"],
+            name=record["name"],
+            meta_data=dict(record["meta_data"] or {}),
+            content=record["content"],
+            embedder=self.embedder,
+            embedding=self._vectors[row].tolist(),  # type: ignore
+            usage=record["usage"],
+        )
+
+    def vector_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """Return the documents most similar to the query.
+
+        Args:
+            query (str): Query to search for.
+            limit (int): Number of results to return.
+            filters (Optional[Dict[str, Any]]): Metadata values the documents must have. A list of values
+                matches documents with any of the values.
+        """
+        query_embedding = self.embedder.get_embedding(query)
+        if query_embedding is None:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+
+        with self._lock:
+            self._load_if_persisted()
+            return [self._get_document(row) for row, _ in self._search_rows(query_embedding, limit, filters)]
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        search_results = self.vector_search(query=query, limit=limit, filters=filters)
+        if self.reranker:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+
+        log_info(f"Found {len(search_results)} documents")
+        return search_results
+
+    async def async_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Search asynchronously by running in a thread."""
+        return await asyncio.to_thread(self.search, query, limit, filters)
+
+    def drop(self) -> None:
+        """Delete the collection and its files."""
+        with self._lock:
+            self._vectors = None
+            self._squared_norms = np.zeros(0, dtype=np.float32)
+            self._live = np.zeros(0, dtype=bool)
+            self._dead_count = 0
+            self._count = 0
+            self._records = []
+            self._centroids = None
+            self._assignments = np.zeros(0, dtype=np.int32)
+            self._rebuild_indexes()
+            self._created = False
+            self._generation = self._vectors_generation = 0
+            if self.path is not None and self.path.exists():
+                log_debug(f"Deleting collection: {self.collection_name}")
+                shutil.rmtree(self.path)
+
+    async def async_drop(self) -> None:
+        await asyncio.to_thread(self.drop)
+
+    def exists(self) -> bool:
+        if self.path is not None:
+            return self._get_file(MANIFEST_FILE).exists()
+        return self._created
+
+    async def async_exists(self) -> bool:
+        return self.exists()
+
+    def get_count(self) -> int:
+        self._load_if_persisted()
+        return self._count - self._dead_count
+
+    def optimize(self) -> None:
+        """Retrain the index on the current documents."""
+        with self._lock:
+            self._train_index()
+
+    def _keep_rows(self, keep: np.ndarray) -> None:
+        """Compact the collection to the rows where `keep` is True"""
+        kept_rows = np.flatnonzero(keep)
+        if self.path is not None:
+            self._start_rewrite(kept_rows)
+        elif self._vectors is not None:
+            self._vectors[: len(kept_rows)] = self._vectors[kept_rows]
+        if self._vectors is not None:
+            self._squared_norms[: len(kept_rows)] = self._squared_norms[kept_rows]
+        if self._centroids is not None:
+            self._assignments = self._assignments[kept_rows]
+        self._records = [self._records[row] for row in kept_rows]
+        self._count = len(kept_rows)
+        self._live[:] = False
+        self._live[: self._count] = True
+        self._dead_count = 0
+        self._rebuild_indexes()
+        if self.path is not None:
+            self._commit_rewrite()
+
+    def delete(self) -> bool:
+        """Delete all documents from the collection."""
+        with self._lock:
+            if not self.exists():
+                return False
+            self._load_if_persisted()
+            self._keep_rows(np.zeros(self._count, dtype=bool))
+            self._centroids = None
+            return True
+
+    def delete_by_content_hashes(self, content_hashes: List[str]) -> bool:
+        with self._lock:
+            self._load_if_persisted()
+            hashes = set(content_hashes)
+            keep = self._live[: self._count] & np.fromiter(
+                (record["content_hash"] not in hashes for record in self._records[: self._count]),
+                dtype=bool,
+                count=self._count,
+            )
+            if not keep.all():
+                self._keep_rows(keep)
+            return True
@@ -1,6 +1,6 @@
 import json
 from hashlib import md5
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Union
 
 try:
     import asyncio
@@ -328,6 +328,33 @@ class Milvus(VectorDb):
         )
         return len(collection_points) > 0
 
+    def existing_content_hashes(self, content_hashes: List[str]) -> Set[str]:
+        """
+        Return the content hashes that already exist in the collection, using a single request
+
+        Args:
+            content_hashes (List[str]): Content hashes to check
+        """
+        if not content_hashes or not self.client:
+            return set()
+        collection_points = self.client.get(
+            collection_name=self.collection,
+            ids=content_hashes,
+            output_fields=["id"],
+        )
+        return {point["id"] for point in collection_points}
+
+    async def async_existing_content_hashes(self, content_hashes: List[str]) -> Set[str]:
+        """Return the content hashes that already exist in the collection asynchronously."""
+        if not content_hashes:
+            return set()
+        collection_points = await self.async_client.get(
+            collection_name=self.collection,
+            ids=content_hashes,
+            output_fields=["id"],
+        )
+        return {point["id"] for point in collection_points}
+
     def name_exists(self, name: str) -> bool:
         """
         Validates if a document with the given name exists in the collection.
@@ -380,13 +407,13 @@ class Milvus(VectorDb):
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """Insert documents based on search type."""
         log_debug(f"Inserting {len(documents)} documents")
+        Document.embed_many(documents, embedder=self.embedder)
 
         if self.search_type == SearchType.hybrid:
             for document in documents:
                 self._insert_hybrid_document(document)
         else:
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 doc_id = md5(cleaned_content.encode()).hexdigest()
 
@@ -413,13 +440,13 @@ class Milvus(VectorDb):
     async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """Insert documents asynchronously based on search type."""
         log_debug(f"Inserting {len(documents)} documents asynchronously")
+        await Document.async_embed_many(documents, embedder=self.embedder)
 
         if self.search_type == SearchType.hybrid:
             await asyncio.gather(*[self._async_insert_hybrid_document(doc) for doc in documents])
         else:
 
             async def process_document(document):
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 doc_id = md5(cleaned_content.encode()).hexdigest()
 
@@ -464,8 +491,8 @@ class Milvus(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to apply while upserting
         """
         log_debug(f"Upserting {len(documents)} documents")
+        Document.embed_many(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             data = {
@@ -484,9 +511,9 @@ class Milvus(VectorDb):
 
     async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         log_debug(f"Upserting {len(documents)} documents asynchronously")
+        await Document.async_embed_many(documents, embedder=self.embedder)
 
         async def process_document(document):
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             data = {
@@ -818,6 +845,15 @@ class Milvus(VectorDb):
             return True
         return False
 
+    def delete_by_content_hashes(self, content_hashes: List[str]) -> bool:
+        if self.client:
+            try:
+                self.client.delete(collection_name=self.collection, ids=content_hashes)
+                return True
+            except Exception as e:
+                logger.error(f"Error deleting documents: {e}")
+        return False
+
     def _build_expr(self, filters: Optional[Dict[str, Any]]) -> Optional[str]:
         """Build Milvus expression from filters."""
         if not filters:
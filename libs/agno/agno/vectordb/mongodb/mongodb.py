@@ -1,6 +1,6 @@
 import asyncio
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from bson import ObjectId
 
@@ -463,6 +463,17 @@ class MongoDb(VectorDb):
             logger.error(f"Error checking document existence: {e}")
             return False
 
+    def existing_content_hashes(self, content_hashes: List[str]) -> Set[str]:
+        """Return the content hashes that already exist in the collection, using a single query."""
+        if not content_hashes:
+            return set()
+        try:
+            collection = self._get_collection()
+            return {doc["_id"] for doc in collection.find({"_id": {"$in": content_hashes}}, {"_id": 1})}
+        except Exception as e:
+            logger.error(f"Error checking document existence: {e}")
+            return set()
+
     def name_exists(self, name: str) -> bool:
         """Check if a document with a given name exists in the collection."""
         try:
@@ -489,6 +500,7 @@ class MongoDb(VectorDb):
         """Insert documents into the MongoDB collection."""
         log_debug(f"Inserting {len(documents)} documents")
         collection = self._get_collection()
+        Document.embed_many(documents, embedder=self.embedder)
 
         prepared_docs = []
         for document in documents:
@@ -513,6 +525,7 @@ class MongoDb(VectorDb):
         """Upsert documents into the MongoDB collection."""
         log_info(f"Upserting {len(documents)} documents")
         collection = self._get_collection()
+        Document.embed_many(documents, embedder=self.embedder)
 
         for document in documents:
             try:
@@ -914,9 +927,21 @@ class MongoDb(VectorDb):
         # Return True if collection doesn't exist (nothing to delete)
         return True
 
+    def delete_by_content_hashes(self, content_hashes: List[str]) -> bool:
+        """Delete the documents with the given content hashes from the collection."""
+        try:
+            collection = self._get_collection()
+            result = collection.delete_many({"_id": {"$in": content_hashes}})
+            log_info(f"Deleted {result.deleted_count} documents from collection.")
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting documents: {e}")
+            return False
+
     def prepare_doc(self, document: Document, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Prepare a document for insertion or upsertion into MongoDB."""
-        document.embed(embedder=self.embedder)
+        if document.embedding is None:
+            document.embed(embedder=self.embedder)
         if document.embedding is None:
             raise ValueError(f"Failed to generate embedding for document: {document.id}")
 
@@ -962,10 +987,23 @@ class MongoDb(VectorDb):
             logger.error(f"Error checking document existence asynchronously: {e}")
             return False
 
+    async def async_existing_content_hashes(self, content_hashes: List[str]) -> Set[str]:
+        """Return the content hashes that already exist in the collection asynchronously."""
+        if not content_hashes:
+            return set()
+        try:
+            collection = await self._get_async_collection()
+            cursor = collection.find({"_id": {"$in": content_hashes}}, {"_id": 1})
+            return {doc["_id"] async for doc in cursor}
+        except Exception as e:
+            logger.error(f"Error checking document existence asynchronously: {e}")
+            return set()
+
     async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """Insert documents asynchronously."""
         log_debug(f"Inserting {len(documents)} documents asynchronously")
         collection = await self._get_async_collection()
+        await Document.async_embed_many(documents, embedder=self.embedder)
 
         prepared_docs = []
         for document in documents:
@@ -990,6 +1028,7 @@ class MongoDb(VectorDb):
         """Upsert documents asynchronously."""
         log_info(f"Upserting {len(documents)} documents asynchronously")
         collection = await self._get_async_collection()
+        await Document.async_embed_many(documents, embedder=self.embedder)
 
         for document in documents:
             try:
@@ -1,11 +1,12 @@
 from agno.vectordb.distance import Distance
 from agno.vectordb.pgvector.index import HNSW, Ivfflat
 from agno.vectordb.pgvector.pgvector import PgVector
-from agno.vectordb.search import SearchType
+from agno.vectordb.search import HybridMode, SearchType
 
 __all__ = [
     "Distance",
     "HNSW",
+    "HybridMode",
     "Ivfflat",
     "PgVector",
     "SearchType",
@@ -1,14 +1,15 @@
 import asyncio
 from math import sqrt
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set, Union, cast
 
 try:
     from sqlalchemy.dialects import postgresql
-    from sqlalchemy.engine import Engine, create_engine
+    from sqlalchemy.engine import Engine, Row, create_engine, make_url
+    from sqlalchemy.exc import ArgumentError
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session, scoped_session, sessionmaker
-    from sqlalchemy.schema import Column, Index, MetaData, Table
-    from sqlalchemy.sql.expression import bindparam, desc, func, select, text
+    from sqlalchemy.schema import Column, Computed, Index, MetaData, Table
+    from sqlalchemy.sql.expression import ColumnElement, Select, TextClause, bindparam, desc, func, select, text
     from sqlalchemy.types import DateTime, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install using `pip install sqlalchemy psycopg`")
@@ -21,12 +22,22 @@ except ImportError:
 from agno.document import Document
 from agno.embedder import Embedder
 from agno.reranker.base import Reranker
+from agno.utils.async_engine import dispose_async_engine
 from agno.utils.log import log_debug, log_info, logger
 from agno.utils.string import safe_content_hash
 from agno.vectordb.base import VectorDb
 from agno.vectordb.distance import Distance
 from agno.vectordb.pgvector.index import HNSW, Ivfflat
-from agno.vectordb.search import SearchType
+from agno.vectordb.search import HybridMode, SearchType
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+# SQLSTATE of the error raised when a table does not exist
+UNDEFINED_TABLE_SQLSTATE = "42P01"
+
+# Number of candidates each leg of a reciprocal rank fusion hybrid search returns, as a multiple of the limit
+RRF_CANDIDATE_MULTIPLIER = 4
 
 
 class PgVector(VectorDb):
@@ -53,6 +64,12 @@ class PgVector(VectorDb):
         schema_version: int = 1,
         auto_upgrade_schema: bool = False,
         reranker: Optional[Reranker] = None,
+        async_db_url: Optional[str] = None,
+        async_db_engine: Optional["AsyncEngine"] = None,
+        async_pool_size: int = 20,
+        async_max_overflow: int = 20,
+        hybrid_mode: HybridMode = HybridMode.weighted,
+        rrf_k: int = 60,
     ):
         """
         Initialize the PgVector instance.
@@ -71,6 +88,13 @@ class PgVector(VectorDb):
             content_language (str): Language for full-text search.
             schema_version (int): Version of the database schema.
             auto_upgrade_schema (bool): Automatically upgrade schema if True.
+            async_db_url (Optional[str]): Database connection URL for the async engine. Defaults to db_url with an async driver.
+            async_db_engine (Optional[AsyncEngine]): SQLAlchemy async database engine.
+            async_pool_size (int): Connection pool size of the async engine created from the URL.
+            async_max_overflow (int): Connections allowed above async_pool_size for the async engine created from the URL.
+            hybrid_mode (HybridMode): How hybrid search combines the vector and keyword scores. `weighted` scores every
+                row with a weighted sum, `rrf` fuses separate top-k vector and keyword searches by reciprocal rank.
+            rrf_k (int): Rank constant for reciprocal rank fusion. Higher values flatten the gap between top ranks.
         """
         if not table_name:
             raise ValueError("Table name must be provided.")
@@ -118,6 +142,10 @@ class PgVector(VectorDb):
         self.vector_score_weight: float = vector_score_weight
         # Content language for full-text search
         self.content_language: str = content_language
+        # How hybrid search combines the vector and keyword scores
+        self.hybrid_mode: HybridMode = hybrid_mode
+        # Rank constant for reciprocal rank fusion
+        self.rrf_k: int = rrf_k
 
         # Table schema version
         self.schema_version: int = schema_version
@@ -129,10 +157,106 @@ class PgVector(VectorDb):
 
         # Database session
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
+
+        # Async database settings. An async engine is created on first use in each event loop, so sync-only usage
+        # never opens one. Without an async engine, the async methods run the sync methods in a thread.
+        self.async_db_url: Optional[str] = async_db_url or (self._get_async_db_url(db_url) if db_url else None)
+        self.async_db_engine: Optional["AsyncEngine"] = async_db_engine
+        self.async_pool_size: int = async_pool_size
+        self.async_max_overflow: int = async_max_overflow
+        self._async_engines: Dict[asyncio.AbstractEventLoop, "AsyncEngine"] = {}
+        self._async_sessions: Dict[asyncio.AbstractEventLoop, "async_sessionmaker[AsyncSession]"] = {}
+        # Whether the table has the stored content_tsv column. Tables created before it existed fall back to
+        # tokenizing content at query time until the column is added by optimize() or auto_upgrade_schema.
+        self._content_tsv_exists: Optional[bool] = None
         # Database table
         self.table: Table = self.get_table()
         log_debug(f"Initialized PgVector with table '{self.schema}.{self.table_name}'")
 
+    @staticmethod
+    def _get_async_db_url(db_url: str) -> str:
+        """Return db_url with an async capable driver. psycopg (v3) is used unless an async driver is already set."""
+        url = make_url(db_url)
+        if url.drivername in ("postgresql", "postgresql+psycopg2", "postgresql+pg8000"):
+            url = url.set(drivername="postgresql+psycopg")
+        return url.render_as_string(hide_password=False)
+
+    @staticmethod
+    def _is_undefined_table_error(error: Exception) -> bool:
+        """Returns True if a database error was raised because the table does not exist (SQLSTATE 42P01)."""
+        db_error = getattr(error, "orig", None) or error
+        return UNDEFINED_TABLE_SQLSTATE in (getattr(db_error, "sqlstate", None), getattr(db_error, "pgcode", None))
+
+    def _get_async_engine(self) -> Optional["AsyncEngine"]:
+        """
+        Get the async engine of the running event loop, creating it on first use.
+        Async connections are bound to the event loop that opened them, so every event loop gets its own engine.
+        An async_db_engine passed to PgVector is used as is.
+
+        Returns:
+            Optional[AsyncEngine]: The async engine, or None if no async engine is configured.
+        """
+        if self.async_db_engine is not None:
+            return self.async_db_engine
+        if self.async_db_url is None:
+            return None
+
+        loop = asyncio.get_running_loop()
+        async_db_engine = self._async_engines.get(loop)
+        if async_db_engine is None:
+            from sqlalchemy.ext.asyncio import create_async_engine
+
+            try:
+                async_db_engine = create_async_engine(
+                    self.async_db_url,
+                    pool_size=self.async_pool_size,
+                    max_overflow=self.async_max_overflow,
+                    pool_pre_ping=True,
+                )
+            except (ImportError, ArgumentError) as e:
+                # The async driver is not installed or does not support the database URL
+                logger.warning(f"Failed to create async engine, falling back to the sync engine: {e}")
+                self.async_db_url = None
+                return None
+            except Exception as e:
+                logger.warning(f"Failed to create async engine, falling back to the sync engine for this call: {e}")
+                return None
+            # Drop and dispose the engines of event loops that have been closed, e.g. by earlier asyncio.run() calls
+            for closed_loop in [loop for loop in self._async_engines if loop.is_closed()]:
+                dispose_async_engine(self._async_engines.pop(closed_loop))
+                self._async_sessions.pop(closed_loop, None)
+            self._async_engines[loop] = async_db_engine
+        return async_db_engine
+
+    def get_async_session(self) -> Optional["async_sessionmaker[AsyncSession]"]:
+        """
+        Get the async session factory of the running event loop, creating the async engine on first use.
+
+        Returns:
+            Optional[async_sessionmaker[AsyncSession]]: The async session factory, or None if no async engine is configured.
+        """
+        if self.async_db_engine is None and self.async_db_url is None:
+            return None
+        try:
+            from sqlalchemy.ext.asyncio import async_sessionmaker
+        except ImportError:
+            logger.warning(
+                "`greenlet` not installed, falling back to the sync engine. Please install using `pip install greenlet`"
+            )
+            self.async_db_url = None
+            self.async_db_engine = None
+            return None
+
+        async_db_engine = self._get_async_engine()
+        if async_db_engine is None:
+            return None
+        loop = asyncio.get_running_loop()
+        async_session = self._async_sessions.get(loop)
+        if async_session is None:
+            async_session = async_sessionmaker(bind=async_db_engine, expire_on_commit=False)
+            self._async_sessions[loop] = async_session
+        return async_session
+
     def get_table_v1(self) -> Table:
         """
         Get the SQLAlchemy Table object for schema version 1.
@@ -155,6 +279,7 @@ class PgVector(VectorDb):
             Column("created_at", DateTime(timezone=True), server_default=func.now()),
             Column("updated_at", DateTime(timezone=True), onupdate=func.now()),
             Column("content_hash", String),
+            Column("content_tsv", postgresql.TSVECTOR, Computed(self._get_tsvector_expression(), persisted=True)),
             extend_existing=True,
         )
 
@@ -162,6 +287,7 @@ class PgVector(VectorDb):
         Index(f"idx_{self.table_name}_id", table.c.id)
         Index(f"idx_{self.table_name}_name", table.c.name)
         Index(f"idx_{self.table_name}_content_hash", table.c.content_hash)
+        Index(self._get_gin_index_name(), table.c.content_tsv, postgresql_using="gin")
 
         return table
 
@@ -177,6 +303,68 @@ class PgVector(VectorDb):
         else:
             raise NotImplementedError(f"Unsupported schema version: {self.schema_version}")
 
+    def _get_tsvector_expression(self) -> str:
+        """Get the SQL expression that generates the stored content_tsv column."""
+        content_language = self.content_language.replace("'", "''")
+        return f"to_tsvector('{content_language}'::regconfig, content)"
+
+    def _get_gin_index_name(self) -> str:
+        """Get the name of the GIN index on the content_tsv column."""
+        return f"idx_{self.table_name}_content_tsv"
+
+    def _get_add_content_tsv_column_statement(self) -> TextClause:
+        """Get the statement that adds the stored content_tsv column to a table created before it existed."""
+        return text(
+            f"ALTER TABLE {self.table.fullname} ADD COLUMN IF NOT EXISTS content_tsv tsvector "
+            f"GENERATED ALWAYS AS ({self._get_tsvector_expression()}) STORED;"
+        )
+
+    def _content_tsv_column_exists(self) -> bool:
+        """
+        Check if the table has the stored content_tsv column. The result is cached once the table exists.
+
+        Returns:
+            bool: True if the column exists, False otherwise.
+        """
+        if self._content_tsv_exists is None:
+            try:
+                columns = inspect(self.db_engine).get_columns(self.table_name, schema=self.schema)
+            except Exception as e:
+                log_debug(f"Could not check for column 'content_tsv': {e}")
+                return False
+            self._content_tsv_exists = any(column["name"] == "content_tsv" for column in columns)
+        return self._content_tsv_exists
+
+    async def _async_content_tsv_column_exists(self) -> bool:
+        """
+        Check if the table has the stored content_tsv column using the async engine.
+        The result is cached once the table exists.
+
+        Returns:
+            bool: True if the column exists, False otherwise.
+        """
+        if self._content_tsv_exists is None:
+            try:
+                async with self._get_async_engine().connect() as conn:  # type: ignore
+                    columns = await conn.run_sync(
+                        lambda sync_conn: inspect(sync_conn).get_columns(self.table_name, schema=self.schema)
+                    )
+            except Exception as e:
+                log_debug(f"Could not check for column 'content_tsv': {e}")
+                return False
+            self._content_tsv_exists = any(column["name"] == "content_tsv" for column in columns)
+        return self._content_tsv_exists
+
+    def _add_content_tsv_column(self) -> None:
+        """
+        Add the stored content_tsv column to a table created before it existed.
+        Postgres rewrites the table to populate the column, so this is only done by optimize() or auto_upgrade_schema.
+        """
+        log_info(f"Adding column 'content_tsv' to table '{self.table.fullname}'.")
+        with self.Session() as sess, sess.begin():
+            sess.execute(self._get_add_content_tsv_column_statement())
+        self._content_tsv_exists = True
+
     def table_exists(self) -> bool:
         """
         Check if the table exists in the database.
@@ -204,10 +392,52 @@ class PgVector(VectorDb):
                     sess.execute(text(f"CREATE SCHEMA IF NOT EXISTS {self.schema};"))
             log_debug(f"Creating table: {self.table_name}")
             self.table.create(self.db_engine)
+            self._content_tsv_exists = True
+        elif self.auto_upgrade_schema and not self._content_tsv_column_exists():
+            self._add_content_tsv_column()
+
+    async def _async_table_exists(self) -> bool:
+        """
+        Check if the table exists in the database using the async engine.
+
+        Returns:
+            bool: True if the table exists, False otherwise.
+        """
+        log_debug(f"Checking if table '{self.table.fullname}' exists.")
+        try:
+            async with self._get_async_engine().connect() as conn:  # type: ignore
+                return await conn.run_sync(
+                    lambda sync_conn: inspect(sync_conn).has_table(self.table_name, schema=self.schema)
+                )
+        except Exception as e:
+            logger.error(f"Error checking if table exists: {e}")
+            raise
 
     async def async_create(self) -> None:
-        """Create the table asynchronously by running in a thread."""
-        await asyncio.to_thread(self.create)
+        """
+        Create the table if it does not exist, using the async engine when available.
+        """
+        async_session = self.get_async_session()
+        if async_session is None:
+            await asyncio.to_thread(self.create)
+            return
+
+        if not await self._async_table_exists():
+            async with async_session() as sess, sess.begin():
+                log_debug("Creating extension: vector")
+                await sess.execute(text("CREATE EXTENSION IF NOT EXISTS vector;"))
+                if self.schema is not None:
+                    log_debug(f"Creating schema: {self.schema}")
+                    await sess.execute(text(f"CREATE SCHEMA IF NOT EXISTS {self.schema};"))
+            log_debug(f"Creating table: {self.table_name}")
+            async with self._get_async_engine().begin() as conn:  # type: ignore
+                await conn.run_sync(self.table.create)
+            self._content_tsv_exists = True
+        elif self.auto_upgrade_schema and not await self._async_content_tsv_column_exists():
+            log_info(f"Adding column 'content_tsv' to table '{self.table.fullname}'.")
+            async with async_session() as sess, sess.begin():
+                await sess.execute(self._get_add_content_tsv_column_statement())
+            self._content_tsv_exists = True
 
     def _record_exists(self, column, value) -> bool:
         """
@@ -229,6 +459,26 @@ class PgVector(VectorDb):
             logger.error(f"Error checking if record exists: {e}")
             return False
 
+    async def _async_record_exists(self, column, value) -> bool:
+        """
+        Check if a record with the given column value exists in the table using the async engine.
+
+        Args:
+            column: The column to check.
+            value: The value to search for.
+
+        Returns:
+            bool: True if the record exists, False otherwise.
+        """
+        try:
+            async with self.get_async_session()() as sess, sess.begin():  # type: ignore
+                stmt = select(1).where(column == value).limit(1)
+                result = (await sess.execute(stmt)).first()
+                return result is not None
+        except Exception as e:
+            logger.error(f"Error checking if record exists: {e}")
+            raise
+
     def doc_exists(self, document: Document) -> bool:
         """
         Check if a document with the same content hash exists in the table.
@@ -243,8 +493,39 @@ class PgVector(VectorDb):
         return self._record_exists(self.table.c.content_hash, content_hash)
 
     async def async_doc_exists(self, document: Document) -> bool:
-        """Check if document exists asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.doc_exists, document)
+        """
+        Check if a document with the same content hash exists in the table, using the async engine when available.
+
+        Args:
+            document (Document): The document to check.
+
+        Returns:
+            bool: True if the document exists, False otherwise.
+        """
+        if self.get_async_session() is None:
+            return await asyncio.to_thread(self.doc_exists, document)
+        content_hash = safe_content_hash(document.content)
+        return await self._async_record_exists(self.table.c.content_hash, content_hash)
+
+    def existing_content_hashes(self, content_hashes: List[str]) -> Set[str]:
+        """
+        Return the content hashes that already exist in the table, using a single query.
+
+        Args:
+            content_hashes (List[str]): The content hashes to check.
+
+        Returns:
+            Set[str]: The subset of content hashes that exist in the table.
+        """
+        if not content_hashes:
+            return set()
+        try:
+            with self.Session() as sess, sess.begin():
+                stmt = select(self.table.c.content_hash).where(self.table.c.content_hash.in_(content_hashes))
+                return {row[0] for row in sess.execute(stmt)}
+        except Exception as e:
+            logger.error(f"Error checking if records exist: {e}")
+            return set()
 
     def name_exists(self, name: str) -> bool:
         """
@@ -259,8 +540,18 @@ class PgVector(VectorDb):
         return self._record_exists(self.table.c.name, name)
 
     async def async_name_exists(self, name: str) -> bool:
-        """Check if name exists asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.name_exists, name)
+        """
+        Check if a document with the given name exists in the table, using the async engine when available.
+
+        Args:
+            name (str): The name to check.
+
+        Returns:
+            bool: True if a document with the name exists, False otherwise.
+        """
+        if self.get_async_session() is None:
+            return await asyncio.to_thread(self.name_exists, name)
+        return await self._async_record_exists(self.table.c.name, name)
 
     def id_exists(self, id: str) -> bool:
         """
@@ -306,6 +597,9 @@ class PgVector(VectorDb):
                     batch_docs = documents[i : i + batch_size]
                     log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
+                        # Embed the batch in bulk, falling back to embedding each document on failure
+                        Document.embed_many(batch_docs, embedder=self.embedder)
+
                         # Prepare documents for insertion
                         batch_records = []
                         for doc in batch_docs:
@@ -327,9 +621,54 @@ class PgVector(VectorDb):
             logger.error(f"Error inserting documents: {e}")
             raise
 
-    async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
-        """Insert documents asynchronously by running in a thread."""
-        await asyncio.to_thread(self.insert, documents, filters)
+    async def async_insert(
+        self,
+        documents: List[Document],
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 100,
+    ) -> None:
+        """
+        Insert documents into the database, using the async engine when available.
+
+        Args:
+            documents (List[Document]): List of documents to insert.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the documents.
+            batch_size (int): Number of documents to insert in each batch.
+        """
+        async_session = self.get_async_session()
+        if async_session is None:
+            await asyncio.to_thread(self.insert, documents, filters)
+            return
+
+        try:
+            async with async_session() as sess:
+                for i in range(0, len(documents), batch_size):
+                    batch_docs = documents[i : i + batch_size]
+                    log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
+                    try:
+                        # Embed the batch in bulk, falling back to embedding each document on failure
+                        await Document.async_embed_many(batch_docs, embedder=self.embedder)
+
+                        # Prepare documents for insertion
+                        batch_records = []
+                        for doc in batch_docs:
+                            try:
+                                batch_records.append(self._get_document_record(doc, filters))
+                            except Exception as e:
+                                logger.error(f"Error processing document '{doc.name}': {e}")
+
+                        # Insert the batch of records
+                        insert_stmt = postgresql.insert(self.table)
+                        await sess.execute(insert_stmt, batch_records)
+                        await sess.commit()  # Commit batch independently
+                        log_info(f"Inserted batch of {len(batch_records)} documents.")
+                    except Exception as e:
+                        logger.error(f"Error with batch starting at index {i}: {e}")
+                        await sess.rollback()  # Rollback the current batch if there's an error
+                        raise
+        except Exception as e:
+            logger.error(f"Error inserting documents: {e}")
+            raise
 
     def upsert_available(self) -> bool:
         """
@@ -360,6 +699,9 @@ class PgVector(VectorDb):
                     batch_docs = documents[i : i + batch_size]
                     log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
+                        # Embed the batch in bulk, falling back to embedding each document on failure
+                        Document.embed_many(batch_docs, embedder=self.embedder)
+
                         # Prepare documents for upserting
                         batch_records = []
                         for doc in batch_docs:
@@ -369,20 +711,7 @@ class PgVector(VectorDb):
                                 logger.error(f"Error processing document '{doc.name}': {e}")
 
                         # Upsert the batch of records
-                        insert_stmt = postgresql.insert(self.table).values(batch_records)
-                        upsert_stmt = insert_stmt.on_conflict_do_update(
-                            index_elements=["id"],
-                            set_={
-                                "name": insert_stmt.excluded.name,
-                                "meta_data": insert_stmt.excluded.meta_data,
-                                "filters": insert_stmt.excluded.filters,
-                                "content": insert_stmt.excluded.content,
-                                "embedding": insert_stmt.excluded.embedding,
-                                "usage": insert_stmt.excluded.usage,
-                                "content_hash": insert_stmt.excluded.content_hash,
-                            },
-                        )
-                        sess.execute(upsert_stmt)
+                        sess.execute(self._get_upsert_statement(batch_records))
                         sess.commit()  # Commit batch independently
                         log_info(f"Upserted batch of {len(batch_records)} documents.")
                     except Exception as e:
@@ -393,8 +722,25 @@ class PgVector(VectorDb):
             logger.error(f"Error upserting documents: {e}")
             raise
 
+    def _get_upsert_statement(self, batch_records: List[Dict[str, Any]]):
+        """Build the statement that upserts a batch of records, updating existing rows with the same id."""
+        insert_stmt = postgresql.insert(self.table).values(batch_records)
+        return insert_stmt.on_conflict_do_update(
+            index_elements=["id"],
+            set_={
+                "name": insert_stmt.excluded.name,
+                "meta_data": insert_stmt.excluded.meta_data,
+                "filters": insert_stmt.excluded.filters,
+                "content": insert_stmt.excluded.content,
+                "embedding": insert_stmt.excluded.embedding,
+                "usage": insert_stmt.excluded.usage,
+                "content_hash": insert_stmt.excluded.content_hash,
+            },
+        )
+
     def _get_document_record(self, doc: Document, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        doc.embed(embedder=self.embedder)
+        if doc.embedding is None:
+            doc.embed(embedder=self.embedder)
         cleaned_content = self._clean_content(doc.content)
         content_hash = safe_content_hash(doc.content)
         _id = doc.id or content_hash
@@ -414,9 +760,53 @@ class PgVector(VectorDb):
             "content_hash": content_hash,
         }
 
-    async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
-        """Upsert documents asynchronously by running in a thread."""
-        await asyncio.to_thread(self.upsert, documents, filters)
+    async def async_upsert(
+        self,
+        documents: List[Document],
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 100,
+    ) -> None:
+        """
+        Upsert (insert or update) documents in the database, using the async engine when available.
+
+        Args:
+            documents (List[Document]): List of documents to upsert.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the documents.
+            batch_size (int): Number of documents to upsert in each batch.
+        """
+        async_session = self.get_async_session()
+        if async_session is None:
+            await asyncio.to_thread(self.upsert, documents, filters)
+            return
+
+        try:
+            async with async_session() as sess:
+                for i in range(0, len(documents), batch_size):
+                    batch_docs = documents[i : i + batch_size]
+                    log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
+                    try:
+                        # Embed the batch in bulk, falling back to embedding each document on failure
+                        await Document.async_embed_many(batch_docs, embedder=self.embedder)
+
+                        # Prepare documents for upserting
+                        batch_records = []
+                        for doc in batch_docs:
+                            try:
+                                batch_records.append(self._get_document_record(doc, filters))
+                            except Exception as e:
+                                logger.error(f"Error processing document '{doc.name}': {e}")
+
+                        # Upsert the batch of records
+                        await sess.execute(self._get_upsert_statement(batch_records))
+                        await sess.commit()  # Commit batch independently
+                        log_info(f"Upserted batch of {len(batch_records)} documents.")
+                    except Exception as e:
+                        logger.error(f"Error with batch starting at index {i}: {e}")
+                        await sess.rollback()  # Rollback the current batch if there's an error
+                        raise
+        except Exception as e:
+            logger.error(f"Error upserting documents: {e}")
+            raise
 
     def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """
@@ -443,8 +833,119 @@ class PgVector(VectorDb):
     async def async_search(
         self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
-        """Search asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.search, query, limit, filters)
+        """
+        Perform a search based on the configured search type, using the async engine when available.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        if self.get_async_session() is None:
+            return await asyncio.to_thread(self.search, query, limit, filters)
+
+        if self.search_type == SearchType.vector:
+            return await self.async_vector_search(query=query, limit=limit, filters=filters)
+        elif self.search_type == SearchType.keyword:
+            return await self.async_keyword_search(query=query, limit=limit, filters=filters)
+        elif self.search_type == SearchType.hybrid:
+            return await self.async_hybrid_search(query=query, limit=limit, filters=filters)
+        else:
+            logger.error(f"Invalid search type '{self.search_type}'.")
+            return []
+
+    def _get_search_columns(self) -> List[Column]:
+        """Get the columns returned by a search."""
+        return [
+            self.table.c.id,
+            self.table.c.name,
+            self.table.c.meta_data,
+            self.table.c.content,
+            self.table.c.embedding,
+            self.table.c.usage,
+        ]
+
+    def _get_index_search_setting(self) -> Optional[TextClause]:
+        """Get the statement that applies the vector index search settings to the current transaction."""
+        if isinstance(self.vector_index, Ivfflat):
+            return text(f"SET LOCAL ivfflat.probes = {self.vector_index.probes}")
+        elif isinstance(self.vector_index, HNSW):
+            return text(f"SET LOCAL hnsw.ef_search = {self.vector_index.ef_search}")
+        return None
+
+    def _get_results_as_documents(self, results: Sequence[Row]) -> List[Document]:
+        """Convert the rows returned by a search to Document objects."""
+        search_results: List[Document] = []
+        for result in results:
+            search_results.append(
+                Document(
+                    id=result.id,
+                    name=result.name,
+                    meta_data=result.meta_data,
+                    content=result.content,
+                    embedder=self.embedder,
+                    embedding=result.embedding,
+                    usage=result.usage,
+                )
+            )
+        return search_results
+
+    def _get_vector_distance(self, query_embedding: List[float]) -> Optional[ColumnElement]:
+        """
+        Get the distance between the embedding column and the query embedding. Smaller distances are better.
+
+        Args:
+            query_embedding (List[float]): The embedding of the search query.
+
+        Returns:
+            Optional[ColumnElement]: The distance expression, or None if the distance metric is unknown.
+        """
+        if self.distance == Distance.l2:
+            return self.table.c.embedding.l2_distance(query_embedding)
+        elif self.distance == Distance.cosine:
+            return self.table.c.embedding.cosine_distance(query_embedding)
+        elif self.distance == Distance.max_inner_product:
+            # pgvector returns the negative inner product, so smaller is better here too
+            return self.table.c.embedding.max_inner_product(query_embedding)
+        logger.error(f"Unknown distance metric: {self.distance}")
+        return None
+
+    def _get_vector_search_statement(
+        self, query_embedding: List[float], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> Optional[Select]:
+        """
+        Build the statement for a vector similarity search.
+
+        Args:
+            query_embedding (List[float]): The embedding of the search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            Optional[Select]: The search statement, or None if the distance metric is unknown.
+        """
+        # Build the base statement
+        stmt = select(*self._get_search_columns())
+
+        # Apply filters if provided
+        if filters is not None:
+            stmt = stmt.where(self.table.c.meta_data.contains(filters))
+
+        # Order the results based on the distance metric
+        vector_distance = self._get_vector_distance(query_embedding)
+        if vector_distance is None:
+            return None
+        stmt = stmt.order_by(vector_distance)
+
+        # Limit the number of results
+        stmt = stmt.limit(limit)
+
+        # Log the query for debugging
+        log_debug(f"Vector search query: {stmt}")
+        return stmt
 
     def vector_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """
@@ -465,69 +966,83 @@ class PgVector(VectorDb):
                 logger.error(f"Error getting embedding for Query: {query}")
                 return []
 
-            # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
-
-            # Build the base statement
-            stmt = select(*columns)
-
-            # Apply filters if provided
-            if filters is not None:
-                stmt = stmt.where(self.table.c.meta_data.contains(filters))
-
-            # Order the results based on the distance metric
-            if self.distance == Distance.l2:
-                stmt = stmt.order_by(self.table.c.embedding.l2_distance(query_embedding))
-            elif self.distance == Distance.cosine:
-                stmt = stmt.order_by(self.table.c.embedding.cosine_distance(query_embedding))
-            elif self.distance == Distance.max_inner_product:
-                stmt = stmt.order_by(self.table.c.embedding.max_inner_product(query_embedding))
-            else:
-                logger.error(f"Unknown distance metric: {self.distance}")
+            stmt = self._get_vector_search_statement(query_embedding, limit=limit, filters=filters)
+            if stmt is None:
                 return []
 
-            # Limit the number of results
-            stmt = stmt.limit(limit)
-
-            # Log the query for debugging
-            log_debug(f"Vector search query: {stmt}")
-
             # Execute the query
             try:
                 with self.Session() as sess, sess.begin():
-                    if self.vector_index is not None:
-                        if isinstance(self.vector_index, Ivfflat):
-                            sess.execute(text(f"SET LOCAL ivfflat.probes = {self.vector_index.probes}"))
-                        elif isinstance(self.vector_index, HNSW):
-                            sess.execute(text(f"SET LOCAL hnsw.ef_search = {self.vector_index.ef_search}"))
+                    index_search_setting = self._get_index_search_setting()
+                    if index_search_setting is not None:
+                        sess.execute(index_search_setting)
                     results = sess.execute(stmt).fetchall()
             except Exception as e:
-                logger.error(f"Error performing semantic search: {e}")
-                logger.error("Table might not exist, creating for future use")
+                if not self._is_undefined_table_error(e):
+                    logger.error(f"Error performing semantic search: {e}")
+                    return []
+                logger.error("Table does not exist, creating for future use")
                 self.create()
                 return []
 
             # Process the results and convert to Document objects
-            search_results: List[Document] = []
-            for result in results:
-                search_results.append(
-                    Document(
-                        id=result.id,
-                        name=result.name,
-                        meta_data=result.meta_data,
-                        content=result.content,
-                        embedder=self.embedder,
-                        embedding=result.embedding,
-                        usage=result.usage,
-                    )
-                )
+            search_results = self._get_results_as_documents(results)
+
+            if self.reranker:
+                search_results = self.reranker.rerank(query=query, documents=search_results)
+
+            log_info(f"Found {len(search_results)} documents")
+            return search_results
+        except Exception as e:
+            logger.error(f"Error during vector search: {e}")
+            return []
+
+    async def async_vector_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """
+        Perform a vector similarity search using the async engine.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        async_session = self.get_async_session()
+        if async_session is None:
+            return await asyncio.to_thread(self.vector_search, query, limit, filters)
+
+        try:
+            # Get the embedding for the query string
+            query_embedding = await self._async_get_query_embedding(query)
+            if query_embedding is None:
+                logger.error(f"Error getting embedding for Query: {query}")
+                return []
+
+            stmt = self._get_vector_search_statement(query_embedding, limit=limit, filters=filters)
+            if stmt is None:
+                return []
+
+            # Execute the query
+            try:
+                async with async_session() as sess, sess.begin():
+                    index_search_setting = self._get_index_search_setting()
+                    if index_search_setting is not None:
+                        await sess.execute(index_search_setting)
+                    results = (await sess.execute(stmt)).fetchall()
+            except Exception as e:
+                if not self._is_undefined_table_error(e):
+                    logger.error(f"Error performing semantic search: {e}")
+                    return []
+                logger.error("Table does not exist, creating for future use")
+                await self.async_create()
+                return []
+
+            # Process the results and convert to Document objects
+            search_results = self._get_results_as_documents(results)
 
             if self.reranker:
                 search_results = self.reranker.rerank(query=query, documents=search_results)
@@ -538,6 +1053,11 @@ class PgVector(VectorDb):
             logger.error(f"Error during vector search: {e}")
             return []
 
+    async def _async_get_query_embedding(self, query: str) -> Optional[List[float]]:
+        """Get the embedding for the query string using the embedder's async API."""
+        embeddings, _ = await self.embedder.async_get_embeddings_batch_and_usage([query])
+        return embeddings[0] if embeddings else None
+
     def enable_prefix_matching(self, query: str) -> str:
         """
         Preprocess the query for prefix matching.
@@ -553,6 +1073,59 @@ class PgVector(VectorDb):
         processed_words = [word + "*" for word in words]
         return " ".join(processed_words)
 
+    def _get_ts_vector(self) -> ColumnElement:
+        """Get the text search vector, using the stored content_tsv column instead of tokenizing content per query."""
+        if self._content_tsv_exists:
+            return self.table.c.content_tsv
+        return func.to_tsvector(self.content_language, self.table.c.content)
+
+    def _get_ts_query(self, query: str) -> ColumnElement:
+        """Get the text search query for the search query using websearch_to_tsquery with parameter binding."""
+        processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
+        return func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
+
+    def _get_keyword_search_statement(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> Select:
+        """
+        Build the statement for a keyword search on the 'content' column.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            Select: The search statement.
+        """
+        # Build the base statement
+        stmt = select(*self._get_search_columns())
+
+        # Build the text search vector
+        ts_vector = self._get_ts_vector()
+        # Create the ts_query using websearch_to_tsquery with parameter binding
+        ts_query = self._get_ts_query(query)
+        # Compute the text rank
+        text_rank = func.ts_rank_cd(ts_vector, ts_query)
+
+        # Only keep matching rows, which lets Postgres use the GIN index
+        stmt = stmt.where(ts_vector.op("@@")(ts_query))
+
+        # Apply filters if provided
+        if filters is not None:
+            # Use the contains() method for JSONB columns to check if the filters column contains the specified filters
+            stmt = stmt.where(self.table.c.meta_data.contains(filters))
+
+        # Order by the relevance rank
+        stmt = stmt.order_by(text_rank.desc())
+
+        # Limit the number of results
+        stmt = stmt.limit(limit)
+
+        # Log the query for debugging
+        log_debug(f"Keyword search query: {stmt}")
+        return stmt
+
     def keyword_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """
         Perform a keyword search on the 'content' column.
@@ -566,65 +1139,24 @@ class PgVector(VectorDb):
             List[Document]: List of matching documents.
         """
         try:
-            # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
-
-            # Build the base statement
-            stmt = select(*columns)
-
-            # Build the text search vector
-            ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
-            # Create the ts_query using websearch_to_tsquery with parameter binding
-            processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
-            ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
-            # Compute the text rank
-            text_rank = func.ts_rank_cd(ts_vector, ts_query)
-
-            # Apply filters if provided
-            if filters is not None:
-                # Use the contains() method for JSONB columns to check if the filters column contains the specified filters
-                stmt = stmt.where(self.table.c.meta_data.contains(filters))
-
-            # Order by the relevance rank
-            stmt = stmt.order_by(text_rank.desc())
-
-            # Limit the number of results
-            stmt = stmt.limit(limit)
-
-            # Log the query for debugging
-            log_debug(f"Keyword search query: {stmt}")
+            # Use the stored text search vector if the table has it
+            self._content_tsv_column_exists()
+            stmt = self._get_keyword_search_statement(query, limit=limit, filters=filters)
 
             # Execute the query
             try:
                 with self.Session() as sess, sess.begin():
                     results = sess.execute(stmt).fetchall()
             except Exception as e:
-                logger.error(f"Error performing keyword search: {e}")
-                logger.error("Table might not exist, creating for future use")
+                if not self._is_undefined_table_error(e):
+                    logger.error(f"Error performing keyword search: {e}")
+                    return []
+                logger.error("Table does not exist, creating for future use")
                 self.create()
                 return []
 
             # Process the results and convert to Document objects
-            search_results: List[Document] = []
-            for result in results:
-                search_results.append(
-                    Document(
-                        id=result.id,
-                        name=result.name,
-                        meta_data=result.meta_data,
-                        content=result.content,
-                        embedder=self.embedder,
-                        embedding=result.embedding,
-                        usage=result.usage,
-                    )
-                )
+            search_results = self._get_results_as_documents(results)
 
             log_info(f"Found {len(search_results)} documents")
             return search_results
@@ -632,6 +1164,209 @@ class PgVector(VectorDb):
             logger.error(f"Error during keyword search: {e}")
             return []
 
+    async def async_keyword_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """
+        Perform a keyword search on the 'content' column using the async engine.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        async_session = self.get_async_session()
+        if async_session is None:
+            return await asyncio.to_thread(self.keyword_search, query, limit, filters)
+
+        try:
+            # Use the stored text search vector if the table has it
+            await self._async_content_tsv_column_exists()
+            stmt = self._get_keyword_search_statement(query, limit=limit, filters=filters)
+
+            # Execute the query
+            try:
+                async with async_session() as sess, sess.begin():
+                    results = (await sess.execute(stmt)).fetchall()
+            except Exception as e:
+                if not self._is_undefined_table_error(e):
+                    logger.error(f"Error performing keyword search: {e}")
+                    return []
+                logger.error("Table does not exist, creating for future use")
+                await self.async_create()
+                return []
+
+            # Process the results and convert to Document objects
+            search_results = self._get_results_as_documents(results)
+
+            log_info(f"Found {len(search_results)} documents")
+            return search_results
+        except Exception as e:
+            logger.error(f"Error during keyword search: {e}")
+            return []
+
+    def _get_hybrid_search_statement(
+        self,
+        query: str,
+        query_embedding: List[float],
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Select]:
+        """
+        Build the statement for a hybrid search combining vector similarity and full-text search.
+
+        Args:
+            query (str): The search query.
+            query_embedding (List[float]): The embedding of the search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            Optional[Select]: The search statement, or None if the distance metric is unknown.
+        """
+        if self.hybrid_mode == HybridMode.rrf:
+            return self._get_rrf_hybrid_search_statement(query, query_embedding, limit=limit, filters=filters)
+
+        # Build the text search vector
+        ts_vector = self._get_ts_vector()
+        # Create the ts_query using websearch_to_tsquery with parameter binding
+        ts_query = self._get_ts_query(query)
+        # Compute the text rank
+        text_rank = func.ts_rank_cd(ts_vector, ts_query)
+
+        # Compute the vector similarity score
+        if self.distance == Distance.l2:
+            # For L2 distance, smaller distances are better
+            vector_distance = self.table.c.embedding.l2_distance(query_embedding)
+            # Invert and normalize the distance to get a similarity score between 0 and 1
+            vector_score = 1 / (1 + vector_distance)
+        elif self.distance == Distance.cosine:
+            # For cosine distance, smaller distances are better
+            vector_distance = self.table.c.embedding.cosine_distance(query_embedding)
+            vector_score = 1 / (1 + vector_distance)
+        elif self.distance == Distance.max_inner_product:
+            # For inner product, higher values are better
+            # Assume embeddings are normalized, so inner product ranges from -1 to 1
+            raw_vector_score = self.table.c.embedding.max_inner_product(query_embedding)
+            # Normalize to range [0, 1]
+            vector_score = (raw_vector_score + 1) / 2
+        else:
+            logger.error(f"Unknown distance metric: {self.distance}")
+            return None
+
+        # Apply weights to control the influence of each score
+        # Validate the vector_weight parameter
+        if not 0 <= self.vector_score_weight <= 1:
+            raise ValueError("vector_score_weight must be between 0 and 1")
+        text_rank_weight = 1 - self.vector_score_weight  # weight for text rank
+
+        # Combine the scores into a hybrid score
+        hybrid_score = (self.vector_score_weight * vector_score) + (text_rank_weight * text_rank)
+
+        # Build the base statement, including the hybrid score
+        stmt = select(*self._get_search_columns(), hybrid_score.label("hybrid_score"))
+
+        # Add the full-text search condition
+        # stmt = stmt.where(ts_vector.op("@@")(ts_query))
+
+        # Apply filters if provided
+        if filters is not None:
+            stmt = stmt.where(self.table.c.meta_data.contains(filters))
+
+        # Order the results by the hybrid score in descending order
+        stmt = stmt.order_by(desc("hybrid_score"))
+
+        # Limit the number of results
+        stmt = stmt.limit(limit)
+
+        # Log the query for debugging
+        log_debug(f"Hybrid search query: {stmt}")
+        return stmt
+
+    def _get_rrf_hybrid_search_statement(
+        self,
+        query: str,
+        query_embedding: List[float],
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Select]:
+        """
+        Build the statement for a hybrid search that fuses a vector search and a keyword search by reciprocal rank.
+
+        Each leg is a separate top-k query that can use its own index (the vector index for the embedding and the
+        GIN index for content_tsv), and the fused score of a document is the weighted sum of 1 / (rrf_k + rank)
+        over the legs it appears in.
+
+        Args:
+            query (str): The search query.
+            query_embedding (List[float]): The embedding of the search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            Optional[Select]: The search statement, or None if the distance metric is unknown.
+        """
+        # Validate the vector_weight parameter
+        if not 0 <= self.vector_score_weight <= 1:
+            raise ValueError("vector_score_weight must be between 0 and 1")
+        text_rank_weight = 1 - self.vector_score_weight  # weight for text rank
+
+        num_candidates = limit * RRF_CANDIDATE_MULTIPLIER
+
+        # Vector leg: the nearest neighbours of the query embedding
+        vector_distance = self._get_vector_distance(query_embedding)
+        if vector_distance is None:
+            return None
+        vector_stmt = select(self.table.c.id, vector_distance.label("distance"))
+        if filters is not None:
+            vector_stmt = vector_stmt.where(self.table.c.meta_data.contains(filters))
+        vector_top_k = vector_stmt.order_by(vector_distance).limit(num_candidates).subquery("vector_top_k")
+        vector_ranked = select(
+            vector_top_k.c.id,
+            func.row_number().over(order_by=vector_top_k.c.distance).label("rank"),
+        ).subquery("vector_ranked")
+
+        # Keyword leg: the best ranked rows matching the text search query
+        ts_vector = self._get_ts_vector()
+        ts_query = self._get_ts_query(query)
+        text_rank = func.ts_rank_cd(ts_vector, ts_query)
+        keyword_stmt = select(self.table.c.id, text_rank.label("text_rank")).where(ts_vector.op("@@")(ts_query))
+        if filters is not None:
+            keyword_stmt = keyword_stmt.where(self.table.c.meta_data.contains(filters))
+        keyword_top_k = keyword_stmt.order_by(text_rank.desc()).limit(num_candidates).subquery("keyword_top_k")
+        keyword_ranked = select(
+            keyword_top_k.c.id,
+            func.row_number().over(order_by=keyword_top_k.c.text_rank.desc()).label("rank"),
+        ).subquery("keyword_ranked")
+
+        # Fuse the legs, a document missing from one leg gets no score from it
+        rrf_score = self.vector_score_weight * func.coalesce(
+            1.0 / (self.rrf_k + vector_ranked.c.rank), 0.0
+        ) + text_rank_weight * func.coalesce(1.0 / (self.rrf_k + keyword_ranked.c.rank), 0.0)
+        fused = (
+            select(
+                func.coalesce(vector_ranked.c.id, keyword_ranked.c.id).label("id"),
+                rrf_score.label("rrf_score"),
+            )
+            .select_from(vector_ranked.outerjoin(keyword_ranked, vector_ranked.c.id == keyword_ranked.c.id, full=True))
+            .subquery("fused")
+        )
+
+        # Fetch the fused documents in order of their score
+        stmt = (
+            select(*self._get_search_columns(), fused.c.rrf_score)
+            .join(fused, self.table.c.id == fused.c.id)
+            .order_by(fused.c.rrf_score.desc())
+            .limit(limit)
+        )
+
+        # Log the query for debugging
+        log_debug(f"Hybrid search query: {stmt}")
+        return stmt
+
     def hybrid_search(
         self,
         query: str,
@@ -656,99 +1391,82 @@ class PgVector(VectorDb):
                 logger.error(f"Error getting embedding for Query: {query}")
                 return []
 
-            # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
-
-            # Build the text search vector
-            ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
-            # Create the ts_query using websearch_to_tsquery with parameter binding
-            processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
-            ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
-            # Compute the text rank
-            text_rank = func.ts_rank_cd(ts_vector, ts_query)
-
-            # Compute the vector similarity score
-            if self.distance == Distance.l2:
-                # For L2 distance, smaller distances are better
-                vector_distance = self.table.c.embedding.l2_distance(query_embedding)
-                # Invert and normalize the distance to get a similarity score between 0 and 1
-                vector_score = 1 / (1 + vector_distance)
-            elif self.distance == Distance.cosine:
-                # For cosine distance, smaller distances are better
-                vector_distance = self.table.c.embedding.cosine_distance(query_embedding)
-                vector_score = 1 / (1 + vector_distance)
-            elif self.distance == Distance.max_inner_product:
-                # For inner product, higher values are better
-                # Assume embeddings are normalized, so inner product ranges from -1 to 1
-                raw_vector_score = self.table.c.embedding.max_inner_product(query_embedding)
-                # Normalize to range [0, 1]
-                vector_score = (raw_vector_score + 1) / 2
-            else:
-                logger.error(f"Unknown distance metric: {self.distance}")
+            # Use the stored text search vector if the table has it
+            self._content_tsv_column_exists()
+            stmt = self._get_hybrid_search_statement(query, query_embedding, limit=limit, filters=filters)
+            if stmt is None:
                 return []
 
-            # Apply weights to control the influence of each score
-            # Validate the vector_weight parameter
-            if not 0 <= self.vector_score_weight <= 1:
-                raise ValueError("vector_score_weight must be between 0 and 1")
-            text_rank_weight = 1 - self.vector_score_weight  # weight for text rank
+            # Execute the query
+            try:
+                with self.Session() as sess, sess.begin():
+                    index_search_setting = self._get_index_search_setting()
+                    if index_search_setting is not None:
+                        sess.execute(index_search_setting)
+                    results = sess.execute(stmt).fetchall()
+            except Exception as e:
+                logger.error(f"Error performing hybrid search: {e}")
+                return []
 
-            # Combine the scores into a hybrid score
-            hybrid_score = (self.vector_score_weight * vector_score) + (text_rank_weight * text_rank)
+            # Process the results and convert to Document objects
+            search_results = self._get_results_as_documents(results)
 
-            # Build the base statement, including the hybrid score
-            stmt = select(*columns, hybrid_score.label("hybrid_score"))
+            if self.reranker:
+                search_results = self.reranker.rerank(query=query, documents=search_results)
 
-            # Add the full-text search condition
-            # stmt = stmt.where(ts_vector.op("@@")(ts_query))
+            log_info(f"Found {len(search_results)} documents")
+            return search_results
+        except Exception as e:
+            logger.error(f"Error during hybrid search: {e}")
+            return []
 
-            # Apply filters if provided
-            if filters is not None:
-                stmt = stmt.where(self.table.c.meta_data.contains(filters))
+    async def async_hybrid_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Document]:
+        """
+        Perform a hybrid search combining vector similarity and full-text search using the async engine.
 
-            # Order the results by the hybrid score in descending order
-            stmt = stmt.order_by(desc("hybrid_score"))
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        async_session = self.get_async_session()
+        if async_session is None:
+            return await asyncio.to_thread(self.hybrid_search, query, limit, filters)
 
-            # Limit the number of results
-            stmt = stmt.limit(limit)
+        try:
+            # Get the embedding for the query string
+            query_embedding = await self._async_get_query_embedding(query)
+            if query_embedding is None:
+                logger.error(f"Error getting embedding for Query: {query}")
+                return []
 
-            # Log the query for debugging
-            log_debug(f"Hybrid search query: {stmt}")
+            # Use the stored text search vector if the table has it
+            await self._async_content_tsv_column_exists()
+            stmt = self._get_hybrid_search_statement(query, query_embedding, limit=limit, filters=filters)
+            if stmt is None:
+                return []
 
             # Execute the query
             try:
-                with self.Session() as sess, sess.begin():
-                    if self.vector_index is not None:
-                        if isinstance(self.vector_index, Ivfflat):
-                            sess.execute(text(f"SET LOCAL ivfflat.probes = {self.vector_index.probes}"))
-                        elif isinstance(self.vector_index, HNSW):
-                            sess.execute(text(f"SET LOCAL hnsw.ef_search = {self.vector_index.ef_search}"))
-                    results = sess.execute(stmt).fetchall()
+                async with async_session() as sess, sess.begin():
+                    index_search_setting = self._get_index_search_setting()
+                    if index_search_setting is not None:
+                        await sess.execute(index_search_setting)
+                    results = (await sess.execute(stmt)).fetchall()
             except Exception as e:
                 logger.error(f"Error performing hybrid search: {e}")
                 return []
 
             # Process the results and convert to Document objects
-            search_results: List[Document] = []
-            for result in results:
-                search_results.append(
-                    Document(
-                        id=result.id,
-                        name=result.name,
-                        meta_data=result.meta_data,
-                        content=result.content,
-                        embedder=self.embedder,
-                        embedding=result.embedding,
-                        usage=result.usage,
-                    )
-                )
+            search_results = self._get_results_as_documents(results)
 
             if self.reranker:
                 search_results = self.reranker.rerank(query=query, documents=search_results)
@@ -775,8 +1493,24 @@ class PgVector(VectorDb):
             log_info(f"Table '{self.table.fullname}' does not exist.")
 
     async def async_drop(self) -> None:
-        """Drop the table asynchronously by running in a thread."""
-        await asyncio.to_thread(self.drop)
+        """
+        Drop the table from the database, using the async engine when available.
+        """
+        if self.get_async_session() is None:
+            await asyncio.to_thread(self.drop)
+            return
+
+        if await self._async_table_exists():
+            try:
+                log_debug(f"Dropping table '{self.table.fullname}'.")
+                async with self._get_async_engine().begin() as conn:  # type: ignore
+                    await conn.run_sync(self.table.drop)
+                log_info(f"Table '{self.table.fullname}' dropped successfully.")
+            except Exception as e:
+                logger.error(f"Error dropping table '{self.table.fullname}': {e}")
+                raise
+        else:
+            log_info(f"Table '{self.table.fullname}' does not exist.")
 
     def exists(self) -> bool:
         """
@@ -788,8 +1522,15 @@ class PgVector(VectorDb):
         return self.table_exists()
 
     async def async_exists(self) -> bool:
-        """Check if table exists asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.exists)
+        """
+        Check if the table exists in the database, using the async engine when available.
+
+        Returns:
+            bool: True if the table exists, False otherwise.
+        """
+        if self.get_async_session() is None:
+            return await asyncio.to_thread(self.exists)
+        return await self._async_table_exists()
 
     def get_count(self) -> int:
         """
@@ -973,12 +1714,22 @@ class PgVector(VectorDb):
 
     def _create_gin_index(self, force_recreate: bool = False) -> None:
         """
-        Create or recreate the GIN index for full-text search.
+        Create or recreate the GIN index on the stored content_tsv column for full-text search.
 
         Args:
             force_recreate (bool): If True, existing index will be dropped and recreated.
         """
-        gin_index_name = f"{self.table_name}_content_gin_index"
+        gin_index_name = self._get_gin_index_name()
+
+        # Add the stored text search vector to tables created before it existed
+        if not self._content_tsv_column_exists():
+            self._add_content_tsv_column()
+
+        # Drop the expression index used before the stored column existed, it is not used by the queries anymore
+        legacy_gin_index_name = f"{self.table_name}_content_gin_index"
+        if self._index_exists(legacy_gin_index_name):
+            log_info(f"Dropping legacy GIN index '{legacy_gin_index_name}'.")
+            self._drop_index(legacy_gin_index_name)
 
         gin_index_exists = self._index_exists(gin_index_name)
 
@@ -997,8 +1748,7 @@ class PgVector(VectorDb):
                 log_debug(f"Creating GIN index '{gin_index_name}' on table '{self.table.fullname}'.")
                 # Create index
                 create_gin_index_sql = text(
-                    f'CREATE INDEX "{gin_index_name}" ON {self.table.fullname} '
-                    f"USING GIN (to_tsvector({self.content_language}, content));"
+                    f'CREATE INDEX "{gin_index_name}" ON {self.table.fullname} USING GIN (content_tsv);'
                 )
                 sess.execute(create_gin_index_sql)
         except Exception as e:
@@ -1025,6 +1775,27 @@ class PgVector(VectorDb):
             sess.rollback()
             return False
 
+    def delete_by_content_hashes(self, content_hashes: List[str]) -> bool:
+        """
+        Delete the records with the given content hashes.
+
+        Args:
+            content_hashes (List[str]): The content hashes of the records to delete.
+
+        Returns:
+            bool: True if deletion was successful, False otherwise.
+        """
+        from sqlalchemy import delete
+
+        try:
+            with self.Session() as sess, sess.begin():
+                result = sess.execute(delete(self.table).where(self.table.c.content_hash.in_(content_hashes)))
+                log_info(f"Deleted {result.rowcount} records from table '{self.table.fullname}'.")
+                return True
+        except Exception as e:
+            logger.error(f"Error deleting rows from table '{self.table.fullname}': {e}")
+            return False
+
     def __deepcopy__(self, memo):
         """
         Create a deep copy of the PgVector instance, handling unpickleable attributes.
@@ -1047,7 +1818,7 @@ class PgVector(VectorDb):
             if k in {"metadata", "table"}:
                 continue
             # Reuse db_engine and Session without copying
-            elif k in {"db_engine", "Session", "embedder"}:
+            elif k in {"db_engine", "Session", "embedder", "async_db_engine", "_async_engines", "_async_sessions"}:
                 setattr(copied_obj, k, v)
             else:
                 setattr(copied_obj, k, deepcopy(v, memo))
@@ -251,9 +251,10 @@ class PineconeDb(VectorDb):
 
         """
 
+        Document.embed_many(documents, embedder=self.embedder)
+
         vectors = []
         for document in documents:
-            document.embed(embedder=self.embedder)
             document.meta_data["text"] = document.content
             data_to_upsert = {
                 "id": document.id,
@@ -310,9 +311,10 @@ class PineconeDb(VectorDb):
 
     def _prepare_vectors(self, documents):
         """Prepare vectors for upsert."""
+        Document.embed_many(documents, embedder=self.embedder)
+
         vectors = []
         for doc in documents:
-            doc.embed(embedder=self.embedder)
             doc.meta_data["text"] = doc.content
             data_to_upsert = {
                 "id": doc.id,
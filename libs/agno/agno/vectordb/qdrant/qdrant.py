@@ -1,5 +1,6 @@
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
+from uuid import UUID
 
 try:
     from qdrant_client import AsyncQdrantClient, QdrantClient  # noqa: F401
@@ -12,7 +13,7 @@ except ImportError:
 from agno.document import Document
 from agno.embedder import Embedder
 from agno.reranker.base import Reranker
-from agno.utils.log import log_debug, log_info
+from agno.utils.log import log_debug, log_info, logger
 from agno.vectordb.base import VectorDb
 from agno.vectordb.distance import Distance
 from agno.vectordb.search import SearchType
@@ -260,6 +261,36 @@ class Qdrant(VectorDb):
         )
         return len(collection_points) > 0
 
+    def existing_content_hashes(self, content_hashes: List[str]) -> Set[str]:
+        """
+        Return the content hashes that already exist in the collection, using a single request
+
+        Args:
+            content_hashes (List[str]): Content hashes to check
+        """
+        if not content_hashes or not self.client:
+            return set()
+        collection_points = self.client.retrieve(
+            collection_name=self.collection,
+            ids=content_hashes,
+            with_payload=False,
+            with_vectors=False,
+        )
+        # Qdrant returns hex ids in UUID format
+        return {UUID(str(point.id)).hex for point in collection_points}
+
+    async def async_existing_content_hashes(self, content_hashes: List[str]) -> Set[str]:
+        """Return the content hashes that already exist in the collection asynchronously."""
+        if not content_hashes:
+            return set()
+        collection_points = await self.async_client.retrieve(
+            collection_name=self.collection,
+            ids=content_hashes,
+            with_payload=False,
+            with_vectors=False,
+        )
+        return {UUID(str(point.id)).hex for point in collection_points}
+
     def name_exists(self, name: str) -> bool:
         """
         Validates if a document with the given name exists in the collection.
@@ -312,6 +343,9 @@ class Qdrant(VectorDb):
             batch_size (int): Batch size for inserting documents
         """
         log_debug(f"Inserting {len(documents)} documents")
+        if self.search_type in [SearchType.vector, SearchType.hybrid]:
+            Document.embed_many(documents, embedder=self.embedder)
+
         points = []
         for document in documents:
             cleaned_content = document.content.replace("\x00", "\ufffd")
@@ -325,13 +359,11 @@ class Qdrant(VectorDb):
 
             if self.search_type == SearchType.vector:
                 # For vector search, maintain backward compatibility with unnamed vectors
-                document.embed(embedder=self.embedder)
                 vector = document.embedding  # type: ignore
             else:
                 # For other search types, use named vectors
                 vector = {}
                 if self.search_type in [SearchType.hybrid]:
-                    document.embed(embedder=self.embedder)
                     vector[self.dense_vector_name] = document.embedding
 
                 if self.search_type in [SearchType.keyword, SearchType.hybrid]:
@@ -373,6 +405,8 @@ class Qdrant(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to apply while inserting documents
         """
         log_debug(f"Inserting {len(documents)} documents asynchronously")
+        if self.search_type in [SearchType.vector, SearchType.hybrid]:
+            await Document.async_embed_many(documents, embedder=self.embedder)
 
         async def process_document(document):
             cleaned_content = document.content.replace("\x00", "\ufffd")
@@ -380,13 +414,11 @@ class Qdrant(VectorDb):
 
             if self.search_type == SearchType.vector:
                 # For vector search, maintain backward compatibility with unnamed vectors
-                document.embed(embedder=self.embedder)
                 vector = document.embedding
             else:
                 # For other search types, use named vectors
                 vector = {}
                 if self.search_type in [SearchType.hybrid]:
-                    document.embed(embedder=self.embedder)
                     vector[self.dense_vector_name] = document.embedding
 
                 if self.search_type in [SearchType.keyword, SearchType.hybrid]:
@@ -704,3 +736,14 @@ class Qdrant(VectorDb):
 
     def delete(self) -> bool:
         return self.client.delete_collection(collection_name=self.collection)
+
+    def delete_by_content_hashes(self, content_hashes: List[str]) -> bool:
+        try:
+            self.client.delete(
+                collection_name=self.collection,
+                points_selector=models.PointIdsList(points=content_hashes),  # type: ignore
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting documents: {e}")
+            return False
@@ -5,3 +5,8 @@ class SearchType(str, Enum):
     vector = "vector"
     keyword = "keyword"
     hybrid = "hybrid"
+
+
+class HybridMode(str, Enum):
+    weighted = "weighted"
+    rrf = "rrf"
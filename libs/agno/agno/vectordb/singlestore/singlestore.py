@@ -1,6 +1,6 @@
 import json
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     from sqlalchemy.dialects import mysql
@@ -137,6 +137,19 @@ class SingleStore(VectorDb):
             result = sess.execute(stmt).first()
             return result is not None
 
+    def existing_content_hashes(self, content_hashes: List[str]) -> Set[str]:
+        """
+        Return the content hashes that already exist in the table, using a single query
+
+        Args:
+            content_hashes (List[str]): Content hashes to check
+        """
+        if not content_hashes:
+            return set()
+        with self.Session.begin() as sess:
+            stmt = select(self.table.c.content_hash).where(self.table.c.content_hash.in_(content_hashes))
+            return {row[0] for row in sess.execute(stmt)}
+
     def name_exists(self, name: str) -> bool:
         """
         Validate if a row with this name exists or not
@@ -170,10 +183,10 @@ class SingleStore(VectorDb):
             filters (Optional[Dict[str, Any]]): Optional filters for the insert.
             batch_size (int): Number of documents to insert in each batch.
         """
+        Document.embed_many(documents, embedder=self.embedder, batch_size=batch_size)
         with self.Session.begin() as sess:
             counter = 0
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
@@ -213,10 +226,10 @@ class SingleStore(VectorDb):
             filters (Optional[Dict[str, Any]]): Optional filters for the upsert.
             batch_size (int): Number of documents to upsert in each batch.
         """
+        Document.embed_many(documents, embedder=self.embedder, batch_size=batch_size)
         with self.Session.begin() as sess:
             counter = 0
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
@@ -393,6 +406,24 @@ class SingleStore(VectorDb):
             sess.execute(stmt)
             return True
 
+    def delete_by_content_hashes(self, content_hashes: List[str]) -> bool:
+        """
+        Delete the rows with the given content hashes.
+
+        Returns:
+            bool: True if the rows were deleted, False otherwise.
+        """
+        from sqlalchemy import delete
+
+        try:
+            with self.Session.begin() as sess:
+                stmt = delete(self.table).where(self.table.c.content_hash.in_(content_hashes))
+                sess.execute(stmt)
+                return True
+        except Exception as e:
+            logger.error(f"Error deleting rows from table '{self.table.fullname}': {e}")
+            return False
+
     async def async_create(self) -> None:
         raise NotImplementedError(f"Async not supported on {self.__class__.__name__}.")
 
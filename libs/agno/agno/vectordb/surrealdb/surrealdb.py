@@ -221,8 +221,8 @@ class SurrealDb(VectorDb):
             filters: A dictionary of filters to apply to the query.
 
         """
+        Document.embed_many(documents, embedder=self.embedder)
         for doc in documents:
-            doc.embed(embedder=self.embedder)
             meta_data: Dict[str, Any] = doc.meta_data if isinstance(doc.meta_data, dict) else {}
             data: Dict[str, Any] = {"content": doc.content, "embedding": doc.embedding, "meta_data": meta_data}
             if filters:
@@ -237,8 +237,8 @@ class SurrealDb(VectorDb):
             filters: A dictionary of filters to apply to the query.
 
         """
+        Document.embed_many(documents, embedder=self.embedder)
         for doc in documents:
-            doc.embed(embedder=self.embedder)
             meta_data: Dict[str, Any] = doc.meta_data if isinstance(doc.meta_data, dict) else {}
             data: Dict[str, Any] = {"content": doc.content, "embedding": doc.embedding, "meta_data": meta_data}
             if filters:
@@ -388,8 +388,8 @@ class SurrealDb(VectorDb):
             filters: A dictionary of filters to apply to the query.
 
         """
+        await Document.async_embed_many(documents, embedder=self.embedder)
         for doc in documents:
-            doc.embed(embedder=self.embedder)
             meta_data: Dict[str, Any] = doc.meta_data if isinstance(doc.meta_data, dict) else {}
             data: Dict[str, Any] = {"content": doc.content, "embedding": doc.embedding, "meta_data": meta_data}
             if filters:
@@ -405,8 +405,8 @@ class SurrealDb(VectorDb):
             filters: A dictionary of filters to apply to the query.
 
         """
+        await Document.async_embed_many(documents, embedder=self.embedder)
         for doc in documents:
-            doc.embed(embedder=self.embedder)
             meta_data: Dict[str, Any] = doc.meta_data if isinstance(doc.meta_data, dict) else {}
             data: Dict[str, Any] = {"content": doc.content, "embedding": doc.embedding, "meta_data": meta_data}
             if filters:
@@ -301,8 +301,8 @@ class Weaviate(VectorDb):
         log_debug(f"Inserting {len(documents)} documents into Weaviate.")
         collection = self.get_client().collections.get(self.collection)
 
+        Document.embed_many(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             if document.embedding is None:
                 logger.error(f"Document embedding is None: {document.name}")
                 continue
@@ -344,11 +344,11 @@ class Weaviate(VectorDb):
         try:
             collection = client.collections.get(self.collection)
 
-            # Process documents first
+            # Embed all documents in batches
+            await Document.async_embed_many(documents, embedder=self.embedder)
+
             for document in documents:
                 try:
-                    # Embed document
-                    document.embed(embedder=self.embedder)
                     if document.embedding is None:
                         logger.error(f"Document embedding is None: {document.name}")
                         continue
@@ -427,8 +427,8 @@ class Weaviate(VectorDb):
         try:
             collection = client.collections.get(self.collection)
 
+            await Document.async_embed_many(documents, embedder=self.embedder)
             for document in documents:
-                document.embed(embedder=self.embedder)
                 if document.embedding is None:
                     logger.error(f"Document embedding is None: {document.name}")
                     continue
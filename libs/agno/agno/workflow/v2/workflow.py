@@ -936,7 +936,7 @@ class Workflow:
                 workflow_run_response.content = f"Workflow execution failed: {e}"
 
         # Store error response
-        self._save_run_to_storage(workflow_run_response)
+        await self._asave_run_to_storage(workflow_run_response)
 
         return workflow_run_response
 
@@ -1136,7 +1136,7 @@ class Workflow:
         yield self._handle_event(workflow_completed_event, workflow_run_response)
 
         # Store the completed workflow response
-        self._save_run_to_storage(workflow_run_response)
+        await self._asave_run_to_storage(workflow_run_response)
 
     def _update_workflow_session_state(self):
         if not self.workflow_session_state:
@@ -1180,7 +1180,7 @@ class Workflow:
             self.run_id = str(uuid4())
 
         self.initialize_workflow()
-        self.load_session()
+        await self.aload_session()
         self._prepare_steps()
 
         # Create workflow run response with PENDING status
@@ -1194,7 +1194,7 @@ class Workflow:
         )
 
         # Store PENDING response immediately
-        self._save_run_to_storage(workflow_run_response)
+        await self._asave_run_to_storage(workflow_run_response)
 
         # Prepare execution input
         inputs = WorkflowExecutionInput(
@@ -1212,11 +1212,11 @@ class Workflow:
             try:
                 # Update status to RUNNING and save
                 workflow_run_response.status = RunStatus.running
-                self._save_run_to_storage(workflow_run_response)
+                await self._asave_run_to_storage(workflow_run_response)
 
                 await self._aexecute(execution_input=inputs, workflow_run_response=workflow_run_response, **kwargs)
 
-                self._save_run_to_storage(workflow_run_response)
+                await self._asave_run_to_storage(workflow_run_response)
 
                 log_debug(f"Background execution completed with status: {workflow_run_response.status}")
 
@@ -1224,7 +1224,7 @@ class Workflow:
                 logger.error(f"Background workflow execution failed: {e}")
                 workflow_run_response.status = RunStatus.error
                 workflow_run_response.content = f"Background execution failed: {str(e)}"
-                self._save_run_to_storage(workflow_run_response)
+                await self._asave_run_to_storage(workflow_run_response)
 
         # Create and start asyncio task
         loop = asyncio.get_running_loop()
@@ -1456,7 +1456,7 @@ class Workflow:
         self.initialize_workflow()
 
         # Load or create session
-        self.load_session()
+        await self.aload_session()
 
         # Prepare steps
         self._prepare_steps()
@@ -1588,6 +1588,25 @@ class Workflow:
                 return saved_session
         return None
 
+    async def aread_from_storage(self) -> Optional[WorkflowSessionV2]:
+        """Load the WorkflowSessionV2 from storage without blocking the event loop"""
+        if self.storage is not None and self.session_id is not None:
+            session = await self.storage.aread(session_id=self.session_id)
+            if session and isinstance(session, WorkflowSessionV2):
+                self.load_workflow_session(session)
+                return session
+        return None
+
+    async def awrite_to_storage(self) -> Optional[WorkflowSessionV2]:
+        """Save the WorkflowSessionV2 to storage without blocking the event loop"""
+        if self.storage is not None:
+            session_to_save = self.get_workflow_session()
+            saved_session = await self.storage.aupsert(session=session_to_save)
+            if saved_session and isinstance(saved_session, WorkflowSessionV2):
+                self.workflow_session = saved_session
+                return saved_session
+        return None
+
     def load_session(self, force: bool = False) -> Optional[str]:
         """Load an existing session from storage or create a new one"""
         if self.workflow_session is not None and not force:
@@ -1601,25 +1620,50 @@ class Workflow:
 
             # Create new session if it doesn't exist
             if existing_session is None:
-                log_debug("Creating new WorkflowSessionV2")
+                self._create_workflow_session()
+                saved_session = self.write_to_storage()
+                if saved_session is None:
+                    raise Exception("Failed to create new WorkflowSessionV2 in storage")
+                log_debug(f"Created WorkflowSessionV2: {saved_session.session_id}")
 
-                # Ensure we have a session_id
-                if self.session_id is None:
-                    self.session_id = str(uuid4())
+        return self.session_id
 
-                self.workflow_session = WorkflowSessionV2(
-                    session_id=self.session_id,
-                    user_id=self.user_id,
-                    workflow_id=self.workflow_id,
-                    workflow_name=self.name,
-                )
-                saved_session = self.write_to_storage()
+    async def aload_session(self, force: bool = False) -> Optional[str]:
+        """Load an existing session from storage or create a new one, without blocking the event loop"""
+        if self.workflow_session is not None and not force:
+            if self.session_id is not None and self.workflow_session.session_id == self.session_id:
+                log_debug("Using existing workflow session")
+                return self.workflow_session.session_id
+
+        if self.storage is not None:
+            # Try to load existing session
+            existing_session = await self.aread_from_storage()
+
+            # Create new session if it doesn't exist
+            if existing_session is None:
+                self._create_workflow_session()
+                saved_session = await self.awrite_to_storage()
                 if saved_session is None:
                     raise Exception("Failed to create new WorkflowSessionV2 in storage")
                 log_debug(f"Created WorkflowSessionV2: {saved_session.session_id}")
 
         return self.session_id
 
+    def _create_workflow_session(self) -> None:
+        """Create a new WorkflowSessionV2 for the current session_id"""
+        log_debug("Creating new WorkflowSessionV2")
+
+        # Ensure we have a session_id
+        if self.session_id is None:
+            self.session_id = str(uuid4())
+
+        self.workflow_session = WorkflowSessionV2(
+            session_id=self.session_id,
+            user_id=self.user_id,
+            workflow_id=self.workflow_id,
+            workflow_name=self.name,
+        )
+
     def new_session(self) -> None:
         """Create a new workflow session"""
         log_debug("Creating new workflow session")
@@ -3281,6 +3325,12 @@ class Workflow:
             self.workflow_session.upsert_run(workflow_run_response)
             self.write_to_storage()
 
+    async def _asave_run_to_storage(self, workflow_run_response: WorkflowRunResponse) -> None:
+        """Helper method to save workflow run response to storage without blocking the event loop"""
+        if self.workflow_session:
+            self.workflow_session.upsert_run(workflow_run_response)
+            await self.awrite_to_storage()
+
     def update_agents_and_teams_session_info(self):
         """Update agents and teams with workflow session information"""
         log_debug("Updating agents and teams with session information")
@@ -263,7 +263,7 @@ class Workflow:
         self.run_response = RunResponse(run_id=self.run_id, session_id=self.session_id, workflow_id=self.workflow_id)
 
         # Read existing session from storage
-        self.read_from_storage()
+        await self.aread_from_storage()
 
         # Update the session_id for all Agent instances
         self.update_agent_session_ids()
@@ -293,7 +293,7 @@ class Workflow:
             elif isinstance(self.memory, Memory):
                 self.memory.add_run(session_id=self.session_id, run=self.run_response)  # type: ignore
             # Write this run to the database
-            self.write_to_storage()
+            await self.awrite_to_storage()
             log_debug(f"Workflow Run End: {self.run_id}", center=True)
             return result
         else:
@@ -319,7 +319,7 @@ class Workflow:
         self.run_response = RunResponse(run_id=self.run_id, session_id=self.session_id, workflow_id=self.workflow_id)
 
         # Read existing session from storage
-        self.read_from_storage()
+        await self.aread_from_storage()
 
         # Update the session_id for all Agent instances
         self.update_agent_session_ids()
@@ -354,7 +354,7 @@ class Workflow:
             elif isinstance(self.memory, Memory):
                 self.memory.add_run(session_id=self.session_id, run=self.run_response)  # type: ignore
             # Write this run to the database
-            self.write_to_storage()
+            await self.awrite_to_storage()
             log_debug(f"Workflow Run End: {self.run_id}", center=True)
         except Exception as e:
             logger.error(f"Workflow.arun() failed: {e}")
@@ -666,6 +666,30 @@ class Workflow:
             self.workflow_session = cast(WorkflowSession, self.storage.upsert(session=self.get_workflow_session()))
         return self.workflow_session
 
+    async def aread_from_storage(self) -> Optional[WorkflowSession]:
+        """Load the WorkflowSession from storage without blocking the event loop.
+
+        Returns:
+            Optional[WorkflowSession]: The loaded WorkflowSession or None if not found.
+        """
+        if self.storage is not None and self.session_id is not None:
+            self.workflow_session = cast(WorkflowSession, await self.storage.aread(session_id=self.session_id))
+            if self.workflow_session is not None:
+                self.load_workflow_session(session=self.workflow_session)
+        return self.workflow_session
+
+    async def awrite_to_storage(self) -> Optional[WorkflowSession]:
+        """Save the WorkflowSession to storage without blocking the event loop
+
+        Returns:
+            Optional[WorkflowSession]: The saved WorkflowSession or None if not saved.
+        """
+        if self.storage is not None:
+            self.workflow_session = cast(
+                WorkflowSession, await self.storage.aupsert(session=self.get_workflow_session())
+            )
+        return self.workflow_session
+
     def load_session(self, force: bool = False) -> Optional[str]:
         """Load an existing session from the database and return the session_id.
         If a session does not exist, create a new session.
@@ -771,6 +795,51 @@ class Workflow:
         log_debug(f"Created new {self.__class__.__name__}")
         return new_workflow
 
+    def run_copy(self, *, update: Optional[Dict[str, Any]] = None) -> Workflow:
+        """Create and return a lightweight per-run copy of this Workflow, optionally updating fields.
+
+        Unlike deep_copy, storage and the Agent definitions are shared with this Workflow.
+        Only per-run state (session state, memory, extra data) is copied.
+
+        Args:
+            update (Optional[Dict[str, Any]]): Optional dictionary of fields for the new Workflow.
+
+        Returns:
+            Workflow: A new Workflow instance.
+        """
+        from copy import deepcopy
+
+        # Run state is reset for every run, so it is not carried over
+        excluded_fields = ["run_id", "run_input", "run_response", "images", "videos", "audio"]
+        fields_for_new_workflow: Dict[str, Any] = {}
+
+        for f in fields(self):
+            if f.name in excluded_fields:
+                continue
+            field_value = getattr(self, f.name)
+            if field_value is not None:
+                if isinstance(field_value, Agent):
+                    fields_for_new_workflow[f.name] = field_value.run_copy()
+                elif f.name == "memory" and isinstance(field_value, WorkflowMemory):
+                    fields_for_new_workflow[f.name] = field_value.deep_copy()
+                elif f.name in ("session_state", "extra_data", "memory"):
+                    try:
+                        fields_for_new_workflow[f.name] = deepcopy(field_value)
+                    except Exception as e:
+                        logger.warning(f"Failed to deepcopy field: {f.name} - {e}")
+                        fields_for_new_workflow[f.name] = field_value
+                else:
+                    fields_for_new_workflow[f.name] = field_value
+
+        # Update fields if provided
+        if update:
+            fields_for_new_workflow.update(update)
+
+        # Create a new Workflow
+        new_workflow = self.__class__(**fields_for_new_workflow)
+        log_debug(f"Created new {self.__class__.__name__} from template")
+        return new_workflow
+
     def _deep_copy_field(self, field_name: str, field_value: Any) -> Any:
         """Helper method to deep copy a field based on its type."""
         from copy import copy, deepcopy
@@ -0,0 +1,69 @@
+from agno.agent import Agent
+from agno.models.openai import OpenAIChat
+from agno.tools.toolkit import Toolkit
+from agno.workflow import Workflow
+
+
+def get_weather(city: str) -> str:
+    return f"Sunny in {city}"
+
+
+def test_run_copy_shares_definition():
+    toolkit = Toolkit(name="weather", tools=[get_weather])
+    agent = Agent(
+        model=OpenAIChat(id="gpt-4o", api_key="test"),
+        tools=[toolkit],
+        instructions=["Be concise"],
+        session_state={"counter": 0},
+    )
+
+    copied = agent.run_copy(update={"session_id": "s1"})
+
+    assert copied.session_id == "s1"
+    assert copied.instructions is agent.instructions
+    assert copied.model is not agent.model
+    assert copied.model.id == agent.model.id
+
+    # Per-run state is isolated
+    copied.session_state["counter"] = 1
+    assert agent.session_state == {"counter": 0}
+
+    # Functions are per copy so binding one to a run does not affect the template
+    copied_toolkit = copied.tools[0]
+    assert copied_toolkit is not toolkit
+    assert copied_toolkit.functions["get_weather"] is not toolkit.functions["get_weather"]
+    copied_toolkit.functions["get_weather"]._agent = copied
+    assert toolkit.functions["get_weather"]._agent is None
+
+
+def test_workflow_run_copy():
+    class DemoWorkflow(Workflow):
+        def run(self, topic: str):
+            return None
+
+    workflow = DemoWorkflow(session_state={"topics": []})
+    copied = workflow.run_copy(update={"workflow_id": "demo", "session_id": "s1"})
+
+    assert copied.workflow_id == "demo"
+    assert copied.session_id == "s1"
+    copied.session_state["topics"].append("ai")
+    assert workflow.session_state == {"topics": []}
+
+
+def test_run_copy_isolates_context():
+    def get_user(agent):
+        return {"name": "Ava"}
+
+    agent = Agent(
+        model=OpenAIChat(id="gpt-4o", api_key="test"),
+        context={"user": get_user},
+        extra_data={"tags": []},
+    )
+
+    copied = agent.run_copy()
+    copied.resolve_run_context()
+    copied.extra_data["tags"].append("run")
+
+    assert copied.context == {"user": {"name": "Ava"}}
+    assert agent.context == {"user": get_user}
+    assert agent.extra_data == {"tags": []}
@@ -0,0 +1,119 @@
+import re
+
+import pytest
+
+from agno.document.base import Document
+from agno.document.chunking.fixed import FixedSizeChunking
+from agno.document.chunking.recursive import RecursiveChunking
+from agno.document.chunking.token import TokenChunking
+from agno.document.chunking.tokenizer import Tokenizer
+from agno.embedder.base import Embedder
+
+TEXT = "The quick brown fox.\n\nJumps over\tthe lazy dog.  " * 20
+
+
+def _pieces(text: str, size: int):
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def _contents(documents):
+    return [(doc.id, doc.content, doc.meta_data) for doc in documents]
+
+
+def test_clean_text_collapses_whitespace():
+    assert FixedSizeChunking().clean_text("a \n\n b\t\tc\r\n") == "a b c "
+
+
+def test_fixed_size_chunking_ends_chunks_at_whitespace():
+    document = Document(id="doc", content=TEXT, meta_data={"source": "test"})
+    chunks = FixedSizeChunking(chunk_size=50).chunk(document)
+
+    cleaned = FixedSizeChunking().clean_text(TEXT)
+    assert "".join(chunk.content for chunk in chunks) == cleaned
+    assert all(len(chunk.content) <= 50 for chunk in chunks)
+    assert all(chunk.content.startswith(" ") for chunk in chunks[1:])
+    assert chunks[0].id == "doc_1"
+    assert chunks[0].meta_data == {"source": "test", "chunk": 1, "chunk_size": len(chunks[0].content)}
+    assert document.meta_data == {"source": "test"}
+
+
+def test_fixed_size_chunking_splits_long_words():
+    chunks = FixedSizeChunking(chunk_size=4).chunk(Document(name="doc", content="abcdefghij kl"))
+
+    assert [chunk.content for chunk in chunks] == ["abcd", "efgh", "ij", " kl"]
+    assert [chunk.id for chunk in chunks] == ["doc_1", "doc_2", "doc_3", "doc_4"]
+
+
+def test_fixed_size_chunking_overlap_does_not_loop():
+    chunks = FixedSizeChunking(chunk_size=10, overlap=5).chunk(Document(content="a bcdefghijklmnop"))
+
+    assert chunks[0].content == "a"
+    assert "".join(chunk.content for chunk in chunks[:2]) == "a bcdefghij"
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        FixedSizeChunking(chunk_size=50),
+        FixedSizeChunking(chunk_size=50, overlap=10),
+        RecursiveChunking(chunk_size=50),
+        RecursiveChunking(chunk_size=60, overlap=5),
+    ],
+)
+@pytest.mark.parametrize("piece_size", [1, 7, 64, 10_000])
+def test_chunk_stream_matches_chunk(strategy, piece_size):
+    document = Document(id="doc", name="doc", content=TEXT, meta_data={"source": "test"})
+
+    streamed = list(strategy.chunk_stream(document, _pieces(TEXT, piece_size)))
+
+    assert _contents(streamed) == _contents(strategy.chunk(document))
+
+
+def test_recursive_chunk_stream_returns_short_content_unchanged():
+    document = Document(id="doc", content="short\n\ntext")
+
+    streamed = list(RecursiveChunking(chunk_size=50).chunk_stream(document, ["short\n", "\ntext"]))
+
+    assert len(streamed) == 1
+    assert streamed[0].content == "short\n\ntext"
+
+
+class _WordTokenizer(Tokenizer):
+    """Counts every run of non-whitespace characters as one token"""
+
+    def get_token_offsets(self, text: str):
+        return [match.start() for match in re.finditer(r"\S+", text)]
+
+
+def test_token_chunking_cuts_chunks_at_token_budget():
+    content = " ".join(f"word{i}" for i in range(10))
+    chunks = TokenChunking(chunk_size=4, overlap=1, tokenizer=_WordTokenizer()).chunk(
+        Document(id="doc", content=content)
+    )
+
+    assert [chunk.content for chunk in chunks] == [
+        "word0 word1 word2 word3 ",
+        "word3 word4 word5 word6 ",
+        "word6 word7 word8 word9",
+    ]
+    assert [chunk.meta_data["chunk_tokens"] for chunk in chunks] == [4, 4, 4]
+    assert chunks[1].id == "doc_2"
+
+
+def test_token_chunking_uses_embedder_token_limit():
+    embedder = Embedder(max_tokens=3)
+
+    assert TokenChunking(tokenizer=_WordTokenizer(), embedder=embedder).chunk_size == 3
+    assert TokenChunking(chunk_size=100, tokenizer=_WordTokenizer(), embedder=embedder).chunk_size == 3
+    assert TokenChunking(tokenizer=_WordTokenizer()).chunk_size == 512
+
+
+def test_recursive_chunking_in_tokens():
+    tokenizer = _WordTokenizer()
+    content = "One two three. Four five six seven. Eight nine. Ten eleven twelve thirteen fourteen."
+    chunks = RecursiveChunking(chunk_size=6, tokenizer=tokenizer).chunk(Document(content=content))
+
+    assert chunks[0].content == "One two three."
+    assert all(tokenizer.count_tokens(chunk.content) <= 6 for chunk in chunks)
+    assert "".join(chunk.content for chunk in chunks) == content
+    assert RecursiveChunking(chunk_size=20, tokenizer=tokenizer).chunk(Document(content=content))[0].content == content
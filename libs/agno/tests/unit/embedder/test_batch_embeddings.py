@@ -0,0 +1,136 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.document import Document
+from agno.embedder.base import Embedder
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    """Embedder that embeds a text as [len(text)] and records every request"""
+
+    dimensions: int = 1
+    calls: List[List[str]] = field(default_factory=list)
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [float(len(text))]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.calls.append([text])
+        return self.get_embedding(text), {"total_tokens": 1}
+
+
+@dataclass
+class NativeBatchEmbedder(CountingEmbedder):
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        self.calls.append(list(texts))
+        return [self.get_embedding(text) for text in texts], {"total_tokens": len(texts)}
+
+
+def test_default_batch_falls_back_to_single_requests():
+    embedder = CountingEmbedder()
+    embeddings, usages = embedder.get_embeddings_batch_and_usage(["a", "bb", "ccc"], batch_size=2)
+
+    assert embeddings == [[1.0], [2.0], [3.0]]
+    assert len(embedder.calls) == 3
+    # Usage is summed per batch and reported on the first text of each batch
+    assert usages == [{"total_tokens": 2}, None, {"total_tokens": 1}]
+
+
+def test_native_batch_sends_one_request_per_batch():
+    embedder = NativeBatchEmbedder(batch_size=2)
+    embeddings = embedder.get_embeddings_batch(["a", "bb", "ccc", "dddd", "eeeee"])
+
+    assert embeddings == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert embedder.calls == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+
+
+async def test_async_batch_preserves_order():
+    embedder = NativeBatchEmbedder(batch_size=2, batch_concurrency=2)
+    embeddings, usages = await embedder.async_get_embeddings_batch_and_usage(["a", "bb", "ccc"])
+
+    assert embeddings == [[1.0], [2.0], [3.0]]
+    assert usages == [{"total_tokens": 2}, None, {"total_tokens": 1}]
+    assert len(embedder.calls) == 2
+
+
+def test_document_embed_many():
+    embedder = NativeBatchEmbedder(batch_size=10)
+    documents = [Document(content="a"), Document(content="bb"), Document(content="ccc")]
+
+    Document.embed_many(documents, embedder=embedder)
+
+    assert [doc.embedding for doc in documents] == [[1.0], [2.0], [3.0]]
+    assert documents[0].usage == {"total_tokens": 3}
+    assert embedder.calls == [["a", "bb", "ccc"]]
+
+
+async def test_document_async_embed_many():
+    embedder = NativeBatchEmbedder(batch_size=2)
+    documents = [Document(content="a", embedder=embedder), Document(content="bb"), Document(content="ccc")]
+
+    await Document.async_embed_many(documents)
+
+    assert [doc.embedding for doc in documents] == [[1.0], [2.0], [3.0]]
+
+
+def test_document_embed_many_requires_embedder():
+    with pytest.raises(ValueError):
+        Document.embed_many([Document(content="a")])
+
+
+def test_document_embed_many_replaces_embeddings_of_other_embedders():
+    embedder = NativeBatchEmbedder(batch_size=10)
+    stale = Document(content="a", embedding=[0.0, 0.0])
+    documents = [stale, Document(content="bb")]
+
+    Document.embed_many(documents, embedder=embedder)
+    assert stale.embedding == [1.0]
+
+    # Documents embedded by the same embedder are not embedded again
+    Document.embed_many(documents, embedder=embedder)
+    assert embedder.calls == [["a", "bb"]]
+
+
+def test_document_embed_many_checks_embedding_count():
+    class ShortEmbedder(NativeBatchEmbedder):
+        def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+            return [[1.0]], None
+
+    with pytest.raises(ValueError):
+        Document.embed_many([Document(content="a"), Document(content="bb")], embedder=ShortEmbedder())
+
+
+@dataclass
+class FailingBatchEmbedder(NativeBatchEmbedder):
+    """Embedder whose batch requests fail and whose single requests fail for texts containing 'bad'"""
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        raise RuntimeError("batch request failed")
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        if "bad" in text:
+            raise RuntimeError("request failed")
+        return super().get_embedding_and_usage(text)
+
+
+def test_document_embed_many_falls_back_to_single_requests():
+    embedder = FailingBatchEmbedder()
+    documents = [Document(content="a"), Document(content="bad"), Document(content="ccc", embedding=[0.0, 0.0])]
+
+    Document.embed_many(documents, embedder=embedder)
+
+    # Documents the embedder fails on are left without an embedding, the others are embedded
+    assert [doc.embedding for doc in documents] == [[1.0], None, [3.0]]
+    assert embedder.calls == [["a"], ["ccc"]]
+
+
+async def test_document_async_embed_many_falls_back_to_single_requests():
+    embedder = FailingBatchEmbedder()
+    documents = [Document(content="a"), Document(content="bad")]
+
+    await Document.async_embed_many(documents, embedder=embedder)
+
+    assert [doc.embedding for doc in documents] == [[1.0], None]
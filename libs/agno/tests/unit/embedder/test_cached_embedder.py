@@ -0,0 +1,98 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.embedder.base import Embedder
+from agno.embedder.cache import EmbeddingCache, InMemoryEmbeddingCache
+from agno.embedder.cache.sqlite import SqliteEmbeddingCache
+from agno.embedder.cached import CachedEmbedder
+
+
+@dataclass
+class RecordingEmbedder(Embedder):
+    """Embedder that embeds a text as [len(text), 0.5] and records every batch request"""
+
+    id: str = "recording"
+    dimensions: int = 2
+    calls: List[List[str]] = field(default_factory=list)
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [float(len(text)), 0.5]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.calls.append([text])
+        return self.get_embedding(text), {"total_tokens": 1}
+
+    def _get_batch_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        self.calls.append(list(texts))
+        return [self.get_embedding(text) for text in texts], {"total_tokens": len(texts)}
+
+
+def test_cached_embedder_only_embeds_misses():
+    embedder = RecordingEmbedder()
+    cached_embedder = CachedEmbedder(embedder=embedder)
+
+    assert cached_embedder.get_embedding("hello") == [5.0, 0.5]
+    embeddings, usages = cached_embedder.get_embeddings_batch_and_usage(["hello", "hi", "hey", "hi"])
+
+    assert embeddings == [[5.0, 0.5], [2.0, 0.5], [3.0, 0.5], [2.0, 0.5]]
+    # Only the unique misses are sent, in a single batch, and cache hits report no usage
+    assert embedder.calls == [["hello"], ["hi", "hey"]]
+    assert usages == [None, {"total_tokens": 2}, None, None]
+    assert (cached_embedder.hits, cached_embedder.misses) == (2, 3)
+    assert cached_embedder.dimensions == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_embedder_async_batch():
+    embedder = RecordingEmbedder()
+    cached_embedder = CachedEmbedder(embedder=embedder)
+
+    await cached_embedder.async_get_embeddings_batch(["a", "bb"])
+    embeddings = await cached_embedder.async_get_embeddings_batch(["bb", "ccc"])
+
+    assert embeddings == [[2.0, 0.5], [3.0, 0.5]]
+    assert embedder.calls == [["a", "bb"], ["ccc"]]
+
+
+def test_cached_embedder_falls_back_to_embedder_when_cache_fails():
+    embedder = RecordingEmbedder()
+    cache = MagicMock(spec=EmbeddingCache)
+    cache.get_many.side_effect = ConnectionError("cache is down")
+    cache.set_many.side_effect = ConnectionError("cache is down")
+    cached_embedder = CachedEmbedder(embedder=embedder, cache=cache)
+
+    embeddings = cached_embedder.get_embeddings_batch(["a", "bb"])
+
+    assert embeddings == [[1.0, 0.5], [2.0, 0.5]]
+    assert embedder.calls == [["a", "bb"]]
+    assert cached_embedder.misses == 2
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryEmbeddingCache(max_size=2)
+    cache.set_many({"a": [1.0], "b": [2.0]})
+    cache.get_many(["a"])
+    cache.set_many({"c": [3.0]})
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": [1.0], "c": [3.0]}
+
+
+def test_sqlite_cache_is_shared_between_embedders(tmp_path):
+    db_file = str(tmp_path / "embeddings.db")
+    CachedEmbedder(embedder=RecordingEmbedder(), cache=SqliteEmbeddingCache(db_file=db_file)).get_embeddings_batch(
+        ["hello", "world!"]
+    )
+
+    embedder = RecordingEmbedder()
+    cached_embedder = CachedEmbedder(embedder=embedder, cache=SqliteEmbeddingCache(db_file=db_file))
+    assert cached_embedder.get_embeddings_batch(["world!", "hello"]) == [[6.0, 0.5], [5.0, 0.5]]
+    assert embedder.calls == []
+    assert cached_embedder.hit_rate == 1.0
+
+    # Embeddings of a different model are cached separately
+    other_embedder = RecordingEmbedder(id="other")
+    CachedEmbedder(embedder=other_embedder, cache=SqliteEmbeddingCache(db_file=db_file)).get_embedding("hello")
+    assert other_embedder.calls == [["hello"]]
@@ -0,0 +1,382 @@
+import os
+import time
+from pathlib import Path
+from typing import List
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agno.document import Document
+from agno.embedder.base import Embedder
+from agno.knowledge.agent import AgentKnowledge
+from agno.knowledge.cache import KnowledgeSearchCache
+from agno.knowledge.pipeline import IngestionPipeline
+from agno.utils.string import safe_content_hash
+from agno.vectordb.base import VectorDb
+
+
+@pytest.fixture
+def documents():
+    return [Document(name=f"doc_{i}", content=f"content {i}") for i in range(5)] + [
+        Document(name="duplicate", content="content 0")
+    ]
+
+
+def test_filter_existing_documents_bulk(documents):
+    """Existing documents are looked up in bulk, one query per batch"""
+    existing = {safe_content_hash("content 1"), safe_content_hash("content 3")}
+    vector_db = MagicMock(spec=VectorDb)
+    vector_db.existing_content_hashes.side_effect = lambda hashes: existing.intersection(hashes)
+
+    knowledge = AgentKnowledge(vector_db=vector_db, existence_check_batch_size=2)
+    filtered = knowledge.filter_existing_documents(documents)
+
+    assert [doc.name for doc in filtered] == ["doc_0", "doc_2", "doc_4"]
+    assert vector_db.existing_content_hashes.call_count == 3
+    vector_db.doc_exists.assert_not_called()
+
+
+def test_filter_existing_documents_falls_back_to_doc_exists(documents):
+    """Vector dbs without a bulk lookup are checked one document at a time"""
+    vector_db = MagicMock(spec=VectorDb)
+    vector_db.existing_content_hashes.side_effect = NotImplementedError
+    vector_db.doc_exists.side_effect = lambda doc: doc.content == "content 2"
+
+    knowledge = AgentKnowledge(vector_db=vector_db)
+    filtered = knowledge.filter_existing_documents(documents)
+
+    assert [doc.name for doc in filtered] == ["doc_0", "doc_1", "doc_3", "doc_4"]
+    assert vector_db.doc_exists.call_count == 5
+
+
+@pytest.mark.asyncio
+async def test_async_filter_existing_documents_bulk(documents):
+    existing = {safe_content_hash("content 0")}
+
+    async def _existing_content_hashes(hashes):
+        return existing.intersection(hashes)
+
+    vector_db = MagicMock(spec=VectorDb)
+    vector_db.async_existing_content_hashes.side_effect = _existing_content_hashes
+
+    knowledge = AgentKnowledge(vector_db=vector_db)
+    filtered = await knowledge.async_filter_existing_documents(documents)
+
+    assert [doc.name for doc in filtered] == ["doc_1", "doc_2", "doc_3", "doc_4"]
+
+
+@pytest.fixture
+def in_memory_vector_db():
+    """Mock vector db that stores documents by content hash"""
+    store = {}
+
+    def _delete_by_content_hashes(hashes):
+        for content_hash in hashes:
+            store.pop(content_hash, None)
+        return True
+
+    vector_db = MagicMock(spec=VectorDb)
+    vector_db.exists.return_value = True
+    vector_db.upsert_available.return_value = False
+    vector_db.insert.side_effect = lambda documents, filters=None: store.update(
+        {safe_content_hash(doc.content): doc for doc in documents}
+    )
+    vector_db.existing_content_hashes.side_effect = lambda hashes: set(hashes).intersection(store)
+    vector_db.delete_by_content_hashes.side_effect = _delete_by_content_hashes
+    vector_db.store = store
+    return vector_db
+
+
+def test_sync_only_processes_changed_sources(tmp_path, in_memory_vector_db):
+    from agno.knowledge.manifest.sqlite import SqliteKnowledgeManifest
+    from agno.knowledge.text import TextKnowledgeBase
+
+    for name in ["a", "b", "c", "d"]:
+        (tmp_path / f"{name}.txt").write_text(f"content of {name}")
+    # Files with the same content share their documents
+    (tmp_path / "d.txt").write_text("content of c")
+
+    knowledge = TextKnowledgeBase(
+        path=tmp_path, vector_db=in_memory_vector_db, manifest=SqliteKnowledgeManifest(table_name="manifest")
+    )
+
+    result = knowledge.sync()
+    assert len(result.added) == 4
+    assert len(in_memory_vector_db.store) == 3
+
+    result = knowledge.sync()
+    assert len(result.unchanged) == 4
+    assert in_memory_vector_db.insert.call_count == 3
+
+    # Touch a file without changing it, change a file and remove two files
+    (tmp_path / "a.txt").write_text("content of a")
+    os.utime(tmp_path / "a.txt", (0, 0))
+    (tmp_path / "b.txt").write_text("new content of b")
+    (tmp_path / "c.txt").unlink()
+
+    result = knowledge.sync()
+    assert sorted(Path(uri).name for uri in result.unchanged) == ["a.txt", "d.txt"]
+    assert [Path(uri).name for uri in result.changed] == ["b.txt"]
+    assert [Path(uri).name for uri in result.removed] == ["c.txt"]
+    assert sorted(doc.content for doc in in_memory_vector_db.store.values()) == [
+        "content of a",
+        "content of c",
+        "new content of b",
+    ]
+
+
+@pytest.mark.parametrize("delete_error", [NotImplementedError(), None])
+def test_sync_retries_stale_documents_when_delete_fails(tmp_path, in_memory_vector_db, delete_error):
+    from agno.knowledge.manifest.sqlite import SqliteKnowledgeManifest
+    from agno.knowledge.text import TextKnowledgeBase
+
+    for name in ["a", "b"]:
+        (tmp_path / f"{name}.txt").write_text(f"content of {name}")
+    manifest = SqliteKnowledgeManifest(table_name="manifest")
+    knowledge = TextKnowledgeBase(path=tmp_path, vector_db=in_memory_vector_db, manifest=manifest)
+    knowledge.sync()
+
+    # The vector db either does not support deleting documents or fails to delete them
+    delete_side_effect = in_memory_vector_db.delete_by_content_hashes.side_effect
+    in_memory_vector_db.delete_by_content_hashes.side_effect = delete_error
+    in_memory_vector_db.delete_by_content_hashes.return_value = False
+    (tmp_path / "a.txt").write_text("new content of a")
+    (tmp_path / "b.txt").unlink()
+
+    result = knowledge.sync()
+    assert [Path(uri).name for uri in result.changed] == ["a.txt"]
+    assert [Path(uri).name for uri in result.removed] == ["b.txt"]
+    records = {Path(uri).name: record for uri, record in manifest.read_all().items()}
+    assert sorted(records) == ["a.txt", "b.txt"]
+    assert records["a.txt"].stale_hashes == [safe_content_hash("content of a")]
+    assert len(in_memory_vector_db.store) == 3
+
+    # Once deleting works again the next sync removes the stale documents
+    in_memory_vector_db.delete_by_content_hashes.side_effect = delete_side_effect
+    result = knowledge.sync()
+    assert [Path(uri).name for uri in result.unchanged] == ["a.txt"]
+    assert [Path(uri).name for uri in result.removed] == ["b.txt"]
+    records = {Path(uri).name: record for uri, record in manifest.read_all().items()}
+    assert sorted(records) == ["a.txt"]
+    assert records["a.txt"].stale_hashes == []
+    assert [doc.content for doc in in_memory_vector_db.store.values()] == ["new content of a"]
+
+
+def test_sync_combined_knowledge_base(tmp_path, in_memory_vector_db):
+    from agno.knowledge.combined import CombinedKnowledgeBase
+    from agno.knowledge.manifest.sqlite import SqliteKnowledgeManifest
+    from agno.knowledge.text import TextKnowledgeBase
+
+    for name in ["a", "b"]:
+        (tmp_path / name).mkdir()
+        (tmp_path / name / f"{name}.txt").write_text(f"content of {name}")
+
+    knowledge = CombinedKnowledgeBase(
+        sources=[TextKnowledgeBase(path=tmp_path / name) for name in ["a", "b"]],
+        vector_db=in_memory_vector_db,
+        manifest=SqliteKnowledgeManifest(table_name="manifest"),
+    )
+
+    result = knowledge.sync()
+    assert sorted(Path(uri).name for uri in result.added) == ["a.txt", "b.txt"]
+    assert len(knowledge.sync().unchanged) == 2
+
+
+def test_file_sources(tmp_path):
+    """Files are filtered by format and excluded names, and list items carry their metadata"""
+    (tmp_path / "nested").mkdir()
+    for name in ["a.txt", "nested/b.txt", "c.csv", "skip.txt"]:
+        (tmp_path / name).write_text(f"content of {name}")
+
+    def read(path: Path) -> List[Document]:
+        return [Document(name=path.name, content=path.read_text())]
+
+    knowledge = AgentKnowledge()
+    sources = knowledge._get_file_sources(tmp_path, [".txt"], read, exclude_files=["skip.txt"])
+    assert sorted(Path(source.uri).name for source in sources) == ["a.txt", "b.txt"]
+
+    items = [{"path": str(tmp_path / "a.txt"), "metadata": {"tag": "a"}}, {"path": str(tmp_path / "c.csv")}]
+    sources = list(knowledge._get_file_sources(items, [".txt"], read))
+    assert len(sources) == 1
+    assert sources[0].read()[0].meta_data == {"tag": "a"}
+
+
+def test_search_cache_hits_until_load_invalidates():
+    """Repeated searches are served from the cache until documents are loaded"""
+    vector_db = MagicMock(spec=VectorDb)
+    vector_db.search.return_value = [Document(content="cached")]
+    vector_db.upsert_available.return_value = True
+
+    knowledge = AgentKnowledge(vector_db=vector_db, search_cache=KnowledgeSearchCache())
+    assert knowledge.search("what is  agno?")[0].content == "cached"
+    assert knowledge.search("what is agno? ")[0].content == "cached"
+    assert vector_db.search.call_count == 1
+
+    # Different filters and number of documents are cached separately
+    knowledge.search("what is agno?", filters={"type": "faq"})
+    knowledge.search("what is agno?", num_documents=2)
+    assert vector_db.search.call_count == 3
+
+    knowledge.load_documents([Document(content="new")], upsert=True)
+    knowledge.search("what is agno?")
+    assert vector_db.search.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_async_search_cache():
+    async def _async_search(query, limit, filters):
+        return [Document(content="cached")]
+
+    vector_db = MagicMock(spec=VectorDb)
+    vector_db.async_search.side_effect = _async_search
+
+    knowledge = AgentKnowledge(vector_db=vector_db, search_cache=KnowledgeSearchCache())
+    await knowledge.async_search("query")
+    await knowledge.async_search("query")
+    assert vector_db.async_search.call_count == 1
+
+
+def test_search_cache_ttl_lru_and_versioning():
+    cache = KnowledgeSearchCache(max_size=2, ttl=60)
+    docs = [Document(content="doc")]
+
+    cache.set("a", docs, cache.version)
+    cache.set("b", docs, cache.version)
+    cache.get("a")
+    cache.set("c", docs, cache.version)
+    # "b" was the least recently used entry
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+    # Results of a search that started before an invalidation are not stored
+    version = cache.version
+    cache.invalidate()
+    cache.set("d", docs, version)
+    assert cache.get("d") is None and len(cache) == 0
+
+    with patch("agno.knowledge.cache.monotonic", return_value=time.monotonic() + 61):
+        cache.set("e", docs, cache.version)
+    assert cache.get("e") is not None
+    cache.set("f", docs, cache.version)
+    with patch("agno.knowledge.cache.monotonic", return_value=time.monotonic() + 61):
+        assert cache.get("f") is None
+
+
+def test_search_cache_query_case():
+    """Queries are case-sensitive unless lowercase_queries is set"""
+    cache = KnowledgeSearchCache()
+    assert cache.get_key("What is  Agno?", 5) == cache.get_key(" What is Agno?", 5)
+    assert cache.get_key("What is Agno?", 5) != cache.get_key("what is agno?", 5)
+
+    cache = KnowledgeSearchCache(lowercase_queries=True)
+    assert cache.get_key("What is Agno?", 5) == cache.get_key("what is agno?", 5)
+
+
+def test_search_cache_returns_copies():
+    """Changing the documents of a search does not change the cached documents"""
+    cache = KnowledgeSearchCache()
+    docs = [Document(content="doc", meta_data={"tags": ["a"]}, embedding=[1.0])]
+    cache.set("key", docs, cache.version)
+    docs[0].meta_data["tags"].append("b")
+
+    cached = cache.get("key")
+    assert cached is not None and cached[0] is not docs[0]
+    assert cached[0].meta_data == {"tags": ["a"]}
+    cached[0].meta_data["source"] = "changed"
+    cached[0].embedding.append(2.0)  # type: ignore
+
+    cached_again = cache.get("key")
+    assert cached_again is not None
+    assert cached_again[0].meta_data == {"tags": ["a"]} and cached_again[0].embedding == [1.0]
+
+
+class _CountingEmbedder(Embedder):
+    """Embeds each text as its length"""
+
+    def get_embedding_and_usage(self, text):
+        return [float(len(text))], None
+
+
+class _ListKnowledge(AgentKnowledge):
+    sources_to_load: List[List[Document]] = []
+
+    @property
+    def document_lists(self):
+        for document_list in self.sources_to_load:
+            yield document_list
+
+    @property
+    async def async_document_lists(self):
+        for document_list in self.sources_to_load:
+            yield document_list
+
+
+@pytest.fixture
+def pipeline_sources():
+    return [[Document(content=f"source {s} document {i}", meta_data={"source": s}) for i in range(5)] for s in range(3)]
+
+
+def test_load_with_ingestion_pipeline(pipeline_sources, in_memory_vector_db):
+    in_memory_vector_db.embedder = _CountingEmbedder()
+    progress = []
+    pipeline = IngestionPipeline(embed_batch_size=2, embed_concurrency=2, write_batch_size=4, queue_size=1)
+    pipeline.progress_callback = lambda metrics: progress.append(metrics.documents_written)
+
+    knowledge = _ListKnowledge(
+        vector_db=in_memory_vector_db, sources_to_load=pipeline_sources, ingestion_pipeline=pipeline
+    )
+    knowledge.load()
+
+    assert len(in_memory_vector_db.store) == 15
+    assert all(doc.embedding == [float(len(doc.content))] for doc in in_memory_vector_db.store.values())
+    for call in in_memory_vector_db.insert.call_args_list:
+        documents, filters = call.kwargs["documents"], call.kwargs["filters"]
+        # Writes are batched and never mix documents with different filters
+        assert len(documents) <= 4
+        assert all(doc.meta_data == filters for doc in documents)
+    assert pipeline.metrics.sources_read == 3
+    assert pipeline.metrics.documents_embedded == 15
+    assert pipeline.metrics.documents_written == 15
+    assert progress[-1] == 15 and len(progress) == pipeline.metrics.batches_written
+    assert knowledge.valid_metadata_filters == {"source"}
+
+    # Existing documents are skipped on the next load
+    knowledge.load()
+    assert pipeline.metrics.documents_written == 0
+
+
+def test_ingestion_pipeline_raises_stage_errors(pipeline_sources, in_memory_vector_db):
+    # Embedding errors fall back to embedding documents one by one, write errors fail the load
+    in_memory_vector_db.embedder = _CountingEmbedder()
+    in_memory_vector_db.insert.side_effect = RuntimeError("write failed")
+
+    knowledge = _ListKnowledge(
+        vector_db=in_memory_vector_db,
+        sources_to_load=pipeline_sources,
+        ingestion_pipeline=IngestionPipeline(embed_batch_size=1, queue_size=1),
+    )
+    with pytest.raises(RuntimeError, match="write failed"):
+        knowledge.load()
+
+
+@pytest.mark.asyncio
+async def test_aload_with_ingestion_pipeline(pipeline_sources, in_memory_vector_db):
+    async def _async_insert(documents, filters=None):
+        in_memory_vector_db.insert(documents=documents, filters=filters)
+
+    async def _async_existing_content_hashes(hashes):
+        return in_memory_vector_db.existing_content_hashes(hashes)
+
+    in_memory_vector_db.embedder = _CountingEmbedder()
+    in_memory_vector_db.async_insert.side_effect = _async_insert
+    in_memory_vector_db.async_existing_content_hashes.side_effect = _async_existing_content_hashes
+    pipeline = IngestionPipeline(embed_batch_size=3, embed_concurrency=3, write_batch_size=5, queue_size=1)
+
+    knowledge = _ListKnowledge(
+        vector_db=in_memory_vector_db, sources_to_load=pipeline_sources, ingestion_pipeline=pipeline
+    )
+    await knowledge.aload()
+
+    assert len(in_memory_vector_db.store) == 15
+    assert all(doc.embedding is not None for doc in in_memory_vector_db.store.values())
+    assert pipeline.metrics.documents_written == 15
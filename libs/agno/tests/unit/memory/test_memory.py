@@ -1,12 +1,20 @@
+import asyncio
+import threading
+from copy import deepcopy
 from datetime import datetime
+from typing import List
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
+from agno.embedder.base import Embedder
 from agno.memory.v2 import MemoryManager, SessionSummarizer
 from agno.memory.v2.db.schema import MemoryRow
+from agno.memory.v2.db.sqlite import SqliteMemoryDb
 from agno.memory.v2.memory import Memory
 from agno.memory.v2.schema import SessionSummary, UserMemory
+from agno.memory.v2.vector_index import get_memory_content_hash
+from agno.memory.v2.worker import MemoryWorker
 from agno.models.message import Message
 from agno.models.openai.chat import OpenAIChat
 from agno.run.response import RunResponse
@@ -408,6 +416,125 @@ def test_search_user_memories_last_n(memory_with_model):
         assert results == mock_memories
 
 
+class KeywordEmbedder(Embedder):
+    """Embeds text as keyword counts, so similarity is predictable in tests"""
+
+    keywords = ["pizza", "hiking", "python"]
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [float(text.lower().count(keyword)) + 0.01 for keyword in self.keywords]
+
+    def get_embedding_and_usage(self, text: str):
+        return self.get_embedding(text), None
+
+
+def test_search_user_memories_semantic():
+    embedder = KeywordEmbedder()
+    memory = Memory(embedder=embedder)
+    memory.add_user_memory(UserMemory(memory="Loves pizza", memory_id="m1"), user_id="test_user")
+    memory.add_user_memory(UserMemory(memory="Goes hiking on weekends", memory_id="m2"), user_id="test_user")
+    memory.add_user_memory(UserMemory(memory="Writes python for work", memory_id="m3"), user_id="test_user")
+
+    with patch.object(embedder, "get_embeddings_batch") as mock_batch:
+        results = memory.search_user_memories(
+            query="Where to go hiking?", retrieval_method="semantic", limit=2, user_id="test_user"
+        )
+        # Memories are embedded at write time, so searching only embeds the query
+        mock_batch.assert_not_called()
+
+    assert [m.memory_id for m in results][0] == "m2"
+    assert len(results) == 2
+
+    # Replaced memories are re-embedded
+    memory.replace_user_memory("m1", UserMemory(memory="Writes python scripts", memory_id="m1"), user_id="test_user")
+    results = memory.search_user_memories(query="python", retrieval_method="semantic", user_id="test_user")
+    assert {m.memory_id for m in results[:2]} == {"m1", "m3"}
+
+    # Deleted memories are not returned
+    memory.delete_user_memory("m3", user_id="test_user")
+    results = memory.search_user_memories(query="python", retrieval_method="semantic", user_id="test_user")
+    assert [m.memory_id for m in results] == ["m1", "m2"]
+
+
+def test_search_user_memories_semantic_embeds_missing_memories():
+    memory = Memory(embedder=KeywordEmbedder())
+    # Memories written without going through add_user_memory are embedded on search
+    memory.memories = {
+        "test_user": {
+            "m1": UserMemory(memory="Loves pizza", memory_id="m1"),
+            "m2": UserMemory(memory="Goes hiking", memory_id="m2"),
+        }
+    }
+    results = memory.search_user_memories(query="pizza", retrieval_method="semantic", limit=1, user_id="test_user")
+    assert [m.memory_id for m in results] == ["m1"]
+
+    with pytest.raises(ValueError):
+        memory.search_user_memories(retrieval_method="semantic", user_id="test_user")
+
+
+def test_search_user_memories_semantic_persists_embeddings():
+    db = SqliteMemoryDb()
+    memory = Memory(db=db, embedder=KeywordEmbedder())
+    memory.add_user_memory(UserMemory(memory="Loves pizza", memory_id="m1"), user_id="test_user")
+    assert db.read_memory_embeddings(user_id="test_user")["m1"][0] == get_memory_content_hash(
+        "Loves pizza", embedder=memory.embedder
+    )
+
+    # A new Memory reads the stored embeddings instead of embedding the memories again
+    new_memory = Memory(db=db, embedder=KeywordEmbedder())
+    with patch.object(new_memory.embedder, "get_embeddings_batch") as mock_batch:
+        results = new_memory.search_user_memories(query="pizza", retrieval_method="semantic", user_id="test_user")
+        mock_batch.assert_not_called()
+    assert [m.memory_id for m in results] == ["m1"]
+
+    # Embeddings made by another embedder are not used
+    other_memory = Memory(db=db, embedder=KeywordEmbedder(dimensions=3))
+    with patch.object(other_memory.embedder, "get_embeddings_batch", return_value=[[1.0, 0.0, 0.0]]) as mock_batch:
+        other_memory.search_user_memories(query="pizza", retrieval_method="semantic", user_id="test_user")
+        mock_batch.assert_called_once_with(["Loves pizza"])
+
+    new_memory.delete_user_memory("m1", user_id="test_user")
+    assert db.read_memory_embeddings(user_id="test_user") == {}
+
+
+def test_sqlite_memory_db_upserts_embeddings_in_bulk():
+    db = SqliteMemoryDb()
+    with patch.object(db.embeddings_table, "create", wraps=db.embeddings_table.create) as mock_create:
+        db.upsert_memory_embeddings({"m1": ("hash-1", [1.0, 0.0]), "m2": ("hash-2", [0.0, 1.0])}, user_id="u1")
+        db.upsert_memory_embedding(memory_id="m1", embedding=[0.5, 0.5], content_hash="hash-3", user_id="u1")
+        # The table is only created on the first write
+        mock_create.assert_called_once()
+
+    assert db.read_memory_embeddings(user_id="u1") == {"m1": ("hash-3", [0.5, 0.5]), "m2": ("hash-2", [0.0, 1.0])}
+
+
+def test_update_memory_index_stores_embeddings_in_bulk():
+    db = SqliteMemoryDb()
+    # Memories written without an embedding, e.g. by another process
+    for memory_id, text in [("m1", "Loves pizza"), ("m2", "Goes hiking")]:
+        db.upsert_memory(
+            MemoryRow(id=memory_id, user_id="test_user", memory=UserMemory(memory=text, memory_id=memory_id).to_dict())
+        )
+    memory = Memory(db=db, embedder=KeywordEmbedder())
+    with patch.object(
+        SqliteMemoryDb, "upsert_memory_embeddings", autospec=True, side_effect=SqliteMemoryDb.upsert_memory_embeddings
+    ) as mock_upsert:
+        memory.search_user_memories(query="pizza", retrieval_method="semantic", user_id="test_user")
+        mock_upsert.assert_called_once()
+    assert sorted(db.read_memory_embeddings(user_id="test_user")) == ["m1", "m2"]
+
+
+def test_search_user_memories_semantic_warns_on_dimension_mismatch():
+    memory = Memory(embedder=KeywordEmbedder())
+    memory.add_user_memory(UserMemory(memory="Loves pizza", memory_id="m1"), user_id="test_user")
+
+    with patch.object(memory.embedder, "get_embedding", return_value=[1.0, 0.0]):
+        with patch("agno.memory.v2.vector_index.log_warning") as mock_warning:
+            results = memory.search_user_memories(query="pizza", retrieval_method="semantic", user_id="test_user")
+    assert results == []
+    mock_warning.assert_called_once()
+
+
 def test_search_user_memories_first_n(memory_with_model):
     # Setup test data
     memory_with_model.memories = {
@@ -597,6 +724,37 @@ def test_get_messages_from_last_n_runs(memory_with_model):
     assert messages[1].content == "It's expected to rain."
 
 
+def test_get_messages_from_last_n_runs_within_token_budget(memory_with_model):
+    session_id = "test_session"
+    for i in range(4):
+        memory_with_model.add_run(
+            session_id,
+            RunResponse(
+                run_id=f"run_{i}",
+                messages=[
+                    Message(role="system", content="s" * 400),
+                    Message(role="user", content="u" * 36),
+                    Message(role="assistant", content="a" * 76),
+                ],
+            ),
+        )
+
+    # Each run takes (9 + 4) + (19 + 4) = 36 tokens without the system message
+    messages = memory_with_model.get_messages_from_last_n_runs(session_id, skip_role="system", max_tokens=100)
+    assert len(messages) == 4
+    assert memory_with_model._history_token_counts[session_id]["run_3"] == [104, 13, 23]
+
+    # Runs are included whole and newest first
+    messages = memory_with_model.get_messages_from_last_n_runs(session_id, last_n=1, skip_role="system", max_tokens=100)
+    assert len(messages) == 2
+    assert memory_with_model.get_messages_from_last_n_runs(session_id, skip_role="system", max_tokens=35) == []
+
+    # The token counts of runs removed from memory are dropped
+    memory_with_model.runs[session_id] = memory_with_model.runs[session_id][2:]
+    memory_with_model.get_messages_from_last_n_runs(session_id, skip_role="system", max_tokens=100)
+    assert set(memory_with_model._history_token_counts[session_id]) == {"run_2", "run_3"}
+
+
 # Team Context Tests
 def test_add_interaction_to_team_context(memory_with_model):
     """Test adding an interaction to team context."""
@@ -709,6 +867,74 @@ def test_create_user_memories(memory_with_managers, mock_db):
     assert any(m.memory == "New memory 2" for m in memories)
 
 
+def test_deferred_user_memories_are_coalesced(memory_with_managers):
+    started, release = threading.Event(), threading.Event()
+    calls: List[List[str]] = []
+
+    def create_or_update_memories(messages, **kwargs):
+        calls.append([message.content for message in messages])
+        started.set()
+        release.wait(timeout=5)
+        return "ok"
+
+    memory_with_managers.memory_manager.create_or_update_memories.side_effect = create_or_update_memories
+
+    memory_with_managers.schedule_user_memories([Message(role="user", content="first")], user_id="test_user")
+    assert started.wait(timeout=5)
+    # Messages scheduled while the first update runs are sent in a single call, also by copies of the memory
+    copied_memory = deepcopy(memory_with_managers)
+    assert copied_memory.get_update_worker() is memory_with_managers.get_update_worker()
+    for content in ("second", "third"):
+        copied_memory.schedule_user_memories([Message(role="user", content=content)], user_id="test_user")
+    release.set()
+
+    assert memory_with_managers.flush_updates(timeout=5)
+    assert calls == [["first"], ["second", "third"]]
+    assert not memory_with_managers.get_update_worker()._running
+    memory_with_managers.shutdown_updates()
+
+
+def test_deferred_session_summary(memory_with_managers, sample_run_response):
+    mock_summary = MagicMock()
+    mock_summary.summary = "Test summary"
+    mock_summary.topics = ["test"]
+    memory_with_managers.summary_manager.run.return_value = mock_summary
+    memory_with_managers.add_run("test_session", sample_run_response)
+
+    completed: List[SessionSummary] = []
+    memory_with_managers.schedule_session_summary("test_session", "test_user", on_complete=completed.append)
+    # The conversation is captured when the summary is scheduled
+    memory_with_managers.runs.pop("test_session")
+
+    assert memory_with_managers.flush_updates(timeout=5)
+    assert completed[0].summary == "Test summary"
+    assert memory_with_managers.summaries["test_user"]["test_session"] == completed[0]
+    conversation = memory_with_managers.summary_manager.run.call_args.kwargs["conversation"]
+    assert [message.content for message in conversation] == ["Hello", "Hi there!"]
+    memory_with_managers.shutdown_updates()
+
+
+def test_session_writes_wait_for_background_writes():
+    worker = MemoryWorker()
+    order: List[str] = []
+
+    async def write_session():
+        async with worker.alock_session_writes():
+            order.append("foreground")
+
+    # A session written while a summary is persisted in the background waits for it
+    with worker.lock_session_writes():
+        writer = threading.Thread(target=asyncio.run, args=(write_session(),))
+        writer.start()
+        writer.join(timeout=0.1)
+        order.append("background")
+    writer.join(timeout=5)
+
+    assert order == ["background", "foreground"]
+    with worker.lock_session_writes():
+        pass
+
+
 def test_to_dict_and_from_dict(memory_with_model, sample_user_memory, sample_session_summary):
     # Setup memory with user memories and summaries
     user_id = "test_user"
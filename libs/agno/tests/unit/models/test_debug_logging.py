@@ -0,0 +1,73 @@
+from unittest.mock import patch
+
+from agno.agent import Agent
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+from agno.team import Team
+from agno.utils.debug_trace import InMemoryDebugTrace, JsonlDebugTrace
+from agno.utils.log import set_log_level_to_debug, set_log_level_to_info
+
+
+def _respond(messages, assistant_message, model_response, **kwargs):
+    assistant_message.content = "Hi there!"
+
+
+def test_message_log_is_skipped_when_debug_is_off():
+    message = Message(role="user", content="Hello")
+
+    set_log_level_to_info()
+    with patch("agno.models.message.log_debug") as log_debug:
+        message.log(metrics=True)
+    log_debug.assert_not_called()
+
+    set_log_level_to_debug()
+    try:
+        with patch("agno.models.message.log_debug") as log_debug:
+            message.log(metrics=True)
+        log_debug.assert_called()
+    finally:
+        set_log_level_to_info()
+
+
+def test_debug_trace_records_model_messages_without_debug_logging():
+    set_log_level_to_info()
+    trace = InMemoryDebugTrace()
+    model = OpenAIChat(id="gpt-4o", debug_trace=trace)
+
+    with patch.object(model, "_process_model_response", side_effect=_respond):
+        model.response(messages=[Message(role="user", content="Hello")])
+
+    assert [record["event"] for record in trace.records] == ["request", "assistant_message"]
+    assert trace.records[0]["model"] == "gpt-4o"
+    assert trace.records[0]["messages"][0]["content"] == "Hello"
+    assert trace.records[1]["messages"][0]["content"] == "Hi there!"
+
+
+def test_debug_trace_does_not_modify_shared_model():
+    model = OpenAIChat(id="gpt-4o")
+    agent_trace = InMemoryDebugTrace()
+    team_trace = InMemoryDebugTrace()
+    agent = Agent(model=model, debug_trace=agent_trace, telemetry=False, monitoring=False)
+    team = Team(members=[], model=model, debug_trace=team_trace, telemetry=False, monitoring=False)
+
+    agent.initialize_agent()
+    team.initialize_team()
+
+    assert model.debug_trace is None
+    assert agent.model is not model and agent.model.debug_trace is agent_trace
+    assert team.model is not model and team.model.debug_trace is team_trace
+
+    # The traced copy is kept for later runs
+    traced_model = agent.model
+    agent.initialize_agent()
+    assert agent.model is traced_model
+
+
+def test_jsonl_debug_trace(tmp_path):
+    trace = JsonlDebugTrace(tmp_path / "trace.jsonl")
+    trace.emit("request", messages=[{"role": "user", "content": "Hello"}])
+    trace.emit("assistant_message", messages=[])
+
+    lines = (tmp_path / "trace.jsonl").read_text().splitlines()
+    assert len(lines) == 2
+    assert '"event": "request"' in lines[0]
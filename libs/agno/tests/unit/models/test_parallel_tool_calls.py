@@ -0,0 +1,61 @@
+import threading
+import time
+
+from agno.models.openai import OpenAIChat
+from agno.models.response import ModelResponseEvent
+from agno.tools.function import Function, FunctionCall
+
+
+def _function_call(function: Function, call_id: str, **arguments) -> FunctionCall:
+    function.process_entrypoint()
+    return FunctionCall(function=function, arguments=arguments, call_id=call_id)
+
+
+def test_run_function_calls_in_parallel_keeps_order():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def slow_echo(value: str, delay: float) -> str:
+        # All three calls must be running at the same time to pass the barrier
+        barrier.wait()
+        time.sleep(delay)
+        return value
+
+    model = OpenAIChat(id="gpt-4o", run_tools_in_parallel=True, max_tool_workers=3)
+    function_calls = [
+        _function_call(Function(name="slow_echo", entrypoint=slow_echo), call_id=f"call-{i}", value=str(i), delay=delay)
+        for i, delay in enumerate([0.2, 0.1, 0.0])
+    ]
+
+    function_call_results = []
+    events = list(model.run_function_calls(function_calls=function_calls, function_call_results=function_call_results))
+
+    started = [e for e in events if e.event == ModelResponseEvent.tool_call_started.value]
+    completed = [e for e in events if e.event == ModelResponseEvent.tool_call_completed.value]
+    assert [e.tool_executions[0].tool_call_id for e in started] == ["call-0", "call-1", "call-2"]
+    assert [e.tool_executions[0].tool_call_id for e in completed] == ["call-0", "call-1", "call-2"]
+    assert [r.content for r in function_call_results] == ["0", "1", "2"]
+
+
+def test_run_function_calls_in_parallel_runs_unsafe_functions_in_caller_thread():
+    threads = {}
+
+    def record_thread(name: str) -> str:
+        threads[name] = threading.current_thread()
+        return name
+
+    model = OpenAIChat(id="gpt-4o", run_tools_in_parallel=True)
+    function_calls = [
+        _function_call(Function(name="record_thread", entrypoint=record_thread), call_id="call-0", name="safe-0"),
+        _function_call(
+            Function(name="record_thread", entrypoint=record_thread, thread_safe=False), call_id="call-1", name="unsafe"
+        ),
+        _function_call(Function(name="record_thread", entrypoint=record_thread), call_id="call-2", name="safe-1"),
+    ]
+
+    function_call_results = []
+    list(model.run_function_calls(function_calls=function_calls, function_call_results=function_call_results))
+
+    assert [r.content for r in function_call_results] == ["safe-0", "unsafe", "safe-1"]
+    assert threads["unsafe"] is threading.current_thread()
+    assert threads["safe-0"] is not threading.current_thread()
+    assert threads["safe-1"] is not threading.current_thread()
@@ -0,0 +1,80 @@
+from unittest.mock import patch
+
+from agno.agent import Agent
+from agno.media import AudioResponse
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+from agno.models.response import ModelResponse
+from agno.run.response import RunEvent
+from agno.team import Team
+from agno.utils.stream_buffer import StreamBuffer
+
+CHUNKS = ["The ", "quick ", "brown ", "fox"]
+
+
+def _patch_stream(model: OpenAIChat):
+    """Make the model stream CHUNKS as content and thinking, and two chunks of audio"""
+
+    def process_response_stream(messages, assistant_message, stream_data, **kwargs):
+        for chunk in CHUNKS:
+            yield from model._populate_stream_data_and_assistant_message(
+                stream_data, assistant_message, ModelResponse(content=chunk, thinking=chunk.upper())
+            )
+        for chunk in ["AAE", "C"]:
+            yield from model._populate_stream_data_and_assistant_message(
+                stream_data, assistant_message, ModelResponse(audio=AudioResponse(id="audio", content=chunk))
+            )
+
+    return patch.object(model, "process_response_stream", side_effect=process_response_stream)
+
+
+def test_stream_buffer():
+    buffer = StreamBuffer()
+    assert not buffer
+    assert buffer.getvalue() == ""
+    assert buffer.getvalue(None) is None
+
+    buffer += "Hello"
+    buffer.append("")
+    buffer.append(", world")
+    assert len(buffer) == 12
+    assert str(buffer) == buffer.getvalue() == "Hello, world"
+
+    audio = StreamBuffer(b"\x00")
+    audio.append(b"\x01")
+    assert audio.getvalue() == b"\x00\x01"
+
+
+def test_model_response_stream_joins_chunks():
+    model = OpenAIChat(id="gpt-4o")
+    messages = [Message(role="user", content="Hello")]
+
+    with _patch_stream(model):
+        deltas = list(model.response_stream(messages=messages))
+
+    assert [delta.content for delta in deltas if delta.content] == CHUNKS
+    assistant_message = messages[-1]
+    assert assistant_message.content == "The quick brown fox"
+    assert assistant_message.thinking == "THE QUICK BROWN FOX"
+    assert assistant_message.audio_output.content == "AAEC"
+
+
+def test_agent_and_team_stream_join_chunks():
+    agent = Agent(model=OpenAIChat(id="gpt-4o"), telemetry=False, monitoring=False)
+    with _patch_stream(agent.model):
+        events = list(agent.run("Hello", stream=True))
+
+    assert "".join(e.content for e in events if e.event == RunEvent.run_response_content and e.content) == (
+        "The quick brown fox"
+    )
+    assert agent.run_response.content == "The quick brown fox"
+    assert agent.run_response.thinking == "THE QUICK BROWN FOX"
+    assert agent.run_response.response_audio.content == "AAEC"
+
+    team = Team(members=[], model=OpenAIChat(id="gpt-4o"), telemetry=False, monitoring=False)
+    with _patch_stream(team.model):
+        list(team.run("Hello", stream=True))
+
+    assert team.run_response.content == "The quick brown fox"
+    assert team.run_response.thinking == "THE QUICK BROWN FOX"
+    assert team.run_response.response_audio.content == "AAEC"
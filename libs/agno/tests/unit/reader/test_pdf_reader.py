@@ -1,6 +1,7 @@
 import asyncio
 from io import BytesIO
 from pathlib import Path
+from unittest.mock import patch
 
 import httpx
 import pytest
@@ -11,6 +12,7 @@ from agno.document.reader.pdf_reader import (
     PDFUrlImageReader,
     PDFUrlReader,
     _clean_page_numbers,
+    _get_process_pool,
 )
 
 
@@ -342,3 +344,104 @@ def test_clean_page_numbers_untrustable(p_nr_format):
     assert not clean_content[0].endswith(p_nr_format["end"].format(page_nr=1))
     assert not clean_content[0].startswith(p_nr_format["start"].format(page_nr=2))
     assert not clean_content[0].endswith(p_nr_format["end"].format(page_nr=2))
+
+
+def _make_pdf(page_texts) -> bytes:
+    """Build a PDF with one line of text per page line"""
+    from pypdf import PdfWriter
+    from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+    writer = PdfWriter()
+    font = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type1"),
+            NameObject("/BaseFont"): NameObject("/Helvetica"),
+        }
+    )
+    font_ref = writer._add_object(font)
+    for text in page_texts:
+        page = writer.add_blank_page(width=300, height=300)
+        stream = DecodedStreamObject()
+        lines = "".join(f"({line}) Tj 0 -20 Td " for line in text.split("\n"))
+        stream.set_data(f"BT /F1 12 Tf 20 250 Td {lines}ET".encode())
+        page[NameObject("/Contents")] = writer._add_object(stream)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font_ref})}
+        )
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def numbered_pdf_paths(tmp_path):
+    paths = []
+    for name, num_pages in [("manual", 9), ("guide", 3), ("note", 1)]:
+        path = tmp_path / f"{name}.pdf"
+        path.write_bytes(_make_pdf([f"{name} page {i}\n{i}" for i in range(1, num_pages + 1)]))
+        paths.append(path)
+    return paths
+
+
+def test_pdf_reader_process_parallel_matches_serial(numbered_pdf_paths):
+    serial_documents = PDFReader(chunk=False).read(numbered_pdf_paths[0])
+    parallel_documents = PDFReader(chunk=False, parallel="process", workers=2).read(numbered_pdf_paths[0])
+
+    assert [doc.content for doc in parallel_documents] == [doc.content for doc in serial_documents]
+    assert [doc.meta_data["page"] for doc in parallel_documents] == list(range(1, 10))
+    # Page numbers are detected across all pages and reformatted
+    assert parallel_documents[0].content.startswith("<start page 1>\nmanual page 1")
+    assert parallel_documents[-1].content.endswith("<end page 9>")
+
+
+@pytest.mark.asyncio
+async def test_pdf_reader_process_parallel_async(numbered_pdf_paths):
+    serial_documents = await PDFReader(chunk=False).async_read(numbered_pdf_paths[0])
+    parallel_documents = await PDFReader(chunk=False, parallel="process", workers=2).async_read(numbered_pdf_paths[0])
+
+    assert [doc.content for doc in parallel_documents] == [doc.content for doc in serial_documents]
+
+
+def test_pdf_reader_process_parallel_reads_streams_from_a_temporary_file(numbered_pdf_paths):
+    pdf_bytes = numbered_pdf_paths[0].read_bytes()
+    serial_documents = PDFReader(chunk=False).read(BytesIO(pdf_bytes))
+
+    pool = _get_process_pool(2)
+    with patch.object(pool, "submit", wraps=pool.submit) as submit:
+        parallel_documents = PDFReader(chunk=False, parallel="process", workers=2).read(BytesIO(pdf_bytes))
+
+    assert [doc.content for doc in parallel_documents] == [doc.content for doc in serial_documents]
+    # Every page range is read from the same file, which is removed once the pages are extracted
+    pdf_paths = {call.args[1] for call in submit.call_args_list}
+    assert len(submit.call_args_list) > 1 and len(pdf_paths) == 1
+    assert not Path(pdf_paths.pop()).exists()
+
+
+def test_pdf_reader_process_parallel_read_many(numbered_pdf_paths):
+    reader = PDFReader(chunk=False, parallel="process", workers=2)
+    document_lists = list(reader.read_many([(path, None) for path in numbered_pdf_paths]))
+
+    assert [len(documents) for documents in document_lists] == [9, 3, 1]
+    assert [documents[0].name for documents in document_lists] == ["manual", "guide", "note"]
+
+
+def test_pdf_knowledge_base_reads_files_in_process_pool(numbered_pdf_paths):
+    from agno.knowledge.pdf import PDFKnowledgeBase
+
+    knowledge_base = PDFKnowledgeBase(
+        path=[{"path": str(path), "metadata": {"file": path.stem}} for path in numbered_pdf_paths],
+        reader=PDFReader(chunk=False, parallel="process", workers=2),
+    )
+    document_lists = list(knowledge_base.document_lists)
+
+    assert [[doc.meta_data["file"] for doc in documents] for documents in document_lists] == [
+        ["manual"] * 9,
+        ["guide"] * 3,
+        ["note"],
+    ]
+
+
+def test_pdf_reader_invalid_parallel_mode():
+    with pytest.raises(ValueError):
+        PDFReader(parallel="thread")
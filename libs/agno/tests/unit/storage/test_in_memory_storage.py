@@ -1,5 +1,6 @@
 import pytest
 
+from agno.storage.base import FIRST_RUN_FIELD
 from agno.storage.in_memory import InMemoryStorage
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.workflow import WorkflowSession
@@ -390,3 +391,39 @@ def test_external_dict_with_existing_data():
     session_ids = [s.session_id for s in all_sessions]
     assert "existing-session" in session_ids
     assert "new-session" in session_ids
+
+
+def test_list_sessions(agent_storage: InMemoryStorage):
+    for i in range(3):
+        agent_storage.upsert(
+            AgentSession(
+                session_id=f"session-{i}",
+                agent_id="test-agent",
+                user_id="test-user",
+                memory={"runs": [{"run_id": f"run-{i}"}]},
+                session_data={"session_name": f"Session {i}"},
+                created_at=i + 1,
+            )
+        )
+
+    first_page = agent_storage.list_sessions(user_id="test-user", limit=2, fields=[FIRST_RUN_FIELD])
+    assert [s.session_id for s in first_page.sessions] == ["session-2", "session-1"]
+    assert first_page.sessions[0].session_name == "Session 2"
+    assert first_page.sessions[0].first_run == {"run_id": "run-2"}
+
+    second_page = agent_storage.list_sessions(user_id="test-user", limit=2, cursor=first_page.next_cursor)
+    assert [s.session_id for s in second_page.sessions] == ["session-0"]
+    assert second_page.next_cursor is None
+
+
+async def test_async_methods_use_storage_executor(agent_storage: InMemoryStorage):
+    session = AgentSession(session_id="test-session", agent_id="test-agent", user_id="test-user")
+    assert await agent_storage.aupsert(session) is not None
+
+    read_session = await agent_storage.aread("test-session")
+    assert read_session is not None
+    assert read_session.agent_id == "test-agent"
+    assert [s.session_id for s in await agent_storage.aget_all_sessions(user_id="test-user")] == ["test-session"]
+
+    await agent_storage.adelete_session("test-session")
+    assert await agent_storage.aread("test-session") is None
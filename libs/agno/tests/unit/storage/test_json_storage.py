@@ -1,12 +1,14 @@
 import tempfile
 from pathlib import Path
 from typing import Generator
+from unittest.mock import patch
 
 import pytest
 
 from agno.storage.json import JsonStorage
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.workflow import WorkflowSession
+from agno.storage.session_index import SessionIndex
 
 
 @pytest.fixture
@@ -174,3 +176,85 @@ def test_workflow_storage_filtering(workflow_storage: JsonStorage):
 
     empty_sessions = workflow_storage.get_all_sessions(entity_id="non-existent")
     assert len(empty_sessions) == 0
+
+
+def test_session_index(agent_storage: JsonStorage, temp_dir: Path):
+    for i in range(3):
+        agent_storage.upsert(
+            AgentSession(
+                session_id=f"session-{i}",
+                agent_id="test-agent",
+                user_id=f"user-{i % 2}",
+                session_data={"session_name": f"Session {i}"},
+                created_at=100 + i,
+            )
+        )
+    agent_storage.delete_session("session-1")
+
+    # Listing and recency queries only read the index and the returned sessions
+    (temp_dir / "session-0.json").write_text("not json")
+    assert agent_storage.get_all_session_ids() == ["session-0", "session-2"]
+    assert agent_storage.get_all_session_ids(user_id="user-0", entity_id="test-agent") == ["session-0", "session-2"]
+    assert [session.session_id for session in agent_storage.get_recent_sessions(limit=1)] == ["session-2"]
+    page = agent_storage.list_sessions(limit=1)
+    assert [(item.session_id, item.session_name) for item in page.sessions] == [("session-2", "Session 2")]
+    assert page.next_cursor is not None
+    assert [item.session_id for item in agent_storage.list_sessions(cursor=page.next_cursor).sessions] == ["session-0"]
+
+    # A new storage picks up the index, and rebuilds it from the session files if it is missing
+    assert JsonStorage(dir_path=temp_dir).get_all_session_ids() == ["session-0", "session-2"]
+    agent_storage.upsert(AgentSession(session_id="session-0", agent_id="test-agent", user_id="user-0"))
+    (temp_dir / ".sessions.index.jsonl").unlink()
+    storage = JsonStorage(dir_path=temp_dir)
+    assert sorted(storage.get_all_session_ids()) == ["session-0", "session-2"]
+    assert storage.get_all_session_ids(user_id="user-0") == storage.get_all_session_ids()
+
+    storage.drop()
+    assert storage.get_all_session_ids() == []
+    assert list(temp_dir.iterdir()) == [temp_dir / ".sessions.index.jsonl"]
+
+
+def test_session_index_compaction_keeps_lines_of_other_writers(temp_dir: Path):
+    path = temp_dir / ".sessions.index.jsonl"
+    index = SessionIndex(path)
+    other_index = SessionIndex(path)
+
+    with patch("agno.storage.session_index.COMPACT_MIN_LINES", 0):
+        index.upsert({"session_id": "session-0", "updated_at": 1})
+        # Appended by another writer after the last refresh of `index`, and kept when `index` compacts the log
+        other_index.upsert({"session_id": "session-1", "updated_at": 1})
+        for updated_at in range(2, 5):
+            index.upsert({"session_id": "session-0", "updated_at": updated_at})
+
+    assert len(path.read_text().splitlines()) == 2
+    assert [entry["session_id"] for entry in SessionIndex(path).get_entries()] == ["session-0", "session-1"]
+    assert [entry["session_id"] for entry in other_index.get_entries()] == ["session-0", "session-1"]
+    assert list(temp_dir.iterdir()) == [path]
+
+
+def test_compact_serialization(temp_dir: Path):
+    storage = JsonStorage(dir_path=temp_dir, compact=True)
+    storage.upsert(AgentSession(session_id="compact", agent_id="test-agent", memory={"key": "value"}))
+
+    assert "\n" not in (temp_dir / "compact.json").read_text()
+    assert storage.read("compact").memory == {"key": "value"}
+
+
+def test_concurrent_upserts_of_a_session(agent_storage: JsonStorage, temp_dir: Path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    sessions = [
+        AgentSession(session_id="shared", agent_id="test-agent", memory={"runs": list(range(1000)), "writer": i})
+        for i in range(20)
+    ]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(agent_storage.upsert, sessions))
+
+    # Every writer replaces the session with a complete file, and no temporary files are left behind
+    assert all(result is not None for result in results)
+    assert agent_storage.read("shared").memory["runs"] == list(range(1000))
+    assert sorted(path.name for path in temp_dir.iterdir()) == [".sessions.index.jsonl", "shared.json"]
+
+    with patch("agno.storage.json.os.replace", side_effect=OSError("disk full")):
+        assert agent_storage.upsert(sessions[0]) is None
+    assert sorted(path.name for path in temp_dir.iterdir()) == [".sessions.index.jsonl", "shared.json"]
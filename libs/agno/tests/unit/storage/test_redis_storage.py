@@ -5,6 +5,7 @@ from uuid import uuid4
 import pytest
 import redis
 
+from agno.storage.base import FIRST_RUN_FIELD
 from agno.storage.redis import RedisStorage
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
@@ -37,8 +38,59 @@ def mock_redis_client():
 
         # Mock scan_iter to return keys
         client.scan_iter.side_effect = lambda match: [
-            k for k in mock_data.keys() if k.startswith(match.replace("*", ""))
+            k for k in list(mock_data.keys()) + list(mock_sorted_sets.keys()) if k.startswith(match.replace("*", ""))
         ]
+        client.exists.side_effect = lambda key: int(key in mock_data or key in mock_sorted_sets)
+        client.mget.side_effect = lambda keys: [mock_data.get(k) for k in keys]
+
+        # Simulate sorted sets, ordered by (score, member)
+        mock_sorted_sets: Dict[str, Dict[str, float]] = {}
+
+        def mock_zadd(key, mapping):
+            mock_sorted_sets.setdefault(key, {}).update({m: float(s) for m, s in mapping.items()})
+
+        def mock_zrem(key, *members):
+            for member in members:
+                mock_sorted_sets.get(key, {}).pop(member, None)
+
+        def sorted_members_desc(key):
+            return sorted(mock_sorted_sets.get(key, {}).items(), key=lambda item: (item[1], item[0]), reverse=True)
+
+        def mock_zrevrange(key, start, end):
+            members = [m for m, _ in sorted_members_desc(key)]
+            return members[start:] if end == -1 else members[start : end + 1]
+
+        def mock_zrevrangebyscore(key, max, min, start=0, num=None, withscores=False):
+            max_score = float(max)
+            members = [(m, s) for m, s in sorted_members_desc(key) if s <= max_score]
+            members = members[start:] if num is None else members[start : start + num]
+            return members if withscores else [m for m, _ in members]
+
+        def mock_delete_key(key):
+            if key in mock_sorted_sets:
+                del mock_sorted_sets[key]
+                return 1
+            return mock_delete(key)
+
+        client.zadd.side_effect = mock_zadd
+        client.zrem.side_effect = mock_zrem
+        client.zrevrange.side_effect = mock_zrevrange
+        client.zrevrangebyscore.side_effect = mock_zrevrangebyscore
+        client.delete.side_effect = mock_delete_key
+        client.sorted_sets = mock_sorted_sets
+
+        # Pipelines queue commands and run them against the mock client on execute
+        class MockPipeline:
+            def __init__(self):
+                self.commands = []
+
+            def __getattr__(self, name):
+                return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+            def execute(self):
+                return [getattr(client, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+        client.pipeline.side_effect = lambda transaction=True: MockPipeline()
 
         # Return the mock Redis instance when Redis.Redis() is called
         mock_redis.return_value = client
@@ -429,3 +481,106 @@ def test_error_handling_with_uuid(agent_storage, mock_redis_client):
     mock_redis_client.get.return_value = "invalid json"
     result = agent_storage.read(str(uuid4()))
     assert result is None
+
+
+def test_upsert_and_delete_maintain_indexes(agent_storage, mock_redis_client):
+    """Test that upsert and delete_session keep the session indexes up to date."""
+    session = AgentSession(session_id="session-1", agent_id="agent-1", user_id="user-1", created_at=100)
+    agent_storage.upsert(session)
+
+    assert mock_redis_client.sorted_sets["test_agent__index:sessions"] == {"session-1": 100}
+    assert mock_redis_client.sorted_sets["test_agent__index:user:user-1"] == {"session-1": 100}
+    assert mock_redis_client.sorted_sets["test_agent__index:entity:agent-1"] == {"session-1": 100}
+    assert mock_redis_client.sorted_sets["test_agent__index:user:user-1:entity:agent-1"] == {"session-1": 100}
+
+    agent_storage.delete_session("session-1")
+    assert all(not members for members in mock_redis_client.sorted_sets.values())
+
+
+def test_indexed_reads_do_not_scan(agent_storage, mock_redis_client):
+    """Test that reads use the indexes and MGET instead of scanning the keyspace."""
+    for i in range(4):
+        agent_storage.upsert(
+            AgentSession(
+                session_id=f"session-{i}",
+                agent_id="agent-1" if i < 2 else "agent-2",
+                user_id="user-1",
+                created_at=100 + i,
+            )
+        )
+    agent_storage.build_indexes()
+    mock_redis_client.scan_iter.reset_mock()
+    mock_redis_client.get.reset_mock()
+
+    recent_sessions = agent_storage.get_recent_sessions(user_id="user-1", limit=2)
+    assert [s.session_id for s in recent_sessions] == ["session-3", "session-2"]
+    assert [s.session_id for s in agent_storage.get_all_sessions(entity_id="agent-1")] == ["session-1", "session-0"]
+    mock_redis_client.scan_iter.assert_not_called()
+    mock_redis_client.get.assert_not_called()
+
+    # Index entries of expired sessions are removed when they are read
+    mock_redis_client.delete("test_agent:session-3")
+    assert [s.session_id for s in agent_storage.get_all_sessions(user_id="user-1")] == [
+        "session-2",
+        "session-1",
+        "session-0",
+    ]
+    assert "session-3" not in mock_redis_client.zrevrange("test_agent__index:user:user-1", 0, -1)
+
+
+def test_list_sessions_pagination(agent_storage, mock_redis_client):
+    """Test keyset pagination of session summaries using the indexes."""
+    for i in range(5):
+        agent_storage.upsert(
+            AgentSession(
+                session_id=f"session-{i}",
+                agent_id="agent-1",
+                user_id="user-1",
+                memory={"runs": [{"run_id": f"run-{i}"}]},
+                session_data={"session_name": f"Session {i}"},
+                # Two sessions created in the same second
+                created_at=100 + min(i, 3),
+            )
+        )
+
+    first_page = agent_storage.list_sessions(user_id="user-1", limit=3, fields=[FIRST_RUN_FIELD])
+    assert [s.session_id for s in first_page.sessions] == ["session-4", "session-3", "session-2"]
+    assert first_page.sessions[0].session_name == "Session 4"
+    assert first_page.sessions[0].first_run == {"run_id": "run-4"}
+
+    second_page = agent_storage.list_sessions(user_id="user-1", limit=3, cursor=first_page.next_cursor)
+    assert [s.session_id for s in second_page.sessions] == ["session-1", "session-0"]
+    assert second_page.next_cursor is None
+
+
+def test_list_sessions_skips_expired_sessions_before_paging(agent_storage, mock_redis_client):
+    """Test that index entries of expired sessions do not shorten a page or hide the next cursor."""
+    for i in range(5):
+        agent_storage.upsert(
+            AgentSession(session_id=f"session-{i}", agent_id="agent-1", user_id="user-1", created_at=100 + i)
+        )
+    mock_redis_client.delete("test_agent:session-3")
+
+    first_page = agent_storage.list_sessions(user_id="user-1", limit=2)
+    assert [s.session_id for s in first_page.sessions] == ["session-4", "session-2"]
+    assert first_page.next_cursor is not None
+    assert "session-3" not in mock_redis_client.sorted_sets["test_agent__index:user:user-1"]
+
+    second_page = agent_storage.list_sessions(user_id="user-1", limit=2, cursor=first_page.next_cursor)
+    assert [s.session_id for s in second_page.sessions] == ["session-1", "session-0"]
+    assert second_page.next_cursor is None
+
+
+def test_get_recent_sessions_skips_expired_sessions(agent_storage, mock_redis_client):
+    """Test that index entries of expired sessions do not shorten the recent sessions."""
+    for i in range(5):
+        agent_storage.upsert(
+            AgentSession(session_id=f"session-{i}", agent_id="agent-1", user_id="user-1", created_at=100 + i)
+        )
+    mock_redis_client.delete("test_agent:session-4")
+    mock_redis_client.delete("test_agent:session-2")
+
+    recent_sessions = agent_storage.get_recent_sessions(user_id="user-1", limit=2)
+    assert [s.session_id for s in recent_sessions] == ["session-3", "session-1"]
+    assert "session-4" not in mock_redis_client.sorted_sets["test_agent__index:user:user-1"]
+    assert "session-2" not in mock_redis_client.sorted_sets["test_agent__index:user:user-1"]
@@ -1,10 +1,14 @@
+import asyncio
 import os
 import tempfile
 from pathlib import Path
 from typing import Generator
+from unittest.mock import patch
 
 import pytest
+from sqlalchemy import text
 
+from agno.storage.base import FIRST_RUN_FIELD
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.workflow import WorkflowSession
 from agno.storage.sqlite import SqliteStorage
@@ -193,3 +197,209 @@ def test_workflow_storage_filtering(workflow_storage: SqliteStorage):
 
     empty_sessions = workflow_storage.get_all_sessions(entity_id="non-existent")
     assert len(empty_sessions) == 0
+
+
+@pytest.fixture
+def agent_storage_with_runs(temp_db_path: Path) -> SqliteStorage:
+    return SqliteStorage(
+        table_name="agent_sessions", runs_table_name="agent_runs", db_file=str(temp_db_path), mode="agent"
+    )
+
+
+def _run(run_id: str, content: str = "") -> dict:
+    return {"run_id": run_id, "session_id": "test-session", "content": content}
+
+
+def test_agent_storage_runs_table(agent_storage_with_runs: SqliteStorage):
+    agent_storage_with_runs.create()
+    assert agent_storage_with_runs.stores_runs_separately
+    assert agent_storage_with_runs.runs_table_exists()
+
+    # Each upsert only carries the new run, the older runs are kept in the run log
+    for i in range(3):
+        agent_storage_with_runs.upsert(
+            AgentSession(session_id="test-session", agent_id="test-agent", memory={"runs": [_run(f"run-{i}")]})
+        )
+
+    read_session = agent_storage_with_runs.read("test-session")
+    assert read_session is not None
+    assert [run["run_id"] for run in read_session.memory["runs"]] == ["run-0", "run-1", "run-2"]
+
+    # The session row itself does not contain the runs
+    with agent_storage_with_runs.SqlSession() as sess:
+        memory = sess.execute(agent_storage_with_runs.table.select()).fetchone()._mapping["memory"]
+    assert "runs" not in memory
+
+    # Updating an existing run keeps its position
+    agent_storage_with_runs.upsert(
+        AgentSession(session_id="test-session", agent_id="test-agent", memory={"runs": [_run("run-1", "updated")]})
+    )
+    runs = agent_storage_with_runs.read_runs("test-session")
+    assert [run["run_id"] for run in runs] == ["run-0", "run-1", "run-2"]
+    assert runs[1]["content"] == "updated"
+
+    # Only the most recent runs are read
+    assert [run["run_id"] for run in agent_storage_with_runs.read_runs("test-session", limit=2)] == ["run-1", "run-2"]
+    agent_storage_with_runs.num_runs_to_read = 1
+    assert [run["run_id"] for run in agent_storage_with_runs.read("test-session").memory["runs"]] == ["run-2"]
+
+    # Deleting the session deletes its runs
+    agent_storage_with_runs.delete_session("test-session")
+    assert agent_storage_with_runs.read("test-session") is None
+    assert agent_storage_with_runs.read_runs("test-session") == []
+
+    agent_storage_with_runs.drop()
+    assert not agent_storage_with_runs.table_exists()
+    assert not agent_storage_with_runs.runs_table_exists()
+
+
+def test_agent_storage_runs_table_migrates_legacy_runs(temp_db_path: Path):
+    legacy_storage = SqliteStorage(table_name="agent_sessions", db_file=str(temp_db_path), mode="agent")
+    legacy_storage.upsert(
+        AgentSession(session_id="test-session", agent_id="test-agent", memory={"runs": [_run("run-0"), _run("run-1")]})
+    )
+
+    storage = SqliteStorage(
+        table_name="agent_sessions", runs_table_name="agent_runs", db_file=str(temp_db_path), mode="agent"
+    )
+    storage.create()
+
+    # Runs stored in the memory column are moved to the run log on read
+    read_session = storage.read("test-session")
+    assert [run["run_id"] for run in read_session.memory["runs"]] == ["run-0", "run-1"]
+    assert [run["run_id"] for run in storage.read_runs("test-session")] == ["run-0", "run-1"]
+
+    storage.upsert(AgentSession(session_id="test-session", agent_id="test-agent", memory={"runs": [_run("run-2")]}))
+    assert [run["run_id"] for run in storage.read("test-session").memory["runs"]] == ["run-0", "run-1", "run-2"]
+
+
+def test_upsert_returns_written_session_and_batches_run_reads(agent_storage_with_runs: SqliteStorage):
+    agent_storage_with_runs.create()
+
+    # The upserted session is built from the written row, without reading the session back
+    with patch.object(agent_storage_with_runs, "read", side_effect=AssertionError("read after upsert")):
+        for i in range(3):
+            for j in range(3):
+                saved_session = agent_storage_with_runs.upsert(
+                    AgentSession(
+                        session_id=f"session-{i}",
+                        agent_id="test-agent",
+                        memory={"runs": [_run(f"run-{i}-{j}")], "summary": "summary"},
+                    )
+                )
+    assert saved_session.session_id == "session-2"
+    assert saved_session.created_at is not None
+    assert saved_session.memory == {"summary": "summary", "runs": [_run("run-2-2")]}
+
+    # The runs of all sessions are read with one query instead of one query per session
+    agent_storage_with_runs.num_runs_to_read = 2
+    with patch.object(agent_storage_with_runs, "read_runs", side_effect=AssertionError("read runs per session")):
+        sessions = agent_storage_with_runs.get_all_sessions()
+        recent_sessions = agent_storage_with_runs.get_recent_sessions(limit=2)
+    assert sorted(session.session_id for session in sessions) == ["session-0", "session-1", "session-2"]
+    assert len(recent_sessions) == 2
+    for session in sessions + recent_sessions:
+        i = session.session_id.split("-")[1]
+        assert [run["run_id"] for run in session.memory["runs"]] == [f"run-{i}-1", f"run-{i}-2"]
+
+
+def test_list_sessions_pagination(agent_storage_with_runs: SqliteStorage):
+    for i in range(5):
+        agent_storage_with_runs.upsert(
+            AgentSession(
+                session_id=f"session-{i}",
+                agent_id="agent-1" if i < 4 else "agent-2",
+                user_id="test-user",
+                memory={"runs": [_run(f"run-{i}-0"), _run(f"run-{i}-1")]},
+                session_data={"session_name": f"Session {i}"},
+                extra_data={"custom": i},
+            )
+        )
+
+    first_page = agent_storage_with_runs.list_sessions(entity_id="agent-1", limit=3, fields=[FIRST_RUN_FIELD])
+    assert [s.session_id for s in first_page.sessions] == ["session-3", "session-2", "session-1"]
+    assert first_page.sessions[0].session_name == "Session 3"
+    assert first_page.sessions[0].first_run["run_id"] == "run-3-0"
+    assert first_page.sessions[0].data == {}
+    assert first_page.next_cursor is not None
+
+    second_page = agent_storage_with_runs.list_sessions(
+        entity_id="agent-1", limit=3, cursor=first_page.next_cursor, fields=["extra_data"]
+    )
+    assert [s.session_id for s in second_page.sessions] == ["session-0"]
+    assert second_page.sessions[0].first_run is None
+    assert second_page.sessions[0].data == {"extra_data": {"custom": 0}}
+    assert second_page.next_cursor is None
+
+    all_sessions = agent_storage_with_runs.list_sessions(user_id="test-user", limit=None)
+    assert len(all_sessions.sessions) == 5
+    assert all_sessions.next_cursor is None
+
+
+async def test_async_agent_storage_crud(agent_storage_with_runs: SqliteStorage):
+    session = AgentSession(
+        session_id="test-session",
+        agent_id="test-agent",
+        user_id="test-user",
+        memory={"runs": [_run("run-0")]},
+        session_data={"state": "active"},
+    )
+
+    saved_session = await agent_storage_with_runs.aupsert(session)
+    assert saved_session is not None
+    assert saved_session.session_id == session.session_id
+
+    await agent_storage_with_runs.aupsert(
+        AgentSession(session_id="test-session", agent_id="test-agent", memory={"runs": [_run("run-1")]})
+    )
+    read_session = await agent_storage_with_runs.aread("test-session")
+    assert [run["run_id"] for run in read_session.memory["runs"]] == ["run-0", "run-1"]
+    assert await agent_storage_with_runs.aread("test-session", user_id="other-user") is None
+    assert await agent_storage_with_runs.aget_all_session_ids() == ["test-session"]
+
+    await agent_storage_with_runs.adelete_session("test-session")
+    assert await agent_storage_with_runs.aread("test-session") is None
+    assert await agent_storage_with_runs.aread_runs("test-session") == []
+
+
+def test_async_storage_across_event_loops(agent_storage_with_runs: SqliteStorage):
+    pytest.importorskip("aiosqlite")
+    pytest.importorskip("greenlet")
+    session = AgentSession(session_id="test-session", agent_id="test-agent", memory={"runs": [_run("run-0")]})
+
+    # Every event loop gets its own async engine, so the storage can be used from consecutive asyncio.run calls
+    asyncio.run(agent_storage_with_runs.aupsert(session))
+    with patch("agno.storage.sqlite.dispose_async_engine") as dispose_async_engine:
+        read_session = asyncio.run(agent_storage_with_runs.aread("test-session"))
+    assert read_session is not None
+    assert [run["run_id"] for run in read_session.memory["runs"]] == ["run-0"]
+    assert len(agent_storage_with_runs._async_sessions) == 1
+    # The engine of the closed event loop is disposed
+    assert dispose_async_engine.call_count == 1
+
+
+async def test_async_read_returns_none_on_database_errors(agent_storage: SqliteStorage):
+    agent_storage.create()
+    await agent_storage.aupsert(AgentSession(session_id="test-session", agent_id="test-agent"))
+
+    with agent_storage.SqlSession() as sess, sess.begin():
+        sess.execute(text(f"ALTER TABLE {agent_storage.table_name} DROP COLUMN agent_data"))
+    # Database errors are logged and reported as a missing session, with or without an async driver
+    assert agent_storage.read("test-session") is None
+    assert await agent_storage.aread("test-session") is None
+
+
+def test_async_engine_errors_fall_back_to_the_thread_pool(agent_storage: SqliteStorage):
+    pytest.importorskip("aiosqlite")
+    pytest.importorskip("greenlet")
+    agent_storage.create()
+
+    async def _read():
+        return await agent_storage.aread("test-session")
+
+    # Errors other than a missing driver only fall back for the current call
+    with patch("sqlalchemy.ext.asyncio.create_async_engine", side_effect=RuntimeError("boom")):
+        assert asyncio.run(_read()) is None
+    assert not agent_storage._async_unavailable
+    asyncio.run(_read())
+    assert len(agent_storage._async_sessions) == 1
@@ -174,3 +174,47 @@ def test_workflow_storage_filtering(workflow_storage: YamlStorage):
 
     empty_sessions = workflow_storage.get_all_sessions(entity_id="non-existent")
     assert len(empty_sessions) == 0
+
+
+def test_session_index(agent_storage: YamlStorage, temp_dir: Path):
+    for i in range(3):
+        agent_storage.upsert(
+            AgentSession(
+                session_id=f"session-{i}",
+                agent_id="test-agent",
+                user_id=f"user-{i % 2}",
+                session_data={"session_name": f"Session {i}"},
+                created_at=100 + i,
+            )
+        )
+    agent_storage.delete_session("session-1")
+
+    # Listing and recency queries only read the index and the returned sessions
+    (temp_dir / "session-0.yaml").write_text("[not: yaml")
+    assert agent_storage.get_all_session_ids() == ["session-0", "session-2"]
+    assert agent_storage.get_all_session_ids(user_id="user-0", entity_id="test-agent") == ["session-0", "session-2"]
+    assert [session.session_id for session in agent_storage.get_recent_sessions(limit=1)] == ["session-2"]
+    page = agent_storage.list_sessions(limit=1)
+    assert [(item.session_id, item.session_name) for item in page.sessions] == [("session-2", "Session 2")]
+    assert page.next_cursor is not None
+    assert [item.session_id for item in agent_storage.list_sessions(cursor=page.next_cursor).sessions] == ["session-0"]
+
+    # A new storage picks up the index, and rebuilds it from the session files if it is missing
+    assert YamlStorage(dir_path=temp_dir).get_all_session_ids() == ["session-0", "session-2"]
+    agent_storage.upsert(AgentSession(session_id="session-0", agent_id="test-agent", user_id="user-0"))
+    (temp_dir / ".sessions.index.jsonl").unlink()
+    storage = YamlStorage(dir_path=temp_dir)
+    assert sorted(storage.get_all_session_ids()) == ["session-0", "session-2"]
+    assert storage.get_all_session_ids(user_id="user-0") == storage.get_all_session_ids()
+
+    storage.drop()
+    assert storage.get_all_session_ids() == []
+    assert list(temp_dir.iterdir()) == [temp_dir / ".sessions.index.jsonl"]
+
+
+def test_compact_serialization(temp_dir: Path):
+    storage = YamlStorage(dir_path=temp_dir, compact=True)
+    storage.upsert(AgentSession(session_id="compact", agent_id="test-agent", memory={"key": "value"}))
+
+    assert (temp_dir / "compact.yaml").read_text().startswith("{")
+    assert storage.read("compact").memory == {"key": "value"}
@@ -708,3 +708,48 @@ def test_tool_decorator_with_complex_types():
     assert complex_types_func.parameters["properties"]["param2"]["type"] == "object"
     assert complex_types_func.parameters["properties"]["param3"]["type"] == "boolean"
     assert "param3" not in complex_types_func.parameters["required"]
+
+
+def test_process_entrypoint_reuses_cached_schema(monkeypatch):
+    """Test that the entrypoint schema is built once per function and shared between toolkit instances."""
+    from agno.tools.function import clear_entrypoint_schema_cache
+    from agno.tools.toolkit import Toolkit
+
+    class ExampleTools(Toolkit):
+        def __init__(self):
+            super().__init__(name="example_tools", tools=[self.lookup])
+
+        def lookup(self, query: str, limit: int = 5) -> str:
+            """Look up a query.
+
+            Args:
+                query: The query to look up
+                limit: The maximum number of results
+            """
+            return query
+
+    clear_entrypoint_schema_cache()
+    build_calls = []
+    original_build = Function._build_entrypoint_schema
+
+    def counting_build(self, entrypoint, strict):
+        build_calls.append(strict)
+        return original_build(self, entrypoint, strict)
+
+    monkeypatch.setattr(Function, "_build_entrypoint_schema", counting_build)
+
+    first = ExampleTools().functions["lookup"]
+    second = ExampleTools().functions["lookup"]
+    first.process_entrypoint()
+    second.process_entrypoint()
+    first.process_entrypoint()
+    second.process_entrypoint(strict=True)
+
+    assert build_calls == [False, True]
+    assert first.parameters["required"] == ["query"]
+    assert second.parameters["required"] == ["query", "limit"]
+    assert first.description == "Look up a query."
+
+    # Each function gets its own copy of the cached schema
+    first.parameters["properties"]["query"]["description"] = "changed"
+    assert second.parameters["properties"]["query"]["description"] != "changed"
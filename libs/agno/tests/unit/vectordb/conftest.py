@@ -1,5 +1,5 @@
 from typing import Any, Dict, List
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -22,4 +22,11 @@ def mock_embedder():
     mock_usage: Dict[str, Any] = {"prompt_tokens": 10, "total_tokens": 10}
     mock.get_embedding_and_usage.return_value = (mock_embedding, mock_usage)
 
+    # Mock the batch embedding methods
+    def get_embeddings_batch_and_usage(texts, batch_size=None):
+        return [mock_embedding for _ in texts], [mock_usage for _ in texts]
+
+    mock.get_embeddings_batch_and_usage.side_effect = get_embeddings_batch_and_usage
+    mock.async_get_embeddings_batch_and_usage = AsyncMock(side_effect=get_embeddings_batch_and_usage)
+
     return mock
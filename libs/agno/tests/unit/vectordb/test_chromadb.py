@@ -5,6 +5,7 @@ from typing import List
 import pytest
 
 from agno.document import Document
+from agno.utils.string import safe_content_hash
 from agno.vectordb.chroma import ChromaDb
 from agno.vectordb.distance import Distance
 
@@ -130,6 +131,14 @@ def test_doc_exists(chroma_db, sample_documents):
     assert chroma_db.doc_exists(sample_documents[0]) is True
 
 
+def test_existing_content_hashes(chroma_db, sample_documents):
+    """Test bulk content hash existence check"""
+    chroma_db.insert(sample_documents[:2])
+    content_hashes = [safe_content_hash(doc.content) for doc in sample_documents]
+    assert chroma_db.existing_content_hashes(content_hashes) == set(content_hashes[:2])
+    assert chroma_db.existing_content_hashes([]) == set()
+
+
 def test_get_count(chroma_db, sample_documents):
     """Test document count"""
     assert chroma_db.get_count() == 0
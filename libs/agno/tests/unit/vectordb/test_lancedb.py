@@ -5,6 +5,7 @@ from typing import List
 import pytest
 
 from agno.document import Document
+from agno.utils.string import safe_content_hash
 from agno.vectordb.lancedb import LanceDb
 from agno.vectordb.search import SearchType
 
@@ -125,6 +126,14 @@ def test_doc_exists(lance_db, sample_documents):
     assert lance_db.doc_exists(sample_documents[0]) is True
 
 
+def test_existing_content_hashes(lance_db, sample_documents):
+    """Test bulk content hash existence check"""
+    lance_db.insert(sample_documents[:2])
+    content_hashes = [safe_content_hash(doc.content) for doc in sample_documents]
+    assert lance_db.existing_content_hashes(content_hashes) == set(content_hashes[:2])
+    assert lance_db.existing_content_hashes([]) == set()
+
+
 def test_name_exists(lance_db, sample_documents):
     """Test name existence check"""
     lance_db.insert([sample_documents[0]])
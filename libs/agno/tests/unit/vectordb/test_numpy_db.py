@@ -0,0 +1,239 @@
+from typing import Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from agno.document import Document
+from agno.embedder.base import Embedder
+from agno.utils.string import safe_content_hash
+from agno.vectordb.distance import Distance
+from agno.vectordb.local import Ivf, NumpyVectorDb
+
+KEYWORDS = ["soup", "noodles", "curry", "coconut"]
+
+
+class _KeywordEmbedder(Embedder):
+    """Embeds a text as the counts of a few keywords"""
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [float(text.lower().count(keyword)) + 0.01 for keyword in KEYWORDS]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+
+@pytest.fixture
+def sample_documents() -> List[Document]:
+    return [
+        Document(
+            content="Tom Kha Gai is a Thai coconut soup with chicken",
+            name="tom_kha_gai",
+            meta_data={"cuisine": "Thai", "type": "soup"},
+        ),
+        Document(
+            content="Pad Thai is a stir-fried rice noodles dish", meta_data={"cuisine": "Thai", "type": "noodles"}
+        ),
+        Document(
+            content="Green curry is a spicy Thai curry with coconut milk",
+            meta_data={"cuisine": "Thai", "type": "curry"},
+        ),
+        Document(content="Ramen is a Japanese noodles soup", meta_data={"cuisine": "Japanese", "type": "noodles"}),
+    ]
+
+
+@pytest.fixture
+def numpy_db() -> NumpyVectorDb:
+    db = NumpyVectorDb(collection="recipes", embedder=_KeywordEmbedder(dimensions=len(KEYWORDS)))
+    db.create()
+    return db
+
+
+def test_insert_and_search(numpy_db, sample_documents):
+    numpy_db.insert(sample_documents)
+
+    assert numpy_db.get_count() == 4
+    results = numpy_db.search("curry", limit=2)
+    assert results[0].content.startswith("Green curry")
+    assert len(results) == 2
+    assert results[0].embedding is not None
+
+    assert numpy_db.doc_exists(sample_documents[0])
+    assert numpy_db.name_exists("tom_kha_gai")
+    assert not numpy_db.name_exists("pho")
+    hashes = [safe_content_hash(doc.content) for doc in sample_documents[:2]] + ["missing"]
+    assert numpy_db.existing_content_hashes(hashes) == set(hashes[:2])
+
+
+def test_search_with_filters(numpy_db, sample_documents):
+    numpy_db.insert(sample_documents)
+
+    results = numpy_db.search("noodles", limit=5, filters={"cuisine": "Japanese"})
+    assert [doc.content for doc in results] == ["Ramen is a Japanese noodles soup"]
+
+    results = numpy_db.search("soup", limit=5, filters={"cuisine": "Thai", "type": ["soup", "curry"]})
+    assert {doc.meta_data["type"] for doc in results} == {"soup", "curry"}
+    assert numpy_db.search("soup", filters={"cuisine": "French"}) == []
+
+
+def test_insert_skips_and_upsert_replaces_existing_ids(numpy_db):
+    numpy_db.insert([Document(id="recipe", content="coconut soup", meta_data={"version": 1})])
+    numpy_db.insert([Document(id="recipe", content="curry", meta_data={"version": 2})])
+    assert numpy_db.search("soup")[0].meta_data == {"version": 1}
+
+    numpy_db.upsert([Document(id="recipe", content="curry", meta_data={"version": 2})])
+    assert numpy_db.get_count() == 1
+    assert numpy_db.search("curry", filters={"version": 2})[0].content == "curry"
+    assert numpy_db.search("curry", filters={"version": 1}) == []
+    assert not numpy_db.doc_exists(Document(content="coconut soup"))
+
+
+@pytest.mark.parametrize("distance", [Distance.cosine, Distance.l2, Distance.max_inner_product])
+def test_search_matches_brute_force(distance):
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(200, 8)).astype(np.float32)
+    query = rng.normal(size=8).astype(np.float32)
+    embedder = _KeywordEmbedder()
+    db = NumpyVectorDb(collection="random", embedder=embedder, distance=distance)
+    db.insert(
+        [
+            Document(id=str(i), content=f"doc {i}", embedding=vector.tolist(), embedded_with=embedder)
+            for i, vector in enumerate(vectors)
+        ]
+    )
+
+    if distance == Distance.cosine:
+        scores = vectors @ query / (np.linalg.norm(vectors, axis=1) * np.linalg.norm(query))
+    elif distance == Distance.l2:
+        scores = -np.linalg.norm(vectors - query, axis=1)
+    else:
+        scores = vectors @ query
+    expected = np.argsort(-scores)[:10].tolist()
+
+    assert [row for row, _ in db._search_rows(query.tolist(), 10)] == expected
+
+
+def test_persistence_and_delete(tmp_path):
+    embedder = _KeywordEmbedder()
+    rng = np.random.default_rng(2)
+    documents = [
+        Document(
+            content=f"document {i}",
+            meta_data={"group": i % 3},
+            embedding=rng.normal(size=4).tolist(),
+            embedded_with=embedder,
+        )
+        for i in range(1500)
+    ]
+    db = NumpyVectorDb(collection="persisted", embedder=embedder, path=str(tmp_path))
+    db.create()
+    db.insert(documents[:1000])
+    db.insert(documents[1000:])
+    db.delete_by_content_hashes([safe_content_hash("document 0"), safe_content_hash("document 1")])
+
+    reloaded = NumpyVectorDb(collection="persisted", embedder=embedder, path=str(tmp_path))
+    assert reloaded.exists()
+    assert reloaded.get_count() == 1498
+    assert not reloaded.doc_exists(documents[0])
+    assert reloaded.doc_exists(documents[1499])
+    query = documents[1234].embedding
+    assert reloaded._records[reloaded._search_rows(query, 1)[0][0]]["content"] == "document 1234"
+    assert len(reloaded.search("document", limit=1000, filters={"group": 2})) == 500
+
+    reloaded.drop()
+    assert not reloaded.exists()
+    assert not (tmp_path / "persisted").exists()
+
+
+def test_ivf_index_searches_nearest_clusters():
+    rng = np.random.default_rng(3)
+    centers = rng.normal(size=(20, 16)) * 10
+    vectors = (centers[rng.integers(0, 20, size=2000)] + rng.normal(size=(2000, 16))).astype(np.float32)
+    embedder = _KeywordEmbedder()
+    db = NumpyVectorDb(collection="clustered", embedder=embedder, index=Ivf(lists=20, probes=3, min_rows=1000))
+    db.insert(
+        [
+            Document(content=f"doc {i}", embedding=vector.tolist(), embedded_with=embedder)
+            for i, vector in enumerate(vectors)
+        ]
+    )
+
+    queries = vectors[:50]
+    exact = [int(np.argmax(vectors @ q / np.linalg.norm(vectors, axis=1))) for q in queries]
+    approximate = [db._search_rows(q.tolist(), 1)[0][0] for q in queries]
+
+    assert db._centroids is not None
+    assert sum(a == e for a, e in zip(approximate, exact)) >= 45
+    # Documents inserted after the index is trained are assigned to a cluster
+    db.insert([Document(content="new", embedding=vectors[0].tolist(), embedded_with=embedder)])
+    assert len(db._assignments) == db.get_count()
+
+
+def test_interrupted_rewrite_keeps_persisted_collection(tmp_path, sample_documents):
+    embedder = _KeywordEmbedder(dimensions=len(KEYWORDS))
+    db = NumpyVectorDb(collection="recipes", embedder=embedder, path=str(tmp_path))
+    db.insert(sample_documents)
+
+    # Crash after the files of the next generation are written, before the manifest switches to them
+    with patch.object(NumpyVectorDb, "_write_manifest", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            db.delete_by_content_hashes([safe_content_hash(sample_documents[0].content)])
+
+    reloaded = NumpyVectorDb(collection="recipes", embedder=embedder, path=str(tmp_path))
+    assert reloaded.get_count() == 4
+    for row, record in enumerate(reloaded._records):
+        assert reloaded._vectors[row].tolist() == pytest.approx(embedder.get_embedding(record["content"]))
+
+    # Upserts append to the current files and deletes replace them with the files of the next generation
+    updated = Document(content=sample_documents[0].content, meta_data={"cuisine": "Thai", "type": "curry"})
+    reloaded.upsert([updated])
+    assert sorted(path.name for path in (tmp_path / "recipes").iterdir()) == [
+        "documents.jsonl",
+        "manifest.json",
+        "vectors.f32",
+    ]
+    reloaded.delete_by_content_hashes([safe_content_hash(sample_documents[1].content)])
+    assert sorted(path.name for path in (tmp_path / "recipes").iterdir()) == [
+        "documents.1.jsonl",
+        "manifest.json",
+        "vectors.1.f32",
+    ]
+    reloaded = NumpyVectorDb(collection="recipes", embedder=embedder, path=str(tmp_path))
+    assert reloaded.get_count() == 3
+    assert reloaded.search("soup", filters={"type": "curry"})[0].content == sample_documents[0].content
+
+
+def test_persisted_upserts_append_and_compact(tmp_path):
+    embedder = _KeywordEmbedder()
+    rng = np.random.default_rng(4)
+    documents = [
+        Document(id=str(i), content=f"document {i}", embedding=rng.normal(size=4).tolist(), embedded_with=embedder)
+        for i in range(1000)
+    ]
+    db = NumpyVectorDb(collection="upserted", embedder=embedder, path=str(tmp_path))
+    db.insert(documents)
+
+    # Upsert every document in batches, each replacing rows that already exist
+    replacements = [
+        Document(id=doc.id, content=f"{doc.content} v2", embedding=rng.normal(size=4).tolist(), embedded_with=embedder)
+        for doc in documents
+    ]
+    with patch.object(
+        NumpyVectorDb, "_start_rewrite", autospec=True, side_effect=NumpyVectorDb._start_rewrite
+    ) as rewrite:
+        for start in range(0, len(replacements), 50):
+            db.upsert(replacements[start : start + 50])
+    # The collection is only rewritten when the replaced rows cross the compaction threshold
+    assert 1 <= rewrite.call_count <= 4
+    assert db.get_count() == 1000
+    assert db._dead_count <= 0.25 * db._count
+
+    query = replacements[123].embedding
+    assert db._records[db._search_rows(query, 1)[0][0]]["content"] == "document 123 v2"
+    assert not db.doc_exists(documents[123])
+
+    reloaded = NumpyVectorDb(collection="upserted", embedder=embedder, path=str(tmp_path))
+    assert reloaded.get_count() == 1000
+    assert reloaded._dead_count == db._dead_count
+    assert all(doc.content.endswith("v2") for doc in reloaded.search("document", limit=1000))
+    assert reloaded._records[reloaded._search_rows(query, 1)[0][0]]["content"] == "document 123 v2"
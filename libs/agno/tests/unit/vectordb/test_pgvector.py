@@ -1,13 +1,18 @@
+import asyncio
 import uuid
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.engine import URL, Engine
+from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 from agno.document import Document
 from agno.utils.string import safe_content_hash
-from agno.vectordb.pgvector import PgVector
+from agno.vectordb.pgvector import HybridMode, PgVector
+from agno.vectordb.pgvector.pgvector import RRF_CANDIDATE_MULTIPLIER
 from agno.vectordb.search import SearchType
 
 # Configuration for tests
@@ -509,3 +514,193 @@ async def test_async_exists(mock_pgvector):
         # Check result and that exists was called via to_thread
         assert result is True
         mock_to_thread.assert_called_once_with(mock_pgvector.exists)
+
+
+def mock_async_session_factory():
+    """Create a mock async session factory and the session it yields."""
+    session = MagicMock()
+    result = MagicMock()
+    result.fetchall.return_value = []
+    session.execute = AsyncMock(return_value=result)
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    session.begin.return_value.__aenter__.return_value = session
+
+    factory = MagicMock()
+    factory.return_value.__aenter__.return_value = session
+    return factory, session
+
+
+def test_get_async_db_url():
+    """Test that the async engine URL uses an async capable driver."""
+    assert PgVector._get_async_db_url("postgresql://ai:ai@localhost:5532/ai") == (
+        "postgresql+psycopg://ai:ai@localhost:5532/ai"
+    )
+    assert PgVector._get_async_db_url("postgresql+psycopg://ai:ai@localhost:5532/ai") == (
+        "postgresql+psycopg://ai:ai@localhost:5532/ai"
+    )
+    assert PgVector._get_async_db_url("postgresql+asyncpg://ai:ai@localhost:5532/ai") == (
+        "postgresql+asyncpg://ai:ai@localhost:5532/ai"
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_search_uses_async_engine(mock_pgvector):
+    """Test async_search runs on the async session instead of a thread."""
+    factory, session = mock_async_session_factory()
+    mock_pgvector.get_async_session = MagicMock(return_value=factory)
+    mock_pgvector.search_type = SearchType.vector
+
+    with (
+        patch.object(mock_pgvector, "_get_vector_search_statement", return_value=MagicMock()) as mock_stmt,
+        patch("asyncio.to_thread") as mock_to_thread,
+    ):
+        results = await mock_pgvector.async_search("test query", limit=3)
+
+    assert results == []
+    mock_to_thread.assert_not_called()
+    assert mock_stmt.call_args.kwargs["limit"] == 3
+    # Index search setting and search statement
+    assert session.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_upsert_uses_async_engine(mock_pgvector):
+    """Test async_upsert embeds and upserts each batch on the async session."""
+    factory, session = mock_async_session_factory()
+    mock_pgvector.get_async_session = MagicMock(return_value=factory)
+    docs = create_test_documents(3)
+
+    with (
+        patch.object(mock_pgvector, "_get_upsert_statement", return_value=MagicMock()) as mock_upsert_stmt,
+        patch("asyncio.to_thread") as mock_to_thread,
+    ):
+        await mock_pgvector.async_upsert(docs, batch_size=2)
+
+    mock_to_thread.assert_not_called()
+    assert mock_upsert_stmt.call_count == 2
+    assert session.commit.await_count == 2
+    assert all(doc.embedding is not None for doc in docs)
+
+
+@pytest.mark.asyncio
+async def test_async_search_returns_no_results_on_database_errors(mock_pgvector):
+    """Test async_search logs database errors like search and only creates the table when it does not exist."""
+    factory, session = mock_async_session_factory()
+    mock_pgvector.get_async_session = MagicMock(return_value=factory)
+    mock_pgvector.search_type = SearchType.vector
+
+    class UndefinedTable(Exception):
+        sqlstate = "42P01"
+
+    with (
+        patch.object(mock_pgvector, "_get_vector_search_statement", return_value=MagicMock()),
+        patch.object(mock_pgvector, "async_create", new_callable=AsyncMock) as mock_create,
+    ):
+        session.execute.side_effect = ConnectionError("connection refused")
+        assert await mock_pgvector.async_search("test query") == []
+        # A missing column or schema is not a missing table
+        session.execute.side_effect = Exception('column "content_tsv" does not exist')
+        assert await mock_pgvector.async_search("test query") == []
+        mock_create.assert_not_awaited()
+
+        session.execute.side_effect = ProgrammingError(
+            "SELECT", {}, UndefinedTable(f'relation "{TEST_TABLE}" does not exist')
+        )
+        assert await mock_pgvector.async_search("test query") == []
+        mock_create.assert_awaited_once()
+
+
+def test_async_engine_per_event_loop(mock_engine, mock_embedder):
+    """Test each event loop gets its own async engine and engines of closed loops are disposed."""
+    with patch("agno.vectordb.pgvector.pgvector.inspect"):
+        db = PgVector(
+            table_name=TEST_TABLE,
+            schema=TEST_SCHEMA,
+            db_engine=mock_engine,
+            embedder=mock_embedder,
+            async_db_url="postgresql+psycopg://ai:ai@localhost:5532/ai",
+        )
+
+    async def get_engine():
+        assert db.get_async_session() is db.get_async_session()
+        return db._get_async_engine()
+
+    with (
+        patch("sqlalchemy.ext.asyncio.create_async_engine", side_effect=lambda *args, **kwargs: MagicMock()),
+        patch("agno.vectordb.pgvector.pgvector.dispose_async_engine") as mock_dispose,
+    ):
+        first_engine = asyncio.run(get_engine())
+        second_engine = asyncio.run(get_engine())
+
+    assert first_engine is not second_engine
+    mock_dispose.assert_called_once_with(first_engine)
+    assert list(db._async_engines.values()) == [second_engine]
+    assert len(db._async_sessions) == 1
+
+
+@pytest.fixture
+def pgvector_with_table(mock_engine, mock_embedder):
+    """Create a PgVector instance with its real table definition."""
+    with patch("agno.vectordb.pgvector.pgvector.inspect"):
+        yield PgVector(table_name=TEST_TABLE, schema=TEST_SCHEMA, db_engine=mock_engine, embedder=mock_embedder)
+
+
+def test_table_has_stored_tsvector_column(pgvector_with_table):
+    """Test the table generates content_tsv on write and indexes it with GIN."""
+    dialect = postgresql.dialect()
+    ddl = str(CreateTable(pgvector_with_table.table).compile(dialect=dialect))
+    assert "content_tsv TSVECTOR GENERATED ALWAYS AS (to_tsvector('english'::regconfig, content)) STORED" in ddl
+
+    indexes = {index.name: index for index in pgvector_with_table.table.indexes}
+    gin_index = indexes[f"idx_{TEST_TABLE}_content_tsv"]
+    assert "USING gin (content_tsv)" in str(CreateIndex(gin_index).compile(dialect=dialect))
+
+
+def test_keyword_search_statement_uses_stored_tsvector(pgvector_with_table):
+    """Test keyword search uses content_tsv when the table has it and tokenizes content otherwise."""
+    dialect = postgresql.dialect()
+
+    pgvector_with_table._content_tsv_exists = True
+    sql = str(pgvector_with_table._get_keyword_search_statement("test query").compile(dialect=dialect))
+    assert "content_tsv @@ websearch_to_tsquery" in sql
+    assert "to_tsvector" not in sql
+
+    pgvector_with_table._content_tsv_exists = False
+    sql = str(pgvector_with_table._get_keyword_search_statement("test query").compile(dialect=dialect))
+    assert "to_tsvector" in sql
+
+
+def test_rrf_hybrid_search_statement(pgvector_with_table):
+    """Test RRF hybrid search runs separate top-k vector and keyword legs and fuses them."""
+    pgvector_with_table._content_tsv_exists = True
+    pgvector_with_table.hybrid_mode = HybridMode.rrf
+
+    stmt = pgvector_with_table._get_hybrid_search_statement("test query", [0.1] * 1024, limit=3)
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    assert "AS vector_top_k" in sql and "AS keyword_top_k" in sql
+    assert "FULL OUTER JOIN" in sql
+    assert "content_tsv @@ websearch_to_tsquery" in sql
+    assert "ORDER BY fused.rrf_score DESC" in sql
+    # Each leg fetches more candidates than the final limit
+    params = stmt.compile(dialect=postgresql.dialect()).params
+    assert 3 * RRF_CANDIDATE_MULTIPLIER in params.values()
+
+
+def test_create_gin_index_adds_stored_tsvector_column(mock_pgvector):
+    """Test optimizing a table created before content_tsv adds the column and indexes it."""
+    sess = mock_pgvector.Session.return_value.__enter__.return_value
+    with (
+        patch.object(mock_pgvector, "_content_tsv_column_exists", return_value=False),
+        patch.object(mock_pgvector, "_index_exists", side_effect=lambda name: name.endswith("_content_gin_index")),
+        patch.object(mock_pgvector, "_drop_index") as mock_drop_index,
+    ):
+        mock_pgvector._create_gin_index()
+
+    executed = [str(call.args[0]) for call in sess.execute.call_args_list]
+    assert "ADD COLUMN IF NOT EXISTS content_tsv tsvector GENERATED ALWAYS AS" in executed[0]
+    assert f'CREATE INDEX "idx_{TEST_TABLE}_content_tsv"' in executed[1]
+    assert "USING GIN (content_tsv)" in executed[1]
+    mock_drop_index.assert_called_once_with(f"{TEST_TABLE}_content_gin_index")
+    assert mock_pgvector._content_tsv_exists is True
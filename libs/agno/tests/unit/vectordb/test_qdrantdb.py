@@ -214,6 +214,14 @@ def test_get_count(qdrant_db, mock_qdrant_client):
     mock_qdrant_client.count.assert_called_once_with(collection_name="test_collection", exact=True)
 
 
+def test_delete_by_content_hashes(qdrant_db, mock_qdrant_client):
+    """Test deleting documents reports failures instead of raising"""
+    assert qdrant_db.delete_by_content_hashes(["hash"]) is True
+
+    mock_qdrant_client.delete.side_effect = Exception("Qdrant unavailable")
+    assert qdrant_db.delete_by_content_hashes(["hash"]) is False
+
+
 @pytest.mark.asyncio
 async def test_async_create(mock_embedder):
     """Test async collection creation"""
@@ -20,6 +20,12 @@ def mock_embedder() -> MagicMock:
     embedder.get_embedding.return_value = [0.1] * 384
     embedder.get_embedding_and_usage.return_value = [0.1] * 384, {}
     embedder.embedding_dim = 384
+
+    def get_embeddings_batch_and_usage(texts, batch_size=None):
+        return [[0.1] * 384 for _ in texts], [{} for _ in texts]
+
+    embedder.get_embeddings_batch_and_usage.side_effect = get_embeddings_batch_and_usage
+    embedder.async_get_embeddings_batch_and_usage = AsyncMock(side_effect=get_embeddings_batch_and_usage)
     return embedder
 
 